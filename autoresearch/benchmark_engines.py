@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Repeatable search-speed benchmark across every compiled V*_* engine."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import math
+import os
+import platform
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from run_autoresearch import (
+    REPO_ROOT,
+    emit_console,
+    load_changelog,
+    log_phase,
+    parse_version,
+    run,
+    t_critical_one_sided_95,
+)
+
+
+ENGINE_ROOT = REPO_ROOT / "engine_csharp" / "src" / "Engine.Core"
+BENCHMARK_DIR = REPO_ROOT / "autoresearch" / "benchmarks"
+ENGINE_FILE_RE = re.compile(r"^V(?P<major>\d+)_(?P<minor>\d+)Engine\.cs$")
+DEFAULT_DEPTH = 4
+DEFAULT_TIME_LIMIT_MS = 200
+DEFAULT_REPEATS = 3
+DEFAULT_MIN_REGRESSION = 0.03
+
+
+def main() -> int:
+    args = parse_args()
+    git_sha = current_short_sha()
+
+    if not args.compare_only:
+        engine_files = discover_engine_files(args.version)
+        if not engine_files:
+            raise SystemExit("No matching V*_*Engine.cs files were found under engine_csharp/src/Engine.Core.")
+        if not args.skip_build:
+            log_phase("Building engine_csharp/ChessEngine.sln in Release for benchmarking.")
+            run(["dotnet", "build", "engine_csharp/ChessEngine.sln", "-c", "Release"], cwd=REPO_ROOT, check=True)
+        for version, engine_file in engine_files:
+            log_phase(f"Benchmarking {version} ({engine_file.relative_to(REPO_ROOT)}).")
+            report = run_engine_benchmark(engine_file, args.depth, args.time_limit_ms, args.repeats)
+            if report is None:
+                emit_console(f"Benchmark failed for {version}; skipping.\n", stream=sys.stderr, flush=True)
+                continue
+            path = store_benchmark(version, engine_file, git_sha, report)
+            log_phase(f"Stored {version} benchmark at {path.relative_to(REPO_ROOT)}.")
+
+    comparisons = compare_approved_versions(load_latest_benchmarks(), args.min_regression)
+    for comparison in comparisons:
+        emit_console(format_comparison(comparison) + "\n", flush=True)
+    regressions = [comparison for comparison in comparisons if comparison["regression"]]
+    if regressions:
+        log_phase(
+            "Significant speed regressions: "
+            + ", ".join(f"{item['previous']} -> {item['current']}" for item in regressions)
+            + "."
+        )
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark search speed of every compiled engine version.")
+    parser.add_argument(
+        "--version",
+        action="append",
+        help="Only benchmark this version, for example v4.0. May be repeated. Defaults to every engine file.",
+    )
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="Fixed search depth for the node-count pass.")
+    parser.add_argument(
+        "--time-limit-ms",
+        type=int,
+        default=DEFAULT_TIME_LIMIT_MS,
+        help="Fixed per-search time for the NPS pass.",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Searches per position and mode.")
+    parser.add_argument(
+        "--min-regression",
+        type=float,
+        default=DEFAULT_MIN_REGRESSION,
+        help="Smallest NPS drop (fraction) reported as a regression when it is also significant.",
+    )
+    parser.add_argument("--skip-build", action="store_true", help="Reuse the existing Release build.")
+    parser.add_argument(
+        "--compare-only",
+        action="store_true",
+        help="Do not run engines; only compare benchmarks already stored in autoresearch/benchmarks.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when any consecutive approved pair regresses significantly.",
+    )
+    return parser.parse_args()
+
+
+def current_short_sha() -> str:
+    result = run(["git", "rev-parse", "--short", "HEAD"], check=True, capture=True)
+    return result.stdout.strip()
+
+
+def discover_engine_files(versions: list[str] | None) -> list[tuple[str, Path]]:
+    wanted = {version.lower() for version in versions} if versions else None
+    engine_files: list[tuple[str, Path]] = []
+    for path in ENGINE_ROOT.glob("V*/V*_*Engine.cs"):
+        match = ENGINE_FILE_RE.match(path.name)
+        if not match:
+            continue
+        version = f"v{int(match.group('major'))}.{int(match.group('minor'))}"
+        if wanted is None or version in wanted:
+            engine_files.append((version, path))
+    engine_files.sort(key=lambda item: parse_version(item[0]))
+    return engine_files
+
+
+def run_engine_benchmark(engine_file: Path, depth: int, time_limit_ms: int, repeats: int) -> dict[str, Any] | None:
+    with tempfile.TemporaryDirectory(prefix="engine-benchmark-") as tmp:
+        output_path = Path(tmp) / "benchmark.json"
+        result = run(
+            [
+                "dotnet",
+                "run",
+                "--no-build",
+                "-c",
+                "Release",
+                "--project",
+                "engine_csharp/src/LocalTesting",
+                "--",
+                "benchmark",
+                "--engine-file",
+                str(engine_file.relative_to(REPO_ROOT)),
+                "--depth",
+                str(depth),
+                "--time-limit-ms",
+                str(time_limit_ms),
+                "--repeats",
+                str(repeats),
+                "--output",
+                str(output_path),
+            ],
+            cwd=REPO_ROOT,
+            check=False,
+        )
+        if result.returncode != 0 or not output_path.exists():
+            return None
+        return json.loads(output_path.read_text(encoding="utf-8"))
+
+
+def store_benchmark(version: str, engine_file: Path, git_sha: str, report: dict[str, Any]) -> Path:
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    record = {
+        "version": version,
+        "engine_file": str(engine_file.relative_to(REPO_ROOT)),
+        "git_sha": git_sha,
+        "recorded_at": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "host": {"node": platform.node(), "cpu_count": os.cpu_count(), "machine": platform.machine()},
+        "summary": summarize_records(report["records"]),
+        "benchmark": report,
+    }
+    path = BENCHMARK_DIR / f"{report['engine_stem']}-{git_sha}.json"
+    path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def summarize_records(records: list[dict[str, Any]]) -> dict[str, Any]:
+    summary: dict[str, Any] = {}
+    for mode in ("depth", "time"):
+        selected = [record for record in records if record["mode"] == mode]
+        if not selected:
+            continue
+        tt_rates = [record["tt_hit_rate"] for record in selected if record.get("tt_hit_rate") is not None]
+        depths = [record["completed_depth"] for record in selected if record.get("completed_depth") is not None]
+        summary[mode] = {
+            "searches": len(selected),
+            "total_nodes": int(sum(record["nodes"] for record in selected)),
+            "total_wall_ms": float(sum(record["wall_milliseconds"] for record in selected)),
+            "nps": float(sum(record["nodes"] for record in selected))
+            / max(sum(record["wall_milliseconds"] for record in selected) / 1000.0, 1e-9),
+            "average_completed_depth": float(np.mean(depths)) if depths else None,
+            "average_tt_hit_rate": float(np.mean(tt_rates)) if tt_rates else None,
+        }
+    return summary
+
+
+def load_latest_benchmarks() -> dict[str, dict[str, Any]]:
+    latest: dict[str, dict[str, Any]] = {}
+    for path in BENCHMARK_DIR.glob("*.json"):
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            continue
+        version = str(record.get("version", ""))
+        if not version:
+            continue
+        if version not in latest or record["recorded_at"] > latest[version]["recorded_at"]:
+            latest[version] = record
+    return latest
+
+
+def approved_versions() -> list[str]:
+    versions = load_changelog().get("versions", [])
+    approved = [str(item["version"]).lower() for item in versions if isinstance(item, dict) and item.get("status") == "approved"]
+    return sorted(approved, key=parse_version)
+
+
+def per_position_nps(record: dict[str, Any], mode: str) -> dict[int, float]:
+    totals: dict[int, list[float]] = {}
+    for item in record["benchmark"]["records"]:
+        if item["mode"] == mode:
+            totals.setdefault(int(item["position_index"]), []).append(float(item["nps"]))
+    return {position: float(np.mean(values)) for position, values in totals.items() if min(values) > 0}
+
+
+def compare_approved_versions(latest: dict[str, dict[str, Any]], min_regression: float) -> list[dict[str, Any]]:
+    benchmarked = [version for version in approved_versions() if version in latest]
+    comparisons: list[dict[str, Any]] = []
+    for previous, current in zip(benchmarked, benchmarked[1:]):
+        previous_record = latest[previous]
+        current_record = latest[current]
+        mode = (
+            "time"
+            if previous_record["benchmark"]["supports_time_limit"] and current_record["benchmark"]["supports_time_limit"]
+            else "depth"
+        )
+        previous_nps = per_position_nps(previous_record, mode)
+        current_nps = per_position_nps(current_record, mode)
+        positions = sorted(set(previous_nps) & set(current_nps))
+        if len(positions) < 2:
+            continue
+
+        # Positions differ far more from each other than repeats do, so pair on position and test the
+        # mean log-NPS ratio; a significant regression needs its one-sided 95% upper bound below zero.
+        log_ratios = np.array([math.log(current_nps[position] / previous_nps[position]) for position in positions])
+        mean = float(log_ratios.mean())
+        standard_error = float(log_ratios.std(ddof=1)) / math.sqrt(len(log_ratios))
+        upper_bound = mean + t_critical_one_sided_95(len(log_ratios) - 1) * standard_error
+        ratio = math.exp(mean)
+        comparisons.append(
+            {
+                "previous": previous,
+                "current": current,
+                "mode": mode,
+                "positions": len(positions),
+                "nps_ratio": ratio,
+                "nps_ratio_upper95": math.exp(upper_bound),
+                "previous_git_sha": previous_record["git_sha"],
+                "current_git_sha": current_record["git_sha"],
+                "regression": upper_bound < 0 and ratio < 1.0 - min_regression,
+            }
+        )
+    return comparisons
+
+
+def format_comparison(comparison: dict[str, Any]) -> str:
+    return (
+        f"{comparison['previous']} ({comparison['previous_git_sha']}) -> {comparison['current']} "
+        f"({comparison['current_git_sha']}): {comparison['mode']} NPS ratio {comparison['nps_ratio']:.3f} "
+        f"(upper95 {comparison['nps_ratio_upper95']:.3f}, {comparison['positions']} positions)"
+        f"{' REGRESSION' if comparison['regression'] else ''}"
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
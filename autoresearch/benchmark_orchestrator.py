@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""Timing suite for the orchestrator's own hot paths on synthetic, long-history fixtures.
+
+Each benchmark runs a real ``run_autoresearch`` function several times against generated files of
+the size a long-lived repo reaches: a 100k-game evaluation CSV (and its ``.evb`` companion), a
+10k-attempt ``ATTEMPTS.md``, a 5k-version ``CHANGELOG.json`` and a multi-GB console mirror. The
+orchestrator's path globals are pointed at the fixtures for the duration of a run, so nothing in the
+repo is touched. Median times are compared with the baseline recorded for this host, and any
+benchmark that slowed beyond the tolerance is reported as a regression and fails the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import datetime as dt
+import json
+import os
+import platform
+import re
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import run_autoresearch
+from evaluation_records import CSV_COLUMN_TYPES, format_double, write_companion
+from run_autoresearch import (
+    REPO_ROOT,
+    STATE_PATH,
+    TERMINATION_CODES,
+    append_attempt_markdown,
+    current_text_log_line_count,
+    emit_console,
+    latest_experiment_log_head_tail,
+    load_state,
+    log_phase,
+    next_candidate,
+    parse_evaluation_csv,
+    replace_latest_attempt_placeholders,
+    update_latest_approved_markdown,
+    upsert_changelog_version,
+    write_changelog,
+)
+
+
+BASELINE_DIR = REPO_ROOT / "autoresearch" / "benchmarks" / "orchestrator"
+DEFAULT_ROUNDS = 3
+DEFAULT_TOLERANCE = 0.25
+# Timings this close to the baseline are noise whatever the ratio says.
+MIN_REGRESSION_SECONDS = 0.005
+DEFAULT_EVALUATION_GAMES = 100_000
+DEFAULT_ATTEMPTS = 10_000
+DEFAULT_CHANGELOG_VERSIONS = 5_000
+DEFAULT_CONSOLE_LOG_MB = 2048
+DEFAULT_CONSOLE_MESSAGES = 200_000
+ATTEMPT_ENTRY_RE = re.compile(r"^## Attempt: \d", re.MULTILINE)
+CONSOLE_LOG_BENCHMARKS = ("current_text_log_line_count", "latest_experiment_log_head_tail")
+CONSOLE_LINE = (
+    "[LocalTesting] game 48213/100000 pair 24107 V4_0Engine vs Stockfish-1350 "
+    "1-0 checkmate plies=87 avg_move_ms=41.2\n"
+)
+
+
+@dataclass(frozen=True)
+class FixtureSizes:
+    evaluation_games: int
+    attempts: int
+    changelog_versions: int
+    console_log_mb: int
+    console_messages: int
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    run: Callable[[], object]
+    # Untimed; restores the fixture a benchmark mutates before each round.
+    setup: Callable[[], None] | None = None
+    # Work per round and its unit, for the throughput column.
+    units: float = 1.0
+    unit: str = "call"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    rounds: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    max_seconds: float
+    units: float
+    unit: str
+
+    @property
+    def throughput(self) -> float:
+        return self.units / max(self.median_seconds, 1e-12)
+
+
+def main() -> int:
+    args = parse_args()
+    sizes = FixtureSizes(
+        evaluation_games=max(2, int(DEFAULT_EVALUATION_GAMES * args.scale)),
+        attempts=max(1, int(DEFAULT_ATTEMPTS * args.scale)),
+        changelog_versions=max(1, int(DEFAULT_CHANGELOG_VERSIONS * args.scale)),
+        console_log_mb=args.console_log_mb,
+        console_messages=max(1, int(DEFAULT_CONSOLE_MESSAGES * args.scale)),
+    )
+    baseline_path = args.baseline or BASELINE_DIR / f"{platform.node() or 'unknown-host'}.json"
+
+    with fixture_dir(args.work_dir) as root:
+        log_phase(f"Generating fixtures in {root}: {format_sizes(sizes)}.")
+        benchmarks = build_benchmarks(root, sizes, args.only)
+        selected = [benchmark for benchmark in benchmarks if not args.only or benchmark.name in args.only]
+        unknown = sorted(set(args.only or []) - {benchmark.name for benchmark in benchmarks})
+        if unknown:
+            raise SystemExit(f"Unknown benchmark(s): {', '.join(unknown)}.")
+        results = []
+        with redirected_paths(root):
+            for benchmark in selected:
+                log_phase(f"Timing {benchmark.name} ({args.rounds} rounds).")
+                results.append(time_benchmark(benchmark, args.rounds))
+
+    baseline = load_baseline(baseline_path)
+    comparable = baseline is not None and baseline.get("sizes") == asdict(sizes)
+    if baseline is not None and not comparable:
+        log_phase(f"Baseline {display(baseline_path)} was recorded with other fixture sizes; not comparing.")
+    regressions = []
+    emit_console(format_header(), flush=True)
+    for result in results:
+        previous = baseline["results"].get(result.name) if comparable else None
+        regression = previous is not None and is_regression(result, previous, args.tolerance)
+        if regression:
+            regressions.append(result.name)
+        emit_console(format_result(result, previous, regression) + "\n", flush=True)
+
+    if args.record_baseline:
+        record_baseline(baseline_path, sizes, results, baseline if comparable else None)
+        log_phase(f"Recorded baseline for {len(results)} benchmark(s) at {display(baseline_path)}.")
+    elif baseline is None:
+        log_phase(f"No baseline at {display(baseline_path)}; rerun with --record-baseline to create one.")
+    if regressions:
+        log_phase(
+            f"REGRESSION: {', '.join(regressions)} slowed by more than {args.tolerance:.0%} against "
+            f"{display(baseline_path)}."
+        )
+        return 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time the orchestrator's hot paths on synthetic long-history fixtures.")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Timed calls per benchmark.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for the CSV, ATTEMPTS.md, CHANGELOG.json and emit_console fixture sizes.",
+    )
+    parser.add_argument(
+        "--console-log-mb",
+        type=int,
+        default=DEFAULT_CONSOLE_LOG_MB,
+        help="Size of the synthetic console mirror that the log-slicing benchmarks stream.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        help="Only run this benchmark, for example parse_evaluation_csv[csv]. May be repeated.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Median slowdown (fraction) over the baseline that fails the run.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Baseline JSON. Defaults to autoresearch/benchmarks/orchestrator/<host>.json.",
+    )
+    parser.add_argument(
+        "--record-baseline",
+        action="store_true",
+        help="Store these results as the baseline instead of only comparing against it.",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Directory for the fixtures, which are kept afterwards. Defaults to a temporary directory.",
+    )
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1.")
+    if args.scale <= 0 or args.console_log_mb < 1:
+        parser.error("--scale and --console-log-mb must be positive.")
+    return args
+
+
+@contextlib.contextmanager
+def fixture_dir(work_dir: Path | None) -> Iterator[Path]:
+    if work_dir is not None:
+        work_dir.mkdir(parents=True, exist_ok=True)
+        yield work_dir
+        return
+    with tempfile.TemporaryDirectory(prefix="orchestrator-benchmark-") as tmp:
+        yield Path(tmp)
+
+
+@contextlib.contextmanager
+def redirected_paths(root: Path) -> Iterator[None]:
+    """Point the orchestrator's file globals at the fixtures; every function reads them at call time."""
+    redirects = {
+        "STATE_PATH": root / "state.json",
+        "ATTEMPTS_PATH": root / "ATTEMPTS.md",
+        "CHANGELOG_PATH": root / "CHANGELOG.json",
+        "CURRENT_TEXT_LOG": root / "console-log.txt",
+    }
+    saved = {name: getattr(run_autoresearch, name) for name in redirects}
+    for name, path in redirects.items():
+        setattr(run_autoresearch, name, path)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(run_autoresearch, name, value)
+
+
+def build_benchmarks(root: Path, sizes: FixtureSizes, only: list[str] | None) -> list[Benchmark]:
+    rng = np.random.default_rng(1350)
+    state = load_state()
+    shutil.copyfile(STATE_PATH, root / "state.json")
+    csv_dir = root / "csv"
+    evb_dir = root / "evb"
+    csv_dir.mkdir(exist_ok=True)
+    evb_dir.mkdir(exist_ok=True)
+    csv_path = csv_dir / "benchmark-result.csv"
+    write_evaluation_csv(csv_path, sizes.evaluation_games, rng)
+    evb_csv_path = evb_dir / csv_path.name
+    shutil.copyfile(csv_path, evb_csv_path)
+    write_companion(evb_csv_path)
+    metrics = parse_evaluation_csv(csv_path, state)
+
+    attempts_fixture = root / "ATTEMPTS.fixture.md"
+    write_attempts(attempts_fixture, sizes.attempts, rng)
+    changelog_fixture = root / "CHANGELOG.fixture.json"
+    write_changelog_fixture(changelog_fixture, sizes.changelog_versions)
+    console_log = root / "console-log.txt"
+    # Writing gigabytes takes a while; skip it when no selected benchmark reads the console log.
+    needs_console_log = not only or any(name in only for name in CONSOLE_LOG_BENCHMARKS)
+    write_console_log(console_log, sizes.console_log_mb if needs_console_log else 0)
+    console_lines = count_lines(console_log)
+
+    candidate = next_candidate(state, "v9999.0", False)
+    attempt_note = {
+        "hypotheses": ["Synthetic hypothesis for the orchestrator benchmark."],
+        "implementation_summary": "Synthetic attempt appended by benchmark_orchestrator.py.",
+    }
+    latest = {**state["latest_approved"], "notes": "Rewritten by benchmark_orchestrator.py."}
+
+    def restore(fixture: Path, target: str) -> Callable[[], None]:
+        return lambda: shutil.copyfile(fixture, root / target)
+
+    def emit_round() -> None:
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            for _ in range(sizes.console_messages):
+                emit_console(CONSOLE_LINE, stream=sink)
+
+    def truncate_console_log() -> None:
+        (root / "emit-console-log.txt").write_bytes(b"")
+        run_autoresearch.CURRENT_TEXT_LOG = root / "emit-console-log.txt"
+
+    def reset_console_log() -> None:
+        run_autoresearch.CURRENT_TEXT_LOG = console_log
+
+    console_mb = console_log.stat().st_size / 1_000_000
+    return [
+        Benchmark(
+            "parse_evaluation_csv[csv]",
+            lambda: parse_evaluation_csv(csv_path, state),
+            units=sizes.evaluation_games,
+            unit="games",
+        ),
+        Benchmark(
+            "parse_evaluation_csv[evb]",
+            lambda: parse_evaluation_csv(evb_csv_path, state),
+            units=sizes.evaluation_games,
+            unit="games",
+        ),
+        Benchmark(
+            "upsert_changelog_version",
+            lambda: upsert_changelog_version(candidate, "rejected", attempt_note, metrics, None, "<n/a>"),
+            setup=restore(changelog_fixture, "CHANGELOG.json"),
+            units=sizes.changelog_versions,
+            unit="versions",
+        ),
+        Benchmark(
+            "update_latest_approved_markdown",
+            lambda: update_latest_approved_markdown(latest),
+            setup=restore(attempts_fixture, "ATTEMPTS.md"),
+            units=sizes.attempts,
+            unit="attempts",
+        ),
+        Benchmark(
+            "replace_latest_attempt_placeholders",
+            lambda: replace_latest_attempt_placeholders("abc1234", "autoresearch/approved_logs/abc1234-result.csv"),
+            setup=restore(attempts_fixture, "ATTEMPTS.md"),
+            units=sizes.attempts,
+            unit="attempts",
+        ),
+        Benchmark(
+            "current_text_log_line_count",
+            current_text_log_line_count,
+            setup=reset_console_log,
+            units=console_mb,
+            unit="MB",
+        ),
+        Benchmark(
+            "latest_experiment_log_head_tail",
+            # Slice from the middle of the log, as an attempt that started halfway through a run would.
+            lambda: latest_experiment_log_head_tail(console_lines // 2),
+            setup=reset_console_log,
+            units=console_mb,
+            unit="MB",
+        ),
+        Benchmark(
+            "emit_console",
+            emit_round,
+            setup=truncate_console_log,
+            units=sizes.console_messages,
+            unit="lines",
+        ),
+    ]
+
+
+def write_evaluation_csv(path: Path, games: int, rng: np.random.Generator) -> None:
+    """A LocalTesting-shaped result CSV: paired games, colour swapped within each pair."""
+    columns = list(CSV_COLUMN_TYPES)
+    game_numbers = np.arange(1, games + 1)
+    scores = rng.choice([0.0, 0.5, 1.0], size=games, p=[0.45, 0.2, 0.35])
+    terminations = rng.choice(list(TERMINATION_CODES), size=games, p=[0.6, 0.36, 0.01, 0.02, 0.01])
+    plies = rng.integers(20, 300, size=games)
+    move_ms = rng.gamma(4.0, 10.0, size=(games, 2))
+    positions = rng.gamma(4.0, 50_000.0, size=(games, 2))
+    started = 1_760_000_000_000 + game_numbers * 9_000
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(columns)
+        for index in range(games):
+            engine_a_white = index % 2 == 0
+            termination = str(terminations[index])
+            failed = termination in ("illegal_move", "timeout", "engine_exception")
+            white_ms, black_ms = (round(float(value), 3) for value in move_ms[index])
+            white_positions, black_positions = (round(float(value), 1) for value in positions[index])
+            values = {
+                "commit_short_sha": "abc1234",
+                "game_number": int(game_numbers[index]),
+                "pair_number": index // 2 + 1,
+                "opening_index": (index // 2) % 5000,
+                "engine_a_was_white": "true" if engine_a_white else "false",
+                "white_engine": "V9999_0Engine" if engine_a_white else "Stockfish-1350",
+                "black_engine": "Stockfish-1350" if engine_a_white else "V9999_0Engine",
+                "result": {1.0: "1-0", 0.5: "1/2-1/2", 0.0: "0-1"}[float(scores[index])],
+                "termination_reason": termination,
+                "plies": int(plies[index]),
+                "engine_a_score": float(scores[index]),
+                "white_moves": int(plies[index]) // 2,
+                "black_moves": int(plies[index]) // 2,
+                "white_total_positions": int(white_positions * 40),
+                "black_total_positions": int(black_positions * 40),
+                "white_average_positions": white_positions,
+                "black_average_positions": black_positions,
+                "white_average_move_ms": white_ms,
+                "black_average_move_ms": black_ms,
+                "game_elapsed_ms": round((white_ms + black_ms) * int(plies[index]) / 2, 3),
+                "failure_engine": "V9999_0Engine" if failed else "",
+                "failure_message": f"Synthetic {termination}." if failed else "",
+                "opening_fen": "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1",
+                "game_started_unix_ms": int(started[index]),
+                "game_finished_unix_ms": int(started[index]) + 8_000,
+            }
+            for side, ms in (("white", white_ms), ("black", black_ms)):
+                for name, factor in (("p50", 0.9), ("p95", 1.8), ("p99", 2.5), ("max", 3.0)):
+                    values[f"{side}_move_ms_{name}"] = round(ms * factor, 3)
+            # Doubles are written the way .NET formats them, so the .evb companion round-trips exactly.
+            writer.writerow(
+                [format_double(value) if isinstance(value, float) else value for value in map(values.get, columns)]
+            )
+
+
+def write_attempts(path: Path, attempts: int, rng: np.random.Generator) -> None:
+    """The real ATTEMPTS.md preamble plus ``attempts`` entries written by the orchestrator's own formatter."""
+    template = run_autoresearch.ATTEMPTS_PATH
+    text = template.read_text(encoding="utf-8")
+    first_attempt = ATTEMPT_ENTRY_RE.search(text)
+    preamble = text[: first_attempt.start()] if first_attempt is not None else text
+    # update_latest_approved_markdown only rewrites an existing seed section, so start the file with one.
+    preamble = preamble.replace(
+        "## Entry Template",
+        "## Latest Approved Engine Seed\n\n- approved_version: `<pending>`\n\n## Entry Template",
+        1,
+    )
+    path.write_text(preamble.rstrip("\n"), encoding="utf-8")
+    run_autoresearch.ATTEMPTS_PATH = path
+    try:
+        for index in range(attempts):
+            last = index == attempts - 1
+            wins, draws = (int(value) for value in rng.integers(0, 100, size=2))
+            losses = 200 - wins - draws
+            append_attempt_markdown(
+                {
+                    "timestamp": (dt.datetime(2025, 1, 1) + dt.timedelta(hours=index)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "status": "rejected" if not last and index % 7 else "approved",
+                    "commit": "<pending>" if last else f"{index:07x}",
+                    "evaluator_baseline": "stockfish-1350",
+                    "seed_version": f"v{index // 100 + 1}.{index % 100}",
+                    "seed_file": "engine_csharp/src/Engine.Core/V4/V4_0Engine.cs",
+                    "candidate_version": f"v{(index + 1) // 100 + 1}.{(index + 1) % 100}",
+                    "version_bump": "minor",
+                    "direction": "search-pruning",
+                    "hypotheses": [f"Synthetic hypothesis {index}.{item}" for item in range(3)],
+                    "implementation_summary": f"Synthetic attempt {index} for benchmark_orchestrator.py.",
+                    "evaluation_log_path": "<pending>" if last else "<n/a>",
+                    "metrics": {
+                        "wins": wins,
+                        "draws": draws,
+                        "losses": losses,
+                        "score": wins + draws / 2,
+                        "score_rate": (wins + draws / 2) / 200,
+                        "average_plies": 90.5,
+                        "average_processing_time_ms": 41.2,
+                        "average_positions_or_nodes": 210_000.0,
+                    },
+                    "inferred_conclusion": "Synthetic conclusion.",
+                }
+            )
+    finally:
+        run_autoresearch.ATTEMPTS_PATH = template
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n")
+
+
+def write_changelog_fixture(path: Path, versions: int) -> None:
+    entries = []
+    for index in range(versions):
+        version = f"v{index // 100 + 1}.{index % 100}"
+        major, minor = index // 100 + 1, index % 100
+        entries.append(
+            {
+                "version": version,
+                "api_version": version.replace(".", "_"),
+                "engine_file": f"engine_csharp/src/Engine.Core/V{major}/V{major}_{minor}Engine.cs",
+                "served": index % 50 == 0,
+                "status": "approved" if index % 7 == 0 else "rejected",
+                "commit": f"{index:07x}",
+                "hypotheses": [f"Synthetic hypothesis {index}.{item}" for item in range(3)],
+                "summary": f"Synthetic version {index}.",
+                "implementation_summary": f"Synthetic version {index}.",
+                "evaluation_log_path": f"autoresearch/approved_logs/{index:07x}-result.csv",
+                "evaluation_opponents": {
+                    "stockfish-1350": {
+                        "games": 200,
+                        "wins": 80,
+                        "draws": 40,
+                        "losses": 80,
+                        "score": 100.0,
+                        "score_rate": 0.5,
+                        "text": f"C# {version} scored 100.0/200 against Stockfish (1350 Elo).",
+                    },
+                },
+                "limitations": [],
+            }
+        )
+    changelog = {
+        "schema_version": 2,
+        "generated_from": "autoresearch/benchmark_orchestrator.py",
+        "evaluation_opponents": {"stockfish-1350": {"name": "Stockfish", "elo": 1350}},
+        "versions": entries,
+    }
+    # write_changelog targets CHANGELOG_PATH, so format the fixture the same way through it.
+    target = run_autoresearch.CHANGELOG_PATH
+    run_autoresearch.CHANGELOG_PATH = path
+    try:
+        write_changelog(changelog)
+    finally:
+        run_autoresearch.CHANGELOG_PATH = target
+
+
+def write_console_log(path: Path, megabytes: int) -> None:
+    chunk = (CONSOLE_LINE * (1_000_000 // len(CONSOLE_LINE) + 1)).encode("utf-8")
+    target = megabytes * 1_000_000
+    with path.open("wb") as handle:
+        written = 0
+        while written < target:
+            handle.write(chunk)
+            written += len(chunk)
+
+
+def count_lines(path: Path) -> int:
+    with path.open("rb") as handle:
+        return sum(block.count(b"\n") for block in iter(lambda: handle.read(1 << 20), b""))
+
+
+def time_benchmark(benchmark: Benchmark, rounds: int) -> BenchmarkResult:
+    timings = []
+    for _ in range(rounds):
+        if benchmark.setup is not None:
+            benchmark.setup()
+        started = time.perf_counter()
+        benchmark.run()
+        timings.append(time.perf_counter() - started)
+    values = np.asarray(timings)
+    return BenchmarkResult(
+        name=benchmark.name,
+        rounds=rounds,
+        min_seconds=float(values.min()),
+        median_seconds=float(np.median(values)),
+        mean_seconds=float(values.mean()),
+        max_seconds=float(values.max()),
+        units=float(benchmark.units),
+        unit=benchmark.unit,
+    )
+
+
+def is_regression(result: BenchmarkResult, previous: dict[str, Any], tolerance: float) -> bool:
+    baseline_seconds = float(previous["median_seconds"])
+    return (
+        result.median_seconds > baseline_seconds * (1.0 + tolerance)
+        and result.median_seconds - baseline_seconds > MIN_REGRESSION_SECONDS
+    )
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def record_baseline(
+    path: Path,
+    sizes: FixtureSizes,
+    results: list[BenchmarkResult],
+    previous: dict[str, Any] | None,
+) -> None:
+    # A partial run (--only) keeps the other benchmarks' baselines.
+    stored = dict(previous["results"]) if previous is not None else {}
+    stored.update({result.name: asdict(result) for result in results})
+    record = {
+        "recorded_at": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "git_sha": run_autoresearch.run(["git", "rev-parse", "--short", "HEAD"], check=True, capture=True).stdout.strip(),
+        "host": {
+            "node": platform.node(),
+            "cpu_count": os.cpu_count(),
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+        },
+        "sizes": asdict(sizes),
+        "results": stored,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+
+
+def format_sizes(sizes: FixtureSizes) -> str:
+    return (
+        f"{sizes.evaluation_games} games, {sizes.attempts} attempts, {sizes.changelog_versions} versions, "
+        f"{sizes.console_log_mb} MB console log, {sizes.console_messages} emit_console lines"
+    )
+
+
+def format_header() -> str:
+    return f"\n{'benchmark':<38} {'median':>10} {'min':>10} {'max':>10} {'throughput':>22}  baseline\n"
+
+
+def format_result(result: BenchmarkResult, previous: dict[str, Any] | None, regression: bool) -> str:
+    line = (
+        f"{result.name:<38} {format_seconds(result.median_seconds):>10} {format_seconds(result.min_seconds):>10} "
+        f"{format_seconds(result.max_seconds):>10} {f'{result.throughput:,.0f} {result.unit}/s':>22}"
+    )
+    if previous is None:
+        return line + "  n/a"
+    ratio = result.median_seconds / max(float(previous["median_seconds"]), 1e-12)
+    return line + f"  {format_seconds(float(previous['median_seconds']))} ({ratio:.2f}x){' REGRESSION' if regression else ''}"
+
+
+def format_seconds(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+
+def display(path: Path) -> Path:
+    return path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
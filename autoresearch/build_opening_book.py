@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Compile Openings.lookup.tsv into the memory-mapped binary opening book.
+
+Binary layout (little-endian), read by engine_csharp/src/Engine.Core/OpeningBookIndex.cs:
+
+    header   32 bytes  magic "OBK1", u32 format version, u32 position count, u32 move count,
+                       u64 source TSV length, u64 FNV-1a hash of the source TSV bytes
+    entries  16 bytes  u64 position key, u32 first move index, u16 move count, u16 reserved;
+                       sorted by key
+    moves     2 bytes  u16 packed move: from square (bits 0-5), to square (bits 6-11),
+                       promotion piece (bits 12-14: 0 none, 1 n, 2 b, 3 r, 4 q)
+
+The position key is the same 64-bit hash BoardState.TranspositionKey uses (ZobristHash.Compute:
+FNV-1a over the normalized four-field FEN key), so a lookup needs no string work at all.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+from pathlib import Path
+
+from run_autoresearch import REPO_ROOT, log_phase, run
+
+
+LOOKUP_TSV_PATH = REPO_ROOT / "Openings.lookup.tsv"
+LOOKUP_BIN_PATH = REPO_ROOT / "Openings.lookup.bin"
+MAGIC = b"OBK1"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIQQ")
+ENTRY = struct.Struct("<QIHH")
+FNV_OFFSET_BASIS = 14695981039346656037
+FNV_PRIME = 1099511628211
+UINT64_MASK = (1 << 64) - 1
+PROMOTION_CODES = {"": 0, "n": 1, "b": 2, "r": 3, "q": 4}
+
+
+def main() -> int:
+    args = parse_args()
+    if args.rebuild_lookup:
+        log_phase("Rebuilding Openings.lookup.tsv with LocalTesting build-openings-lookup.")
+        run(
+            ["dotnet", "run", "-c", "Release", "--project", "engine_csharp/src/LocalTesting", "--", "build-openings-lookup"],
+            cwd=REPO_ROOT,
+            check=True,
+        )
+
+    source = Path(args.input)
+    output = Path(args.output)
+    positions, moves = build_opening_book(source, output)
+    log_phase(
+        f"Wrote {output.relative_to(REPO_ROOT) if output.is_relative_to(REPO_ROOT) else output}: "
+        f"{positions} positions, {moves} moves, {output.stat().st_size} bytes "
+        f"(TSV {source.stat().st_size} bytes)."
+    )
+
+    if args.benchmark:
+        run(
+            [
+                "dotnet",
+                "run",
+                "-c",
+                "Release",
+                "--project",
+                "engine_csharp/src/LocalTesting",
+                "--",
+                "benchmark-opening-book",
+                "--tsv",
+                str(source),
+                "--bin",
+                str(output),
+            ],
+            cwd=REPO_ROOT,
+            check=True,
+        )
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compile the opening lookup TSV into a binary opening book.")
+    parser.add_argument("--input", default=str(LOOKUP_TSV_PATH), help="Source lookup TSV.")
+    parser.add_argument("--output", default=str(LOOKUP_BIN_PATH), help="Binary book to write.")
+    parser.add_argument(
+        "--rebuild-lookup",
+        action="store_true",
+        help="Regenerate Openings.lookup.tsv from Openings.txt with LocalTesting first.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Afterwards compare load time, memory and lookup latency of both formats with LocalTesting.",
+    )
+    return parser.parse_args()
+
+
+def fnv1a64(data: bytes) -> int:
+    value = FNV_OFFSET_BASIS
+    for byte in data:
+        value = ((value ^ byte) * FNV_PRIME) & UINT64_MASK
+    return value
+
+
+def square_index(square: str) -> int:
+    file_index = ord(square[0]) - ord("a")
+    rank_index = int(square[1]) - 1
+    if not (0 <= file_index < 8 and 0 <= rank_index < 8):
+        raise ValueError(f"Invalid square {square!r}.")
+    return rank_index * 8 + file_index
+
+
+def pack_move(uci: str) -> int:
+    if len(uci) not in (4, 5) or uci[4:] not in PROMOTION_CODES:
+        raise ValueError(f"Invalid UCI move {uci!r}.")
+    return square_index(uci[0:2]) | (square_index(uci[2:4]) << 6) | (PROMOTION_CODES[uci[4:]] << 12)
+
+
+def read_lookup_tsv(path: Path) -> dict[str, list[str]]:
+    # Mirrors OpeningBook.LoadLookup: skip comments and malformed rows, de-duplicate moves in order.
+    lookup: dict[str, list[str]] = {}
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        columns = line.split("\t")
+        if len(columns) != 2:
+            continue
+        moves = list(dict.fromkeys(move.strip() for move in columns[1].split(",") if move.strip()))
+        if moves:
+            lookup[columns[0]] = moves
+    return lookup
+
+
+def build_opening_book(source: Path, output: Path) -> tuple[int, int]:
+    if not source.exists():
+        raise SystemExit(f"Opening lookup not found: {source}")
+    source_bytes = source.read_bytes()
+    lookup = read_lookup_tsv(source)
+
+    keyed: dict[int, tuple[str, list[str]]] = {}
+    for fen_key, moves in lookup.items():
+        # Normalized FEN keys are ASCII, so hashing bytes matches C#'s hashing of UTF-16 chars.
+        key = fnv1a64(fen_key.encode("ascii"))
+        if key in keyed:
+            raise SystemExit(f"64-bit key collision between {keyed[key][0]!r} and {fen_key!r}.")
+        keyed[key] = (fen_key, moves)
+
+    entries = bytearray()
+    packed_moves: list[int] = []
+    for key in sorted(keyed):
+        _, moves = keyed[key]
+        if len(moves) > 0xFFFF:
+            raise SystemExit(f"Too many moves for one position: {len(moves)}.")
+        entries += ENTRY.pack(key, len(packed_moves), len(moves), 0)
+        packed_moves.extend(pack_move(move) for move in moves)
+
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(keyed),
+        len(packed_moves),
+        len(source_bytes),
+        fnv1a64(source_bytes),
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(header + bytes(entries) + struct.pack(f"<{len(packed_moves)}H", *packed_moves))
+    return len(keyed), len(packed_moves)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Measure run-to-run noise of the approved seed and cache a noise model for decide_candidate."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from evaluation_records import companion_path
+from run_autoresearch import (
+    NOISE_MODELS_PATH,
+    REPO_ROOT,
+    approved_reference_score_rate,
+    evaluator_command,
+    format_float,
+    load_noise_models,
+    load_state,
+    log_phase,
+    noise_model_config,
+    noise_model_key,
+    noise_rule_pass_rates,
+    noise_run_sd,
+    parse_evaluation_csv,
+    resolve_stockfish_path,
+    run,
+    run_build,
+)
+
+
+DEFAULT_RUNS = 4
+LOG_DIR = REPO_ROOT / "autoresearch" / "logs"
+
+
+def main() -> int:
+    args = parse_args()
+    state = load_state()
+    seed = state["latest_approved"]
+    engine_file = REPO_ROOT / seed["engine_file"]
+    workers = args.workers or int(state["evaluator"]["workers"])
+    games = args.games or int(state["evaluator"]["games"])
+    if args.runs < 2:
+        raise SystemExit("--runs must be at least 2 to separate run-to-run drift from sampling noise.")
+    if games < 4 or games % 2:
+        raise SystemExit("--games must be an even number of at least 4.")
+    stockfish_path = resolve_stockfish_path()
+    if stockfish_path is None:
+        raise SystemExit("Stockfish binary not found at autoresearch/stockfish/stockfish-ubuntu-x86-64-avx2.")
+    if not args.skip_build and not run_build():
+        raise SystemExit("Build failed.")
+
+    stamp = dt.datetime.now(dt.timezone.utc).strftime("%m%d%H%M%S")
+    log_phase(f"Calibrating {seed['version']} vs Stockfish: {args.runs} runs x {games} games, {workers} workers.")
+    stockfish_runs = [
+        run_calibration(
+            state,
+            engine_file,
+            f"calib-{stamp}-sf{index}",
+            games,
+            workers,
+            stockfish_path=stockfish_path,
+            keep_log=args.keep_logs,
+        )
+        for index in range(1, args.runs + 1)
+    ]
+    self_play_runs = []
+    if args.self_play_runs:
+        log_phase(f"Calibrating {seed['version']} vs itself: {args.self_play_runs} runs x {games} games.")
+        self_play_runs = [
+            run_calibration(
+                state,
+                engine_file,
+                f"calib-{stamp}-self{index}",
+                games,
+                workers,
+                opponent_engine_file=engine_file,
+                keep_log=args.keep_logs,
+            )
+            for index in range(1, args.self_play_runs + 1)
+        ]
+
+    config = noise_model_config(state, workers)
+    model = {
+        **fit_noise_model(stockfish_runs),
+        "config": config,
+        "calibrated_at": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "games_per_run": games,
+        "reference_score_rate": approved_reference_score_rate(state),
+        "self_play": fit_noise_model(self_play_runs) if len(self_play_runs) >= 2 else None,
+    }
+    models = load_noise_models()
+    models[noise_model_key(config)] = model
+    NOISE_MODELS_PATH.write_text(json.dumps(models, indent=2) + "\n", encoding="utf-8")
+    log_phase(f"Stored noise model in {NOISE_MODELS_PATH.relative_to(REPO_ROOT)}.")
+    log_phase(format_calibration(model, state, int(state["evaluator"]["games"])))
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run the approved seed repeatedly under the current evaluator settings and fit a noise model."
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="Seed vs Stockfish runs.")
+    parser.add_argument("--self-play-runs", type=int, default=0, help="Optional seed vs seed runs.")
+    parser.add_argument("--games", type=int, help="Games per run. Defaults to evaluator.games.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Evaluator workers. Defaults to evaluator.workers; the model is cached per worker count.",
+    )
+    parser.add_argument("--skip-build", action="store_true", help="Reuse the current build output.")
+    parser.add_argument("--keep-logs", action="store_true", help="Keep the calibration CSVs in autoresearch/logs.")
+    return parser.parse_args()
+
+
+def run_calibration(
+    state: dict[str, Any],
+    engine_file: Path,
+    attempt_id: str,
+    games: int,
+    workers: int,
+    *,
+    stockfish_path: Path | None = None,
+    opponent_engine_file: Path | None = None,
+    keep_log: bool,
+) -> dict[str, float]:
+    command = evaluator_command(
+        engine_file,
+        state,
+        attempt_id,
+        games,
+        workers,
+        stockfish_path=stockfish_path,
+        opponent_engine_file=opponent_engine_file,
+    )
+    log_path = LOG_DIR / f"{attempt_id}-result.csv"
+    result = run(command, cwd=REPO_ROOT, check=False)
+    if not log_path.exists():
+        raise SystemExit(f"Calibration run {attempt_id} did not produce {log_path.relative_to(REPO_ROOT)}.")
+    if result.returncode != 0:
+        # A failed game still counts as noise the approval run would see; only a missing CSV is fatal.
+        log_phase(f"Calibration run {attempt_id} reported evaluator failures; keeping its results.")
+    metrics = parse_evaluation_csv(log_path, state)
+    if not keep_log:
+        log_path.unlink()
+        companion_path(log_path).unlink(missing_ok=True)
+    log_phase(
+        f"{attempt_id}: score_rate={metrics.score_rate:.4f}, pair_sd={metrics.pair_sd:.4f}, "
+        f"max_plies_rate={metrics.max_plies_rate:.4f}."
+    )
+    return {
+        "score_rate": metrics.score_rate,
+        "pair_sd": metrics.pair_sd,
+        "pairs": metrics.games // 2,
+        "max_plies_rate": metrics.max_plies_rate,
+    }
+
+
+def fit_noise_model(runs: list[dict[str, float]]) -> dict[str, Any]:
+    """Split the spread of run score rates into pair-sampling noise and run-to-run drift.
+
+    Pooled per-pair variance gives the sampling error each run should have; whatever variance
+    the run means show beyond that is attributed to drift between runs (load, clocks, thermal).
+    """
+    score_rates = np.array([item["score_rate"] for item in runs])
+    pair_variances = np.array([item["pair_sd"] ** 2 for item in runs])
+    pairs = np.array([item["pairs"] for item in runs], dtype=np.float64)
+    pooled_pair_variance = float(np.sum(pair_variances * (pairs - 1)) / np.sum(pairs - 1))
+    expected_sampling_variance = float(np.mean(pooled_pair_variance / pairs))
+    observed_variance = float(score_rates.var(ddof=1))
+    return {
+        "runs": len(runs),
+        "run_score_rates": [round(float(value), 6) for value in score_rates],
+        "score_rate_mean": float(score_rates.mean()),
+        "score_rate_sd": math.sqrt(observed_variance),
+        "pair_sd": math.sqrt(pooled_pair_variance),
+        "between_run_sd": math.sqrt(max(0.0, observed_variance - expected_sampling_variance)),
+        "max_plies_rate_mean": float(np.mean([item["max_plies_rate"] for item in runs])),
+    }
+
+
+def format_calibration(model: dict[str, Any], state: dict[str, Any], games: int) -> str:
+    rates = noise_rule_pass_rates(model, state, games)
+    lines = [
+        f"Seed {model['config']['seed_version']} vs Stockfish over {model['runs']} runs: score_rate "
+        f"{model['score_rate_mean']:.4f} (stored reference {format_float(model['reference_score_rate'])}), run sd "
+        f"{model['score_rate_sd']:.4f}, pair sd {model['pair_sd']:.4f}, between-run sd {model['between_run_sd']:.4f}.",
+        f"At {games} games an unchanged seed scores within +/- {noise_run_sd(model, games):.4f} (1 sd) and passes "
+        f"score_rate {rates['score_rate']:.1%}, lcb95 {rates['lcb95']:.1%}, "
+        f"max_plies_rate {rates['max_plies_rate']:.1%}, all rules {rates['all']:.1%} of the time.",
+    ]
+    self_play = model.get("self_play")
+    if self_play is not None:
+        lines.append(
+            f"Seed vs seed over {self_play['runs']} runs: score_rate {self_play['score_rate_mean']:.4f} "
+            f"(expected 0.5000), run sd {self_play['score_rate_sd']:.4f}, between-run sd {self_play['between_run_sd']:.4f}."
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,234 @@
+"""Pooled HTTP client for the chess API, with automatic request batching."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT_SECONDS = 30.0
+# Matches MaxBatchItems in Engine.Functions/ChessFunction.cs.
+MAX_BATCH_ITEMS = 64
+DEFAULT_BATCH_WINDOW_SECONDS = 0.005
+
+
+@dataclass
+class _PendingMove:
+    payload: dict[str, Any]
+    future: Future[dict[str, Any]] = field(default_factory=Future)
+
+
+class ChessApiClient:
+    """Thread-safe client that keeps up to ``pool_size`` keep-alive connections open.
+
+    ``move`` and ``moves`` are blocking calls. ``submit`` returns a future and queues the FEN;
+    a background thread collects submissions per version for up to ``batch_window_seconds``
+    (or ``max_batch`` items) and sends them as one ``/batch`` request, so callers that fan out
+    many positions get batching without managing it themselves.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_batch: int = MAX_BATCH_ITEMS,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        parsed = urllib.parse.urlsplit(base_url.rstrip("/"))
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme in {base_url!r}.")
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname or "127.0.0.1"
+        self._port = parsed.port
+        self._prefix = parsed.path
+        self._timeout = timeout
+        self._max_batch = max(1, min(max_batch, MAX_BATCH_ITEMS))
+        self._batch_window_seconds = batch_window_seconds
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="chess-api")
+        self._pending: dict[str, list[_PendingMove]] = {}
+        self._pending_lock = threading.Condition()
+        self._batcher: threading.Thread | None = None
+        self._closed = False
+
+    def __enter__(self) -> ChessApiClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._pending_lock:
+            self._closed = True
+            self._pending_lock.notify_all()
+        if self._batcher is not None:
+            self._batcher.join()
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> tuple[int, dict[str, Any] | None]:
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        with self._slots:
+            connection, reused = self._acquire()
+            try:
+                response, raw = exchange(connection, method, self._prefix + path, body, headers)
+            except ConnectionError:
+                # An idle keep-alive connection the server already closed fails on first use;
+                # retry once on a fresh connection. Timeouts and fresh connections are not retried.
+                connection.close()
+                if not reused:
+                    raise
+                connection = self._connect()
+                try:
+                    response, raw = exchange(connection, method, self._prefix + path, body, headers)
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    raise
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+        try:
+            return response.status, json.loads(raw) if raw else None
+        except json.JSONDecodeError:
+            return response.status, None
+
+    def move(
+        self,
+        version: str,
+        fen: str,
+        *,
+        context_id: str | None = None,
+        reset_context: bool = False,
+    ) -> tuple[int, dict[str, Any] | None]:
+        return self.request("POST", f"/api/chess/{version}", move_payload(fen, context_id, reset_context))
+
+    def moves(self, version: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Search many items (``fen`` plus optional ``context_id``) with as few batch calls as possible.
+
+        Chunks are sent concurrently over the pool; results come back in input order.
+        """
+        chunks = [items[start : start + self._max_batch] for start in range(0, len(items), self._max_batch)]
+        futures = [self._executor.submit(self._send_batch, version, chunk) for chunk in chunks]
+        results = [result for future in futures for result in future.result()]
+        for index, result in enumerate(results):
+            result["index"] = index
+        return results
+
+    def submit(
+        self,
+        version: str,
+        fen: str,
+        *,
+        context_id: str | None = None,
+        reset_context: bool = False,
+    ) -> Future[dict[str, Any]]:
+        pending = _PendingMove(move_payload(fen, context_id, reset_context))
+        with self._pending_lock:
+            if self._closed:
+                raise RuntimeError("ChessApiClient is closed.")
+            self._pending.setdefault(version, []).append(pending)
+            if self._batcher is None:
+                self._batcher = threading.Thread(target=self._run_batcher, name="chess-api-batcher", daemon=True)
+                self._batcher.start()
+            self._pending_lock.notify_all()
+        return pending.future
+
+    def _run_batcher(self) -> None:
+        while True:
+            with self._pending_lock:
+                while not self._pending and not self._closed:
+                    self._pending_lock.wait()
+                if not self._pending and self._closed:
+                    return
+                # Give concurrent submitters one short window to join the batch unless it is full.
+                deadline = time.monotonic() + self._batch_window_seconds
+                while (
+                    not self._closed
+                    and max(len(items) for items in self._pending.values()) < self._max_batch
+                    and (remaining := deadline - time.monotonic()) > 0
+                ):
+                    self._pending_lock.wait(remaining)
+                ready: list[tuple[str, list[_PendingMove]]] = []
+                for version in list(self._pending):
+                    items = self._pending[version]
+                    ready.append((version, items[: self._max_batch]))
+                    if len(items) > self._max_batch:
+                        self._pending[version] = items[self._max_batch :]
+                    else:
+                        del self._pending[version]
+            for version, batch in ready:
+                self._executor.submit(self._dispatch_batch, version, batch)
+
+    def _dispatch_batch(self, version: str, batch: list[_PendingMove]) -> None:
+        try:
+            results = self._send_batch(version, [item.payload for item in batch])
+        except Exception as exc:
+            for item in batch:
+                item.future.set_exception(exc)
+            return
+        for item, result in zip(batch, results):
+            item.future.set_result(result)
+
+    def _send_batch(self, version: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if len(items) == 1:
+            # A lone item gains nothing from the batch endpoint, and the single route keeps the
+            # full per-move budget.
+            status, body = self.request("POST", f"/api/chess/{version}", items[0])
+            return [{**(body or {}), "index": 0, "status": status}]
+        status, body = self.request("POST", f"/api/chess/{version}/batch", {"items": items})
+        if status != 200 or body is None or "results" not in body:
+            error = (body or {}).get("error", f"http_{status}")
+            return [{"error": error, "index": index, "status": status} for index in range(len(items))]
+        return list(body["results"])
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+
+
+def exchange(
+    connection: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    body: bytes | None,
+    headers: dict[str, str],
+) -> tuple[http.client.HTTPResponse, bytes]:
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def move_payload(fen: str, context_id: str | None, reset_context: bool) -> dict[str, Any]:
+    payload: dict[str, Any] = {"fen": fen}
+    if context_id is not None:
+        payload["context_id"] = context_id
+    if reset_context:
+        payload["reset_context"] = True
+    return payload
@@ -0,0 +1,174 @@
+"""Codex token usage ledger and quota pacing.
+
+Every Codex turn appends one ``turn`` line to ``codex_usage.jsonl``, and every usage-limit error
+appends a ``limit`` line. Rolling-window totals over that ledger, together with the cost of recent
+attempts, tell the orchestrator whether the next attempt fits in the remaining quota or how long
+to wait until enough usage has aged out of the window.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+TOKEN_FIELDS = ("input_tokens", "cached_input_tokens", "output_tokens", "reasoning_output_tokens", "total_tokens")
+CAMEL_CASE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@dataclass(frozen=True)
+class UsageEntry:
+    kind: str  # "turn" or "limit"
+    unix_ms: int
+    candidate: str
+    attempt_key: str
+    label: str
+    status: str
+    tokens: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return int(self.tokens.get("total_tokens", 0))
+
+
+@dataclass(frozen=True)
+class QuotaWindow:
+    name: str
+    hours: float
+    # None until configured or learned from a usage-limit error.
+    tokens: int | None
+    learned: bool
+
+
+@dataclass(frozen=True)
+class WindowStatus:
+    window: QuotaWindow
+    used_tokens: int
+    wait_seconds: float
+
+
+@dataclass(frozen=True)
+class QuotaPlan:
+    expected_tokens: int | None
+    cost_percentile: float
+    attempts_sampled: int
+    windows: tuple[WindowStatus, ...]
+
+    @property
+    def wait_seconds(self) -> float:
+        return max((status.wait_seconds for status in self.windows), default=0.0)
+
+
+def usage_token_counts(usage: Any | None) -> dict[str, int]:
+    """Flatten an SDK usage object into snake_case token counts, deriving total_tokens if absent."""
+    if usage is None:
+        return {}
+    if hasattr(usage, "model_dump"):
+        usage = usage.model_dump(exclude_none=True)
+    elif hasattr(usage, "dict"):
+        usage = usage.dict(exclude_none=True)
+    if not isinstance(usage, dict):
+        return {}
+    # Some SDK versions report {"total": {...}, "last": {...}}; the per-turn numbers are "last".
+    if isinstance(usage.get("last"), dict):
+        usage = usage["last"]
+    counts = {}
+    for key, value in usage.items():
+        name = CAMEL_CASE_RE.sub("_", key).lower()
+        if name in TOKEN_FIELDS and isinstance(value, (int, float)):
+            counts[name] = int(value)
+    if counts and "total_tokens" not in counts:
+        counts["total_tokens"] = counts.get("input_tokens", 0) + counts.get("output_tokens", 0)
+    return counts
+
+
+def append_entry(path: Path, entry: UsageEntry) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(asdict(entry), sort_keys=True) + "\n")
+
+
+def read_ledger(path: Path) -> list[UsageEntry]:
+    if not path.exists():
+        return []
+    entries = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                entries.append(UsageEntry(**json.loads(line)))
+    return sorted(entries, key=lambda entry: entry.unix_ms)
+
+
+def window_total(entries: list[UsageEntry], end_unix_ms: int, hours: float) -> int:
+    start = end_unix_ms - int(hours * 3_600_000)
+    return sum(entry.total_tokens for entry in entries if entry.kind == "turn" and start < entry.unix_ms <= end_unix_ms)
+
+
+def learned_window(
+    entries: list[UsageEntry],
+    name: str,
+    hours: float,
+    configured: int | None,
+    *,
+    learn: bool,
+) -> QuotaWindow:
+    """Use the configured limit, or the usage in the window just before the latest limit error.
+
+    A limit error does not say which window ran out, so callers learn only the shortest window
+    and leave longer ones unenforced unless configured; learning a weekly limit from a five-hour
+    hit would stall the loop for days.
+    """
+    if configured is not None:
+        return QuotaWindow(name, hours, configured, learned=False)
+    hits = [entry for entry in entries if entry.kind == "limit"]
+    if not learn or not hits:
+        return QuotaWindow(name, hours, None, learned=False)
+    return QuotaWindow(name, hours, window_total(entries, hits[-1].unix_ms, hours), learned=True)
+
+
+def attempt_costs(entries: list[UsageEntry], recent: int) -> list[int]:
+    totals: dict[str, int] = {}
+    for entry in entries:
+        if entry.kind == "turn":
+            totals[entry.attempt_key] = totals.get(entry.attempt_key, 0) + entry.total_tokens
+    return [total for total in totals.values() if total > 0][-recent:]
+
+
+def plan_attempt(
+    entries: list[UsageEntry],
+    windows: list[QuotaWindow],
+    now_unix_ms: int,
+    *,
+    recent_attempts: int,
+    cost_percentile: float,
+) -> QuotaPlan:
+    costs = attempt_costs(entries, recent_attempts)
+    expected = int(np.percentile(costs, cost_percentile)) if costs else None
+    statuses = []
+    for window in windows:
+        used = window_total(entries, now_unix_ms, window.hours)
+        wait = 0.0
+        if window.tokens is not None and expected is not None and expected <= window.tokens:
+            excess = used + expected - window.tokens
+            if excess > 0:
+                # Walk the window oldest first until enough usage has aged out.
+                start = now_unix_ms - int(window.hours * 3_600_000)
+                for entry in entries:
+                    if entry.kind != "turn" or not start < entry.unix_ms <= now_unix_ms:
+                        continue
+                    excess -= entry.total_tokens
+                    if excess <= 0:
+                        wait = (entry.unix_ms + window.hours * 3_600_000 - now_unix_ms) / 1000.0
+                        break
+        statuses.append(WindowStatus(window, used, max(0.0, wait)))
+    return QuotaPlan(
+        expected_tokens=expected,
+        cost_percentile=cost_percentile,
+        attempts_sampled=len(costs),
+        windows=tuple(statuses),
+    )
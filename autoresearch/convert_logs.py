@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Convert evaluation logs between CSV and the compact ``.evb`` record format, or check a pair agrees."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from evaluation_records import (
+    companion_path,
+    csv_to_records,
+    read_records,
+    record_rows,
+    records_to_csv,
+    write_records,
+)
+from log_archive import list_logs, log_exists
+from run_autoresearch import EVALUATION_LOG_DIR, REPO_ROOT, log_phase
+
+
+def main() -> int:
+    args = parse_args()
+    if args.output is not None and len(args.paths) != 1:
+        raise SystemExit("--output takes a single input path.")
+
+    failures = 0
+    if args.command == "to-binary":
+        for path in args.paths:
+            target = args.output or companion_path(path)
+            try:
+                records = csv_to_records(path)
+            except (FileNotFoundError, ValueError) as exc:
+                log_phase(f"Skipping {path}: {exc}")
+                failures += 1
+                continue
+            write_records(target, records)
+            log_phase(f"{path} -> {target} ({len(records)} games, {size_of(path)} -> {target.stat().st_size} bytes).")
+    elif args.command == "to-csv":
+        for path in args.paths:
+            target = args.output or path.with_name(path.name.removesuffix(".evb") + ".csv")
+            records = read_records(path)
+            records_to_csv(records, target)
+            log_phase(f"{path} -> {target} ({len(records)} games).")
+    else:
+        paths = args.paths or list_logs(EVALUATION_LOG_DIR, "*-result.csv")
+        for path in paths:
+            companion = companion_path(path)
+            if not log_exists(companion):
+                continue
+            try:
+                expected = list(record_rows(csv_to_records(path, verify=False)))
+            except ValueError as exc:
+                log_phase(f"{display(path)}: {exc}")
+                failures += 1
+                continue
+            if list(record_rows(read_records(companion))) != expected:
+                log_phase(f"{display(companion)} does not match {display(path)}.")
+                failures += 1
+            else:
+                log_phase(f"{display(companion)} matches ({len(expected)} games).")
+    return 1 if failures else 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert evaluation logs between CSV and .evb records.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    to_binary = subcommands.add_parser("to-binary", help="Write the .evb companion of each CSV, refusing lossy ones.")
+    to_binary.add_argument("paths", nargs="+", type=Path, help="Evaluation CSVs, plain or archived.")
+    to_binary.add_argument("--output", type=Path, default=None, help="Target path; only with a single input.")
+    to_csv = subcommands.add_parser("to-csv", help="Reproduce the CSV from .evb files.")
+    to_csv.add_argument("paths", nargs="+", type=Path, help=".evb files, plain or archived.")
+    to_csv.add_argument("--output", type=Path, default=None, help="Target path; only with a single input.")
+    verify = subcommands.add_parser("verify", help="Check every .evb companion decodes to the fields of its CSV.")
+    verify.add_argument("paths", nargs="*", type=Path, help="CSVs to check; defaults to every log in autoresearch/logs.")
+    verify.set_defaults(output=None)
+    return parser.parse_args()
+
+
+def size_of(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+def display(path: Path) -> Path:
+    return path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
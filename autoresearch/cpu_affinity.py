@@ -0,0 +1,83 @@
+"""Plan per-worker CPU sets for the evaluator from the host's CPU topology (Linux only)."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SYSFS_CPU_ROOT = Path("/sys/devices/system/cpu")
+
+
+@dataclass(frozen=True)
+class CpuTopology:
+    # Logical CPUs grouped by physical core, restricted to the CPUs this process may run on.
+    cores: tuple[tuple[int, ...], ...]
+
+    @property
+    def logical_cpus(self) -> int:
+        return sum(len(core) for core in self.cores)
+
+
+@dataclass(frozen=True)
+class AffinityPlan:
+    cpu_sets: tuple[tuple[int, ...], ...]
+    mode: str
+    max_dedicated_workers: int
+    max_shared_core_workers: int
+
+
+def read_cpu_topology() -> CpuTopology | None:
+    if not hasattr(os, "sched_getaffinity") or not SYSFS_CPU_ROOT.is_dir():
+        return None
+    allowed = os.sched_getaffinity(0)
+    cores: dict[tuple[int, int], list[int]] = {}
+    for cpu in sorted(allowed):
+        topology = SYSFS_CPU_ROOT / f"cpu{cpu}" / "topology"
+        try:
+            package = int((topology / "physical_package_id").read_text(encoding="ascii"))
+            core = int((topology / "core_id").read_text(encoding="ascii"))
+        except (OSError, ValueError):
+            # No topology information (some containers): treat every CPU as its own core.
+            package, core = 0, cpu
+        cores.setdefault((package, core), []).append(cpu)
+    ordered = sorted(cores.items(), key=lambda item: (item[0][0], min(item[1])))
+    return CpuTopology(cores=tuple(tuple(cpus) for _, cpus in ordered))
+
+
+def plan_worker_cpu_sets(topology: CpuTopology, workers: int, cpus_per_worker: int) -> AffinityPlan:
+    """Give each worker slot ``cpus_per_worker`` logical CPUs that no other slot uses.
+
+    Prefers one logical CPU on each of ``cpus_per_worker`` distinct physical cores, leaving SMT
+    siblings idle, so the engine and its Stockfish opponent never share a core's execution units.
+    When there are not enough physical cores, slots take whole cores including their siblings,
+    which still keeps workers apart from each other. If even that does not fit, the plan is empty
+    and the evaluator runs unpinned.
+    """
+    cpus_per_worker = max(1, cpus_per_worker)
+    max_dedicated = len(topology.cores) // cpus_per_worker
+    max_shared = topology.logical_cpus // cpus_per_worker
+    if workers <= max_dedicated:
+        primaries = [core[0] for core in topology.cores]
+        sets = [tuple(primaries[slot * cpus_per_worker : (slot + 1) * cpus_per_worker]) for slot in range(workers)]
+        mode = "dedicated physical cores"
+    elif workers <= max_shared:
+        # Walk cores in order so siblings land in the same slot wherever the counts allow.
+        logical = [cpu for core in topology.cores for cpu in core]
+        sets = [tuple(logical[slot * cpus_per_worker : (slot + 1) * cpus_per_worker]) for slot in range(workers)]
+        mode = "SMT siblings shared within a slot"
+    else:
+        sets = []
+        mode = "unpinned"
+    return AffinityPlan(
+        cpu_sets=tuple(sets),
+        mode=mode,
+        max_dedicated_workers=max_dedicated,
+        max_shared_core_workers=max_shared,
+    )
+
+
+def format_cpu_sets(cpu_sets: tuple[tuple[int, ...], ...]) -> str:
+    """Render sets in the ``--cpu-sets`` syntax LocalTesting parses, e.g. ``0,1;2,3``."""
+    return ";".join(",".join(str(cpu) for cpu in cpu_set) for cpu_set in cpu_sets)
@@ -0,0 +1,200 @@
+"""Background sampler for host CPU contention while the evaluator runs.
+
+Linux only: everything is read from /proc. On other platforms the sampler records nothing and
+the orchestrator skips contention analysis.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+PROC_ROOT = Path("/proc")
+CLOCK_TICKS_PER_SECOND = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass(frozen=True)
+class ContentionSample:
+    """One sampling interval ending at ``unix_ms``.
+
+    ``evaluator_cores`` is CPU time used by the orchestrator's child processes (LocalTesting and
+    its Stockfish instances); ``external_cores`` is everything else that ran on the host.
+    """
+
+    unix_ms: int
+    interval_seconds: float
+    cores: int
+    load_1m: float
+    procs_running: int
+    busy_cores: float
+    evaluator_cores: float
+    external_cores: float
+    steal_fraction: float
+    score: float
+
+
+@dataclass(frozen=True)
+class _CpuReading:
+    monotonic: float
+    total_ticks: int
+    idle_ticks: int
+    steal_ticks: int
+    procs_running: int
+    process_ticks: dict[int, int]
+
+
+def contention_score(cores: int, external_cores: float, steal_fraction: float, procs_running: int) -> float:
+    """0 on an otherwise idle host; 1 roughly means "lost a full machine's worth of CPU".
+
+    Sums the share of cores taken by other processes, the hypervisor steal share, and the
+    runnable-thread excess over the core count.
+    """
+    return external_cores / cores + steal_fraction + max(0, procs_running - cores) / cores
+
+
+class ContentionSampler:
+    """Samples /proc every ``interval_seconds`` on a daemon thread between ``start`` and ``stop``."""
+
+    def __init__(self, interval_seconds: float = 1.0, *, root_pid: int | None = None) -> None:
+        self.interval_seconds = max(0.1, interval_seconds)
+        self.root_pid = os.getpid() if root_pid is None else root_pid
+        self.cores = os.cpu_count() or 1
+        self.samples: list[ContentionSample] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def available(self) -> bool:
+        return (PROC_ROOT / "stat").is_file()
+
+    def __enter__(self) -> ContentionSampler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None or not self.available:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cpu-contention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def write_jsonl(self, path: Path, *, append: bool = False) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a" if append else "w", encoding="utf-8") as handle:
+            for sample in self.samples:
+                handle.write(json.dumps(asdict(sample)) + "\n")
+
+    def _run(self) -> None:
+        previous = self._read()
+        while not self._stop.wait(self.interval_seconds):
+            current = self._read()
+            self.samples.append(self._sample(previous, current))
+            previous = current
+        # Keep the tail of the run: a final partial interval still covers the last games.
+        current = self._read()
+        if current.monotonic - previous.monotonic >= self.interval_seconds / 4:
+            self.samples.append(self._sample(previous, current))
+
+    def _sample(self, previous: _CpuReading, current: _CpuReading) -> ContentionSample:
+        elapsed = max(current.monotonic - previous.monotonic, 1e-6)
+        total = max(current.total_ticks - previous.total_ticks, 1)
+        idle = current.idle_ticks - previous.idle_ticks
+        steal = current.steal_ticks - previous.steal_ticks
+        busy_cores = max(0.0, (total - idle - steal) / total * self.cores)
+        # Children that started during the interval count from zero; children that exited lose
+        # their last partial interval, which only ever under-reports our own usage.
+        evaluator_ticks = sum(
+            max(0, ticks - previous.process_ticks.get(pid, 0)) for pid, ticks in current.process_ticks.items()
+        )
+        evaluator_cores = min(busy_cores, evaluator_ticks / CLOCK_TICKS_PER_SECOND / elapsed)
+        external_cores = busy_cores - evaluator_cores
+        steal_fraction = max(0.0, steal / total)
+        return ContentionSample(
+            unix_ms=int(time.time() * 1000),
+            interval_seconds=round(elapsed, 3),
+            cores=self.cores,
+            load_1m=read_load_average(),
+            procs_running=current.procs_running,
+            busy_cores=round(busy_cores, 3),
+            evaluator_cores=round(evaluator_cores, 3),
+            external_cores=round(external_cores, 3),
+            steal_fraction=round(steal_fraction, 4),
+            score=round(contention_score(self.cores, external_cores, steal_fraction, current.procs_running), 4),
+        )
+
+    def _read(self) -> _CpuReading:
+        total = idle = steal = procs_running = 0
+        for line in (PROC_ROOT / "stat").read_text(encoding="ascii").splitlines():
+            fields = line.split()
+            if fields and fields[0] == "cpu":
+                # user nice system idle iowait irq softirq steal (guest time is already in user).
+                ticks = [int(value) for value in fields[1:9]]
+                total = sum(ticks)
+                idle = ticks[3] + ticks[4]
+                steal = ticks[7]
+            elif fields and fields[0] == "procs_running":
+                procs_running = int(fields[1])
+        return _CpuReading(time.monotonic(), total, idle, steal, procs_running, descendant_cpu_ticks(self.root_pid))
+
+
+def read_load_average() -> float:
+    try:
+        return float((PROC_ROOT / "loadavg").read_text(encoding="ascii").split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def descendant_cpu_ticks(root_pid: int) -> dict[int, int]:
+    """utime + stime in clock ticks for every live descendant of ``root_pid`` (not the root itself)."""
+    parents: dict[int, int] = {}
+    ticks: dict[int, int] = {}
+    for entry in PROC_ROOT.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            raw = (entry / "stat").read_text(encoding="ascii", errors="replace")
+        except OSError:
+            continue
+        # The command name is parenthesised and may contain spaces, so split after the last ')'.
+        fields = raw[raw.rfind(")") + 2 :].split()
+        if len(fields) < 13:
+            continue
+        pid = int(entry.name)
+        parents[pid] = int(fields[1])
+        ticks[pid] = int(fields[11]) + int(fields[12])
+
+    children: dict[int, list[int]] = {}
+    for pid, parent in parents.items():
+        children.setdefault(parent, []).append(pid)
+    descendants: dict[int, int] = {}
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        descendants[pid] = ticks[pid]
+        pending.extend(children.get(pid, []))
+    return descendants
+
+
+def read_samples(path: Path) -> list[ContentionSample]:
+    if not path.exists():
+        return []
+    return [
+        ContentionSample(**json.loads(line))
+        for line in path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
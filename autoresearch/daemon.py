@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Headless autoresearch daemon: run queued experiment jobs and serve a local status API."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from job_queue import Job, JobQueue, finished_jobs, new_job, now_iso, pending_jobs
+from phase_trace import ATTEMPT_OUTCOME_RE, CONSOLE_LINE_RE, CONSOLE_PHASE_MARKERS, STARTING_ATTEMPT_RE
+from run_autoresearch import ATTEMPTS_PATH, ENGINE_VERSION_RE, REPO_ROOT, emit_console, load_state, log_phase, run
+
+
+QUEUE_PATH = REPO_ROOT / "autoresearch" / "jobs" / "queue.json"
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_PORT = 8765
+DEFAULT_DAEMON_POLL_SECONDS = 10
+DEFAULT_DAEMON_MAX_TRIES = 3
+DEFAULT_DAEMON_RECENT_VERDICTS = 20
+QUOTA_WAIT_RE = re.compile(r"^Waiting .* for Codex usage to age out")
+ATTEMPT_HEADING_RE = re.compile(r"^## Attempt: (?P<timestamp>\d{4}-\d\d-\d\dT[\d:]+Z) - (?P<version>\S+)$")
+ATTEMPT_STATUS_RE = re.compile(r"^- status: `(?P<status>\w+)`")
+
+
+class DaemonMonitor:
+    """Thread-safe view of what the daemon is doing, read by the status API."""
+
+    def __init__(self, queue: JobQueue, recent_verdicts: int) -> None:
+        self.queue = queue
+        self.recent_verdicts = recent_verdicts
+        self.started_at = now_iso()
+        self.lock = threading.Lock()
+        self.job: Job | None = None
+        self.phase = "idle"
+        self.message: str | None = None
+        self.phase_since = self.started_at
+
+    def set_phase(self, phase: str, message: str | None = None) -> None:
+        with self.lock:
+            if phase != self.phase:
+                self.phase_since = now_iso()
+            self.phase = phase
+            self.message = message
+
+    def set_job(self, job: Job | None) -> None:
+        with self.lock:
+            self.job = job
+
+    def snapshot(self) -> dict[str, Any]:
+        jobs = self.queue.jobs()
+        with self.lock:
+            current = {
+                "phase": self.phase,
+                "phase_since": self.phase_since,
+                "message": self.message,
+                "job": asdict(self.job) if self.job is not None else None,
+            }
+        return {
+            "daemon": {"pid": os.getpid(), "started_at": self.started_at},
+            "current": current,
+            "queue": [asdict(job) for job in pending_jobs(jobs)],
+            "recent_verdicts": [verdict_summary(job) for job in finished_jobs(jobs, self.recent_verdicts)],
+            "throughput": throughput(jobs),
+        }
+
+
+def main() -> int:
+    args = parse_args()
+    queue = JobQueue(args.queue)
+    if args.command == "submit":
+        return submit(args, queue)
+    if args.command == "status":
+        emit_console(json.dumps(status_snapshot(args, queue), indent=2) + "\n")
+        return 0
+    if args.command == "cancel":
+        return cancel(args.job_id, queue)
+    return serve(args, queue)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run autoresearch experiments from a durable job queue.")
+    parser.add_argument("--queue", type=Path, default=QUEUE_PATH, help="Queue file shared by every subcommand.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subcommands.add_parser("serve", help="Run queued jobs one at a time and serve /status.")
+    serve_parser.add_argument("--host", help=f"Status API bind address. Defaults to daemon.host or {DEFAULT_DAEMON_HOST}.")
+    serve_parser.add_argument("--port", type=int, help=f"Status API port. Defaults to daemon.port or {DEFAULT_DAEMON_PORT}.")
+    serve_parser.add_argument(
+        "--soc-cc",
+        action="store_true",
+        help="Run every job in SOC CC mode: 12 workers, push after each commit, and Gmail notifications.",
+    )
+
+    submit_parser = subcommands.add_parser("submit", help="Append an experiment job to the queue.")
+    submit_parser.add_argument("--prompt", default="", help="Experiment direction embedded into the sandbox PROGRAM.md.")
+    submit_parser.add_argument("--major", action="store_true", help="Start a new major version. Requires --prompt.")
+    submit_parser.add_argument("--version", help="Force the candidate version, for example v4.3.")
+    submit_parser.add_argument(
+        "--games",
+        type=int,
+        help="Game budget for a non-approving smoke evaluation. Omit for the fixed approval run.",
+    )
+    submit_parser.add_argument("--priority", type=int, default=0, help="Higher priorities run first.")
+    submit_parser.add_argument("--profile", action="store_true", help="Add the hot-method profile to the attempt.")
+
+    status_parser = subcommands.add_parser("status", help="Print the daemon status, or the queue if it is not running.")
+    status_parser.add_argument("--host", help="Status API address of the running daemon.")
+    status_parser.add_argument("--port", type=int, help="Status API port of the running daemon.")
+
+    cancel_parser = subcommands.add_parser("cancel", help="Cancel a queued job.")
+    cancel_parser.add_argument("job_id")
+    return parser.parse_args()
+
+
+def daemon_config(state: dict[str, Any], args: argparse.Namespace) -> dict[str, Any]:
+    daemon = state.get("daemon", {})
+    return {
+        "host": getattr(args, "host", None) or daemon.get("host", DEFAULT_DAEMON_HOST),
+        "port": getattr(args, "port", None) or int(daemon.get("port", DEFAULT_DAEMON_PORT)),
+        "poll_seconds": float(daemon.get("poll_seconds", DEFAULT_DAEMON_POLL_SECONDS)),
+        "max_tries": int(daemon.get("max_tries", DEFAULT_DAEMON_MAX_TRIES)),
+        "recent_verdicts": int(daemon.get("recent_verdicts", DEFAULT_DAEMON_RECENT_VERDICTS)),
+    }
+
+
+def submit(args: argparse.Namespace, queue: JobQueue) -> int:
+    if args.major and not args.prompt:
+        raise SystemExit("A major improvement requires additional information about what to modify, so --prompt is required.")
+    if args.version is not None and ENGINE_VERSION_RE.match(args.version) is None:
+        raise SystemExit(f"Invalid version {args.version!r}; expected something like v4.3.")
+    if args.games is not None and args.games < 2:
+        raise SystemExit("--games must be at least 2 so both colors play each opening.")
+    job = queue.submit(
+        new_job(
+            args.prompt,
+            major=args.major,
+            version=args.version,
+            games=args.games,
+            priority=args.priority,
+            profile=args.profile,
+        )
+    )
+    log_phase(f"Queued job {job.id} with priority {job.priority}.")
+    return 0
+
+
+def cancel(job_id: str, queue: JobQueue) -> int:
+    job = next((job for job in queue.jobs() if job.id == job_id), None)
+    if job is None:
+        raise SystemExit(f"No job {job_id} in {queue.path}.")
+    if job.status != "queued":
+        raise SystemExit(f"Job {job_id} is {job.status}; only queued jobs can be cancelled.")
+    queue.update(job_id, status="cancelled", finished_at=now_iso(), message="Cancelled before it ran.")
+    log_phase(f"Cancelled job {job_id}.")
+    return 0
+
+
+def status_snapshot(args: argparse.Namespace, queue: JobQueue) -> dict[str, Any]:
+    # Ask the running daemon first; fall back to the queue file alone when none is listening.
+    config = daemon_config(load_state(), args)
+    try:
+        with urllib.request.urlopen(f"http://{config['host']}:{config['port']}/status", timeout=5) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except (urllib.error.URLError, OSError):
+        return {**DaemonMonitor(queue, config["recent_verdicts"]).snapshot(), "daemon": None}
+
+
+def serve(args: argparse.Namespace, queue: JobQueue) -> int:
+    config = daemon_config(load_state(), args)
+    monitor = DaemonMonitor(queue, config["recent_verdicts"])
+    stop = threading.Event()
+    child: dict[str, subprocess.Popen[str] | None] = {"process": None}
+
+    def request_stop(signum: int, _frame: Any) -> None:
+        log_phase(f"Received signal {signum}; stopping after interrupting the current job.")
+        stop.set()
+        process = child["process"]
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    resume_interrupted_jobs(queue)
+    server = ThreadingHTTPServer((config["host"], config["port"]), status_handler(monitor))
+    threading.Thread(target=server.serve_forever, name="daemon-status", daemon=True).start()
+    log_phase(f"Daemon status API listening on http://{config['host']}:{config['port']}/status.")
+
+    try:
+        while not stop.is_set():
+            if run(["git", "status", "--porcelain"], check=True, capture=True).stdout.strip():
+                monitor.set_phase("blocked", "Working tree has uncommitted changes; commit or discard them to resume.")
+                stop.wait(config["poll_seconds"])
+                continue
+            job = queue.claim_next()
+            if job is None:
+                monitor.set_phase("idle")
+                stop.wait(config["poll_seconds"])
+                continue
+            run_job(job, queue, monitor, child, stop, config, soc_cc=args.soc_cc)
+    finally:
+        server.shutdown()
+    return 0
+
+
+def resume_interrupted_jobs(queue: JobQueue) -> None:
+    """Settle jobs left running by a previous daemon from the attempt history, or queue them again."""
+    for job in queue.jobs():
+        if job.status != "running":
+            continue
+        recorded = recorded_attempt_status(job)
+        if recorded is not None:
+            queue.update(job.id, status="done", outcome=recorded, finished_at=now_iso(), message="Recovered from ATTEMPTS.md.")
+            log_phase(f"Job {job.id} had already recorded {job.candidate} as {recorded}.")
+        else:
+            queue.update(job.id, status="queued", message="Requeued after the daemon stopped mid-run.")
+            log_phase(f"Requeued job {job.id}, which was interrupted by a daemon restart.")
+
+
+def recorded_attempt_status(job: Job) -> str | None:
+    if job.candidate is None or job.started_at is None or not ATTEMPTS_PATH.exists():
+        return None
+    started_at = dt.datetime.fromisoformat(job.started_at).astimezone(dt.timezone.utc)
+    status: str | None = None
+    matched = False
+    for line in ATTEMPTS_PATH.read_text(encoding="utf-8").splitlines():
+        if heading := ATTEMPT_HEADING_RE.match(line):
+            recorded_at = dt.datetime.fromisoformat(heading.group("timestamp").replace("Z", "+00:00"))
+            matched = heading.group("version").lower() == job.candidate.lower() and recorded_at >= started_at
+        elif matched and (status_line := ATTEMPT_STATUS_RE.match(line)):
+            status = status_line.group("status")
+            matched = False
+    return status
+
+
+def job_command(job: Job, *, soc_cc: bool) -> list[str]:
+    command = [sys.executable, "autoresearch/run_autoresearch.py", "--once", "--headless"]
+    if job.prompt:
+        command += ["--prompt", job.prompt]
+    if job.major:
+        command.append("--major")
+    if job.version is not None:
+        command += ["--version", job.version]
+    if job.games is not None:
+        command += ["--smoke-games", str(job.games)]
+    if job.profile:
+        command.append("--profile")
+    if soc_cc:
+        command.append("--soc-cc")
+    return command
+
+
+def run_job(
+    job: Job,
+    queue: JobQueue,
+    monitor: DaemonMonitor,
+    child: dict[str, subprocess.Popen[str] | None],
+    stop: threading.Event,
+    config: dict[str, Any],
+    *,
+    soc_cc: bool,
+) -> None:
+    log_phase(f"Starting job {job.id} (try {job.tries} of {config['max_tries']}).")
+    monitor.set_job(job)
+    monitor.set_phase("starting", f"Job {job.id}")
+    outcome: str | None = None
+    process = subprocess.Popen(
+        job_command(job, soc_cc=soc_cc),
+        cwd=REPO_ROOT,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    child["process"] = process
+    assert process.stdout is not None
+    try:
+        # The child mirrors its own console log; the daemon only echoes and watches its phase messages.
+        for line in process.stdout:
+            emit_console(line)
+            line_match = CONSOLE_LINE_RE.match(line.rstrip("\n"))
+            if line_match is None:
+                continue
+            message = line_match.group("message")
+            if starting := STARTING_ATTEMPT_RE.match(message):
+                job = queue.update(job.id, candidate=starting.group("candidate"))
+                monitor.set_job(job)
+            if persisted := ATTEMPT_OUTCOME_RE.match(message):
+                outcome = persisted.group("outcome")
+            monitor.set_phase(message_phase(message, monitor.phase), message)
+        returncode = process.wait()
+    finally:
+        process.stdout.close()
+        child["process"] = None
+
+    if stop.is_set():
+        job = queue.update(job.id, status="queued", tries=job.tries - 1, message="Interrupted by daemon shutdown.")
+        log_phase(f"Job {job.id} returned to the queue.")
+    elif returncode == 0:
+        job = queue.update(job.id, status="done", outcome=outcome, exit_code=0, finished_at=now_iso())
+        log_phase(f"Job {job.id} finished: {outcome or 'no attempt recorded'}.")
+    elif job.tries < config["max_tries"]:
+        job = queue.update(job.id, status="queued", exit_code=returncode, message=f"Exited with {returncode}; retrying.")
+        log_phase(f"Job {job.id} exited with {returncode}; it stays queued for another try.")
+    else:
+        job = queue.update(
+            job.id,
+            status="failed",
+            outcome=outcome,
+            exit_code=returncode,
+            finished_at=now_iso(),
+            message=f"Exited with {returncode} on every one of {job.tries} tries.",
+        )
+        log_phase(f"Job {job.id} failed after {job.tries} tries.")
+    monitor.set_job(None)
+    monitor.set_phase("idle")
+
+
+def message_phase(message: str, previous: str) -> str:
+    if QUOTA_WAIT_RE.match(message):
+        return "quota_wait"
+    for pattern, phase, edge in CONSOLE_PHASE_MARKERS:
+        if edge == "start" and pattern.match(message):
+            return phase
+    return previous
+
+
+def verdict_summary(job: Job) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "candidate": job.candidate,
+        "status": job.status,
+        "outcome": job.outcome,
+        "prompt": job.prompt,
+        "finished_at": job.finished_at,
+        "duration_seconds": job_seconds(job),
+    }
+
+
+def job_seconds(job: Job) -> float | None:
+    if job.started_at is None or job.finished_at is None:
+        return None
+    return (dt.datetime.fromisoformat(job.finished_at) - dt.datetime.fromisoformat(job.started_at)).total_seconds()
+
+
+def throughput(jobs: list[Job]) -> dict[str, Any]:
+    now = dt.datetime.now()
+    recorded = [
+        job
+        for job in jobs
+        if job.outcome is not None and job.finished_at is not None
+        and now - dt.datetime.fromisoformat(job.finished_at) <= dt.timedelta(days=7)
+    ]
+    last_day = [job for job in recorded if now - dt.datetime.fromisoformat(job.finished_at or "") <= dt.timedelta(days=1)]
+    durations = [seconds for job in recorded if (seconds := job_seconds(job)) is not None]
+    return {
+        "attempts_last_24h": len(last_day),
+        "approved_last_24h": sum(1 for job in last_day if job.outcome == "approved"),
+        "attempts_per_day_last_7d": round(len(recorded) / 7, 2),
+        "median_attempt_seconds": statistics.median(durations) if durations else None,
+    }
+
+
+def status_handler(monitor: DaemonMonitor) -> type[BaseHTTPRequestHandler]:
+    class StatusHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.rstrip("/") not in ("", "/status"):
+                self.send_error(404, "Only /status is served.")
+                return
+            body = json.dumps(monitor.snapshot(), indent=2).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return StatusHandler
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
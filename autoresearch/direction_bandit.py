@@ -0,0 +1,260 @@
+"""Thompson-sampling scheduler over experiment directions (prompt families).
+
+Each family from ``state.json`` is an arm. Its evidence is every attempt in ``ATTEMPTS.md`` that
+ran under it: attempts record their family as ``direction``, and older or hand-prompted attempts
+are matched to a family by keywords in their hypotheses and summary. An approval is a full success;
+a rejected candidate that still beat its seed's reference score earns partial credit in proportion
+to the score delta, so near-misses steer the search too. Each family's success rate gets a Beta
+posterior, each family's compute time per attempt comes from the phase traces, and the next
+direction is the family with the highest sampled approvals per compute-hour.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from phase_trace import ATTEMPT_PHASE, PhaseSpan
+
+
+ATTEMPT_HEADING_RE = re.compile(r"^## Attempt: (?P<timestamp>\d{4}-\d\d-\d\dT[\d:]+Z) - (?P<version>\S+)$")
+ATTEMPT_FIELD_RE = re.compile(r"^- (?P<key>[\w/]+): `(?P<value>.*)`$")
+HYPOTHESIS_RE = re.compile(r"^  - `(?P<value>.*)`$")
+# An attempt span ends when its outcome is recorded, shortly after the ATTEMPTS.md timestamp.
+SPAN_MATCH_WINDOW_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class PromptFamily:
+    name: str
+    prompt: str
+    keywords: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class BanditConfig:
+    prior_alpha: float
+    prior_beta: float
+    # Score-rate gain over the seed's reference that earns a rejected attempt full partial credit.
+    score_delta_scale: float
+    partial_credit_max: float
+    default_attempt_hours: float
+
+
+@dataclass(frozen=True)
+class AttemptRecord:
+    recorded_at: dt.datetime
+    candidate_version: str
+    seed_version: str | None
+    status: str
+    score_rate: float | None
+    direction: str | None
+    text: str
+
+
+@dataclass(frozen=True)
+class FamilyStats:
+    name: str
+    attempts: int
+    approvals: int
+    mean_score_delta: float | None
+    alpha: float
+    beta: float
+    hours_per_attempt: float
+
+    @property
+    def success_rate(self) -> float:
+        return self.alpha / (self.alpha + self.beta)
+
+
+@dataclass(frozen=True)
+class DirectionChoice:
+    family: PromptFamily
+    stats: tuple[FamilyStats, ...]
+    # Sampled successes per compute-hour for each family in this draw.
+    draws: dict[str, float]
+    # Every family, best draw first; fan-out takes one variant direction from each.
+    ranked: tuple[PromptFamily, ...]
+
+
+def read_attempts(path: Path) -> list[AttemptRecord]:
+    if not path.exists():
+        return []
+    attempts: list[AttemptRecord] = []
+    heading: re.Match[str] | None = None
+    fields: dict[str, str] = {}
+    hypotheses: list[str] = []
+
+    def finish() -> None:
+        if heading is None or "status" not in fields:
+            return
+        attempts.append(
+            AttemptRecord(
+                recorded_at=dt.datetime.fromisoformat(heading.group("timestamp").replace("Z", "+00:00")),
+                candidate_version=heading.group("version"),
+                seed_version=fields.get("seed_version"),
+                status=fields["status"],
+                score_rate=parse_float(fields.get("score_rate")),
+                direction=fields.get("direction"),
+                text=" ".join([*hypotheses, fields.get("implementation_summary", "")]),
+            )
+        )
+
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if match := ATTEMPT_HEADING_RE.match(line):
+            finish()
+            heading, fields, hypotheses = match, {}, []
+        elif heading is not None and (field := ATTEMPT_FIELD_RE.match(line)):
+            fields[field.group("key")] = field.group("value")
+        elif heading is not None and (hypothesis := HYPOTHESIS_RE.match(line)):
+            hypotheses.append(hypothesis.group("value"))
+    finish()
+    return attempts
+
+
+def parse_float(text: str | None) -> float | None:
+    try:
+        return float(text) if text is not None else None
+    except ValueError:
+        return None
+
+
+def classify(text: str, families: Iterable[PromptFamily]) -> str | None:
+    """The family whose keywords occur most often in ``text``; ties go to the family listed first."""
+    normalized = normalize(text)
+    best: tuple[int, str] | None = None
+    for family in families:
+        hits = sum(normalized.count(normalize(keyword)) for keyword in family.keywords)
+        if hits and (best is None or hits > best[0]):
+            best = (hits, family.name)
+    return best[1] if best is not None else None
+
+
+def normalize(text: str) -> str:
+    # "Late-move reductions" and "late move reductions" should hit the same keyword.
+    return " ".join(text.lower().replace("-", " ").split())
+
+
+def attempt_family(attempt: AttemptRecord, families: list[PromptFamily]) -> str | None:
+    if attempt.direction is not None and any(family.name == attempt.direction for family in families):
+        return attempt.direction
+    return classify(attempt.text, families)
+
+
+def score_deltas(attempts: list[AttemptRecord], reference_rates: dict[str, float]) -> list[float | None]:
+    """Each attempt's score rate minus its seed's, where both are known.
+
+    Seed rates come from the seed's own approved attempt, or ``reference_rates`` for seeds approved
+    before this log (for example the current ``latest_approved`` reference).
+    """
+    rates = dict(reference_rates)
+    deltas: list[float | None] = []
+    for attempt in attempts:
+        seed_rate = rates.get(attempt.seed_version or "")
+        if attempt.score_rate is None or seed_rate is None:
+            deltas.append(None)
+        else:
+            deltas.append(attempt.score_rate - seed_rate)
+        if attempt.status == "approved" and attempt.score_rate is not None:
+            rates.setdefault(attempt.candidate_version, attempt.score_rate)
+    return deltas
+
+
+def attempt_hours(attempts: list[AttemptRecord], spans: list[PhaseSpan]) -> list[float | None]:
+    """Wall-clock hours of each attempt, from the traced attempt span recorded right after it."""
+    by_candidate: dict[str, list[PhaseSpan]] = {}
+    for span in spans:
+        if span.phase == ATTEMPT_PHASE and span.candidate is not None:
+            by_candidate.setdefault(span.candidate.lower(), []).append(span)
+    hours: list[float | None] = []
+    for attempt in attempts:
+        recorded_ms = attempt.recorded_at.timestamp() * 1000
+        matches = [
+            span
+            for span in by_candidate.get(attempt.candidate_version.lower(), [])
+            if span.outcome == attempt.status and 0 <= span.end_unix_ms - recorded_ms <= SPAN_MATCH_WINDOW_SECONDS * 1000
+        ]
+        hours.append(
+            min(matches, key=lambda span: span.end_unix_ms).duration_seconds / 3600 if matches else None
+        )
+    return hours
+
+
+def attempt_reward(attempt: AttemptRecord, delta: float | None, config: BanditConfig) -> float:
+    if attempt.status == "approved":
+        return 1.0
+    if delta is None or delta <= 0 or config.score_delta_scale <= 0:
+        return 0.0
+    return config.partial_credit_max * min(1.0, delta / config.score_delta_scale)
+
+
+def family_statistics(
+    attempts: list[AttemptRecord],
+    families: list[PromptFamily],
+    config: BanditConfig,
+    *,
+    reference_rates: dict[str, float],
+    hours: list[float | None],
+) -> list[FamilyStats]:
+    deltas = score_deltas(attempts, reference_rates)
+    known_hours = [value for value in hours if value is not None and value > 0]
+    # Families without timed attempts are assumed to cost what a typical attempt does.
+    typical_hours = float(np.median(known_hours)) if known_hours else config.default_attempt_hours
+    grouped: dict[str, list[int]] = {family.name: [] for family in families}
+    for index, attempt in enumerate(attempts):
+        # Only evaluated outcomes are evidence; a hand-approved major version was never scored as an arm.
+        if attempt.status not in ("approved", "rejected"):
+            continue
+        name = attempt_family(attempt, families)
+        if name is not None:
+            grouped[name].append(index)
+
+    stats = []
+    for family in families:
+        indices = grouped[family.name]
+        rewards = [attempt_reward(attempts[index], deltas[index], config) for index in indices]
+        family_deltas = [deltas[index] for index in indices if deltas[index] is not None]
+        family_hours = [hours[index] for index in indices if hours[index] is not None and hours[index] > 0]
+        stats.append(
+            FamilyStats(
+                name=family.name,
+                attempts=len(indices),
+                approvals=sum(1 for index in indices if attempts[index].status == "approved"),
+                mean_score_delta=float(np.mean(family_deltas)) if family_deltas else None,
+                alpha=config.prior_alpha + sum(rewards),
+                beta=config.prior_beta + len(rewards) - sum(rewards),
+                # One pseudo-attempt at the typical cost keeps a single slow outlier from dominating.
+                hours_per_attempt=(sum(family_hours) + typical_hours) / (len(family_hours) + 1),
+            )
+        )
+    return stats
+
+
+def choose_direction(
+    families: list[PromptFamily],
+    stats: list[FamilyStats],
+    rng: np.random.Generator,
+) -> DirectionChoice:
+    """Draw each family's success rate from its posterior and take the best draw per compute-hour."""
+    if not families:
+        raise ValueError("No prompt families are configured.")
+    draws = {item.name: float(rng.beta(item.alpha, item.beta)) / item.hours_per_attempt for item in stats}
+    ranked = tuple(sorted(families, key=lambda family: draws[family.name], reverse=True))
+    return DirectionChoice(ranked[0], tuple(stats), draws, ranked)
+
+
+def format_direction_choice(choice: DirectionChoice) -> str:
+    lines = [f"Direction scheduler chose {choice.family.name} (Thompson sample, successes per compute-hour):"]
+    for item in sorted(choice.stats, key=lambda item: choice.draws[item.name], reverse=True):
+        delta = f"{item.mean_score_delta:+.4f}" if item.mean_score_delta is not None else "n/a"
+        lines.append(
+            f"  {item.name:<22} attempts={item.attempts:<3} approvals={item.approvals:<3} "
+            f"posterior_mean={item.success_rate:.3f} mean_delta={delta:<8} "
+            f"hours/attempt={item.hours_per_attempt:.2f} draw={choice.draws[item.name]:.3f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,243 @@
+"""BayesElo-style rating model: MAP ratings with a Laplace posterior, fitted by Newton's method.
+
+Game outcome probabilities follow BayesElo, with a draw margin and a White advantage:
+
+    P(white wins) = f(r_white - r_black + advantage - draw_elo)
+    P(black wins) = f(r_black - r_white - advantage - draw_elo)
+    P(draw)       = 1 - P(white wins) - P(black wins),    f(x) = 1 / (1 + 10 ** (-x / 400))
+
+Anchored players keep a fixed rating. Every other player needs a Gaussian prior, either around a
+constant or around another player's rating (a random walk between successive versions), which is
+how a candidate with few games borrows strength from the rest of the history.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+
+ELO_SCALE = math.log(10) / 400.0
+# BayesElo's published defaults, used as weak prior means and starting points.
+DEFAULT_DRAW_ELO = 97.3
+DEFAULT_WHITE_ADVANTAGE = 32.8
+NUISANCE_PRIOR_SD = 1000.0
+HESSIAN_STEP = 1e-3
+
+
+@dataclass(frozen=True)
+class GameCell:
+    white: str
+    black: str
+    white_wins: int
+    draws: int
+    black_wins: int
+
+
+@dataclass(frozen=True)
+class RatingPrior:
+    player: str
+    mean: float
+    sd: float
+    # When set, the prior is N(rating[parent] + mean, sd**2) instead of N(mean, sd**2).
+    parent: str | None = None
+
+
+@dataclass(frozen=True)
+class EloFit:
+    players: tuple[str, ...]
+    ratings: dict[str, float]
+    covariance: np.ndarray
+    draw_elo: float
+    white_advantage: float
+    games: dict[str, int]
+    iterations: int
+
+    def sd(self, player: str) -> float:
+        index = self.players.index(player)
+        return math.sqrt(max(float(self.covariance[index, index]), 0.0))
+
+    def probability_better(self, player: str, other: str) -> float:
+        a = self.players.index(player)
+        b = self.players.index(other)
+        variance = self.covariance[a, a] + self.covariance[b, b] - 2.0 * self.covariance[a, b]
+        difference = self.ratings[player] - self.ratings[other]
+        if variance <= 0:
+            return 1.0 if difference > 0 else 0.0 if difference < 0 else 0.5
+        return 0.5 * (1.0 + math.erf(difference / math.sqrt(2.0 * variance)))
+
+
+def fit_ratings(
+    cells: list[GameCell],
+    priors: list[RatingPrior],
+    anchors: dict[str, float],
+    *,
+    initial: dict[str, float] | None = None,
+    max_iterations: int = 100,
+    tolerance: float = 1e-4,
+) -> EloFit:
+    players = tuple(sorted({cell.white for cell in cells} | {cell.black for cell in cells} | {p.player for p in priors}))
+    index = {player: position for position, player in enumerate(players)}
+    free = [player for player in players if player not in anchors]
+    unconstrained = {player for player in free} - {prior.player for prior in priors}
+    if unconstrained:
+        raise ValueError(f"Players without an anchor or prior: {sorted(unconstrained)}")
+    free_index = np.array([index[player] for player in free], dtype=np.intp)
+
+    white = np.array([index[cell.white] for cell in cells], dtype=np.intp)
+    black = np.array([index[cell.black] for cell in cells], dtype=np.intp)
+    wins = np.array([cell.white_wins for cell in cells], dtype=np.float64)
+    draws = np.array([cell.draws for cell in cells], dtype=np.float64)
+    losses = np.array([cell.black_wins for cell in cells], dtype=np.float64)
+    prior_player = np.array([index[prior.player] for prior in priors], dtype=np.intp)
+    prior_parent = np.array([index[prior.parent] if prior.parent else -1 for prior in priors], dtype=np.intp)
+    prior_mean = np.array([prior.mean for prior in priors], dtype=np.float64)
+    prior_sd = np.array([prior.sd for prior in priors], dtype=np.float64)
+
+    base = np.zeros(len(players), dtype=np.float64)
+    for player, rating in anchors.items():
+        if player in index:
+            base[index[player]] = rating
+
+    def unpack(theta: np.ndarray) -> tuple[np.ndarray, float, float]:
+        ratings = base.copy()
+        ratings[free_index] = theta[: len(free)]
+        return ratings, float(theta[-2]), float(theta[-1])
+
+    def prior_terms(ratings: np.ndarray) -> np.ndarray:
+        centre = prior_mean + np.where(prior_parent >= 0, ratings[np.maximum(prior_parent, 0)], 0.0)
+        return (ratings[prior_player] - centre) / prior_sd
+
+    def log_posterior(theta: np.ndarray) -> float:
+        ratings, draw_elo, advantage = unpack(theta)
+        difference = ratings[white] - ratings[black] + advantage
+        p_white = logistic(difference - draw_elo)
+        p_black = logistic(-difference - draw_elo)
+        p_draw = 1.0 - p_white - p_black
+        if np.any(p_draw[draws > 0] <= 0.0):
+            return -math.inf
+        with np.errstate(divide="ignore"):
+            likelihood = (
+                np.sum(wins * np.log(p_white))
+                + np.sum(losses * np.log(p_black))
+                + np.sum(draws[draws > 0] * np.log(p_draw[draws > 0]))
+            )
+        nuisance = ((draw_elo - DEFAULT_DRAW_ELO) ** 2 + (advantage - DEFAULT_WHITE_ADVANTAGE) ** 2) / NUISANCE_PRIOR_SD**2
+        return float(likelihood - 0.5 * np.sum(prior_terms(ratings) ** 2) - 0.5 * nuisance)
+
+    def gradient(theta: np.ndarray) -> np.ndarray:
+        ratings, draw_elo, advantage = unpack(theta)
+        difference = ratings[white] - ratings[black] + advantage
+        p_white = logistic(difference - draw_elo)
+        p_black = logistic(-difference - draw_elo)
+        p_draw = np.maximum(1.0 - p_white - p_black, 1e-300)
+        slope_white = ELO_SCALE * p_white * (1.0 - p_white)
+        slope_black = ELO_SCALE * p_black * (1.0 - p_black)
+        d_difference = (
+            wins * ELO_SCALE * (1.0 - p_white)
+            - losses * ELO_SCALE * (1.0 - p_black)
+            + draws * (slope_black - slope_white) / p_draw
+        )
+        d_draw_elo = (
+            -wins * ELO_SCALE * (1.0 - p_white)
+            - losses * ELO_SCALE * (1.0 - p_black)
+            + draws * (slope_white + slope_black) / p_draw
+        )
+        d_ratings = np.zeros(len(players), dtype=np.float64)
+        np.add.at(d_ratings, white, d_difference)
+        np.add.at(d_ratings, black, -d_difference)
+        z = prior_terms(ratings) / prior_sd
+        np.add.at(d_ratings, prior_player, -z)
+        has_parent = prior_parent >= 0
+        np.add.at(d_ratings, prior_parent[has_parent], z[has_parent])
+        return np.concatenate(
+            [
+                d_ratings[free_index],
+                [float(d_draw_elo.sum()) - (draw_elo - DEFAULT_DRAW_ELO) / NUISANCE_PRIOR_SD**2],
+                [float(d_difference.sum()) - (advantage - DEFAULT_WHITE_ADVANTAGE) / NUISANCE_PRIOR_SD**2],
+            ]
+        )
+
+    def hessian(theta: np.ndarray) -> np.ndarray:
+        columns = []
+        for position in range(len(theta)):
+            step = np.zeros_like(theta)
+            step[position] = HESSIAN_STEP
+            columns.append((gradient(theta + step) - gradient(theta - step)) / (2.0 * HESSIAN_STEP))
+        matrix = np.column_stack(columns)
+        return (matrix + matrix.T) / 2.0
+
+    start = initial or {}
+    theta = np.array(
+        [start.get(player, initial_rating(player, priors, anchors, start)) for player in free]
+        + [start.get("__draw_elo__", DEFAULT_DRAW_ELO), start.get("__white_advantage__", DEFAULT_WHITE_ADVANTAGE)],
+        dtype=np.float64,
+    )
+    current = log_posterior(theta)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        step = np.linalg.solve(-hessian(theta), gradient(theta))
+        scale = 1.0
+        while scale > 1e-6:
+            candidate = theta + scale * step
+            value = log_posterior(candidate)
+            if value >= current:
+                break
+            scale /= 2.0
+        else:
+            break
+        theta, current = candidate, value
+        if float(np.max(np.abs(scale * step))) < tolerance:
+            break
+
+    covariance_free = np.linalg.inv(-hessian(theta))
+    covariance = np.zeros((len(players), len(players)), dtype=np.float64)
+    covariance[np.ix_(free_index, free_index)] = covariance_free[: len(free), : len(free)]
+    ratings, draw_elo, advantage = unpack(theta)
+    games: dict[str, int] = {player: 0 for player in players}
+    for cell in cells:
+        total = cell.white_wins + cell.draws + cell.black_wins
+        games[cell.white] += total
+        if cell.black != cell.white:
+            games[cell.black] += total
+    return EloFit(
+        players=players,
+        ratings={player: float(ratings[index[player]]) for player in players},
+        covariance=covariance,
+        draw_elo=draw_elo,
+        white_advantage=advantage,
+        games=games,
+        iterations=iterations,
+    )
+
+
+def logistic(elo_difference: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-ELO_SCALE * elo_difference))
+
+
+def initial_rating(
+    player: str,
+    priors: list[RatingPrior],
+    anchors: dict[str, float],
+    start: dict[str, float],
+) -> float:
+    # Walk up the prior chain to a constant or an anchored parent.
+    offset = 0.0
+    seen: set[str] = set()
+    current = player
+    while current not in seen:
+        seen.add(current)
+        if current in anchors:
+            return anchors[current] + offset
+        if current != player and current in start:
+            return start[current] + offset
+        prior = next((item for item in priors if item.player == current), None)
+        if prior is None:
+            return offset
+        offset += prior.mean
+        if prior.parent is None:
+            return offset
+        current = prior.parent
+    return offset
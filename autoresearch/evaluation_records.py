@@ -0,0 +1,272 @@
+"""Compact binary evaluation records (``.evb``) and their lossless CSV round trip.
+
+An ``.evb`` file is the evaluation CSV as fixed-width little-endian records. Every text column
+(engine names, result, termination, failure text, opening FEN, commit id) is stored as an index into
+one interned string table, so a full 33-column row is 193 bytes whatever the FEN length and a 100k-game run
+loads as a single NumPy structured array viewing the file:
+
+    b"EVALREC1" | u32 header length | UTF-8 JSON header, space-padded to 8 bytes | records
+
+The header lists the CSV columns in order with their field types, the record size and count, and
+the string table. Numbers are stored as the evaluator's own int32/int64/float64 values and booleans
+as one byte, and CSV export formats them the way .NET does, so converting either way reproduces
+every field's text exactly; ``csv_to_records`` refuses any file for which that would not hold.
+
+LocalTesting writes ``<attempt_id>-result.evb`` next to the canonical CSV. The CSV stays the
+contract; ``load_evaluation_records`` reads the companion when it is at least as new as the CSV and
+parses the CSV otherwise, so approved logs and older runs read the same way.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import math
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+from log_archive import archived_path, log_exists, open_log
+
+
+MAGIC = b"EVALREC1"
+HEADER_LENGTH = struct.Struct("<I")
+RECORD_ALIGNMENT = 8
+FIELD_DTYPES = {"str": "<u4", "i4": "<i4", "i8": "<i8", "f8": "<f8", "bool": "u1"}
+# Types of the columns LocalTesting writes; any other column is kept as text.
+CSV_COLUMN_TYPES = {
+    "commit_short_sha": "str",
+    "game_number": "i4",
+    "pair_number": "i4",
+    "opening_index": "i4",
+    "engine_a_was_white": "bool",
+    "white_engine": "str",
+    "black_engine": "str",
+    "result": "str",
+    "termination_reason": "str",
+    "plies": "i4",
+    "engine_a_score": "f8",
+    "white_moves": "i4",
+    "black_moves": "i4",
+    "white_total_positions": "i4",
+    "black_total_positions": "i4",
+    "white_average_positions": "f8",
+    "black_average_positions": "f8",
+    "white_average_move_ms": "f8",
+    "black_average_move_ms": "f8",
+    "game_elapsed_ms": "f8",
+    "failure_engine": "str",
+    "failure_message": "str",
+    "opening_fen": "str",
+    **{f"{side}_move_ms_{name}": "f8" for side in ("white", "black") for name in ("p50", "p95", "p99", "max")},
+    "game_started_unix_ms": "i8",
+    "game_finished_unix_ms": "i8",
+}
+
+
+@dataclass(frozen=True)
+class EvaluationRecords:
+    columns: tuple[str, ...]
+    types: tuple[str, ...]
+    strings: tuple[str, ...]
+    # Structured array; read from a plain .evb file it is a view over the memory-mapped file.
+    records: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def text(self, column: str) -> np.ndarray:
+        """Decoded values of a text column as an object array."""
+        return np.asarray(self.strings, dtype=object)[self.records[column]]
+
+    def lookup(self, column: str, table: dict[str, int], default: int) -> np.ndarray:
+        """Map a text column through ``table`` without decoding each row: one lookup per distinct string."""
+        codes = np.array([table.get(value, default) for value in self.strings], dtype=np.int64)
+        return codes[self.records[column]] if len(codes) else np.full(len(self), default, dtype=np.int64)
+
+
+def record_dtype(columns: Iterable[str], types: Iterable[str]) -> np.dtype:
+    return np.dtype([(column, FIELD_DTYPES[kind]) for column, kind in zip(columns, types)])
+
+
+def companion_path(csv_path: Path) -> Path:
+    return csv_path.with_name(csv_path.name.removesuffix(".csv") + ".evb")
+
+
+def parse_records(buffer: bytes | memoryview | mmap.mmap) -> EvaluationRecords:
+    view = memoryview(buffer)
+    if bytes(view[: len(MAGIC)]) != MAGIC:
+        raise ValueError("Not an evaluation record file (bad magic).")
+    (header_length,) = HEADER_LENGTH.unpack_from(view, len(MAGIC))
+    header_start = len(MAGIC) + HEADER_LENGTH.size
+    header = json.loads(bytes(view[header_start : header_start + header_length]).decode("utf-8"))
+    columns = tuple(name for name, _ in header["fields"])
+    types = tuple(kind for _, kind in header["fields"])
+    dtype = record_dtype(columns, types)
+    if dtype.itemsize != header["record_size"]:
+        raise ValueError(f"Record size {header['record_size']} does not match its fields ({dtype.itemsize}).")
+    offset = aligned(header_start + header_length)
+    records = np.frombuffer(buffer, dtype=dtype, count=int(header["count"]), offset=offset)
+    return EvaluationRecords(columns, types, tuple(header["strings"]), records)
+
+
+def read_records(path: Path) -> EvaluationRecords:
+    """Memory-map a plain ``.evb`` file; an archived one is decompressed into memory once."""
+    if path.exists():
+        with path.open("rb") as handle:
+            return parse_records(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+    with open_log(path, "rb") as handle:
+        return parse_records(handle.read())
+
+
+def records_bytes(records: EvaluationRecords) -> bytes:
+    header = json.dumps(
+        {
+            "fields": [[column, kind] for column, kind in zip(records.columns, records.types)],
+            "record_size": records.records.dtype.itemsize,
+            "count": len(records),
+            "strings": list(records.strings),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header_end = len(MAGIC) + HEADER_LENGTH.size + len(header)
+    padding = b" " * (aligned(header_end) - header_end)
+    return MAGIC + HEADER_LENGTH.pack(len(header) + len(padding)) + header + padding + records.records.tobytes()
+
+
+def write_records(path: Path, records: EvaluationRecords) -> None:
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_bytes(records_bytes(records))
+    temporary.replace(path)
+
+
+def encode_rows(columns: list[str], rows: Iterable[list[str]]) -> EvaluationRecords:
+    types = tuple(CSV_COLUMN_TYPES.get(column, "str") for column in columns)
+    rows = [row + [""] * (len(columns) - len(row)) if len(row) < len(columns) else row for row in rows if row]
+    strings: dict[str, int] = {}
+    records = np.zeros(len(rows), dtype=record_dtype(columns, types))
+    for column, kind, texts in zip(columns, types, zip(*rows) if rows else [()] * len(columns)):
+        try:
+            records[column] = parse_column(kind, texts, strings)
+        except ValueError:
+            # Re-parse field by field only to name the offending line.
+            for line_number, text in enumerate(texts, start=2):
+                try:
+                    parse_field(kind, text, {})
+                except ValueError as exc:
+                    raise ValueError(f"line {line_number}, column {column}: {exc}") from exc
+            raise
+    return EvaluationRecords(tuple(columns), types, tuple(strings), records)
+
+
+def parse_column(kind: str, texts: tuple[str, ...], strings: dict[str, int]) -> list[object]:
+    if kind == "str":
+        return [strings.setdefault(text, len(strings)) for text in texts]
+    if kind == "bool":
+        return [text == "true" or (text != "false" and parse_field(kind, text, strings)) for text in texts]
+    return list(map(int if kind in ("i4", "i8") else float, texts))
+
+
+def csv_to_records(csv_path: Path, *, verify: bool = True) -> EvaluationRecords:
+    """Encode an evaluation CSV, checking by default that every field's text survives the round trip."""
+    with open_log(csv_path, newline="") as handle:
+        rows = [row for row in csv.reader(handle) if row]
+    if not rows:
+        raise ValueError(f"Evaluation CSV is empty: {csv_path}")
+    records = encode_rows(rows[0], rows[1:])
+    if verify:
+        for line_number, (original, decoded) in enumerate(zip(rows[1:], record_rows(records)), start=2):
+            original = original + [""] * (len(decoded) - len(original))
+            if original != decoded:
+                column = next(name for name, a, b in zip(records.columns, original, decoded) if a != b)
+                raise ValueError(f"{csv_path} line {line_number}, column {column} would not round-trip exactly.")
+    return records
+
+
+def record_rows(records: EvaluationRecords) -> Iterator[list[str]]:
+    formatters = []
+    for column, kind in zip(records.columns, records.types):
+        values = records.records[column]
+        if kind == "str":
+            formatters.append(np.asarray(records.strings, dtype=object)[values] if len(records.strings) else values)
+        elif kind == "bool":
+            formatters.append(np.where(values != 0, "true", "false"))
+        elif kind == "f8":
+            formatters.append([format_double(value) for value in values.tolist()])
+        else:
+            formatters.append([str(value) for value in values.tolist()])
+    for index in range(len(records)):
+        yield [str(column[index]) for column in formatters]
+
+
+def format_double(value: float) -> str:
+    """Format like .NET's ``double.ToString()``: shortest round-trip digits, E notation outside 1e-5..1e15."""
+    if 1e-4 <= abs(value) < 1e15:
+        # Python's repr uses the same shortest digits and is positional over this whole range.
+        return repr(value).removesuffix(".0")
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "-0" if math.copysign(1.0, value) < 0 else "0"
+    sign, digits, exponent = Decimal(repr(value)).normalize().as_tuple()
+    scientific = len(digits) + exponent - 1
+    prefix = "-" if sign else ""
+    if -5 < scientific < 15:
+        return prefix + format(Decimal((0, digits, exponent)), "f")
+    mantissa = str(digits[0]) + ("." + "".join(map(str, digits[1:])) if len(digits) > 1 else "")
+    return f"{prefix}{mantissa}E{'+' if scientific >= 0 else '-'}{abs(scientific):02d}"
+
+
+def format_csv_field(text: str) -> str:
+    # Same quoting rule as LocalTesting's CSV writer.
+    if any(character in text for character in '",\n\r'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def records_to_csv(records: EvaluationRecords, csv_path: Path) -> None:
+    buffer = io.StringIO()
+    buffer.write(",".join(format_csv_field(column) for column in records.columns) + "\n")
+    for row in record_rows(records):
+        buffer.write(",".join(format_csv_field(field) for field in row) + "\n")
+    temporary = csv_path.with_name(csv_path.name + ".tmp")
+    temporary.write_text(buffer.getvalue(), encoding="utf-8")
+    temporary.replace(csv_path)
+
+
+def write_companion(csv_path: Path) -> Path:
+    path = companion_path(csv_path)
+    write_records(path, csv_to_records(csv_path))
+    return path
+
+
+def load_evaluation_records(csv_path: Path) -> EvaluationRecords:
+    """Records for an evaluation CSV, from its ``.evb`` companion when that is not older than the CSV."""
+    companion = companion_path(csv_path)
+    if log_exists(companion):
+        if not log_exists(csv_path) or modified_ns(companion) >= modified_ns(csv_path):
+            return read_records(companion)
+    return csv_to_records(csv_path, verify=False)
+
+
+def modified_ns(path: Path) -> int:
+    # Archived logs keep the original modification time, so either form compares the same.
+    archive = path if path.exists() else archived_path(path)
+    if archive is None:
+        raise FileNotFoundError(path)
+    return archive.stat().st_mtime_ns
+
+
+def aligned(offset: int) -> int:
+    return (offset + RECORD_ALIGNMENT - 1) // RECORD_ALIGNMENT * RECORD_ALIGNMENT
@@ -0,0 +1,176 @@
+"""Client for the persistent LocalTesting evaluator host (``LocalTesting host``).
+
+The host is one long-lived .NET process that loads each candidate build into a collectible
+AssemblyLoadContext and runs LocalTesting commands in it on request, so repeated evaluations,
+benchmarks and scenarios skip .NET startup, JIT warm-up of the harness and Stockfish spawns. It
+speaks line-delimited JSON-RPC 2.0 over stdin/stdout and handles one request at a time: while a
+``run`` executes it streams ``output`` notifications (one per console line) and ``game``
+notifications (one per finished evaluation game, keyed by CSV column), then answers with the
+exit code. See engine_csharp/src/LocalTesting/EvaluatorHost.cs for the server side.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+
+class EvaluatorHostError(RuntimeError):
+    """A request the host rejected; the host itself is still usable."""
+
+
+class EvaluatorHostExited(EvaluatorHostError):
+    """The host process is gone; start a new one or fall back to one process per command."""
+
+
+@dataclass(frozen=True)
+class HostRunResult:
+    returncode: int
+    stdout: str
+    elapsed_ms: float
+    # "loaded" when the build was loaded for this request, "reused" when it was already resident.
+    context: str
+    games: list[dict[str, str]] = field(default_factory=list)
+
+
+class EvaluatorHost:
+    def __init__(self, command: list[str], cwd: Path) -> None:
+        self.command = command
+        self.cwd = cwd
+        self.pid: int | None = None
+        self._process: subprocess.Popen[str] | None = None
+        self._next_id = 0
+
+    def __enter__(self) -> EvaluatorHost:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        # stderr stays attached to the terminal: anything the host prints there is about the host itself.
+        self._process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            text=True,
+            encoding="utf-8",
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=1,
+        )
+        message = self._read_message()
+        if message.get("method") != "ready":
+            self.close()
+            raise EvaluatorHostExited(f"Evaluator host did not start: {message}")
+        self.pid = int(message["params"]["pid"])
+
+    def call(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        on_notification: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        if not self.running:
+            raise EvaluatorHostExited("Evaluator host is not running.")
+        assert self._process is not None and self._process.stdin is not None
+        self._next_id += 1
+        request_id = self._next_id
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError) as exc:
+            raise EvaluatorHostExited(f"Evaluator host stopped accepting requests: {exc}") from exc
+
+        while True:
+            message = self._read_message()
+            if "id" not in message or message.get("method") is not None:
+                if on_notification is not None:
+                    on_notification(message["method"], message.get("params", {}))
+                continue
+            if message["id"] != request_id:
+                raise EvaluatorHostError(f"Evaluator host answered request {message['id']}, expected {request_id}.")
+            if "error" in message:
+                raise EvaluatorHostError(message["error"].get("message", "unknown error"))
+            return message["result"]
+
+    def run(
+        self,
+        build_dir: Path,
+        args: list[str],
+        *,
+        on_output: Callable[[str], None] | None = None,
+        on_game: Callable[[dict[str, str]], None] | None = None,
+    ) -> HostRunResult:
+        """Run one LocalTesting command from ``build_dir``'s LocalTesting.dll and wait for it."""
+        lines: list[str] = []
+        games: list[dict[str, str]] = []
+
+        def notification(method: str, params: dict[str, Any]) -> None:
+            if method == "output":
+                lines.append(params["line"])
+                if on_output is not None:
+                    on_output(params["line"])
+            elif method == "game":
+                games.append(params["row"])
+                if on_game is not None:
+                    on_game(params["row"])
+
+        result = self.call("run", {"build_dir": str(build_dir), "args": args}, on_notification=notification)
+        return HostRunResult(
+            returncode=int(result["exit_code"]),
+            stdout="".join(f"{line}\n" for line in lines),
+            elapsed_ms=float(result["elapsed_ms"]),
+            context=result["context"],
+            games=games,
+        )
+
+    def unload(self, build_dir: Path) -> bool:
+        return bool(self.call("unload", {"build_dir": str(build_dir)})["unloaded"])
+
+    def status(self) -> dict[str, Any]:
+        return self.call("status")
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            self._process = process
+            try:
+                self.call("shutdown")
+            except EvaluatorHostError:
+                pass
+            self._process = None
+            try:
+                process.wait(timeout=SHUTDOWN_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                stream.close()
+
+    def _read_message(self) -> dict[str, Any]:
+        assert self._process is not None and self._process.stdout is not None
+        line = self._process.stdout.readline()
+        if not line:
+            returncode = self._process.wait()
+            raise EvaluatorHostExited(f"Evaluator host exited with code {returncode}.")
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise EvaluatorHostExited(f"Evaluator host wrote a malformed message: {line.strip()}") from exc
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""Multi-node autoresearch farm: one coordinator owns state.json and git, workers run the attempts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from daemon import QUEUE_PATH, job_command, message_phase, throughput, verdict_summary
+from job_queue import Job, JobQueue, finished_jobs, new_job, now_iso, pending_jobs
+from phase_trace import CONSOLE_LINE_RE
+from run_autoresearch import (
+    EVALUATION_LOG_DIR,
+    REPO_ROOT,
+    append_attempt_markdown,
+    bump_major,
+    bump_minor,
+    commit_attempt,
+    current_branch,
+    emit_console,
+    ensure_clean_worktree,
+    finalize_attempt_commit,
+    load_state,
+    log_phase,
+    move_approved_log,
+    next_candidate,
+    parse_evaluation_csv,
+    parse_version,
+    persist_state,
+    push_current_branch,
+    record_elo_in_changelog,
+    run,
+    start_text_log,
+    update_elo_history,
+    update_state_and_attempts,
+)
+
+
+RESULT_DIR = REPO_ROOT / "autoresearch" / "jobs" / "results"
+STOCKFISH_DIR = REPO_ROOT / "autoresearch" / "stockfish"
+DEFAULT_FARM_HOST = "127.0.0.1"
+DEFAULT_FARM_PORT = 8770
+DEFAULT_FARM_LEASE_MINUTES = 30
+DEFAULT_FARM_HEARTBEAT_SECONDS = 60
+DEFAULT_FARM_POLL_SECONDS = 30
+DEFAULT_FARM_MAX_TRIES = 3
+DEFAULT_FARM_RECENT_VERDICTS = 20
+# Paths an attempt can add untracked files to; workers clean only these, never ignored inputs like Stockfish.
+WORKER_SCRATCH_PATHS = ("autoresearch/approved_logs", "engine_csharp/src/Engine.Core")
+
+
+class Coordinator:
+    """Leases jobs with unique candidate versions and records results one at a time."""
+
+    def __init__(self, queue: JobQueue, config: dict[str, Any], *, fill: bool) -> None:
+        self.queue = queue
+        self.config = config
+        self.fill = fill
+        self.started_at = now_iso()
+        self.started_monotonic = time.monotonic()
+        self.branch = current_branch()
+        # git_lock serializes everything that reads or writes state.json and the git history.
+        self.git_lock = threading.Lock()
+        self.lock = threading.Lock()
+        self.workers: dict[str, dict[str, Any]] = {}
+        self.push_pending = False
+
+    def touch(self, worker: str, job_id: str | None, phase: str, message: str | None = None) -> None:
+        with self.lock:
+            self.workers[worker] = {
+                "job": job_id,
+                "phase": phase,
+                "message": message,
+                "seen_monotonic": time.monotonic(),
+            }
+
+    def lease(self, worker: str) -> dict[str, Any]:
+        self.expire_leases()
+        with self.git_lock:
+            if self.push_pending:
+                self.push()
+            state = load_state()
+            with self.queue.locked() as jobs:
+                if self.fill and not any(job.status == "queued" for job in jobs):
+                    jobs.append(new_job(""))
+                queued = [index for index, job in enumerate(jobs) if job.status == "queued"]
+                if not queued:
+                    job = None
+                else:
+                    index = min(queued, key=lambda i: (-jobs[i].priority, jobs[i].submitted_at))
+                    jobs[index] = replace(
+                        jobs[index],
+                        status="running",
+                        tries=jobs[index].tries + 1,
+                        candidate=jobs[index].candidate or allocate_version(state, jobs, jobs[index]),
+                        worker=worker,
+                        started_at=now_iso(),
+                        finished_at=None,
+                        exit_code=None,
+                        message=None,
+                    )
+                    job = jobs[index]
+            commit = run(["git", "rev-parse", "HEAD"], check=True, capture=True).stdout.strip()
+        if job is None:
+            self.touch(worker, None, "idle")
+            return {"job": None}
+        self.touch(worker, job.id, "leased")
+        log_phase(f"Leased job {job.id} as {job.candidate} to {worker}.")
+        return {"job": asdict(job), "branch": self.branch, "commit": commit}
+
+    def heartbeat(self, worker: str, job_id: str, phase: str, message: str | None) -> dict[str, Any]:
+        if not self.holds(worker, job_id):
+            return {"ok": False}
+        self.touch(worker, job_id, phase, message)
+        return {"ok": True}
+
+    def release(self, worker: str, job_id: str, exit_code: int | None, message: str) -> dict[str, Any]:
+        if not self.holds(worker, job_id):
+            return {"ok": False}
+        job = next(job for job in self.queue.jobs() if job.id == job_id)
+        if exit_code is None:
+            # The worker gave the job back without trying it, for example on shutdown.
+            self.queue.update(job_id, status="queued", worker=None, tries=job.tries - 1, message=message)
+        elif job.tries < self.config["max_tries"]:
+            self.queue.update(job_id, status="queued", worker=None, exit_code=exit_code, message=message)
+        else:
+            self.queue.update(
+                job_id,
+                status="failed",
+                worker=None,
+                exit_code=exit_code,
+                finished_at=now_iso(),
+                message=f"{message} Failed on every one of {job.tries} tries.",
+            )
+        log_phase(f"{worker} released job {job_id}: {message}")
+        self.touch(worker, None, "idle")
+        return {"ok": True}
+
+    def result(self, worker: str, job_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if not self.holds(worker, job_id):
+            return {"ok": False}
+        self.touch(worker, job_id, "recording")
+        with self.git_lock:
+            status, commit_sha = record_result(payload)
+            if commit_sha is not None:
+                self.push()
+        self.queue.update(
+            job_id,
+            status="done",
+            outcome=status,
+            exit_code=0,
+            finished_at=now_iso(),
+            message=f"Recorded in {commit_sha}." if commit_sha else "Recorded without a commit.",
+        )
+        self.touch(worker, None, "idle")
+        return {"ok": True, "status": status, "commit": commit_sha}
+
+    def push(self) -> None:
+        try:
+            push_current_branch()
+            self.push_pending = False
+        except RuntimeError as exc:
+            log_phase(f"{exc} Retrying before the next lease.")
+            self.push_pending = True
+
+    def holds(self, worker: str, job_id: str) -> bool:
+        return any(job.id == job_id and job.status == "running" and job.worker == worker for job in self.queue.jobs())
+
+    def expire_leases(self) -> None:
+        # A coordinator restart counts as a heartbeat, so leases from before it get a full grace period.
+        limit = 60 * self.config["lease_minutes"]
+        now = time.monotonic()
+        with self.lock:
+            seen = {name: worker["seen_monotonic"] for name, worker in self.workers.items()}
+        for job in self.queue.jobs():
+            if job.status != "running" or job.worker is None:
+                continue
+            if now - max(seen.get(job.worker, 0.0), self.started_monotonic) > limit:
+                self.queue.update(
+                    job.id,
+                    status="queued",
+                    worker=None,
+                    message=f"Lease expired after {job.worker} was silent for {self.config['lease_minutes']} minutes.",
+                )
+                log_phase(f"Requeued job {job.id}; {job.worker} stopped sending heartbeats.")
+
+    def snapshot(self) -> dict[str, Any]:
+        jobs = self.queue.jobs()
+        now = time.monotonic()
+        with self.lock:
+            workers = {
+                name: {
+                    "job": worker["job"],
+                    "phase": worker["phase"],
+                    "message": worker["message"],
+                    "seconds_since_seen": round(now - worker["seen_monotonic"], 1),
+                }
+                for name, worker in sorted(self.workers.items())
+            }
+        return {
+            "coordinator": {"pid": os.getpid(), "started_at": self.started_at, "branch": self.branch},
+            "workers": workers,
+            "queue": [asdict(job) for job in pending_jobs(jobs)],
+            "recent_verdicts": [verdict_summary(job) for job in finished_jobs(jobs, self.config["recent_verdicts"])],
+            "throughput": throughput(jobs),
+        }
+
+
+def main() -> int:
+    args = parse_args()
+    config = farm_config(load_state(), args)
+    if args.command == "coordinator":
+        return run_coordinator(args, config)
+    if args.command == "worker":
+        return run_worker(args, config)
+    return run_local(args, config)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run autoresearch attempts on several nodes with one coordinator.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = subcommands.add_parser("coordinator", help="Own state.json and git; lease jobs to workers.")
+    coordinator.add_argument("--queue", type=Path, default=QUEUE_PATH, help="Job queue file, shared with daemon.py.")
+    coordinator.add_argument("--host", help=f"Bind address. Defaults to farm.host or {DEFAULT_FARM_HOST}.")
+    coordinator.add_argument("--port", type=int, help=f"Port. Defaults to farm.port or {DEFAULT_FARM_PORT}.")
+    coordinator.add_argument(
+        "--fill",
+        action="store_true",
+        help="When the queue is empty, lease plain minor-version attempts instead of leaving workers idle.",
+    )
+
+    worker = subcommands.add_parser("worker", help="Lease jobs from a coordinator and run them in this clone.")
+    worker.add_argument("--coordinator", required=True, help="Coordinator URL, for example http://10.0.0.5:8770.")
+    worker.add_argument("--name", help="Worker name shown in the coordinator status. Defaults to host-pid.")
+
+    local = subcommands.add_parser(
+        "local",
+        help="Stand up a coordinator and several workers on this machine around a local bare repository.",
+    )
+    local.add_argument("--workers", type=int, default=2, help="Number of worker processes.")
+    local.add_argument(
+        "--root",
+        type=Path,
+        default=REPO_ROOT.parent / f"{REPO_ROOT.name}-farm",
+        help="Directory for the bare remote and one clone per process.",
+    )
+    local.add_argument("--port", type=int, help=f"Coordinator port. Defaults to farm.port or {DEFAULT_FARM_PORT}.")
+    local.add_argument("--fill", action="store_true", help="Pass --fill to the coordinator.")
+    return parser.parse_args()
+
+
+def farm_config(state: dict[str, Any], args: argparse.Namespace) -> dict[str, Any]:
+    farm = state.get("farm", {})
+    return {
+        "host": getattr(args, "host", None) or farm.get("host", DEFAULT_FARM_HOST),
+        "port": getattr(args, "port", None) or int(farm.get("port", DEFAULT_FARM_PORT)),
+        "lease_minutes": float(farm.get("lease_minutes", DEFAULT_FARM_LEASE_MINUTES)),
+        "heartbeat_seconds": float(farm.get("heartbeat_seconds", DEFAULT_FARM_HEARTBEAT_SECONDS)),
+        "poll_seconds": float(farm.get("poll_seconds", DEFAULT_FARM_POLL_SECONDS)),
+        "max_tries": int(farm.get("max_tries", DEFAULT_FARM_MAX_TRIES)),
+        "recent_verdicts": int(farm.get("recent_verdicts", DEFAULT_FARM_RECENT_VERDICTS)),
+    }
+
+
+def allocate_version(state: dict[str, Any], jobs: list[Job], job: Job) -> str:
+    """Pick a version no other job holds, so concurrent attempts never share a sandbox or engine file."""
+    if job.version is not None:
+        return job.version
+    latest = state["latest_approved"]["version"]
+    version = bump_major(latest) if job.major else state.get("next_candidate_version") or bump_minor(latest)
+    taken = {other.candidate.lower() for other in jobs if other.candidate is not None}
+    while version.lower() in taken or next_candidate(state, version, job.major).engine_file.exists():
+        version = bump_minor(version)
+    return version
+
+
+def record_result(payload: dict[str, Any]) -> tuple[str, str | None]:
+    """Apply a worker's attempt to state.json, ATTEMPTS.md, CHANGELOG.json and git, like the local loop does."""
+    state = load_state()
+    candidate = next_candidate(state, payload["version"], payload["version_bump"] == "major")
+    status = payload["status"]
+    verdict_reason = payload["verdict_reason"]
+    seed = payload["seed"]
+    latest = state["latest_approved"]["version"]
+    if status == "approved" and seed["version"] != latest:
+        # Another worker's candidate became the seed while this one was evaluated against the old one.
+        status = "rejected"
+        verdict_reason = (
+            f"Approved against seed {seed['version']}, but {latest} was approved first. "
+            "Rerun the idea against the new seed."
+        )
+        log_phase(verdict_reason)
+
+    attempt_id = payload["attempt_id"]
+    log_path = EVALUATION_LOG_DIR / f"{attempt_id}-result.csv"
+    metrics = None
+    if payload["csv"] is not None:
+        EVALUATION_LOG_DIR.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(payload["csv"], encoding="utf-8")
+        metrics = parse_evaluation_csv(log_path, state)
+    approved_log_path: Path | None = None
+    if status == "approved":
+        candidate.engine_file.parent.mkdir(parents=True, exist_ok=True)
+        candidate.engine_file.write_text(payload["engine_source"], encoding="utf-8")
+        approved_log_path = move_approved_log(candidate, log_path, attempt_id)
+
+    log_phase(f"Persisting attempt outcome: {status}.")
+    next_version = state.get("next_candidate_version") or bump_minor(latest)
+    for entry in payload.get("sub_attempts", []):
+        append_attempt_markdown(entry)
+    update_state_and_attempts(
+        state,
+        candidate,
+        attempt_id,
+        status,
+        verdict_reason,
+        payload["attempt_note"],
+        metrics,
+        log_path,
+        approved_log_path,
+        payload["hot_methods"],
+        seed=seed,
+        direction=payload.get("direction"),
+        fan_out=payload.get("fan_out"),
+    )
+    # Results arrive out of order; never move next_candidate_version backwards.
+    if parse_version(next_version) > parse_version(state["next_candidate_version"]):
+        state["next_candidate_version"] = next_version
+    if metrics is not None:
+        record_elo_in_changelog(update_elo_history(state))
+    persist_state(state)
+    commit_sha = commit_attempt(candidate, status)
+    if commit_sha:
+        commit_sha = finalize_attempt_commit(candidate, status, commit_sha, approved_log_path)
+        log_phase(f"Recorded git commit {commit_sha} for {candidate.version}.")
+    return status, commit_sha
+
+
+def run_coordinator(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    start_text_log()
+    ensure_clean_worktree()
+    coordinator = Coordinator(JobQueue(args.queue), config, fill=args.fill)
+    server = ThreadingHTTPServer((config["host"], config["port"]), coordinator_handler(coordinator))
+    log_phase(f"Farm coordinator listening on http://{config['host']}:{config['port']} for {coordinator.branch}.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log_phase("Coordinator stopped; running leases stay recorded in the queue.")
+    finally:
+        server.server_close()
+    return 0
+
+
+def coordinator_handler(coordinator: Coordinator) -> type[BaseHTTPRequestHandler]:
+    routes = {
+        "/lease": lambda body: coordinator.lease(body["worker"]),
+        "/heartbeat": lambda body: coordinator.heartbeat(body["worker"], body["job_id"], body["phase"], body.get("message")),
+        "/release": lambda body: coordinator.release(body["worker"], body["job_id"], body.get("exit_code"), body["message"]),
+        "/result": lambda body: coordinator.result(body["worker"], body["job_id"], body["result"]),
+    }
+
+    class CoordinatorHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.rstrip("/") not in ("", "/status"):
+                self.send_error(404, "Only /status is served.")
+                return
+            self.reply(coordinator.snapshot())
+
+        def do_POST(self) -> None:  # noqa: N802
+            route = routes.get(self.path)
+            if route is None:
+                self.send_error(404, f"Unknown farm endpoint {self.path}.")
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", "0"))) or b"{}")
+            try:
+                payload = route(body)
+            except (Exception, SystemExit) as exc:
+                log_phase(f"Farm request {self.path} failed: {exc}")
+                payload = {"ok": False, "error": str(exc)}
+            self.reply(payload)
+
+        def reply(self, payload: dict[str, Any]) -> None:
+            body = json.dumps(payload, indent=2).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    return CoordinatorHandler
+
+
+def post(url: str, path: str, body: dict[str, Any]) -> dict[str, Any]:
+    request = urllib.request.Request(
+        url.rstrip("/") + path,
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=300) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def run_worker(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    name = args.name or f"{socket.gethostname()}-{os.getpid()}"
+    stop = threading.Event()
+    child: dict[str, subprocess.Popen[str] | None] = {"process": None}
+
+    def request_stop(signum: int, _frame: Any) -> None:
+        log_phase(f"Worker {name} received signal {signum}; handing its job back.")
+        stop.set()
+        process = child["process"]
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    while not stop.is_set():
+        try:
+            lease = post(args.coordinator, "/lease", {"worker": name})
+        except (urllib.error.URLError, OSError) as exc:
+            log_phase(f"Coordinator unreachable ({exc}); retrying in {config['poll_seconds']:.0f}s.")
+            stop.wait(config["poll_seconds"])
+            continue
+        if lease["job"] is None:
+            stop.wait(config["poll_seconds"])
+            continue
+        job = Job(**lease["job"])
+        log_phase(f"Worker {name} leased job {job.id} as {job.candidate}.")
+        try:
+            sync_clone(lease["commit"])
+        except SystemExit as exc:
+            post(args.coordinator, "/release", {"worker": name, "job_id": job.id, "exit_code": None, "message": str(exc)})
+            stop.wait(config["poll_seconds"])
+            continue
+
+        result_path = RESULT_DIR / f"{job.id}.json"
+        result_path.unlink(missing_ok=True)
+        returncode = run_leased_attempt(job, name, args.coordinator, config, result_path, child)
+        if stop.is_set():
+            post(args.coordinator, "/release", {"worker": name, "job_id": job.id, "exit_code": None, "message": "Worker stopped."})
+        elif returncode == 0 and result_path.exists():
+            payload = json.loads(result_path.read_text(encoding="utf-8"))
+            reply = post(args.coordinator, "/result", {"worker": name, "job_id": job.id, "result": payload})
+            if reply["ok"]:
+                log_phase(f"Coordinator recorded {job.candidate} as {reply['status']} in {reply['commit']}.")
+            else:
+                log_phase(f"Coordinator refused the result for {job.candidate}: {reply.get('error', 'the lease had expired')}.")
+            result_path.unlink()
+        else:
+            post(
+                args.coordinator,
+                "/release",
+                {
+                    "worker": name,
+                    "job_id": job.id,
+                    "exit_code": returncode,
+                    "message": f"Attempt exited with {returncode} without a result.",
+                },
+            )
+    return 0
+
+
+def sync_clone(commit: str) -> None:
+    """Move this clone to the coordinator's commit, dropping whatever the previous attempt left behind."""
+    run(["git", "fetch", "--quiet", "origin"], check=True)
+    run(["git", "reset", "--quiet", "--hard", commit], check=True)
+    run(["git", "clean", "-fdq", "--", *WORKER_SCRATCH_PATHS], check=True)
+
+
+def run_leased_attempt(
+    job: Job,
+    worker: str,
+    coordinator_url: str,
+    config: dict[str, Any],
+    result_path: Path,
+    child: dict[str, subprocess.Popen[str] | None],
+) -> int:
+    command = job_command(replace(job, version=job.candidate), soc_cc=False) + ["--result-json", str(result_path)]
+    process = subprocess.Popen(
+        command,
+        cwd=REPO_ROOT,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+    )
+    child["process"] = process
+    progress = {"phase": "starting", "message": None}
+    finished = threading.Event()
+
+    def heartbeat() -> None:
+        while not finished.wait(config["heartbeat_seconds"]):
+            try:
+                reply = post(coordinator_url, "/heartbeat", {"worker": worker, "job_id": job.id, **progress})
+            except (urllib.error.URLError, OSError):
+                continue
+            if not reply["ok"]:
+                log_phase(f"Lease on {job.id} was lost; stopping the attempt.")
+                process.terminate()
+                return
+
+    threading.Thread(target=heartbeat, name="farm-heartbeat", daemon=True).start()
+    assert process.stdout is not None
+    try:
+        for line in process.stdout:
+            emit_console(line)
+            line_match = CONSOLE_LINE_RE.match(line.rstrip("\n"))
+            if line_match is not None:
+                message = line_match.group("message")
+                progress = {"phase": message_phase(message, progress["phase"]), "message": message}
+        return process.wait()
+    finally:
+        finished.set()
+        process.stdout.close()
+        child["process"] = None
+
+
+def run_local(args: argparse.Namespace, config: dict[str, Any]) -> int:
+    """One-box farm: a bare repository stands in for the remote, each process gets its own clone."""
+    root = args.root.resolve()
+    remote = root / "remote.git"
+    root.mkdir(parents=True, exist_ok=True)
+    if not remote.exists():
+        log_phase(f"Creating bare remote {remote} from the committed {current_branch()} branch.")
+        run(["git", "clone", "--quiet", "--bare", str(REPO_ROOT), str(remote)], check=True)
+    names = ["coordinator", *(f"worker-{index}" for index in range(1, args.workers + 1))]
+    for name in names:
+        clone = root / name
+        if not clone.exists():
+            run(["git", "clone", "--quiet", str(remote), str(clone)], check=True)
+        # Stockfish is not tracked, so every clone gets a copy of this checkout's binary.
+        target = clone / STOCKFISH_DIR.relative_to(REPO_ROOT)
+        if STOCKFISH_DIR.exists() and not target.exists():
+            shutil.copytree(STOCKFISH_DIR, target)
+
+    url = f"http://127.0.0.1:{config['port']}"
+    commands = [[sys.executable, "autoresearch/farm.py", "coordinator", "--port", str(config["port"])]]
+    if args.fill:
+        commands[0].append("--fill")
+    commands += [
+        [sys.executable, "autoresearch/farm.py", "worker", "--coordinator", url, "--name", name] for name in names[1:]
+    ]
+    processes = []
+    for name, command in zip(names, commands):
+        processes.append(subprocess.Popen(command, cwd=root / name))
+        if name == "coordinator":
+            time.sleep(2)
+    log_phase(
+        f"Local farm running from {root}: coordinator on {url}, {args.workers} workers. "
+        f"Queue jobs with: python {root / 'coordinator' / 'autoresearch' / 'daemon.py'} submit --prompt ..."
+    )
+    try:
+        for process in processes:
+            process.wait()
+    except KeyboardInterrupt:
+        log_phase("Stopping the local farm.")
+        for process in reversed(processes):
+            if process.poll() is None:
+                process.send_signal(signal.SIGINT)
+        for process in processes:
+            process.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Durable on-disk queue of autoresearch experiment jobs.
+
+The queue is one JSON file rewritten atomically under an exclusive ``flock``, so ``daemon.py submit``
+and a running daemon can both change it, and a daemon that restarts picks up exactly the jobs that
+were queued or still running when it stopped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import fcntl
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+
+JOB_STATUSES = ("queued", "running", "done", "failed", "cancelled")
+FINISHED_STATUSES = frozenset({"done", "failed", "cancelled"})
+
+
+@dataclass(frozen=True)
+class Job:
+    id: str
+    prompt: str
+    major: bool
+    version: str | None
+    # None runs the fixed approval evaluation; a number runs a non-approving smoke evaluation.
+    games: int | None
+    priority: int
+    profile: bool
+    submitted_at: str
+    status: str = "queued"
+    tries: int = 0
+    candidate: str | None = None
+    # Farm worker holding the job while it runs; None for daemon jobs.
+    worker: str | None = None
+    outcome: str | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+    exit_code: int | None = None
+    message: str | None = None
+
+
+def now_iso() -> str:
+    return dt.datetime.now().isoformat(timespec="seconds")
+
+
+def new_job(
+    prompt: str,
+    *,
+    major: bool = False,
+    version: str | None = None,
+    games: int | None = None,
+    priority: int = 0,
+    profile: bool = False,
+) -> Job:
+    return Job(
+        id=uuid.uuid4().hex[:12],
+        prompt=prompt,
+        major=major,
+        version=version,
+        games=games,
+        priority=priority,
+        profile=profile,
+        submitted_at=now_iso(),
+    )
+
+
+class JobQueue:
+    """Read-modify-write access to ``path``; every change holds ``path.lock`` for its whole duration."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock_path = path.with_name(path.name + ".lock")
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[list[Job]]:
+        # Yields the job list for in-place edits and writes it back when the block exits cleanly.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                jobs = self._read()
+                yield jobs
+                self._write(jobs)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def jobs(self) -> list[Job]:
+        with self.locked() as jobs:
+            return list(jobs)
+
+    def submit(self, job: Job) -> Job:
+        with self.locked() as jobs:
+            jobs.append(job)
+        return job
+
+    def update(self, job_id: str, **changes: object) -> Job:
+        with self.locked() as jobs:
+            for index, job in enumerate(jobs):
+                if job.id == job_id:
+                    jobs[index] = replace(job, **changes)
+                    return jobs[index]
+        raise KeyError(job_id)
+
+    def claim_next(self) -> Job | None:
+        """Mark the highest-priority queued job as running and return it; ties go to the oldest."""
+        with self.locked() as jobs:
+            queued = [index for index, job in enumerate(jobs) if job.status == "queued"]
+            if not queued:
+                return None
+            index = min(queued, key=lambda i: (-jobs[i].priority, jobs[i].submitted_at))
+            jobs[index] = replace(
+                jobs[index],
+                status="running",
+                tries=jobs[index].tries + 1,
+                started_at=now_iso(),
+                finished_at=None,
+                exit_code=None,
+                message=None,
+            )
+            return jobs[index]
+
+    def _read(self) -> list[Job]:
+        if not self.path.exists():
+            return []
+        payload = json.loads(self.path.read_text(encoding="utf-8"))
+        return [Job(**item) for item in payload.get("jobs", [])]
+
+    def _write(self, jobs: list[Job]) -> None:
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps({"jobs": [asdict(job) for job in jobs]}, indent=2) + "\n", encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+def pending_jobs(jobs: list[Job]) -> list[Job]:
+    return sorted(
+        (job for job in jobs if job.status in ("queued", "running")),
+        key=lambda job: (job.status != "running", -job.priority, job.submitted_at),
+    )
+
+
+def finished_jobs(jobs: list[Job], limit: int) -> list[Job]:
+    finished = [job for job in jobs if job.status in FINISHED_STATUSES and job.finished_at is not None]
+    return sorted(finished, key=lambda job: job.finished_at or "", reverse=True)[:limit]
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""HTTP load generator for the served chess API."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import http.client
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+
+from chess_api_client import ChessApiClient
+from evaluation_records import load_evaluation_records
+from log_archive import list_logs
+from run_autoresearch import REPO_ROOT, emit_console, log_phase, run
+
+
+DEFAULT_PORT = 18080
+DEFAULT_DOCKER_IMAGE = "autoresearch-chess-api"
+HEALTH_TIMEOUT_SECONDS = 180
+OPENINGS_LOOKUP_PATH = REPO_ROOT / "Openings.lookup.tsv"
+# OpeningBook.TryGetMove only consults the lookup while all 32 pieces are on the board.
+BOOK_PIECE_COUNT = 32
+SCENARIO_DIR = REPO_ROOT / "engine_scenarios"
+FUNCTIONS_PROJECT = "engine_csharp/src/Engine.Functions"
+FUNCTIONS_DLL = REPO_ROOT / FUNCTIONS_PROJECT / "bin" / "Release" / "net8.0" / "Engine.Functions.dll"
+EVALUATION_LOG_DIRS = (REPO_ROOT / "autoresearch" / "approved_logs", REPO_ROOT / "autoresearch" / "logs")
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    mode: str
+    concurrency: int
+    duration_seconds: float
+    rate_per_second: float
+    versions: dict[str, float]
+    request_timeout_seconds: float
+    use_context_ids: bool
+    seed: int
+
+
+@dataclass
+class LoadSample:
+    version: str
+    latency_ms: float
+    status: int
+    ok: bool
+    processing_time_ms: float | None = None
+    completed_depth: int | None = None
+    opening_book_hit: bool | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class RunningApi:
+    base_url: str
+    process: subprocess.Popen[bytes] | None
+
+
+@dataclass
+class LoadRunResult:
+    profile: LoadProfile
+    wall_seconds: float
+    samples: list[LoadSample] = field(default_factory=list)
+
+
+def main() -> int:
+    args = parse_args()
+    profile = LoadProfile(
+        mode=args.mode,
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        rate_per_second=args.rate,
+        versions=parse_version_mix(args.version),
+        request_timeout_seconds=args.request_timeout,
+        use_context_ids=args.context_ids,
+        seed=args.seed,
+    )
+    fens = load_fen_corpus(limit=args.fen_limit, seed=args.seed)
+    log_phase(f"Loaded {len(fens)} FENs for the load profile.")
+
+    with local_api(
+        args.start,
+        args.url,
+        args.port,
+        args.image,
+        time_limit_seconds=args.engine_time_limit,
+        skip_build=args.skip_build,
+    ) as api:
+        result = run_load(api.base_url, profile, fens)
+
+    report = summarize_load(result)
+    emit_console(format_load_report(report), flush=True)
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        log_phase(f"Wrote load report to {output}.")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay FEN streams against the chess API and report latency.")
+    parser.add_argument(
+        "--start",
+        choices=("none", "dotnet", "docker"),
+        default="dotnet",
+        help="Start the API locally from the Release build or with docker run, or use --url as-is with none.",
+    )
+    parser.add_argument("--skip-build", action="store_true", help="Reuse the existing Engine.Functions Release build.")
+    parser.add_argument("--url", help="Base URL of an already running API, used with --start none.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Local port for a started API.")
+    parser.add_argument("--image", default=DEFAULT_DOCKER_IMAGE, help="Docker image for --start docker.")
+    parser.add_argument(
+        "--engine-time-limit",
+        type=float,
+        help="ENGINE_TIME_LIMIT_SECONDS for a started API. Defaults to the server's own 1.0s.",
+    )
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed", help="Closed-loop or open-loop arrivals.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Closed-loop clients, or open-loop in-flight cap.")
+    parser.add_argument("--rate", type=float, default=2.0, help="Open-loop mean arrival rate in requests per second.")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to generate load.")
+    parser.add_argument(
+        "--version",
+        action="append",
+        help="Version and optional weight, for example v3.15=3. May be repeated. Defaults to v3.15.",
+    )
+    parser.add_argument("--request-timeout", type=float, default=30.0, help="Per-request client timeout in seconds.")
+    parser.add_argument(
+        "--context-ids",
+        action="store_true",
+        help="Send a stable context_id per closed-loop client, like the frontend's per-game key.",
+    )
+    parser.add_argument("--fen-limit", type=int, help="Use at most this many FENs from the corpus.")
+    parser.add_argument("--seed", type=int, default=1350, help="Seed for FEN order, version mix and arrivals.")
+    parser.add_argument("--output", help="Optional JSON report path.")
+    args = parser.parse_args()
+    if args.start == "none" and not args.url:
+        parser.error("--start none requires --url.")
+    return args
+
+
+def parse_version_mix(values: list[str] | None) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for value in values or ["v3.15"]:
+        version, _, weight = value.partition("=")
+        mix[version.strip().lower()] = float(weight) if weight else 1.0
+    if not mix or any(weight <= 0 for weight in mix.values()):
+        raise SystemExit("Every --version weight must be positive.")
+    return mix
+
+
+def load_fen_corpus(*, limit: int | None = None, seed: int = 1350) -> list[str]:
+    # Evaluation CSVs contribute the opening FENs games actually started from; the opening lookup holds
+    # positions reached in recorded book games, and scenarios add middlegame/endgame positions.
+    # Positions the server would answer from the opening book are dropped: they skip the search, so
+    # they would flatter latency and throughput.
+    book_keys: set[str] = set()
+    fens: dict[str, None] = {}
+    for log_dir in EVALUATION_LOG_DIRS:
+        for path in list_logs(log_dir, "*-result.csv"):
+            records = load_evaluation_records(path)
+            if "opening_fen" not in records:
+                continue
+            for index in dict.fromkeys(records.records["opening_fen"].tolist()):
+                fen = records.strings[index].strip()
+                if fen:
+                    fens[fen] = None
+    if OPENINGS_LOOKUP_PATH.exists():
+        for line in OPENINGS_LOOKUP_PATH.read_text(encoding="utf-8").splitlines():
+            if not line or line.startswith("#"):
+                continue
+            key = line.split(chr(9), 1)[0]
+            book_keys.add(key)
+            fens[f"{key} 0 1"] = None
+    for path in sorted(SCENARIO_DIR.glob("*.json")):
+        start_fen = json.loads(path.read_text(encoding="utf-8")).get("startFen")
+        if start_fen:
+            fens[start_fen] = None
+
+    corpus = [fen for fen in fens if not is_book_position(fen, book_keys)]
+    if len(corpus) < len(fens):
+        log_phase(f"Skipped {len(fens) - len(corpus)} opening-book positions from the load corpus.")
+    random.Random(seed).shuffle(corpus)
+    if limit is not None:
+        corpus = corpus[:limit]
+    if not corpus:
+        raise SystemExit("No FENs were found for the load profile.")
+    return corpus
+
+
+def is_book_position(fen: str, book_keys: set[str]) -> bool:
+    fields = fen.split()
+    piece_count = sum(char.isalpha() for char in fields[0]) if fields else 0
+    return piece_count == BOOK_PIECE_COUNT and " ".join(fields[:4]) in book_keys
+
+
+@contextlib.contextmanager
+def local_api(
+    start: str,
+    url: str | None,
+    port: int,
+    image: str,
+    *,
+    time_limit_seconds: float | None = None,
+    extra_env: dict[str, str] | None = None,
+    skip_build: bool = False,
+) -> Iterator[RunningApi]:
+    if start == "none":
+        assert url is not None
+        wait_for_health(url.rstrip("/"), None)
+        yield RunningApi(url.rstrip("/"), None)
+        return
+
+    env = {**os.environ, "PORT": str(port), **(extra_env or {})}
+    if time_limit_seconds is not None:
+        env["ENGINE_TIME_LIMIT_SECONDS"] = str(time_limit_seconds)
+    if start == "dotnet":
+        # Run the built dll directly so the started process is the server itself, not the SDK host.
+        if not skip_build:
+            log_phase(f"Building {FUNCTIONS_PROJECT} in Release.")
+            run(["dotnet", "build", FUNCTIONS_PROJECT, "-c", "Release"], cwd=REPO_ROOT, check=True)
+        command = ["dotnet", str(FUNCTIONS_DLL.relative_to(REPO_ROOT))]
+    else:
+        if shutil.which("docker") is None:
+            raise SystemExit("docker is not available for --start docker.")
+        command = ["docker", "run", "--rm", "-p", f"{port}:8080", "-e", "PORT=8080"]
+        for key in ("ENGINE_TIME_LIMIT_SECONDS", *(extra_env or {})):
+            if key in env:
+                command.extend(["-e", f"{key}={env[key]}"])
+        command.append(image)
+
+    base_url = f"http://127.0.0.1:{port}"
+    log_phase(f"Starting local API: {' '.join(command)}")
+    process = subprocess.Popen(
+        command,
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_health(base_url, process)
+        yield RunningApi(base_url, process)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def wait_for_health(base_url: str, process: subprocess.Popen[bytes] | None) -> None:
+    deadline = time.monotonic() + HEALTH_TIMEOUT_SECONDS
+    with ChessApiClient(base_url, pool_size=1, timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                raise SystemExit(f"Local API exited with code {process.returncode} before becoming healthy.")
+            try:
+                status, _ = client.request("GET", "/healthz")
+                if status == 200:
+                    log_phase(f"API at {base_url} is healthy.")
+                    return
+            except (OSError, http.client.HTTPException):
+                pass
+            time.sleep(0.5)
+    raise SystemExit(f"API at {base_url} did not become healthy within {HEALTH_TIMEOUT_SECONDS}s.")
+
+
+def process_tree_peak_rss_mb(pid: int) -> float | None:
+    # Linux only: VmHWM is the kernel's resident-set high-water mark for each process.
+    pending = [pid]
+    total_kb = 0
+    found = False
+    while pending:
+        current = pending.pop()
+        proc_dir = Path("/proc") / str(current)
+        try:
+            status = (proc_dir / "status").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if line.startswith("VmHWM:"):
+                total_kb += int(line.split()[1])
+                found = True
+        for children in proc_dir.glob("task/*/children"):
+            try:
+                pending.extend(int(child) for child in children.read_text(encoding="utf-8").split())
+            except OSError:
+                continue
+    return total_kb / 1024.0 if found else None
+
+
+def post_move(client: ChessApiClient, version: str, fen: str, context_id: str | None) -> LoadSample:
+    started = time.perf_counter()
+    try:
+        status, body = client.move(version, fen, context_id=context_id)
+    except (OSError, http.client.HTTPException) as exc:
+        return LoadSample(version, (time.perf_counter() - started) * 1000.0, 0, False, error=type(exc).__name__)
+    latency_ms = (time.perf_counter() - started) * 1000.0
+    return sample_from_response(version, latency_ms, status, body)
+
+
+def sample_from_response(version: str, latency_ms: float, status: int, body: dict[str, Any] | None) -> LoadSample:
+    debug = (body or {}).get("debug") or {}
+    processing_time = (body or {}).get("processing_time", debug.get("processing_time"))
+    opening_book = debug.get("opening_book")
+    return LoadSample(
+        version=version,
+        latency_ms=latency_ms,
+        status=status,
+        ok=status == 200 and body is not None and "error" not in body,
+        processing_time_ms=float(processing_time) * 1000.0 if processing_time is not None else None,
+        completed_depth=debug.get("completed_depth"),
+        opening_book_hit=bool(opening_book.get("selected_move_uci")) if isinstance(opening_book, dict) else None,
+        error=(body or {}).get("error"),
+    )
+
+
+def run_load(base_url: str, profile: LoadProfile, fens: list[str]) -> LoadRunResult:
+    rng = random.Random(profile.seed)
+    versions = list(profile.versions)
+    weights = [profile.versions[version] for version in versions]
+    samples: list[LoadSample] = []
+    samples_lock = threading.Lock()
+    fen_cursor = iter(range(sys.maxsize))
+    cursor_lock = threading.Lock()
+
+    def next_request() -> tuple[str, str]:
+        with cursor_lock:
+            index = next(fen_cursor)
+            version = rng.choices(versions, weights=weights)[0]
+        return version, fens[index % len(fens)]
+
+    log_phase(
+        f"Running {profile.mode}-loop load for {profile.duration_seconds:.0f}s against {base_url} "
+        f"(concurrency={profile.concurrency}, versions={profile.versions})."
+    )
+    with ChessApiClient(
+        base_url,
+        pool_size=profile.concurrency,
+        timeout=profile.request_timeout_seconds,
+    ) as api_client:
+        started = time.perf_counter()
+        deadline = started + profile.duration_seconds
+
+        if profile.mode == "closed":
+
+            def closed_client(client_index: int) -> None:
+                context_id = f"load-{profile.seed}-{client_index}" if profile.use_context_ids else None
+                while time.perf_counter() < deadline:
+                    version, fen = next_request()
+                    sample = post_move(api_client, version, fen, context_id)
+                    with samples_lock:
+                        samples.append(sample)
+
+            threads = [
+                threading.Thread(target=closed_client, args=(index,), name=f"load-client-{index}", daemon=True)
+                for index in range(profile.concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        else:
+            # Open loop: arrivals follow a Poisson process regardless of how fast the server answers, and
+            # latency is measured from the scheduled arrival so queueing delay is not hidden (no
+            # coordinated omission).
+            arrival_rng = random.Random(profile.seed + 1)
+
+            def fire(scheduled_at: float, version: str, fen: str) -> None:
+                sample = post_move(api_client, version, fen, None)
+                sample.latency_ms = max(0.0, time.perf_counter() - scheduled_at) * 1000.0
+                with samples_lock:
+                    samples.append(sample)
+
+            with ThreadPoolExecutor(max_workers=profile.concurrency, thread_name_prefix="load-open") as executor:
+                next_arrival = started
+                while True:
+                    next_arrival += arrival_rng.expovariate(profile.rate_per_second)
+                    if next_arrival >= deadline:
+                        break
+                    time.sleep(max(0.0, next_arrival - time.perf_counter()))
+                    version, fen = next_request()
+                    executor.submit(fire, next_arrival, version, fen)
+
+        wall_seconds = time.perf_counter() - started
+    return LoadRunResult(profile=profile, wall_seconds=wall_seconds, samples=samples)
+
+
+def latency_percentiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    data = np.asarray(values, dtype=np.float64)
+    p50, p95, p99 = np.percentile(data, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(data.max())}
+
+
+def summarize_samples(samples: list[LoadSample], wall_seconds: float) -> dict[str, Any]:
+    ok = [sample for sample in samples if sample.ok]
+    processing = [sample.processing_time_ms for sample in ok if sample.processing_time_ms is not None]
+    overhead = [
+        sample.latency_ms - sample.processing_time_ms for sample in ok if sample.processing_time_ms is not None
+    ]
+    depths = [sample.completed_depth for sample in ok if sample.completed_depth is not None]
+    book = [sample.opening_book_hit for sample in ok if sample.opening_book_hit is not None]
+    return {
+        "requests": len(samples),
+        "successful": len(ok),
+        "error_rate": (len(samples) - len(ok)) / len(samples) if samples else 0.0,
+        "requests_per_second": len(ok) / wall_seconds if wall_seconds > 0 else 0.0,
+        "latency_ms": latency_percentiles([sample.latency_ms for sample in ok]),
+        "server_processing_ms": latency_percentiles(processing),
+        "client_overhead_ms": latency_percentiles(overhead),
+        "average_completed_depth": float(np.mean(depths)) if depths else None,
+        "opening_book_hit_rate": sum(book) / len(book) if book else None,
+        "errors": sorted({sample.error or f"http_{sample.status}" for sample in samples if not sample.ok}),
+    }
+
+
+def summarize_load(result: LoadRunResult) -> dict[str, Any]:
+    by_version: dict[str, list[LoadSample]] = {}
+    for sample in result.samples:
+        by_version.setdefault(sample.version, []).append(sample)
+    return {
+        "profile": asdict(result.profile),
+        "wall_seconds": result.wall_seconds,
+        "overall": summarize_samples(result.samples, result.wall_seconds),
+        "versions": {
+            version: summarize_samples(samples, result.wall_seconds) for version, samples in sorted(by_version.items())
+        },
+    }
+
+
+def format_load_report(report: dict[str, Any]) -> str:
+    def ms(values: dict[str, float | None]) -> str:
+        return "/".join("n/a" if values[key] is None else f"{values[key]:.1f}" for key in ("p50", "p95", "p99", "max"))
+
+    profile = report["profile"]
+    lines = [
+        "",
+        f"Load report: mode={profile['mode']}, concurrency={profile['concurrency']}, wall={report['wall_seconds']:.1f}s",
+    ]
+    for label, summary in [("overall", report["overall"]), *report["versions"].items()]:
+        lines.extend(
+            [
+                f"[{label}] requests={summary['requests']} ok={summary['successful']} "
+                f"error_rate={summary['error_rate']:.4f} rps={summary['requests_per_second']:.2f}",
+                f"  latency p50/p95/p99/max ms: {ms(summary['latency_ms'])}",
+                f"  server processing_time p50/p95/p99/max ms: {ms(summary['server_processing_ms'])}",
+                f"  client overhead (latency - processing_time) p50/p95/p99/max ms: {ms(summary['client_overhead_ms'])}",
+            ]
+        )
+        depth = summary["average_completed_depth"]
+        book = summary["opening_book_hit_rate"]
+        lines.append(
+            f"  average completed depth: {'n/a' if depth is None else f'{depth:.2f}'}, "
+            f"opening book hit rate: {'n/a' if book is None else f'{book:.3f}'}"
+        )
+        if summary["errors"]:
+            lines.append(f"  errors: {', '.join(summary['errors'])}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+"""Compressed retention for autoresearch logs, with transparent streaming reads.
+
+Finished console logs, traces and evaluation CSVs are stream-compressed next to where they were
+written (``<name>.gz``, or ``<name>.zst`` where the standard library has zstd) and recorded in a
+small ``archive-index.json`` per directory. Readers go through ``open_log`` and ``list_logs``,
+which accept the original path and stream whichever form exists, so nothing downstream needs to
+know whether a log has been archived.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+
+INDEX_NAME = "archive-index.json"
+CODEC_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+CODEC_OPENERS: dict[str, Callable[..., IO[bytes]]] = {".gz": gzip.open}
+if zstd is not None:
+    CODEC_OPENERS[".zst"] = zstd.open
+DEFAULT_CODEC = "zstd" if zstd is not None else "gzip"
+COPY_CHUNK_BYTES = 1 << 20
+
+
+@dataclass(frozen=True)
+class ArchivedLog:
+    name: str
+    archive: str
+    codec: str
+    raw_bytes: int
+    stored_bytes: int
+    lines: int
+    # Digest of the uncompressed content, so content-keyed readers need not decompress.
+    sha256: str
+    modified_unix_ms: int
+    archived_at: str
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    compress_after_hours: float | None
+    delete_after_days: float | None
+    max_total_mb: float | None
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    directory: Path
+    compressed: int
+    deleted: int
+    bytes_before: int
+    bytes_after: int
+
+
+def available_codecs() -> tuple[str, ...]:
+    return tuple(codec for codec, suffix in CODEC_SUFFIXES.items() if suffix in CODEC_OPENERS)
+
+
+def archived_path(path: Path) -> Path | None:
+    for suffix in CODEC_OPENERS:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def open_log(
+    path: Path,
+    mode: str = "r",
+    *,
+    encoding: str = "utf-8",
+    errors: str | None = None,
+    newline: str | None = None,
+) -> IO[Any]:
+    """Open ``path`` for reading, falling back to its compressed archive when it has been archived."""
+    if mode not in ("r", "rb"):
+        raise ValueError(f"open_log only reads; got mode {mode!r}")
+    if path.exists():
+        if mode == "rb":
+            return path.open("rb")
+        return path.open(encoding=encoding, errors=errors, newline=newline)
+    archive = archived_path(path)
+    if archive is None:
+        raise FileNotFoundError(path)
+    raw = CODEC_OPENERS[archive.suffix](archive, "rb")
+    if mode == "rb":
+        return raw
+    return io.TextIOWrapper(raw, encoding=encoding, errors=errors, newline=newline)
+
+
+def log_exists(path: Path) -> bool:
+    return path.exists() or archived_path(path) is not None
+
+
+def list_logs(directory: Path, pattern: str) -> list[Path]:
+    """Logical paths of every log matching ``pattern``, whether it is stored plain or archived."""
+    if not directory.is_dir():
+        return []
+    names = {path.name for path in directory.glob(pattern)}
+    for suffix in CODEC_OPENERS:
+        names.update(path.name.removesuffix(suffix) for path in directory.glob(pattern + suffix))
+    return [directory / name for name in sorted(names)]
+
+
+def log_digest(path: Path) -> str:
+    """SHA-256 of the uncompressed content, from the index when the log is archived."""
+    if not path.exists():
+        entry = read_index(path.parent).get(path.name)
+        if entry is not None and entry.sha256 and archived_path(path) is not None:
+            return entry.sha256
+    digest = hashlib.sha256()
+    with open_log(path, "rb") as handle:
+        while chunk := handle.read(COPY_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_index(directory: Path) -> dict[str, ArchivedLog]:
+    path = directory / INDEX_NAME
+    if not path.exists():
+        return {}
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return {name: ArchivedLog(**item) for name, item in payload.get("logs", {}).items()}
+
+
+def write_index(directory: Path, index: dict[str, ArchivedLog]) -> None:
+    path = directory / INDEX_NAME
+    temporary = path.with_name(path.name + ".tmp")
+    payload = {"logs": {name: asdict(entry) for name, entry in sorted(index.items())}}
+    temporary.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def compress_log(path: Path, codec: str = DEFAULT_CODEC) -> ArchivedLog:
+    """Stream ``path`` into its archive, then delete the original; digest and line count come for free."""
+    suffix = CODEC_SUFFIXES[codec]
+    if suffix not in CODEC_OPENERS:
+        raise ValueError(f"{codec} compression is not available in this Python")
+    archive = path.with_name(path.name + suffix)
+    temporary = archive.with_name(archive.name + ".tmp")
+    stat = path.stat()
+    digest = hashlib.sha256()
+    raw_bytes = lines = 0
+    with path.open("rb") as source, CODEC_OPENERS[suffix](temporary, "wb") as target:
+        while chunk := source.read(COPY_CHUNK_BYTES):
+            digest.update(chunk)
+            raw_bytes += len(chunk)
+            lines += chunk.count(b"\n")
+            target.write(chunk)
+    os.utime(temporary, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(temporary, archive)
+    path.unlink()
+    return ArchivedLog(
+        name=path.name,
+        archive=archive.name,
+        codec=codec,
+        raw_bytes=raw_bytes,
+        stored_bytes=archive.stat().st_size,
+        lines=lines,
+        sha256=digest.hexdigest(),
+        modified_unix_ms=stat.st_mtime_ns // 1_000_000,
+        archived_at=dt.datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+def apply_retention(
+    directory: Path,
+    patterns: Iterable[str],
+    policy: RetentionPolicy,
+    *,
+    codec: str = DEFAULT_CODEC,
+    keep: Iterable[Path] = (),
+    dry_run: bool = False,
+    now: float | None = None,
+) -> RetentionReport:
+    """Compress finished logs, then delete archives by age and, oldest first, down to the size cap.
+
+    A log counts as finished once it has not been written for ``compress_after_hours``; plain logs
+    are never deleted, so a log is always readable until it has been archived and aged out.
+    """
+    now = time.time() if now is None else now
+    kept = {path.resolve() for path in keep}
+    index = read_index(directory)
+    patterns = tuple(patterns)
+    plain = sorted(
+        {path for pattern in patterns for path in directory.glob(pattern) if path.is_file() and path.resolve() not in kept}
+    )
+    bytes_before = stored_bytes(directory, patterns)
+
+    compressed = 0
+    if policy.compress_after_hours is not None:
+        cutoff = now - policy.compress_after_hours * 3600
+        for path in plain:
+            if path.stat().st_mtime > cutoff:
+                continue
+            compressed += 1
+            if not dry_run:
+                entry = compress_log(path, codec)
+                index[entry.name] = entry
+
+    # Archives written before the index existed, or by hand, are adopted with what can be read cheaply.
+    for suffix in CODEC_OPENERS:
+        for archive in directory.glob(f"*{suffix}"):
+            name = archive.name.removesuffix(suffix)
+            if name not in index and any(Path(name).match(pattern) for pattern in patterns):
+                stat = archive.stat()
+                index[name] = ArchivedLog(
+                    name=name,
+                    archive=archive.name,
+                    codec="",
+                    raw_bytes=0,
+                    stored_bytes=stat.st_size,
+                    lines=0,
+                    sha256="",
+                    modified_unix_ms=stat.st_mtime_ns // 1_000_000,
+                    archived_at="",
+                )
+
+    deleted: list[str] = []
+    if policy.delete_after_days is not None:
+        cutoff_ms = (now - policy.delete_after_days * 86_400) * 1000
+        deleted.extend(name for name, entry in index.items() if entry.modified_unix_ms < cutoff_ms)
+    if policy.max_total_mb is not None:
+        remaining = sorted(
+            (entry for name, entry in index.items() if name not in deleted),
+            key=lambda entry: entry.modified_unix_ms,
+        )
+        total = stored_bytes(directory, patterns) if not dry_run else bytes_before
+        limit = policy.max_total_mb * 1024 * 1024
+        for entry in remaining:
+            if total <= limit:
+                break
+            deleted.append(entry.name)
+            total -= entry.stored_bytes
+
+    if not dry_run:
+        for name in deleted:
+            (directory / index.pop(name).archive).unlink(missing_ok=True)
+        if index or (directory / INDEX_NAME).exists():
+            write_index(directory, index)
+
+    bytes_after = bytes_before if dry_run else stored_bytes(directory, patterns)
+    return RetentionReport(directory, compressed, len(deleted), bytes_before, bytes_after)
+
+
+def stored_bytes(directory: Path, patterns: Iterable[str]) -> int:
+    """On-disk size of every log matching ``patterns``, plain or archived."""
+    total = 0
+    for pattern in patterns:
+        for suffix in ("", *CODEC_OPENERS):
+            total += sum(path.stat().st_size for path in directory.glob(pattern + suffix) if path.is_file())
+    return total
+
+
+def prune_directories(
+    root: Path,
+    pattern: str,
+    max_age_days: float,
+    *,
+    keep: Iterable[Path] = (),
+    dry_run: bool = False,
+) -> list[Path]:
+    """Remove subdirectories of ``root`` whose newest file is older than ``max_age_days``."""
+    if not root.is_dir():
+        return []
+    kept = {path.resolve() for path in keep}
+    cutoff = time.time() - max_age_days * 86_400
+    pruned = []
+    for directory in sorted(root.glob(pattern)):
+        if not directory.is_dir() or directory.resolve() in kept:
+            continue
+        newest = max(
+            (path.stat().st_mtime for path in directory.rglob("*") if path.is_file()),
+            default=directory.stat().st_mtime,
+        )
+        if newest < cutoff:
+            pruned.append(directory)
+            if not dry_run:
+                shutil.rmtree(directory)
+    return pruned
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Aggregate autoresearch phase spans across runs, or export them as a Chrome trace."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+from pathlib import Path
+
+from phase_trace import (
+    ATTEMPT_PHASE,
+    SPAN_PERCENTILES,
+    PhaseSpan,
+    attempts_per_day,
+    chrome_trace,
+    load_history,
+    phase_statistics,
+)
+from run_autoresearch import REPO_ROOT, TEXT_LOG_DIR, emit_console, format_elapsed_duration, log_phase
+
+
+def main() -> int:
+    args = parse_args()
+    spans = load_history(args.paths or [TEXT_LOG_DIR])
+    if args.since is not None:
+        cutoff = dt.datetime.combine(args.since, dt.time()).timestamp() * 1000
+        spans = [span for span in spans if span.start_unix_ms >= cutoff]
+    if not spans:
+        raise SystemExit("No phase spans found.")
+
+    if args.command == "chrome":
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(chrome_trace(spans)) + "\n", encoding="utf-8")
+        log_phase(f"Wrote {len(spans)} spans to {args.output}. Open it in chrome://tracing or ui.perfetto.dev.")
+        return 0
+
+    emit_console(format_report(spans))
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report where autoresearch time goes across runs.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    report = subcommands.add_parser(
+        "report",
+        help="Per-phase duration percentiles and attempts per day.",
+    )
+    chrome = subcommands.add_parser("chrome", help="Convert spans to a Chrome trace JSON file.")
+    chrome.add_argument(
+        "--output",
+        type=Path,
+        default=REPO_ROOT / "autoresearch" / "console-logs" / "trace-chrome.json",
+        help="Chrome trace output path.",
+    )
+    for subcommand in (report, chrome):
+        subcommand.add_argument(
+            "paths",
+            nargs="*",
+            type=Path,
+            help="Trace files, console logs, or directories. Defaults to autoresearch/console-logs.",
+        )
+        subcommand.add_argument(
+            "--since",
+            type=dt.date.fromisoformat,
+            help="Only include spans that started on or after this date (YYYY-MM-DD).",
+        )
+    return parser.parse_args()
+
+
+def format_report(spans: list[PhaseSpan]) -> str:
+    attempts = [span for span in spans if span.phase == ATTEMPT_PHASE]
+    attempt_seconds = sum(span.duration_seconds for span in attempts)
+    header = (
+        f"{'phase':<22}{'count':>7}{'failed':>8}"
+        + "".join(f"{f'p{p}':>10}" for p in SPAN_PERCENTILES)
+        + f"{'max':>10}{'total':>12}{'share':>8}"
+    )
+    lines = [f"Phase durations over {len(spans)} spans from {len({span.run for span in spans})} runs:", header]
+    for stats in phase_statistics(spans):
+        share = f"{stats.total_seconds / attempt_seconds:.1%}" if attempt_seconds > 0 else "n/a"
+        lines.append(
+            f"{stats.phase:<22}{stats.count:>7}{stats.failed:>8}"
+            + "".join(f"{format_elapsed_duration(stats.percentiles_seconds[p]):>10}" for p in SPAN_PERCENTILES)
+            + f"{format_elapsed_duration(stats.max_seconds):>10}"
+            + f"{format_elapsed_duration(stats.total_seconds):>12}{share:>8}"
+        )
+    lines.append("share is the phase total over total attempt wall time; nested phases overlap the attempt row.")
+
+    days = attempts_per_day(spans)
+    if days:
+        first = min(span.start_unix_ms for span in attempts)
+        last = max(span.end_unix_ms for span in attempts)
+        window_days = max((last - first) / 86_400_000, 1 / 24)
+        lines.extend(
+            [
+                "",
+                f"Throughput: {len(attempts)} attempts, {len(attempts) / window_days:.1f} per day over the "
+                f"{window_days:.1f}-day window, {len(attempts) / max(attempt_seconds / 86_400, 1e-9):.1f} per day of busy loop time.",
+                f"{'day':<12}{'attempts':>10}{'approved':>10}{'rejected':>10}{'other':>8}{'busy':>12}",
+            ]
+        )
+        for day, items in days.items():
+            approved = sum(1 for span in items if span.outcome == "approved")
+            rejected = sum(1 for span in items if span.outcome == "rejected")
+            busy = sum(span.duration_seconds for span in items)
+            lines.append(
+                f"{day.isoformat():<12}{len(items):>10}{approved:>10}{rejected:>10}"
+                f"{len(items) - approved - rejected:>8}{format_elapsed_duration(busy):>12}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
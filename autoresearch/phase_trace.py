@@ -0,0 +1,298 @@
+"""Structured phase spans for the autoresearch loop.
+
+Every run writes ``console-logs/<stamp>-trace.jsonl`` next to its ``<stamp>-log.txt``; each line is one
+finished span. Console logs from before spans existed are parsed back into approximate spans from
+their ``[autoresearch HH:MM:SS]`` phase messages, so the timing report covers the whole history.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import json
+import re
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from log_archive import CODEC_OPENERS, list_logs, open_log
+
+
+LOG_STAMP_RE = re.compile(r"(?P<stamp>\d{8}-\d{6})")
+CONSOLE_LINE_RE = re.compile(r"^\[autoresearch (?P<clock>\d\d:\d\d:\d\d)\] (?P<message>.*)$")
+EXPERIMENT_TIMING_RE = re.compile(
+    r"^Experiment timing for (?P<candidate>\S+): start=(?P<start>[\d-]+ [\d:]+), end=(?P<end>[\d-]+ [\d:]+),"
+)
+# (pattern, phase, edge). One message can close one phase and open the next.
+CONSOLE_PHASE_MARKERS = (
+    (re.compile(r"^(Re-p|P)reparing sandbox for "), "sandbox", "start"),
+    (re.compile(r"^Sandbox ready at "), "sandbox", "end"),
+    (re.compile(r"^Codex turn started: \S+ implementation\."), "codex_implementation", "start"),
+    (re.compile(r"^Codex turn completed: \S+ implementation \((?P<outcome>[^)]*)\)"), "codex_implementation", "end"),
+    (re.compile(r"^Codex turn started: \S+ evaluation follow-up\."), "codex_result_update", "start"),
+    (
+        re.compile(r"^Codex turn completed: \S+ evaluation follow-up \((?P<outcome>[^)]*)\)"),
+        "codex_result_update",
+        "end",
+    ),
+    (re.compile(r"^Running solution build for "), "build", "start"),
+    (re.compile(r"^Build (?P<outcome>succeeded|failed)"), "build", "end"),
+    (re.compile(r"^Build succeeded\. Starting evaluator run\."), "evaluator", "start"),
+    (re.compile(r"^Evaluator (?P<outcome>finished|failed)"), "evaluator", "end"),
+    (re.compile(r"^Persisting attempt outcome: "), "record", "start"),
+    (re.compile(r"^(Recorded git commit|Experiment timing for)"), "record", "end"),
+)
+PREPARING_SANDBOX_RE = re.compile(
+    r"^(?:Re-p|P)reparing sandbox for (?:next candidate |retry of )?(?P<candidate>v\d+\.\d+)"
+)
+STARTING_ATTEMPT_RE = re.compile(r"^Starting attempt for (?P<candidate>\S+)\.")
+BUILD_ATTEMPT_RE = re.compile(r"^Running solution build for \S+ \(attempt (?P<attempt>[^)]+)\)")
+ATTEMPT_OUTCOME_RE = re.compile(r"^Persisting attempt outcome: (?P<outcome>[\w ]+)\.")
+TURN_TIMEOUT_RE = re.compile(r"^Codex turn '.*' exceeded \d+ minutes\.")
+ATTEMPT_PHASE = "attempt"
+FAILED_OUTCOMES = frozenset({"error", "failed", "interrupted", "timed_out", "blocked", "incomplete"})
+SPAN_PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True)
+class PhaseSpan:
+    phase: str
+    start_unix_ms: int
+    end_unix_ms: int
+    candidate: str | None
+    attempt: str | None
+    outcome: str
+    run: str
+    detail: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        return max(0, self.end_unix_ms - self.start_unix_ms) / 1000.0
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    phase: str
+    count: int
+    failed: int
+    percentiles_seconds: dict[int, float]
+    max_seconds: float
+    total_seconds: float
+
+
+class PhaseTracer:
+    """Appends finished spans to a JSONL file, tagging each with the current candidate and attempt."""
+
+    def __init__(self, path: Path, run: str) -> None:
+        self.path = path
+        self.run = run
+        self.candidate: str | None = None
+        self.attempt: str | None = None
+
+    def set_context(self, *, candidate: str | None, attempt: str | None) -> None:
+        self.candidate = candidate
+        self.attempt = attempt
+
+    def record(self, phase: str, start_unix_ms: int, end_unix_ms: int, outcome: str, **detail: Any) -> None:
+        span = PhaseSpan(
+            phase=phase,
+            start_unix_ms=start_unix_ms,
+            end_unix_ms=end_unix_ms,
+            candidate=self.candidate,
+            attempt=self.attempt,
+            outcome=outcome,
+            run=self.run,
+            detail=detail,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(asdict(span)) + "\n")
+
+    @contextlib.contextmanager
+    def span(self, phase: str, **detail: Any) -> Iterator[dict[str, Any]]:
+        # The caller may set result["outcome"]; an exception records "error" and propagates.
+        result: dict[str, Any] = {"outcome": "ok"}
+        start = unix_ms()
+        try:
+            yield result
+        except BaseException as exc:
+            self.record(phase, start, unix_ms(), "error", **detail, error=type(exc).__name__)
+            raise
+        self.record(phase, start, unix_ms(), str(result["outcome"]), **detail)
+
+
+def unix_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def read_trace(path: Path) -> list[PhaseSpan]:
+    spans = []
+    with open_log(path) as handle:
+        for line in handle:
+            if line.strip():
+                spans.append(PhaseSpan(**json.loads(line)))
+    return spans
+
+
+def read_console_log(path: Path) -> list[PhaseSpan]:
+    """Rebuild approximate spans (1 s resolution) from a console log written before traces existed."""
+    match = LOG_STAMP_RE.search(path.name)
+    if match is None:
+        return []
+    run = match.group("stamp")
+    day = dt.datetime.strptime(run, "%Y%m%d-%H%M%S").date()
+    previous_clock: dt.time | None = None
+    candidate: str | None = None
+    attempt: str | None = None
+    attempt_outcome: str | None = None
+    open_spans: dict[str, tuple[int, str | None, str | None]] = {}
+    spans: list[PhaseSpan] = []
+
+    def close(phase: str, end: int, outcome: str) -> None:
+        start, span_candidate, span_attempt = open_spans.pop(phase)
+        spans.append(PhaseSpan(phase, start, end, span_candidate, span_attempt or attempt, outcome, run))
+
+    with open_log(path, errors="replace") as handle:
+        for line in handle:
+            line_match = CONSOLE_LINE_RE.match(line.rstrip("\n"))
+            if line_match is None:
+                continue
+            clock = dt.time.fromisoformat(line_match.group("clock"))
+            if previous_clock is not None and clock < previous_clock:
+                day += dt.timedelta(days=1)
+            previous_clock = clock
+            at = int(dt.datetime.combine(day, clock).timestamp() * 1000)
+            message = line_match.group("message")
+
+            if preparing := PREPARING_SANDBOX_RE.match(message):
+                candidate, attempt = preparing.group("candidate"), None
+            if starting := STARTING_ATTEMPT_RE.match(message):
+                candidate, attempt, attempt_outcome = starting.group("candidate"), None, None
+            if build := BUILD_ATTEMPT_RE.match(message):
+                attempt = build.group("attempt")
+            if outcome := ATTEMPT_OUTCOME_RE.match(message):
+                attempt_outcome = outcome.group("outcome")
+            if TURN_TIMEOUT_RE.match(message):
+                attempt_outcome = "timed_out"
+            for pattern, phase, edge in CONSOLE_PHASE_MARKERS:
+                marker = pattern.match(message)
+                if marker is None:
+                    continue
+                if edge == "start":
+                    open_spans[phase] = (at, candidate, attempt)
+                elif phase in open_spans:
+                    outcome_text = marker.groupdict().get("outcome")
+                    close(phase, at, legacy_outcome(outcome_text))
+            if timing := EXPERIMENT_TIMING_RE.match(message):
+                start = dt.datetime.strptime(timing.group("start"), "%Y-%m-%d %H:%M:%S")
+                end = dt.datetime.strptime(timing.group("end"), "%Y-%m-%d %H:%M:%S")
+                spans.append(
+                    PhaseSpan(
+                        ATTEMPT_PHASE,
+                        int(start.timestamp() * 1000),
+                        int(end.timestamp() * 1000),
+                        timing.group("candidate"),
+                        attempt,
+                        attempt_outcome or "incomplete",
+                        run,
+                    )
+                )
+    return spans
+
+
+def legacy_outcome(text: str | None) -> str:
+    if text in (None, "completed", "succeeded", "finished"):
+        return "ok"
+    return text.replace(" ", "_")
+
+
+def load_history(paths: list[Path]) -> list[PhaseSpan]:
+    """Load spans from trace files, console logs, or directories of both, archived or not.
+
+    A console log with a sibling trace file is skipped, since the trace is exact.
+    """
+    files: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(list_logs(path, "*-trace.jsonl") + list_logs(path, "*log.txt"))
+        elif path.suffix in CODEC_OPENERS:
+            # An archive named directly is read through its logical name, like those found in directories.
+            files.append(path.with_suffix(""))
+        else:
+            files.append(path)
+    traced = set()
+    for file in files:
+        match = LOG_STAMP_RE.search(file.name)
+        if file.suffix == ".jsonl" and match is not None:
+            traced.add(match.group("stamp"))
+    spans: list[PhaseSpan] = []
+    for file in files:
+        if file.suffix == ".jsonl":
+            spans.extend(read_trace(file))
+            continue
+        match = LOG_STAMP_RE.search(file.name)
+        if match is not None and match.group("stamp") not in traced:
+            spans.extend(read_console_log(file))
+    return sorted(spans, key=lambda span: span.start_unix_ms)
+
+
+def chrome_trace(spans: list[PhaseSpan]) -> dict[str, Any]:
+    """Complete ("X") events for chrome://tracing or Perfetto; one process row per autoresearch run."""
+    runs = sorted({span.run for span in spans})
+    pids = {run: index + 1 for index, run in enumerate(runs)}
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pids[run], "tid": 1, "args": {"name": f"autoresearch {run}"}}
+        for run in runs
+    ]
+    for span in spans:
+        events.append(
+            {
+                "name": span.phase,
+                "cat": "autoresearch",
+                "ph": "X",
+                "ts": span.start_unix_ms * 1000,
+                "dur": max(0, span.end_unix_ms - span.start_unix_ms) * 1000,
+                "pid": pids[span.run],
+                "tid": 1,
+                "args": {
+                    "candidate": span.candidate,
+                    "attempt": span.attempt,
+                    "outcome": span.outcome,
+                    **span.detail,
+                },
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def phase_statistics(spans: list[PhaseSpan]) -> list[PhaseStats]:
+    by_phase: dict[str, list[PhaseSpan]] = {}
+    for span in spans:
+        by_phase.setdefault(span.phase, []).append(span)
+    stats = []
+    for phase, items in by_phase.items():
+        durations = np.array([span.duration_seconds for span in items], dtype=np.float64)
+        stats.append(
+            PhaseStats(
+                phase=phase,
+                count=len(items),
+                failed=sum(1 for span in items if span.outcome in FAILED_OUTCOMES),
+                percentiles_seconds={p: float(np.percentile(durations, p)) for p in SPAN_PERCENTILES},
+                max_seconds=float(durations.max()),
+                total_seconds=float(durations.sum()),
+            )
+        )
+    return sorted(stats, key=lambda item: item.total_seconds, reverse=True)
+
+
+def attempts_per_day(spans: list[PhaseSpan]) -> dict[dt.date, list[PhaseSpan]]:
+    days: dict[dt.date, list[PhaseSpan]] = {}
+    for span in spans:
+        if span.phase == ATTEMPT_PHASE:
+            day = dt.datetime.fromtimestamp(span.start_unix_ms / 1000).date()
+            days.setdefault(day, []).append(span)
+    return dict(sorted(days.items()))
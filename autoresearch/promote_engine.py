@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Latency SLO gate that marks an approved engine as served in CHANGELOG.json."""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import datetime as dt
+import json
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from load_test import (
+    DEFAULT_PORT,
+    LoadProfile,
+    load_fen_corpus,
+    local_api,
+    process_tree_peak_rss_mb,
+    run_load,
+    summarize_samples,
+)
+from run_autoresearch import emit_console, load_changelog, load_state, log_phase, parse_version, write_changelog
+
+
+@dataclass(frozen=True)
+class ServingMeasurement:
+    version: str
+    requests: int
+    error_rate: float
+    requests_per_second: float
+    p50_latency_ms: float | None
+    p95_latency_ms: float | None
+    p99_latency_ms: float | None
+    p99_processing_ms: float | None
+    peak_rss_mb: float | None
+
+
+@dataclass(frozen=True)
+class SloCheck:
+    name: str
+    passed: bool
+    detail: str
+
+
+def main() -> int:
+    args = parse_args()
+    slo = load_state()["serving"]["slo"]
+    changelog = load_changelog()
+    candidate = find_changelog_entry(changelog, args.version)
+    if candidate.get("status") != "approved":
+        raise SystemExit(f"{candidate['version']} has status {candidate.get('status')!r}; only approved engines can be promoted.")
+    baseline = find_changelog_entry(changelog, args.baseline) if args.baseline else current_served_entry(changelog, candidate)
+
+    profile = LoadProfile(
+        mode="closed",
+        concurrency=int(slo["concurrency"]),
+        duration_seconds=float(args.duration or slo["duration_seconds"]),
+        rate_per_second=0.0,
+        versions={},
+        request_timeout_seconds=float(slo["engine_time_limit_seconds"]) * 10.0,
+        use_context_ids=True,
+        seed=args.seed,
+    )
+    fens = load_fen_corpus(seed=args.seed)
+
+    measurements: dict[str, ServingMeasurement] = {}
+    for index, entry in enumerate([item for item in (baseline, candidate) if item is not None]):
+        measurements[normalize_version(entry["version"])] = measure_version(
+            changelog,
+            entry,
+            profile,
+            fens,
+            slo,
+            port=args.port,
+            skip_build=args.skip_build or index > 0,
+        )
+
+    candidate_measurement = measurements[normalize_version(candidate["version"])]
+    baseline_measurement = measurements.get(normalize_version(baseline["version"])) if baseline is not None else None
+    checks = evaluate_slo(candidate_measurement, baseline_measurement, slo)
+    emit_console(format_promotion_report(candidate_measurement, baseline_measurement, checks), flush=True)
+
+    if not all(check.passed for check in checks):
+        log_phase(f"{candidate['version']} failed the serving SLO; CHANGELOG.json was not changed.")
+        return 1
+    if args.dry_run:
+        log_phase(f"{candidate['version']} passed the serving SLO; --dry-run left CHANGELOG.json unchanged.")
+        return 0
+
+    record_promotion(candidate["version"], candidate_measurement, baseline_measurement, slo)
+    log_phase(f"Marked {candidate['version']} as served in CHANGELOG.json.")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test an approved engine against the served one before serving it.")
+    parser.add_argument("version", help="Approved CHANGELOG.json version to promote, for example v4.0.")
+    parser.add_argument(
+        "--baseline",
+        help="Version to compare against. Defaults to the newest version already marked served.",
+    )
+    parser.add_argument("--duration", type=float, help="Measured seconds per version. Defaults to state.json.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Local port for the started API.")
+    parser.add_argument("--seed", type=int, default=1350, help="Seed for FEN order.")
+    parser.add_argument("--skip-build", action="store_true", help="Reuse the existing Engine.Functions Release build.")
+    parser.add_argument("--dry-run", action="store_true", help="Measure and report, but never edit CHANGELOG.json.")
+    return parser.parse_args()
+
+
+def normalize_version(version: str) -> str:
+    normalized = version.strip().lower().replace("_", ".")
+    return normalized if normalized.startswith("v") else f"v{normalized}"
+
+
+def find_changelog_entry(changelog: dict[str, Any], version: str) -> dict[str, Any]:
+    wanted = normalize_version(version)
+    for entry in changelog.get("versions", []):
+        if isinstance(entry, dict) and normalize_version(str(entry.get("version", ""))) == wanted:
+            return entry
+    raise SystemExit(f"{version} is not listed in CHANGELOG.json.")
+
+
+def current_served_entry(changelog: dict[str, Any], candidate: dict[str, Any]) -> dict[str, Any] | None:
+    served = [
+        entry
+        for entry in changelog.get("versions", [])
+        if isinstance(entry, dict)
+        and entry.get("served")
+        and normalize_version(str(entry["version"])) != normalize_version(candidate["version"])
+    ]
+    if not served:
+        return None
+    return max(served, key=lambda entry: parse_version(normalize_version(str(entry["version"]))))
+
+
+def measure_version(
+    changelog: dict[str, Any],
+    entry: dict[str, Any],
+    profile: LoadProfile,
+    fens: list[str],
+    slo: dict[str, Any],
+    *,
+    port: int,
+    skip_build: bool,
+) -> ServingMeasurement:
+    version = normalize_version(entry["version"])
+    # Serve only this version so the peak RSS belongs to one engine's contexts and tables.
+    isolated = copy.deepcopy(changelog)
+    for item in isolated.get("versions", []):
+        if isinstance(item, dict):
+            item["served"] = normalize_version(str(item.get("version", ""))) == version
+
+    with tempfile.TemporaryDirectory(prefix="promote-engine-") as tmp:
+        changelog_path = Path(tmp) / "CHANGELOG.json"
+        changelog_path.write_text(json.dumps(isolated, indent=2) + "\n", encoding="utf-8")
+        with local_api(
+            "dotnet",
+            None,
+            port,
+            "",
+            time_limit_seconds=float(slo["engine_time_limit_seconds"]),
+            extra_env={"ENGINE_CHANGELOG_PATH": str(changelog_path)},
+            skip_build=skip_build,
+        ) as api:
+            versioned = replace(profile, versions={version: 1.0})
+            warmup = replace(versioned, duration_seconds=float(slo["warmup_seconds"]))
+            log_phase(f"Warming up {version}.")
+            run_load(api.base_url, warmup, fens)
+            result = run_load(api.base_url, versioned, fens)
+            peak_rss_mb = process_tree_peak_rss_mb(api.process.pid) if api.process is not None else None
+
+    summary = summarize_samples(result.samples, result.wall_seconds)
+    return ServingMeasurement(
+        version=version,
+        requests=summary["requests"],
+        error_rate=summary["error_rate"],
+        requests_per_second=summary["requests_per_second"],
+        p50_latency_ms=summary["latency_ms"]["p50"],
+        p95_latency_ms=summary["latency_ms"]["p95"],
+        p99_latency_ms=summary["latency_ms"]["p99"],
+        p99_processing_ms=summary["server_processing_ms"]["p99"],
+        peak_rss_mb=peak_rss_mb,
+    )
+
+
+def evaluate_slo(
+    candidate: ServingMeasurement,
+    baseline: ServingMeasurement | None,
+    slo: dict[str, Any],
+) -> list[SloCheck]:
+    checks = [
+        SloCheck(
+            "error_rate",
+            candidate.error_rate <= float(slo["error_rate_max"]),
+            f"{candidate.error_rate:.4f} <= {float(slo['error_rate_max']):.4f}",
+        ),
+        SloCheck(
+            "p99_latency",
+            candidate.p99_latency_ms is not None and candidate.p99_latency_ms <= float(slo["p99_latency_ms_max"]),
+            f"{format_number(candidate.p99_latency_ms)}ms <= {float(slo['p99_latency_ms_max']):.0f}ms",
+        ),
+    ]
+    if baseline is None:
+        return checks
+
+    checks.append(
+        ratio_check(
+            "p99_latency_vs_baseline",
+            candidate.p99_latency_ms,
+            baseline.p99_latency_ms,
+            maximum=float(slo["p99_latency_ratio_max"]),
+        )
+    )
+    checks.append(
+        ratio_check(
+            "throughput_vs_baseline",
+            candidate.requests_per_second,
+            baseline.requests_per_second,
+            minimum=float(slo["throughput_ratio_min"]),
+        )
+    )
+    if candidate.peak_rss_mb is not None and baseline.peak_rss_mb is not None:
+        checks.append(
+            ratio_check(
+                "peak_rss_vs_baseline",
+                candidate.peak_rss_mb,
+                baseline.peak_rss_mb,
+                maximum=float(slo["peak_rss_ratio_max"]),
+            )
+        )
+    return checks
+
+
+def ratio_check(
+    name: str,
+    candidate: float | None,
+    baseline: float | None,
+    *,
+    minimum: float | None = None,
+    maximum: float | None = None,
+) -> SloCheck:
+    if candidate is None or not baseline:
+        return SloCheck(name, False, "not measured")
+    ratio = candidate / baseline
+    passed = (minimum is None or ratio >= minimum) and (maximum is None or ratio <= maximum)
+    bound = f">= {minimum:.2f}" if minimum is not None else f"<= {maximum:.2f}"
+    return SloCheck(name, passed, f"ratio {ratio:.3f} {bound}")
+
+
+def format_number(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:.1f}"
+
+
+def format_promotion_report(
+    candidate: ServingMeasurement,
+    baseline: ServingMeasurement | None,
+    checks: list[SloCheck],
+) -> str:
+    lines = ["", "Serving SLO report"]
+    for measurement in (baseline, candidate):
+        if measurement is None:
+            continue
+        lines.append(
+            f"{measurement.version}: requests={measurement.requests} error_rate={measurement.error_rate:.4f} "
+            f"rps={measurement.requests_per_second:.2f} p50/p95/p99 ms={format_number(measurement.p50_latency_ms)}/"
+            f"{format_number(measurement.p95_latency_ms)}/{format_number(measurement.p99_latency_ms)} "
+            f"peak_rss_mb={format_number(measurement.peak_rss_mb)}"
+        )
+    if baseline is None:
+        lines.append("No served baseline was found; only absolute limits were checked.")
+    for check in checks:
+        lines.append(f"- {check.name}: {'pass' if check.passed else 'FAIL'} ({check.detail})")
+    return "\n".join(lines) + "\n"
+
+
+def record_promotion(
+    version: str,
+    candidate: ServingMeasurement,
+    baseline: ServingMeasurement | None,
+    slo: dict[str, Any],
+) -> None:
+    changelog = load_changelog()
+    entry = find_changelog_entry(changelog, version)
+    entry["served"] = True
+    entry["serving_benchmark"] = {
+        "measured_at": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "engine_time_limit_seconds": float(slo["engine_time_limit_seconds"]),
+        "concurrency": int(slo["concurrency"]),
+        "requests": candidate.requests,
+        "error_rate": round(candidate.error_rate, 4),
+        "requests_per_second": round(candidate.requests_per_second, 3),
+        "p50_latency_ms": round_or_none(candidate.p50_latency_ms),
+        "p95_latency_ms": round_or_none(candidate.p95_latency_ms),
+        "p99_latency_ms": round_or_none(candidate.p99_latency_ms),
+        "p99_processing_ms": round_or_none(candidate.p99_processing_ms),
+        "peak_rss_mb": round_or_none(candidate.peak_rss_mb),
+        "baseline": None
+        if baseline is None
+        else {
+            "version": baseline.version,
+            "requests_per_second": round(baseline.requests_per_second, 3),
+            "p99_latency_ms": round_or_none(baseline.p99_latency_ms),
+            "peak_rss_mb": round_or_none(baseline.peak_rss_mb),
+        },
+    }
+    write_changelog(changelog)
+
+
+def round_or_none(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
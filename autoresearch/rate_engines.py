@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Fit Bayesian Elo ratings for every engine version from all recorded evaluation logs."""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from run_autoresearch import (
+    ELO_LEDGER_PATH,
+    REPO_ROOT,
+    emit_console,
+    fit_elo_history,
+    load_state,
+    log_phase,
+    record_elo_in_changelog,
+    refresh_elo_ledger,
+)
+
+
+def main() -> int:
+    args = parse_args()
+    state = load_state()
+    ledger = refresh_elo_ledger()
+    history = fit_elo_history(state, ledger)
+    fit = history.fit
+    log_phase(
+        f"Fitted {len(fit.players)} players from {history.sources} logs in {fit.iterations} Newton steps: "
+        f"draw_elo={fit.draw_elo:.1f}, white_advantage={fit.white_advantage:.1f}."
+    )
+    engine_players = sorted(history.player_versions, key=lambda player: (history.player_versions[player], player))
+    for player in [*history.anchors, *engine_players]:
+        emit_console(f"{player:<40} {fit.ratings[player]:8.1f} +/- {fit.sd(player):6.1f}  games={fit.games[player]}\n")
+
+    if args.dry_run:
+        return 0
+    ELO_LEDGER_PATH.write_text(json.dumps(ledger, indent=2) + "\n", encoding="utf-8")
+    updated = record_elo_in_changelog(history)
+    log_phase(
+        f"Wrote {ELO_LEDGER_PATH.relative_to(REPO_ROOT)} and Elo for {updated} CHANGELOG.json versions."
+    )
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pool every evaluation CSV into one Bayesian Elo fit.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the ratings without writing the ledger or CHANGELOG.json.",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Apply the log retention policy by hand, inspect what is archived, or stream an archived log."""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+from log_archive import available_codecs, list_logs, open_log, read_index
+from run_autoresearch import RETENTION_TARGETS, REPO_ROOT, apply_log_retention, emit_console, load_state, log_phase
+
+
+def main() -> int:
+    args = parse_args()
+    if args.command == "cat":
+        try:
+            with open_log(args.path, "rb") as handle:
+                shutil.copyfileobj(handle, sys.stdout.buffer)
+        except FileNotFoundError:
+            raise SystemExit(f"No log or archive for {args.path}.")
+        return 0
+
+    if args.command == "status":
+        emit_console(format_status())
+        return 0
+
+    state = load_state()
+    if not state.get("retention", {}).get("enabled", False):
+        log_phase("retention.enabled is false in state.json; applying the configured policies anyway.")
+        state["retention"] = {**state.get("retention", {}), "enabled": True}
+    reports = apply_log_retention(state, dry_run=args.dry_run)
+    if not any(report.compressed or report.deleted for report in reports):
+        log_phase("Log retention: nothing to compress or delete.")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compress, age out and read autoresearch logs.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    apply = subcommands.add_parser("apply", help="Apply the state.json retention policies now.")
+    apply.add_argument("--dry-run", action="store_true", help="Report what would change without touching files.")
+    subcommands.add_parser("status", help="Show plain and archived log counts and sizes per directory.")
+    cat = subcommands.add_parser("cat", help="Stream a log to stdout, decompressing it if it has been archived.")
+    cat.add_argument("path", type=Path, help="Original log path, for example autoresearch/logs/<attempt_id>-result.csv.")
+    return parser.parse_args()
+
+
+def format_status() -> str:
+    lines = [f"Codecs available: {', '.join(available_codecs())}"]
+    for key, directory, patterns in RETENTION_TARGETS:
+        index = read_index(directory)
+        logs = [path for pattern in patterns for path in list_logs(directory, pattern)]
+        archived = [index[path.name] for path in logs if not path.exists() and path.name in index]
+        plain_bytes = sum(path.stat().st_size for path in logs if path.exists())
+        raw_bytes = sum(entry.raw_bytes for entry in archived)
+        stored_bytes = sum(entry.stored_bytes for entry in archived)
+        ratio = f"{raw_bytes / stored_bytes:.1f}x" if stored_bytes and raw_bytes else "n/a"
+        lines.append(
+            f"{key} ({directory.relative_to(REPO_ROOT)}): {len(logs) - len(archived)} plain "
+            f"({plain_bytes / 1048576:.1f} MB), {len(archived)} archived ({stored_bytes / 1048576:.1f} MB stored, "
+            f"{raw_bytes / 1048576:.1f} MB raw, {ratio})"
+        )
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,38 +4,137 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import collections
 import csv
 import datetime as dt
+import functools
+import itertools
 import json
 import math
 import os
 import re
 import shutil
 import smtplib
+import socket
 import subprocess
 import sys
+import tempfile
 import textwrap
 import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from cpu_affinity import format_cpu_sets, plan_worker_cpu_sets, read_cpu_topology
+from codex_usage import (
+    QuotaPlan,
+    QuotaWindow,
+    UsageEntry,
+    append_entry,
+    learned_window,
+    plan_attempt,
+    read_ledger,
+    usage_token_counts,
+)
+from cpu_contention import ContentionSample, ContentionSampler, read_samples
+from direction_bandit import (
+    BanditConfig,
+    DirectionChoice,
+    PromptFamily,
+    attempt_hours,
+    choose_direction,
+    family_statistics,
+    format_direction_choice,
+    read_attempts,
+)
+from elo_model import EloFit, GameCell, RatingPrior, fit_ratings
+from evaluation_records import companion_path, load_evaluation_records, write_companion
+from evaluator_host import EvaluatorHost, EvaluatorHostError, EvaluatorHostExited
+from log_archive import (
+    DEFAULT_CODEC,
+    RetentionPolicy,
+    RetentionReport,
+    apply_retention,
+    list_logs,
+    log_digest,
+    open_log,
+    prune_directories,
+)
+from phase_trace import PhaseTracer, load_history, unix_ms
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 STATE_PATH = REPO_ROOT / "autoresearch" / "state.json"
 ATTEMPTS_PATH = REPO_ROOT / "autoresearch" / "ATTEMPTS.md"
 CHANGELOG_PATH = REPO_ROOT / "CHANGELOG.json"
+NOISE_MODELS_PATH = REPO_ROOT / "autoresearch" / "noise_models.json"
+ELO_LEDGER_PATH = REPO_ROOT / "autoresearch" / "elo_ratings.json"
+CODEX_USAGE_LEDGER_PATH = REPO_ROOT / "autoresearch" / "codex_usage.jsonl"
+EVALUATION_LOG_DIR = REPO_ROOT / "autoresearch" / "logs"
+APPROVED_LOG_DIR = REPO_ROOT / "autoresearch" / "approved_logs"
 SANDBOX_ROOT = REPO_ROOT / "autoresearch-sandbox"
+CANDIDATE_BUILD_ROOT = REPO_ROOT / "autoresearch" / "builds"
+# The evaluator host runs from its own build; commands for the shared tree load a second one that
+# is rebuilt (after unloading it from the host) whenever the tree may have changed.
+HOST_BUILD_DIR = CANDIDATE_BUILD_ROOT / "host"
+SHARED_BUILD_DIR = CANDIDATE_BUILD_ROOT / "shared"
+LOCAL_TESTING_PROJECT = "engine_csharp/src/LocalTesting/LocalTesting.csproj"
 TEXT_LOG_DIR = REPO_ROOT / "autoresearch" / "console-logs"
 LOCAL_ENV_PATH = REPO_ROOT / ".env"
 ENGINE_VERSION_RE = re.compile(r"^v(?P<major>\d+)\.(?P<minor>\d+)$", re.IGNORECASE)
+ENGINE_STEM_RE = re.compile(r"^V(?P<major>\d+)_(?P<minor>\d+)Engine$")
 SOC_CC_EVALUATOR_WORKERS = 12
 SOC_CC_SMTP_HOST = "smtp.gmail.com"
 SOC_CC_SMTP_PORT = 465
 CURRENT_TEXT_LOG: Path | None = None
+PHASE_TRACER: PhaseTracer | None = None
+EVALUATOR_HOST: EvaluatorHost | None = None
 DEFAULT_STOCKFISH_PATH = REPO_ROOT / "autoresearch" / "stockfish" / "stockfish-ubuntu-x86-64-avx2"
+DEFAULT_BOOTSTRAP_RESAMPLES = 10000
+DEFAULT_BOOTSTRAP_SEED = 1350
+DEFAULT_MOVE_TIME_OVERSHOOT_MARGIN = 0.05
+DEFAULT_MOVE_TIME_UNSEEDED_OVERSHOOT_MARGIN = 0.25
+DEFAULT_MOVE_TIME_SEED_GROWTH_RATIO = 1.2
+DEFAULT_CONTENTION_SAMPLE_INTERVAL_SECONDS = 1.0
+DEFAULT_CONTENTION_HEAVY_SCORE = 0.5
+DEFAULT_CONTENTION_MAX_HEAVY_PAIR_FRACTION = 0.05
+DEFAULT_CONTENTION_REQUEUE_ROUNDS = 1
+DEFAULT_AFFINITY_CPUS_PER_WORKER = 2
+DEFAULT_FIXED_NODES_SEED = 1350
+DEFAULT_FIXED_NODES_CALIBRATION_REPEATS = 3
+DEFAULT_T_CRITICAL_ONE_SIDED_95 = 1.650996
+NOISE_MODEL_DRAWS = 20000
+DEFAULT_ELO_VERSION_STEP_SD = 100.0
+DEFAULT_ELO_INITIAL_SD = 1000.0
+DEFAULT_PROFILE_TIME_LIMIT_MS = 200
+DEFAULT_PROFILE_REPEATS = 2
+DEFAULT_PROFILE_TOP_METHODS = 8
+# Codex plans meter a five-hour and a weekly window; token limits are learned from limit errors.
+DEFAULT_CODEX_QUOTA_WINDOWS = {"five_hour": {"hours": 5.0}, "weekly": {"hours": 168.0}}
+DEFAULT_CODEX_QUOTA_RECENT_ATTEMPTS = 10
+DEFAULT_CODEX_QUOTA_COST_PERCENTILE = 90.0
+DEFAULT_CODEX_QUOTA_POLL_MINUTES = 15
+DEFAULT_DIRECTION_PRIOR = 1.0
+DEFAULT_DIRECTION_SCORE_DELTA_SCALE = 0.05
+DEFAULT_DIRECTION_PARTIAL_CREDIT_MAX = 0.5
+DEFAULT_DIRECTION_ATTEMPT_HOURS = 1.0
+DEFAULT_FAN_OUT_VARIANTS = 1
+DEFAULT_FAN_OUT_INITIAL_GAMES = 32
+DEFAULT_EVALUATOR_HOST_MAX_CONTEXTS = 4
+# (state.json retention key, directory, file patterns); approved_logs/ is tracked and never archived.
+RETENTION_TARGETS = (
+    ("console_logs", TEXT_LOG_DIR, ("*-log.txt", "*-trace.jsonl")),
+    ("evaluation_logs", EVALUATION_LOG_DIR, ("*-result.csv", "*-result.evb", "*-contention.jsonl")),
+)
+MOVE_TIME_PERCENTILE_COLUMNS = ("p50", "p95", "p99", "max")
+TERMINATION_CODES = ("checkmate", "max_plies", "illegal_move", "timeout", "engine_exception")
+TERMINATION_OTHER = len(TERMINATION_CODES)
 
 
 @dataclass(frozen=True)
@@ -67,6 +166,91 @@ class EvaluationMetrics:
     pair_sd: float
     lcb95: float
     games: int
+    bootstrap_lcb95: float
+
+
+@dataclass
+class FanOutVariant:
+    index: int
+    candidate: Candidate
+    direction: str | None
+    session: CodexSession | None = None
+    build_dir: Path | None = None
+    build_ok: bool = False
+    # From the last short match the variant played, at ``games`` games.
+    metrics: EvaluationMetrics | None = None
+    games: int = 0
+
+
+@dataclass(frozen=True)
+class FanOutResult:
+    survivor: FanOutVariant
+    note: str
+    # ATTEMPTS.md entries for the eliminated variants, recorded alongside the survivor's outcome.
+    eliminated: list[dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class EvaluationColumns:
+    engine_a_score: np.ndarray
+    plies: np.ndarray
+    pair_number: np.ndarray
+    engine_move_ms: np.ndarray
+    engine_positions: np.ndarray
+    termination: np.ndarray
+    failed: np.ndarray
+    engine_move_ms_percentiles: dict[str, np.ndarray]
+    game_started_unix_ms: np.ndarray | None = None
+    game_finished_unix_ms: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class MoveTimeRisk:
+    time_limit_ms: float
+    workers: int
+    cpu_count: int
+    typical_p50_ms: float | None
+    typical_p95_ms: float | None
+    typical_p99_ms: float | None
+    worst_game_p99_ms: float | None
+    max_move_ms: float | None
+    game_average_p99_ms: float
+    seed_version: str
+    seed_game_average_p99_ms: float | None
+    seed_worst_game_p99_ms: float | None
+    seed_max_move_ms: float | None
+    flagged: bool
+    detail: str
+
+
+@dataclass(frozen=True)
+class EloHistory:
+    fit: EloFit
+    # Player name -> (major, minor) for engine players; Stockfish players are not listed.
+    player_versions: dict[str, tuple[int, int]]
+    anchors: dict[str, float]
+    sources: int
+
+
+@dataclass(frozen=True)
+class HotMethodProfile:
+    # LocalTesting `profile` reports for the candidate and the approved seed on the same positions.
+    candidate: dict[str, Any]
+    seed: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class ContentionReport:
+    sample_count: int
+    mean_score: float
+    peak_score: float
+    peak_load_1m: float
+    heavy_score: float
+    pair_count: int
+    heavy_pairs: tuple[int, ...]
+    requeued_pairs: int
+    flagged: bool
+    detail: str
 
 
 class CodexTurnTimeoutError(RuntimeError):
@@ -126,6 +310,34 @@ def emit_console(message: str, *, stream: Any = sys.stdout, flush: bool = False)
                 handle.flush()
 
 
+def traced_phase(phase: str, outcome: Callable[[Any], str] | None = None) -> Callable[[Any], Any]:
+    """Record every call of the decorated function as a phase span once the run's trace file is open."""
+
+    def decorate(function: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if PHASE_TRACER is None:
+                return function(*args, **kwargs)
+            with PHASE_TRACER.span(phase) as span:
+                result = function(*args, **kwargs)
+                if outcome is not None:
+                    span["outcome"] = outcome(result)
+                return result
+
+        return wrapper
+
+    return decorate
+
+
+def succeeded(result: bool) -> str:
+    return "ok" if result else "failed"
+
+
+def set_trace_context(candidate: Candidate, attempt_id: str | None = None) -> None:
+    if PHASE_TRACER is not None:
+        PHASE_TRACER.set_context(candidate=candidate.version, attempt=attempt_id)
+
+
 def format_elapsed_duration(seconds: float) -> str:
     total_seconds = max(0, int(round(seconds)))
     hours, remainder = divmod(total_seconds, 3600)
@@ -137,9 +349,16 @@ def format_elapsed_duration(seconds: float) -> str:
     return f"{secs:d}s"
 
 
-def log_experiment_duration(candidate: Candidate, started_at: dt.datetime, started_monotonic: float) -> None:
+def log_experiment_duration(
+    candidate: Candidate,
+    started_at: dt.datetime,
+    started_monotonic: float,
+    outcome: str,
+) -> None:
     ended_at = dt.datetime.now()
     elapsed = time.monotonic() - started_monotonic
+    if PHASE_TRACER is not None:
+        PHASE_TRACER.record("attempt", int(started_at.timestamp() * 1000), unix_ms(), outcome)
     log_phase(
         "Experiment timing for "
         f"{candidate.version}: start={started_at.strftime('%Y-%m-%d %H:%M:%S')}, "
@@ -152,6 +371,8 @@ def main() -> int:
     args = parse_args()
     if args.major and not args.prompt:
         raise SystemExit("A major improvement requires additional information about what to modify, so --prompt is required.")
+    if args.prompt and args.direction is not None:
+        raise SystemExit("--direction picks a prompt family; it cannot be combined with --prompt.")
 
     start_text_log()
     try:
@@ -161,9 +382,11 @@ def main() -> int:
     state = load_state()
     if not args.dry_run:
         ensure_clean_worktree()
+        apply_log_retention(state)
 
-    user_input = args.prompt or ""
+    user_input, direction = attempt_direction(state, args)
     candidate = next_candidate(state, args.version, args.major)
+    set_trace_context(candidate)
     log_phase(f"Preparing sandbox for {candidate.version} from seed {state['latest_approved']['version']}.")
     prepare_sandbox(state, candidate, user_input)
     log_phase(f"Sandbox ready at {candidate.sandbox_dir.relative_to(REPO_ROOT)}.")
@@ -173,35 +396,61 @@ def main() -> int:
         emit_console(f"Candidate: {candidate.version} -> {candidate.engine_file.relative_to(REPO_ROOT)}\n")
         return 0
 
+    start_evaluator_host(state)
+
     while True:
+        wait_for_codex_quota(state)
         experiment_started_at = dt.datetime.now()
         experiment_started_monotonic = time.monotonic()
         experiment_log_start_line = current_text_log_line_count()
+        set_trace_context(candidate)
+        attempt_key = f"{candidate.stem}-{experiment_started_at.strftime('%Y%m%d%H%M%S')}"
         log_phase(f"Starting attempt for {candidate.version}.")
+        variants = fan_out_variants(state, args)
+        fan_out: FanOutResult | None = None
         try:
-            codex_session = run_codex_implementation(
-                state,
-                candidate,
-                soc_cc_enabled=args.soc_cc,
-                soc_cc_config=soc_cc,
-                experiment_log_start_line=experiment_log_start_line,
-            )
+            if variants > 1:
+                fan_out = run_fan_out(
+                    state,
+                    candidate,
+                    args,
+                    user_input,
+                    direction,
+                    variants=variants,
+                    attempt_key=attempt_key,
+                    soc_cc_config=soc_cc,
+                    experiment_log_start_line=experiment_log_start_line,
+                )
+                candidate = fan_out.survivor.candidate
+                codex_session = fan_out.survivor.session
+                direction = fan_out.survivor.direction
+            else:
+                codex_session = run_codex_implementation(
+                    state,
+                    candidate,
+                    attempt_key=attempt_key,
+                    soc_cc_enabled=args.soc_cc,
+                    soc_cc_config=soc_cc,
+                    experiment_log_start_line=experiment_log_start_line,
+                )
         except CodexTurnTimeoutError as exc:
             reason = str(exc)
             log_phase(reason)
             cleanup_timed_out_attempt(candidate)
-            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic)
-            choice = prompt_continue("timed out", candidate, reason, soc_cc_enabled=args.soc_cc)
+            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, "timed_out")
+            choice = prompt_continue("timed out", candidate, reason, soc_cc_enabled=args.soc_cc, headless=args.headless)
             if choice == "stop":
                 return 0
             state = load_state()
-            user_input = args.prompt or ""
             log_phase(f"Re-preparing sandbox for retry of {candidate.version}.")
             prepare_sandbox(state, candidate, user_input)
             log_phase(f"Sandbox ready at {candidate.sandbox_dir.relative_to(REPO_ROOT)}.")
             continue
         except (CodexAuthRequiredError, CodexUsageLimitError) as exc:
             log_phase(str(exc))
+            if isinstance(exc, CodexUsageLimitError):
+                record_codex_limit(candidate, attempt_key, exc)
+            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, "blocked")
             emit_console(format_auth_resolution(exc), flush=True)
             if soc_cc is not None:
                 send_soc_cc_blocker_email(
@@ -212,13 +461,26 @@ def main() -> int:
                 )
             return 1
 
-        log_phase(f"Copying {candidate.sandbox_engine_file.name} back into the repository.")
-        copy_candidate_to_repo(candidate)
         attempt_id = make_attempt_id(candidate)
-        log_phase(f"Running solution build for {candidate.version} (attempt {attempt_id}).")
-        build_ok = run_build()
+        set_trace_context(candidate, attempt_id)
+        if fan_out is not None:
+            # The survivor was already built for its fan-out matches.
+            build_dir = fan_out.survivor.build_dir
+            build_ok = fan_out.survivor.build_ok
+        else:
+            build_dir = candidate_build_dir(attempt_id)
+            log_phase(
+                f"Running solution build for {candidate.version} (attempt {attempt_id}) "
+                f"into {build_dir.relative_to(REPO_ROOT)}."
+            )
+            build_ok = run_candidate_build(candidate, build_dir)
 
         metrics: EvaluationMetrics | None = None
+        move_time_risk: MoveTimeRisk | None = None
+        contention: ContentionReport | None = None
+        elo_history: EloHistory | None = None
+        elo_posterior: str | None = None
+        hot_methods: str | None = None
         status = "rejected"
         verdict_reason = "Build failed before evaluator run."
         log_path = REPO_ROOT / "autoresearch" / "logs" / f"{attempt_id}-result.csv"
@@ -231,12 +493,40 @@ def main() -> int:
                 state,
                 attempt_id,
                 args.smoke_games,
+                build_dir=build_dir,
                 soc_cc_enabled=args.soc_cc,
             )
             if evaluator_ok and log_path.exists():
+                contention = requeue_contended_pairs(
+                    candidate,
+                    state,
+                    attempt_id,
+                    log_path,
+                    build_dir=build_dir,
+                    soc_cc_enabled=args.soc_cc,
+                )
+                log_phase(format_contention(contention))
                 log_phase(f"Evaluator finished. Parsing results from {log_path.relative_to(REPO_ROOT)}.")
                 metrics = parse_evaluation_csv(log_path, state)
-                status, verdict_reason = decide_candidate(metrics, state)
+                move_time_risk = analyze_move_time_risk(
+                    log_path,
+                    state,
+                    evaluator_workers(state, soc_cc_enabled=args.soc_cc),
+                )
+                log_phase(format_move_time_risk(move_time_risk))
+                status, verdict_reason = decide_candidate(
+                    metrics,
+                    state,
+                    workers=evaluator_workers(state, soc_cc_enabled=args.soc_cc),
+                )
+                elo_history = update_elo_history(state)
+                elo_posterior = format_elo_posterior(elo_history, candidate, attempt_id, state)
+                log_phase(elo_posterior)
+                if args.profile:
+                    hot_method_profile = profile_candidate_and_seed(candidate, state, build_dir)
+                    if hot_method_profile is not None:
+                        hot_methods = format_hot_methods(hot_method_profile, state)
+                        log_phase(hot_methods)
                 if args.smoke_games is not None:
                     status = "rejected"
                     verdict_reason = (
@@ -244,13 +534,27 @@ def main() -> int:
                     )
                 if status == "approved":
                     approved_log_path = move_approved_log(candidate, log_path, attempt_id)
+                    log_phase(f"Copying {candidate.sandbox_engine_file.name} into the shared engine tree.")
+                    copy_candidate_to_repo(candidate)
             else:
                 verdict_reason = "Evaluator failed or did not produce the canonical CSV."
                 log_phase(verdict_reason)
         else:
             log_phase("Build failed. Skipping evaluator.")
 
-        evaluation_summary = build_evaluation_summary(candidate, status, verdict_reason, metrics, state)
+        evaluation_summary = build_evaluation_summary(
+            candidate,
+            status,
+            verdict_reason,
+            metrics,
+            state,
+            move_time_risk,
+            contention,
+            elo_posterior,
+            hot_methods,
+        )
+        if fan_out is not None:
+            evaluation_summary += f"Fan-out: {fan_out.note}; this evaluation is of the surviving variant.\n"
         log_phase("Sending evaluation summary back into the existing Codex session.")
         try:
             run_codex_result_update(state, candidate, codex_session, evaluation_summary)
@@ -262,18 +566,21 @@ def main() -> int:
                 log_path=log_path if log_path.exists() else None,
                 approved_log_path=approved_log_path,
             )
-            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic)
-            choice = prompt_continue("timed out", candidate, reason, soc_cc_enabled=args.soc_cc)
+            remove_build_dir(build_dir)
+            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, "timed_out")
+            choice = prompt_continue("timed out", candidate, reason, soc_cc_enabled=args.soc_cc, headless=args.headless)
             if choice == "stop":
                 return 0
             state = load_state()
-            user_input = args.prompt or ""
             log_phase(f"Re-preparing sandbox for retry of {candidate.version}.")
             prepare_sandbox(state, candidate, user_input)
             log_phase(f"Sandbox ready at {candidate.sandbox_dir.relative_to(REPO_ROOT)}.")
             continue
         except (CodexAuthRequiredError, CodexUsageLimitError) as exc:
             log_phase(str(exc))
+            if isinstance(exc, CodexUsageLimitError):
+                record_codex_limit(candidate, attempt_key, exc)
+            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, "blocked")
             emit_console(format_auth_resolution(exc), flush=True)
             if soc_cc is not None:
                 send_soc_cc_blocker_email(
@@ -286,7 +593,30 @@ def main() -> int:
         log_phase("Reading structured sandbox result from RETURN.json.")
         attempt_note = read_return_json(candidate)
 
+        if args.result_json is not None:
+            # Farm workers hand the outcome to the coordinator, which owns state.json and git.
+            log_phase(f"Writing attempt result for the farm coordinator: {status}.")
+            write_attempt_result(
+                args.result_json,
+                state,
+                candidate,
+                attempt_id,
+                status,
+                verdict_reason,
+                attempt_note,
+                approved_log_path or (log_path if log_path.exists() else None),
+                hot_methods,
+                direction,
+                fan_out,
+            )
+            remove_build_dir(build_dir)
+            log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, status)
+            return 0
+
         log_phase(f"Persisting attempt outcome: {status}.")
+        if fan_out is not None:
+            for entry in fan_out.eliminated:
+                append_attempt_markdown(entry)
         update_state_and_attempts(
             state,
             candidate,
@@ -297,9 +627,15 @@ def main() -> int:
             metrics,
             log_path,
             approved_log_path,
+            hot_methods,
+            direction=direction,
+            fan_out=fan_out.note if fan_out is not None else None,
         )
+        if elo_history is not None:
+            record_elo_in_changelog(elo_history)
         persist_state(state)
         cleanup_rejected_candidate(candidate, status)
+        remove_build_dir(build_dir)
         push_error: str | None = None
         commit_sha = commit_attempt(candidate, status)
         if commit_sha:
@@ -312,7 +648,7 @@ def main() -> int:
                     push_error = str(exc)
                     log_phase(push_error)
 
-        log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic)
+        log_experiment_duration(candidate, experiment_started_at, experiment_started_monotonic, status)
         if soc_cc is not None:
             send_soc_cc_completion_email(
                 soc_cc,
@@ -326,15 +662,22 @@ def main() -> int:
             )
         if push_error is not None:
             return 1
-        choice = prompt_continue(status, candidate, verdict_reason, soc_cc_enabled=args.soc_cc)
+        choice = prompt_continue(
+            status,
+            candidate,
+            verdict_reason,
+            soc_cc_enabled=args.soc_cc,
+            headless=args.headless,
+        )
         if choice == "stop":
             return 0
         if args.once:
             return 0
 
         state = load_state()
-        user_input = args.prompt or ""
+        user_input, direction = attempt_direction(state, args)
         candidate = next_candidate(state, args.version, args.major)
+        set_trace_context(candidate)
         log_phase(f"Preparing sandbox for next candidate {candidate.version}.")
         prepare_sandbox(state, candidate, user_input)
         log_phase(f"Sandbox ready at {candidate.sandbox_dir.relative_to(REPO_ROOT)}.")
@@ -347,6 +690,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--major", action="store_true", help="Start a new major version experiment. Requires --prompt.")
     parser.add_argument("--dry-run", action="store_true", help="Prepare sandbox only; do not call Codex or evaluate.")
     parser.add_argument("--once", action="store_true", help="Exit after one attempt instead of prompting for another.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Never open KDialog; continue automatically after every attempt. daemon.py runs jobs this way.",
+    )
     parser.add_argument(
         "--soc-cc",
         action="store_true",
@@ -356,19 +704,51 @@ def parse_args() -> argparse.Namespace:
             "using credentials from the repo-local .env file."
         ),
     )
+    parser.add_argument(
+        "--result-json",
+        type=Path,
+        help=(
+            "Farm worker mode: write the attempt outcome, engine source and CSV path to this file instead "
+            "of updating state.json, ATTEMPTS.md and git. Use with --once."
+        ),
+    )
     parser.add_argument(
         "--smoke-games",
         type=int,
         help="Run a non-approving evaluator smoke test with this game count.",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "After evaluation, sample the candidate and the approved seed with EventPipe on a fixed "
+            "position set and add a hot-method table to the Codex follow-up and ATTEMPTS.md."
+        ),
+    )
+    parser.add_argument(
+        "--direction",
+        help=(
+            "Prompt family from agent.directions to use instead of sampling one when --prompt is not given; "
+            "'none' runs without a direction."
+        ),
+    )
+    parser.add_argument(
+        "--fan-out",
+        type=int,
+        help=(
+            "Implement each version in this many sandboxes with diversified prompts and keep the strongest "
+            "by successive halving over short matches; overrides agent.fan_out.variants."
+        ),
+    )
     return parser.parse_args()
 
 
 def start_text_log() -> None:
-    global CURRENT_TEXT_LOG
+    global CURRENT_TEXT_LOG, PHASE_TRACER
     TEXT_LOG_DIR.mkdir(parents=True, exist_ok=True)
     stamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
     CURRENT_TEXT_LOG = TEXT_LOG_DIR / f"{stamp}-log.txt"
+    PHASE_TRACER = PhaseTracer(TEXT_LOG_DIR / f"{stamp}-trace.jsonl", stamp)
     emit_console(f"[autoresearch {dt.datetime.now().strftime('%H:%M:%S')}] Mirroring console output to {CURRENT_TEXT_LOG.relative_to(REPO_ROOT)}.\n", flush=True)
 
 
@@ -430,18 +810,26 @@ def current_text_log_line_count() -> int:
         return sum(1 for _ in handle)
 
 
-def latest_experiment_log_lines(start_line: int) -> list[str]:
-    if CURRENT_TEXT_LOG is None or not CURRENT_TEXT_LOG.exists():
-        return []
-    with CURRENT_TEXT_LOG.open(encoding="utf-8") as handle:
-        lines = handle.readlines()
-    return lines[start_line:]
+def latest_experiment_log_head_tail(start_line: int, lines: int = 100) -> tuple[list[str], list[str]]:
+    # Streams the log so a long run's console mirror is never held in memory just to cut a slice.
+    if CURRENT_TEXT_LOG is None:
+        return [], []
+    head: list[str] = []
+    tail: collections.deque[str] = collections.deque(maxlen=lines)
+    try:
+        with open_log(CURRENT_TEXT_LOG) as handle:
+            for line in itertools.islice(handle, start_line, None):
+                if len(head) < lines:
+                    head.append(line)
+                else:
+                    tail.append(line)
+    except FileNotFoundError:
+        return [], []
+    return head, list(tail)
 
 
 def build_experiment_log_attachment(candidate: Candidate, start_line: int) -> ExperimentNotificationArtifacts:
-    lines = latest_experiment_log_lines(start_line)
-    first_chunk = lines[:100]
-    last_chunk = lines[-100:] if len(lines) > 100 else []
+    first_chunk, last_chunk = latest_experiment_log_head_tail(start_line)
     body = [
         f"# Latest Experiment Log Slice for {candidate.version}",
         "",
@@ -466,6 +854,7 @@ def build_experiment_log_attachment(candidate: Candidate, start_line: int) -> Ex
     )
 
 
+@traced_phase("email")
 def send_soc_cc_email(
     config: SocCcConfig,
     *,
@@ -538,6 +927,7 @@ def send_soc_cc_completion_email(
             f"wins/draws/losses: {metrics.wins}/{metrics.draws}/{metrics.losses}\n"
             f"score_rate: {metrics.score_rate:.4f}\n"
             f"lcb95: {metrics.lcb95:.4f}\n"
+            f"bootstrap_lcb95: {metrics.bootstrap_lcb95:.4f}\n"
             f"max_plies_rate: {metrics.max_plies_rate:.4f}\n"
             f"average_plies: {metrics.average_plies:.2f}\n"
             f"average_processing_time_ms: {metrics.average_processing_time_ms:.3f}\n"
@@ -575,6 +965,57 @@ def ensure_clean_worktree() -> None:
         raise SystemExit("Working tree must be clean before running autoresearch.")
 
 
+def retention_policy(settings: dict[str, Any]) -> RetentionPolicy:
+    def optional(name: str) -> float | None:
+        value = settings.get(name)
+        return None if value is None else float(value)
+
+    return RetentionPolicy(
+        compress_after_hours=optional("compress_after_hours"),
+        delete_after_days=optional("delete_after_days"),
+        max_total_mb=optional("max_total_mb"),
+    )
+
+
+def apply_log_retention(state: dict[str, Any], *, dry_run: bool = False) -> list[RetentionReport]:
+    """Archive finished console and evaluation logs and prune stale sandboxes per ``state["retention"]``."""
+    retention = state.get("retention", {})
+    if not retention.get("enabled", False):
+        return []
+    codec = str(retention.get("codec", DEFAULT_CODEC))
+    # This run's own console log and trace are still being written.
+    keep = [path for path in (CURRENT_TEXT_LOG, PHASE_TRACER.path if PHASE_TRACER else None) if path is not None]
+    reports = []
+    for key, directory, patterns in RETENTION_TARGETS:
+        if key not in retention:
+            continue
+        report = apply_retention(
+            directory,
+            patterns,
+            retention_policy(retention[key]),
+            codec=codec,
+            keep=keep,
+            dry_run=dry_run,
+        )
+        reports.append(report)
+        if report.compressed or report.deleted:
+            log_phase(
+                f"Log retention for {directory.relative_to(REPO_ROOT)}: "
+                f"{'would compress' if dry_run else 'compressed'} {report.compressed}, "
+                f"{'would delete' if dry_run else 'deleted'} {report.deleted}, "
+                f"{report.bytes_before / 1048576:.1f} MB -> {report.bytes_after / 1048576:.1f} MB."
+            )
+    sandbox_days = retention.get("sandbox", {}).get("delete_after_days")
+    if sandbox_days is not None:
+        pruned = prune_directories(SANDBOX_ROOT, "V*_*", float(sandbox_days), dry_run=dry_run)
+        if pruned:
+            log_phase(
+                f"Log retention: {'would remove' if dry_run else 'removed'} {len(pruned)} sandboxes idle for over "
+                f"{sandbox_days} days ({', '.join(path.name for path in pruned)})."
+            )
+    return reports
+
+
 def next_candidate(state: dict[str, Any], forced_version: str | None, major: bool) -> Candidate:
     version_bump = "major" if major else "minor"
     version = forced_version or (
@@ -609,6 +1050,62 @@ def bump_major(version: str) -> str:
     return f"v{int(match.group('major')) + 1}.0"
 
 
+@traced_phase("sandbox")
+def direction_families(state: dict[str, Any]) -> list[PromptFamily]:
+    families = state.get("agent", {}).get("directions", {}).get("families", {})
+    return [
+        PromptFamily(name, family["prompt"], tuple(family.get("keywords", ())))
+        for name, family in families.items()
+    ]
+
+
+def plan_direction(state: dict[str, Any], rng: np.random.Generator | None = None) -> DirectionChoice:
+    config = state.get("agent", {}).get("directions", {})
+    families = direction_families(state)
+    attempts = read_attempts(ATTEMPTS_PATH)
+    latest = state["latest_approved"]
+    stats = family_statistics(
+        attempts,
+        families,
+        BanditConfig(
+            prior_alpha=float(config.get("prior_alpha", DEFAULT_DIRECTION_PRIOR)),
+            prior_beta=float(config.get("prior_beta", DEFAULT_DIRECTION_PRIOR)),
+            score_delta_scale=float(config.get("score_delta_scale", DEFAULT_DIRECTION_SCORE_DELTA_SCALE)),
+            partial_credit_max=float(config.get("partial_credit_max", DEFAULT_DIRECTION_PARTIAL_CREDIT_MAX)),
+            default_attempt_hours=float(config.get("default_attempt_hours", DEFAULT_DIRECTION_ATTEMPT_HOURS)),
+        ),
+        reference_rates=(
+            {latest["version"]: reference} if (reference := approved_reference_score_rate(state)) is not None else {}
+        ),
+        # Trace files only: they are small, and older console logs predate per-attempt spans anyway.
+        hours=attempt_hours(attempts, load_history(list_logs(TEXT_LOG_DIR, "*-trace.jsonl"))),
+    )
+    return choose_direction(families, stats, rng or np.random.default_rng())
+
+
+def attempt_direction(state: dict[str, Any], args: argparse.Namespace) -> tuple[str, str | None]:
+    """Sandbox user input for the next attempt and the prompt family it came from, if any.
+
+    An explicit --prompt always wins and is recorded without a family; history matching still credits
+    it to one by keywords. Otherwise the direction scheduler samples a family unless it is disabled.
+    """
+    if args.prompt:
+        return args.prompt, None
+    families = {family.name: family for family in direction_families(state)}
+    enabled = state.get("agent", {}).get("directions", {}).get("enabled", False)
+    if args.direction == "none" or not families or (args.direction is None and not enabled):
+        return "", None
+    if args.direction is not None:
+        family = families.get(args.direction)
+        if family is None:
+            raise SystemExit(f"Unknown --direction {args.direction}; state.json defines {', '.join(families)}.")
+        log_phase(f"Using direction {family.name} as requested.")
+        return family.prompt, family.name
+    choice = plan_direction(state)
+    log_phase(format_direction_choice(choice))
+    return choice.family.prompt, choice.family.name
+
+
 def prepare_sandbox(state: dict[str, Any], candidate: Candidate, user_input: str) -> None:
     if candidate.engine_file.exists():
         raise SystemExit(f"Candidate target already exists: {candidate.engine_file.relative_to(REPO_ROOT)}")
@@ -689,7 +1186,7 @@ def agent_program(state: dict[str, Any], candidate: Candidate, user_input: str)
         - candidate_version: `{candidate.version}`
         - candidate_engine_file: `{candidate.sandbox_engine_file.name}`
         - latest_approved_version: `{latest['version']}`
-        - latest_approved_reference_score_rate_vs_stockfish_1350: `{latest['approved_reference_score_rate_vs_stockfish_1350']:.4f}`
+        - latest_approved_reference_score_rate_vs_stockfish_1350: `{format_float(approved_reference_score_rate(state))}`
         - version_bump: `{candidate.version_bump}`
 
         ## Engine API
@@ -699,7 +1196,8 @@ def agent_program(state: dict[str, Any], candidate: Candidate, user_input: str)
 
         - `namespace Engine.Core.V{candidate.major};`
         - `public static class {candidate.stem}`
-        - `public static SearchResult SearchMoveV{candidate.major}_{candidate.minor}(BoardState board, double timeLimitSeconds = 1.0, int? maxDepth = null, V{candidate.major}_{candidate.minor}SearchContext? searchContext = null)`
+        - `public static SearchResult SearchMoveV{candidate.major}_{candidate.minor}(BoardState board, double timeLimitSeconds = 1.0, int? maxDepth = null, V{candidate.major}_{candidate.minor}SearchContext? searchContext = null, long? nodeLimit = null)`
+          (`nodeLimit` must stop the search after that many nodes; fixed-node evaluations depend on it)
         - `public static V{candidate.major}_{candidate.minor}SearchContext CreateSearchContextV{candidate.major}_{candidate.minor}()`
 
         If this is a `major` version bump, pay special attention to the namespace.
@@ -803,6 +1301,8 @@ def init_sandbox_git(path: Path) -> None:
 class CodexSession:
     manager: Any
     thread: Any
+    # Groups this session's turns into one attempt in the usage ledger.
+    attempt_key: str
 
 
 @dataclass
@@ -821,6 +1321,94 @@ def format_codex_usage(usage: Any | None) -> str:
     return str(usage)
 
 
+def record_codex_limit(candidate: Candidate, attempt_key: str, exc: CodexUsageLimitError) -> None:
+    # The window totals just before this entry become the learned quota for windows without a configured limit.
+    append_entry(
+        CODEX_USAGE_LEDGER_PATH,
+        UsageEntry(
+            kind="limit",
+            unix_ms=time.time_ns() // 1_000_000,
+            candidate=candidate.version,
+            attempt_key=attempt_key,
+            label=str(exc),
+            status="usage_limit",
+        ),
+    )
+
+
+def codex_quota_windows(state: dict[str, Any], entries: list[UsageEntry]) -> list[QuotaWindow]:
+    quota = state.get("agent", {}).get("codex_quota", {})
+    windows = quota.get("windows", DEFAULT_CODEX_QUOTA_WINDOWS)
+    shortest = min(float(window["hours"]) for window in windows.values())
+    return [
+        learned_window(
+            entries,
+            name,
+            float(window["hours"]),
+            window.get("tokens"),
+            learn=float(window["hours"]) == shortest,
+        )
+        for name, window in windows.items()
+    ]
+
+
+def plan_codex_quota(state: dict[str, Any]) -> QuotaPlan:
+    quota = state.get("agent", {}).get("codex_quota", {})
+    entries = read_ledger(CODEX_USAGE_LEDGER_PATH)
+    return plan_attempt(
+        entries,
+        codex_quota_windows(state, entries),
+        time.time_ns() // 1_000_000,
+        recent_attempts=int(quota.get("recent_attempts", DEFAULT_CODEX_QUOTA_RECENT_ATTEMPTS)),
+        cost_percentile=float(quota.get("cost_percentile", DEFAULT_CODEX_QUOTA_COST_PERCENTILE)),
+    )
+
+
+def format_codex_quota(plan: QuotaPlan) -> str:
+    expected = (
+        f"{plan.expected_tokens:,} tokens (p{plan.cost_percentile:.0f} of {plan.attempts_sampled} attempts)"
+        if plan.expected_tokens is not None
+        else "unknown (no recorded attempts)"
+    )
+    windows = []
+    for status in plan.windows:
+        window = status.window
+        if window.tokens is None:
+            limit = "limit unknown"
+        else:
+            limit = f"of {window.tokens:,} {'learned' if window.learned else 'configured'}"
+        wait = f", wait {format_elapsed_duration(status.wait_seconds)}" if status.wait_seconds > 0 else ""
+        windows.append(f"{window.name} {status.used_tokens:,} {limit}{wait}")
+    return f"Codex quota: next attempt ~{expected}; " + "; ".join(windows) + "."
+
+
+def wait_for_codex_quota(state: dict[str, Any]) -> None:
+    """Hold the next attempt until the rolling windows have room for its expected Codex cost.
+
+    While waiting, run evaluation-only work that needs no Codex tokens: calibrating the noise model
+    when the current configuration has none. Otherwise sleep and re-check, since usage keeps ageing
+    out of the windows.
+    """
+    quota = state.get("agent", {}).get("codex_quota", {})
+    poll_seconds = 60 * int(quota.get("poll_minutes", DEFAULT_CODEX_QUOTA_POLL_MINUTES))
+    calibration_tried = not quota.get("idle_calibration", True)
+    while True:
+        plan = plan_codex_quota(state)
+        log_phase(format_codex_quota(plan))
+        if plan.wait_seconds <= 0:
+            return
+        if not calibration_tried and load_noise_model(state, int(state["evaluator"]["workers"])) is None:
+            calibration_tried = True
+            log_phase("Waiting for Codex quota; calibrating the seed noise model in the meantime.")
+            result = run([sys.executable, "autoresearch/calibrate_noise.py"], cwd=REPO_ROOT, check=False)
+            if result.returncode == 0:
+                continue
+            log_phase("Noise calibration failed; waiting without idle work.")
+        delay = min(plan.wait_seconds, poll_seconds)
+        log_phase(f"Waiting {format_elapsed_duration(delay)} for Codex usage to age out of the quota window.")
+        time.sleep(delay)
+
+
 def codex_turn_timeout_seconds(state: dict[str, Any]) -> int:
     minutes = int(state.get("agent", {}).get("codex_turn_timeout_minutes", 15))
     return max(minutes, 1) * 60
@@ -979,6 +1567,8 @@ def run_codex_turn(
     prompt: str,
     label: str,
     sandbox_cwd: Path,
+    candidate: Candidate,
+    attempt_key: str,
 ) -> CodexTurnStreamResult:
     emit_console(f"\n[codex prompt: {label}]\n{prompt}\n\n", flush=True)
     turn = thread.turn(prompt, cwd=str(sandbox_cwd))
@@ -1051,13 +1641,27 @@ def run_codex_turn(
     final_response = turn_state["completed_texts"][-1].strip() if turn_state["completed_texts"] else ""
     log_phase(f"Codex turn completed: {label} ({turn_state['completed_status'] or 'unknown'}).")
     log_phase(f"Codex turn usage ({label}): {format_codex_usage(turn_state['completed_usage'])}")
+    append_entry(
+        CODEX_USAGE_LEDGER_PATH,
+        UsageEntry(
+            kind="turn",
+            unix_ms=time.time_ns() // 1_000_000,
+            candidate=candidate.version,
+            attempt_key=attempt_key,
+            label=label,
+            status=turn_state["completed_status"] or "unknown",
+            tokens=usage_token_counts(turn_state["completed_usage"]),
+        ),
+    )
     return CodexTurnStreamResult(final_response=final_response, usage=turn_state["completed_usage"])
 
 
+@traced_phase("codex_implementation")
 def run_codex_implementation(
     state: dict[str, Any],
     candidate: Candidate,
     *,
+    attempt_key: str,
     soc_cc_enabled: bool,
     soc_cc_config: SocCcConfig | None,
     experiment_log_start_line: int,
@@ -1092,6 +1696,8 @@ def run_codex_implementation(
             prompt="Start by looking at `PROGRAM.md`, and let's kick off the experiment loop!",
             label=f"{candidate.version} implementation",
             sandbox_cwd=candidate.sandbox_dir,
+            candidate=candidate,
+            attempt_key=attempt_key,
         )
         final_response = result.final_response
         log_phase("Codex finished the initial implementation pass.")
@@ -1103,9 +1709,10 @@ def run_codex_implementation(
         os.chdir(previous_cwd)
 
     (candidate.sandbox_dir / "CODEX_RESULT.md").write_text(final_response, encoding="utf-8")
-    return CodexSession(manager, thread)
+    return CodexSession(manager, thread, attempt_key)
 
 
+@traced_phase("codex_result_update")
 def run_codex_result_update(
     state: dict[str, Any],
     candidate: Candidate,
@@ -1126,6 +1733,8 @@ def run_codex_result_update(
             ),
             label=f"{candidate.version} evaluation follow-up",
             sandbox_cwd=candidate.sandbox_dir,
+            candidate=candidate,
+            attempt_key=session.attempt_key,
         )
         final_response = result.final_response
         log_phase("Codex finished the evaluation follow-up prompt.")
@@ -1160,6 +1769,251 @@ def cleanup_timed_out_attempt(
         shutil.rmtree(candidate.sandbox_dir)
 
 
+def candidate_variant(candidate: Candidate, index: int | None) -> Candidate:
+    """The same version in fan-out sandbox ``V<major>_<minor>-<index>``, or its base sandbox for None."""
+    sandbox_dir = SANDBOX_ROOT / (f"V{candidate.major}_{candidate.minor}" + (f"-{index}" if index is not None else ""))
+    return replace(candidate, sandbox_dir=sandbox_dir, sandbox_engine_file=sandbox_dir / f"{candidate.stem}.cs")
+
+
+def fan_out_variants(state: dict[str, Any], args: argparse.Namespace) -> int:
+    if args.fan_out is not None:
+        return max(1, args.fan_out)
+    return max(1, int(state.get("agent", {}).get("fan_out", {}).get("variants", DEFAULT_FAN_OUT_VARIANTS)))
+
+
+def fan_out_prompts(
+    state: dict[str, Any],
+    args: argparse.Namespace,
+    user_input: str,
+    direction: str | None,
+    count: int,
+) -> list[tuple[str, str | None]]:
+    """One (sandbox user input, prompt family) per variant.
+
+    When the scheduler picked the direction, the first variant keeps it and the rest take the other
+    families in a fresh Thompson ranking; otherwise all variants share the run's input. Either way
+    each is told it is one of several, so the sessions do not all implement the most obvious idea.
+    """
+    families: list[PromptFamily] = []
+    if direction is not None and args.direction is None:
+        ranked = plan_direction(state).ranked
+        families = [family for family in ranked if family.name == direction]
+        families += [family for family in ranked if family.name != direction]
+        log_phase(f"Fan-out directions: {', '.join(family.name for family in families[:count])}.")
+    prompts = []
+    for index in range(1, count + 1):
+        family = families[(index - 1) % len(families)] if families else None
+        text = family.prompt if family is not None else user_input.strip()
+        note = (
+            f"This is fan-out variant {index} of {count} for this version. The variants are implemented "
+            "separately and only the strongest in short matches goes on to the full evaluation, so "
+            + (
+                "pursue your most promising hypothesis."
+                if index == 1
+                else f"pursue roughly the idea ranked number {index} on your own list rather than the most obvious one."
+            )
+        )
+        prompts.append((f"{text}\n\n{note}" if text else note, family.name if family is not None else direction))
+    return prompts
+
+
+def run_fan_out(
+    state: dict[str, Any],
+    candidate: Candidate,
+    args: argparse.Namespace,
+    user_input: str,
+    direction: str | None,
+    *,
+    variants: int,
+    attempt_key: str,
+    soc_cc_config: SocCcConfig | None,
+    experiment_log_start_line: int,
+) -> FanOutResult:
+    """Implement ``variants`` sandboxes of one version and keep the strongest by successive halving.
+
+    Each variant gets its own Codex session, sandbox and build. Short paired matches against the
+    evaluator opponent then run at a doubling game budget, keeping the better half each rung, until
+    one variant is left or the next budget would reach the full contract. Eliminated variants become
+    rejected sub-attempts; the survivor's session stays open for the full evaluation and follow-up.
+    """
+    base = candidate_variant(candidate, None)
+    shutil.rmtree(base.sandbox_dir, ignore_errors=True)
+    pool = []
+    for index, (prompt, family) in enumerate(fan_out_prompts(state, args, user_input, direction, variants), start=1):
+        variant = FanOutVariant(index, candidate_variant(base, index), family)
+        log_phase(f"Preparing fan-out variant {index}/{variants} (direction {family or 'none'}).")
+        prepare_sandbox(state, variant.candidate, prompt)
+        pool.append(variant)
+
+    timed_out: CodexTurnTimeoutError | None = None
+    eliminated: list[dict[str, Any]] = []
+    try:
+        for variant in pool:
+            if variant.index > 1:
+                wait_for_codex_quota(state)
+            set_trace_context(variant.candidate)
+            try:
+                variant.session = run_codex_implementation(
+                    state,
+                    variant.candidate,
+                    attempt_key=f"{attempt_key}-{variant.index}",
+                    soc_cc_enabled=args.soc_cc,
+                    soc_cc_config=soc_cc_config,
+                    experiment_log_start_line=experiment_log_start_line,
+                )
+            except CodexTurnTimeoutError as exc:
+                timed_out = exc
+                eliminated.append(
+                    retire_fan_out_variant(state, variant, variants, f"codex timeout: {exc}", stage="by codex timeout")
+                )
+    except BaseException:
+        for variant in pool:
+            if variant.session is not None:
+                variant.session.manager.__exit__(None, None, None)
+        raise
+    implemented = [variant for variant in pool if variant.session is not None]
+    if not implemented:
+        assert timed_out is not None
+        # No survivor carries these entries to ATTEMPTS.md, so record them before the attempt retries.
+        for entry in eliminated:
+            append_attempt_markdown(entry)
+        raise timed_out
+
+    stamp = make_attempt_id(base)
+    for variant in implemented:
+        build_id = f"{stamp}-f{variant.index}"
+        variant.build_dir = candidate_build_dir(build_id)
+        set_trace_context(variant.candidate, build_id)
+        log_phase(
+            f"Running solution build for {variant.candidate.version} (attempt {build_id}) "
+            f"into {variant.build_dir.relative_to(REPO_ROOT)}."
+        )
+        variant.build_ok = run_candidate_build(variant.candidate, variant.build_dir)
+
+    survivors = [variant for variant in implemented if variant.build_ok] or implemented[:1]
+    for variant in implemented:
+        if variant not in survivors:
+            eliminated.append(retire_fan_out_variant(state, variant, variants, "Build failed before the fan-out matches."))
+
+    full_games = int(state["evaluator"]["games"])
+    games = max(2, int(state.get("agent", {}).get("fan_out", {}).get("initial_games", DEFAULT_FAN_OUT_INITIAL_GAMES)))
+    games += games % 2
+    rungs = []
+    while len(survivors) > 1 and survivors[0].build_ok and games < full_games:
+        for variant in survivors:
+            variant.metrics = run_fan_out_match(state, variant, f"{stamp}-f{variant.index}-g{games}", games, args)
+            variant.games = games
+        ranked = sorted(survivors, key=fan_out_rank, reverse=True)
+        keep = ranked[: (len(ranked) + 1) // 2]
+        log_phase(
+            f"Fan-out rung at {games} games: "
+            + ", ".join(f"variant {variant.index} {format_fan_out_score(variant)}" for variant in ranked)
+            + f"; keeping {', '.join(str(variant.index) for variant in keep)}."
+        )
+        for variant in ranked[len(keep) :]:
+            eliminated.append(
+                retire_fan_out_variant(
+                    state,
+                    variant,
+                    variants,
+                    f"Eliminated by fan-out successive halving at {games} games with "
+                    f"{format_fan_out_score(variant)}, behind variant {keep[-1].index} "
+                    f"({format_fan_out_score(keep[-1])}).",
+                )
+            )
+        rungs.append(games)
+        survivors = keep
+        games *= 2
+
+    survivor = max(survivors, key=fan_out_rank)
+    for variant in survivors:
+        if variant is not survivor:
+            eliminated.append(
+                retire_fan_out_variant(
+                    state,
+                    variant,
+                    variants,
+                    f"Eliminated at the last fan-out rung ({variant.games} games) with {format_fan_out_score(variant)}, "
+                    f"behind variant {survivor.index} ({format_fan_out_score(survivor)}).",
+                )
+            )
+    rung_text = f" through rungs of {', '.join(map(str, rungs))} games" if rungs else ""
+    note = f"variant {survivor.index}/{variants} survived{rung_text}; {len(eliminated)} eliminated"
+    log_phase(f"Fan-out survivor: {note}.")
+    return FanOutResult(survivor, note, eliminated)
+
+
+def run_fan_out_match(
+    state: dict[str, Any],
+    variant: FanOutVariant,
+    attempt_id: str,
+    games: int,
+    args: argparse.Namespace,
+) -> EvaluationMetrics | None:
+    set_trace_context(variant.candidate, attempt_id)
+    log_phase(f"Fan-out match for variant {variant.index}: {games} games (attempt {attempt_id}).")
+    ok = run_evaluator(
+        variant.candidate,
+        state,
+        attempt_id,
+        games,
+        build_dir=variant.build_dir,
+        soc_cc_enabled=args.soc_cc,
+    )
+    log_path = EVALUATION_LOG_DIR / f"{attempt_id}-result.csv"
+    metrics = parse_evaluation_csv(log_path, state) if ok and log_path.exists() else None
+    # Every variant plays under the same engine stem, so these logs must not reach the Elo ledger.
+    for path in (log_path, companion_path(log_path), contention_samples_path(attempt_id)):
+        path.unlink(missing_ok=True)
+    return metrics
+
+
+def fan_out_rank(variant: FanOutVariant) -> tuple[bool, bool, float, float]:
+    metrics = variant.metrics
+    if metrics is None:
+        return (variant.build_ok, False, -1.0, -1.0)
+    failures = sum(metrics.failure_counts.get(key, 0) for key in ("crash", "illegal_move", "timeout", "harness"))
+    return (variant.build_ok, failures == 0, metrics.score_rate, metrics.lcb95)
+
+
+def format_fan_out_score(variant: FanOutVariant) -> str:
+    if variant.metrics is None:
+        return "no result"
+    return f"score_rate={variant.metrics.score_rate:.4f}"
+
+
+def retire_fan_out_variant(
+    state: dict[str, Any],
+    variant: FanOutVariant,
+    variants: int,
+    verdict: str,
+    *,
+    stage: str | None = None,
+) -> dict[str, Any]:
+    """Close an eliminated variant's session and sandbox and return its rejected ATTEMPTS.md entry."""
+    log_phase(f"Fan-out variant {variant.index}: {verdict}")
+    if variant.session is not None:
+        variant.session.manager.__exit__(None, None, None)
+        variant.session = None
+    note = read_return_json(variant.candidate)
+    if stage is None:
+        stage = f"after {variant.games} games" if variant.games else "before any match"
+    entry = attempt_entry(
+        state,
+        variant.candidate,
+        "rejected",
+        {**note, "inferred_conclusion": note.get("inferred_conclusion") or verdict},
+        variant.metrics,
+        direction=variant.direction,
+        fan_out=f"variant {variant.index}/{variants} eliminated {stage}",
+    )
+    entry["commit"] = "<n/a>"
+    shutil.rmtree(variant.candidate.sandbox_dir, ignore_errors=True)
+    if variant.build_dir is not None:
+        remove_build_dir(variant.build_dir)
+    return entry
+
+
 def make_attempt_id(candidate: Candidate) -> str:
     stamp = dt.datetime.now(dt.timezone.utc).strftime("%m%d%H%M%S")
     return f"{candidate.stem}-{stamp}".lower().replace("engine", "")
@@ -1170,6 +2024,116 @@ def run_build() -> bool:
     return result.returncode == 0
 
 
+def candidate_build_dir(attempt_id: str) -> Path:
+    return CANDIDATE_BUILD_ROOT / attempt_id
+
+
+@traced_phase("build", succeeded)
+def run_candidate_build(candidate: Candidate, build_dir: Path) -> bool:
+    # The candidate compiles straight from its sandbox into Engine.Core through the CandidateEngineFile
+    # overlay, and every project's bin/obj goes under build_dir, so attempts never share outputs
+    # and the shared engine tree only changes when a candidate is approved.
+    result = run(
+        [
+            "dotnet",
+            "build",
+            LOCAL_TESTING_PROJECT,
+            "--artifacts-path",
+            str(build_dir),
+            f"-p:CandidateEngineFile={candidate.sandbox_engine_file}",
+        ],
+        cwd=REPO_ROOT,
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def local_testing_command(build_dir: Path | None) -> list[str]:
+    # With a candidate build, run its LocalTesting.dll directly; dotnet run would rebuild the shared tree.
+    if build_dir is None:
+        return ["dotnet", "run", "--project", "engine_csharp/src/LocalTesting", "--"]
+    return ["dotnet", str(build_dir / "bin" / "LocalTesting" / "debug" / "LocalTesting.dll")]
+
+
+def start_evaluator_host(state: dict[str, Any]) -> None:
+    """Start the persistent LocalTesting host when ``evaluator.host.enabled``; commands fall back to dotnet without it."""
+    global EVALUATOR_HOST
+    host = state["evaluator"].get("host", {})
+    if EVALUATOR_HOST is not None or not host.get("enabled", False):
+        return
+    log_phase(f"Building the evaluator host into {HOST_BUILD_DIR.relative_to(REPO_ROOT)}.")
+    result = run(["dotnet", "build", LOCAL_TESTING_PROJECT, "--artifacts-path", str(HOST_BUILD_DIR)], check=False)
+    if result.returncode != 0:
+        log_phase("Evaluator host build failed; running LocalTesting as one process per command.")
+        return
+    command = [
+        *local_testing_command(HOST_BUILD_DIR),
+        "host",
+        "--max-contexts",
+        str(int(host.get("max_contexts", DEFAULT_EVALUATOR_HOST_MAX_CONTEXTS))),
+    ]
+    try:
+        EVALUATOR_HOST = EvaluatorHost(command, REPO_ROOT)
+        EVALUATOR_HOST.start()
+    except (EvaluatorHostError, OSError) as exc:
+        EVALUATOR_HOST = None
+        log_phase(f"Evaluator host did not start ({exc}); running LocalTesting as one process per command.")
+        return
+    atexit.register(stop_evaluator_host)
+    log_phase(f"Evaluator host running as pid {EVALUATOR_HOST.pid}.")
+
+
+def stop_evaluator_host() -> None:
+    global EVALUATOR_HOST
+    host, EVALUATOR_HOST = EVALUATOR_HOST, None
+    if host is not None:
+        host.close()
+
+
+def run_local_testing(arguments: list[str], build_dir: Path | None) -> subprocess.CompletedProcess[str]:
+    """Run a LocalTesting command in the evaluator host when it is up, else as its own dotnet process.
+
+    Output is mirrored to the console either way, so callers read ``returncode`` and ``stdout`` as
+    they would from ``run``.
+    """
+    if EVALUATOR_HOST is not None:
+        target = build_dir or build_shared_local_testing()
+        if target is not None:
+            try:
+                result = EVALUATOR_HOST.run(
+                    target,
+                    arguments,
+                    on_output=lambda line: emit_console(f"{line}\n", flush=False),
+                )
+                return subprocess.CompletedProcess(arguments, result.returncode, result.stdout, None)
+            except EvaluatorHostExited as exc:
+                log_phase(f"{exc} Running LocalTesting as one process per command from now on.")
+                stop_evaluator_host()
+            except EvaluatorHostError as exc:
+                log_phase(f"Evaluator host rejected the command ({exc}); running it as its own process.")
+    return run([*local_testing_command(build_dir), *arguments], cwd=REPO_ROOT, check=False)
+
+
+def build_shared_local_testing() -> Path | None:
+    # Unload first: the rebuild may overwrite assemblies the host has mapped.
+    assert EVALUATOR_HOST is not None
+    try:
+        EVALUATOR_HOST.unload(SHARED_BUILD_DIR)
+    except EvaluatorHostError:
+        return None
+    result = run(["dotnet", "build", LOCAL_TESTING_PROJECT, "--artifacts-path", str(SHARED_BUILD_DIR)], check=False)
+    return SHARED_BUILD_DIR if result.returncode == 0 else None
+
+
+def remove_build_dir(build_dir: Path) -> None:
+    if EVALUATOR_HOST is not None:
+        try:
+            EVALUATOR_HOST.unload(build_dir)
+        except EvaluatorHostError:
+            pass
+    shutil.rmtree(build_dir, ignore_errors=True)
+
+
 def resolve_stockfish_path() -> Path | None:
     if DEFAULT_STOCKFISH_PATH.is_file():
         return DEFAULT_STOCKFISH_PATH
@@ -1177,12 +2141,150 @@ def resolve_stockfish_path() -> Path | None:
     return None
 
 
+def evaluator_workers(state: dict[str, Any], *, soc_cc_enabled: bool) -> int:
+    if soc_cc_enabled:
+        return SOC_CC_EVALUATOR_WORKERS
+    fixed_nodes = state["evaluator"].get("fixed_nodes", {})
+    if fixed_nodes.get("enabled", False) and fixed_nodes.get("workers") is not None:
+        return int(fixed_nodes["workers"])
+    return int(state["evaluator"]["workers"])
+
+
+def fixed_nodes_enabled(state: dict[str, Any]) -> bool:
+    return bool(state["evaluator"].get("fixed_nodes", {}).get("enabled", False))
+
+
+def ensure_node_budgets(state: dict[str, Any], stockfish_path: Path) -> bool:
+    """Fill in missing fixed-node budgets by timing the seed and Stockfish at ``time_limit_ms``.
+
+    The medians become the per-move node budgets and are persisted to state.json, so every later
+    attempt plays at the same budgets until they are cleared to force a recalibration.
+    """
+    fixed_nodes = state["evaluator"].setdefault("fixed_nodes", {})
+    if fixed_nodes.get("engine_nodes") is not None and fixed_nodes.get("stockfish_nodes") is not None:
+        return True
+    seed = state["latest_approved"]
+    log_phase(
+        f"Calibrating fixed-node budgets from seed {seed['version']} and Stockfish at "
+        f"{state['evaluator']['time_limit_ms']}ms per move."
+    )
+    with tempfile.TemporaryDirectory(prefix="node-calibration-") as tmp:
+        output_path = Path(tmp) / "calibration.json"
+        result = run_local_testing(
+            [
+                "calibrate-nodes",
+                "--engine-file",
+                str(seed["engine_file"]),
+                "--stockfish-path",
+                str(stockfish_path),
+                "--stockfish-elo",
+                str(state["evaluator"]["stockfish_elo"]),
+                "--time-limit-ms",
+                str(state["evaluator"]["time_limit_ms"]),
+                "--repeats",
+                str(fixed_nodes.get("calibration_repeats", DEFAULT_FIXED_NODES_CALIBRATION_REPEATS)),
+                "--output",
+                str(output_path),
+            ],
+            None,
+        )
+        if result.returncode != 0 or not output_path.exists():
+            log_phase("Node calibration failed; the fixed-node evaluation cannot run.")
+            return False
+        report = json.loads(output_path.read_text(encoding="utf-8"))
+    fixed_nodes["engine_nodes"] = int(report["engine_nodes"])
+    fixed_nodes["stockfish_nodes"] = int(report["stockfish_nodes"])
+    persist_state(state)
+    log_phase(
+        f"Fixed-node budgets: engine {fixed_nodes['engine_nodes']:,} nodes, "
+        f"Stockfish {fixed_nodes['stockfish_nodes']:,} nodes per move."
+    )
+    return True
+
+
+def approved_reference_key(state: dict[str, Any]) -> str | None:
+    """Key of the seed's fixed-node reference for the current settings; None under time control."""
+    if not fixed_nodes_enabled(state):
+        return None
+    evaluator = state["evaluator"]
+    fixed_nodes = evaluator["fixed_nodes"]
+    return noise_model_key(
+        {
+            "seed_version": str(state["latest_approved"]["version"]),
+            "opponent": evaluator["opponent"],
+            "stockfish_elo": evaluator["stockfish_elo"],
+            "max_plies": evaluator["max_plies"],
+            "fixed_nodes": f"{fixed_nodes.get('engine_nodes')}/{fixed_nodes.get('stockfish_nodes')}",
+            "seed": fixed_nodes.get("seed", DEFAULT_FIXED_NODES_SEED),
+        }
+    )
+
+
+def approved_reference_score_rate(state: dict[str, Any]) -> float | None:
+    """The seed's score rate measured the way candidates are measured now, or None when it has not been.
+
+    Time-control and fixed-node scores are not comparable, so each mode has its own reference:
+    ``approved_reference_score_rate_vs_stockfish_1350`` under time control, and one entry per
+    node-budget configuration in ``fixed_node_references``.
+    """
+    latest = state["latest_approved"]
+    key = approved_reference_key(state)
+    if key is None:
+        value = latest.get("approved_reference_score_rate_vs_stockfish_1350")
+    else:
+        value = latest.get("fixed_node_references", {}).get(key, {}).get("score_rate")
+    return None if value is None else float(value)
+
+
+def ensure_approved_reference(state: dict[str, Any], stockfish_path: Path, workers: int) -> bool:
+    """Re-baseline the seed in the current evaluation mode when that mode has no reference yet.
+
+    Runs the seed over ``evaluator.games`` with exactly the candidate's evaluator arguments and stores
+    its score rate in state.json. Until that succeeds, ``apply_approval_rules`` refuses approval.
+    """
+    if approved_reference_score_rate(state) is not None:
+        return True
+    seed = state["latest_approved"]
+    games = int(state["evaluator"]["games"])
+    mode = "fixed-node" if fixed_nodes_enabled(state) else "time-control"
+    log_phase(f"Seed {seed['version']} has no {mode} reference score; re-baselining it over {games} games.")
+    attempt_id = f"reference-{dt.datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    arguments = evaluator_arguments(
+        REPO_ROOT / seed["engine_file"],
+        state,
+        attempt_id,
+        games,
+        workers,
+        stockfish_path=stockfish_path,
+    )
+    result = run_local_testing(arguments, None)
+    log_path = EVALUATION_LOG_DIR / f"{attempt_id}-result.csv"
+    if result.returncode != 0 or not log_path.exists():
+        log_phase(f"Seed re-baseline failed; candidates cannot be approved until the seed has a {mode} reference.")
+        return False
+    metrics = parse_evaluation_csv(log_path, state)
+    key = approved_reference_key(state)
+    if key is None:
+        seed["approved_reference_score_rate_vs_stockfish_1350"] = round(metrics.score_rate, 4)
+    else:
+        seed.setdefault("fixed_node_references", {})[key] = {
+            "score_rate": round(metrics.score_rate, 4),
+            "attempt_id": attempt_id,
+            "recorded_at": dt.date.today().isoformat(),
+        }
+    persist_state(state)
+    log_phase(f"Seed {seed['version']} {mode} reference score_rate: {metrics.score_rate:.4f}.")
+    return True
+
+
+@traced_phase("evaluator", succeeded)
 def run_evaluator(
     candidate: Candidate,
     state: dict[str, Any],
     attempt_id: str,
     smoke_games: int | None,
     *,
+    build_dir: Path | None = None,
     soc_cc_enabled: bool,
 ) -> bool:
     stockfish_path = resolve_stockfish_path()
@@ -1194,23 +2296,86 @@ def run_evaluator(
             flush=True,
         )
         return False
+    if fixed_nodes_enabled(state) and not ensure_node_budgets(state, stockfish_path):
+        return False
+    workers = evaluator_workers(state, soc_cc_enabled=soc_cc_enabled)
+    # A missing reference only blocks approval (see apply_approval_rules); the candidate still plays.
+    ensure_approved_reference(state, stockfish_path, workers)
 
     evaluator = state["evaluator"]
-    games = smoke_games or evaluator["games"]
-    workers = SOC_CC_EVALUATOR_WORKERS if soc_cc_enabled else evaluator["workers"]
-    command = [
-        "dotnet",
-        "run",
-        "--project",
-        "engine_csharp/src/LocalTesting",
-        "--",
-        "evaluate-stock",
-        "--engine-file",
-        str(candidate.engine_file.relative_to(REPO_ROOT)),
-        "--stockfish-path",
-        str(stockfish_path),
-        "--stockfish-elo",
-        str(evaluator["stockfish_elo"]),
+    arguments = evaluator_arguments(
+        candidate.engine_file if build_dir is None else candidate.sandbox_engine_file,
+        state,
+        attempt_id,
+        smoke_games or evaluator["games"],
+        workers,
+        stockfish_path=stockfish_path,
+    )
+    interval = float(
+        evaluator.get("contention", {}).get("sample_interval_seconds", DEFAULT_CONTENTION_SAMPLE_INTERVAL_SECONDS)
+    )
+    with ContentionSampler(interval) as sampler:
+        result = run_local_testing(arguments, build_dir)
+    if sampler.available:
+        sampler.write_jsonl(contention_samples_path(attempt_id))
+    return result.returncode == 0
+
+
+def evaluator_command(
+    engine_file: Path,
+    state: dict[str, Any],
+    attempt_id: str,
+    games: int,
+    workers: int,
+    *,
+    stockfish_path: Path | None = None,
+    opponent_engine_file: Path | None = None,
+    build_dir: Path | None = None,
+) -> list[str]:
+    return local_testing_command(build_dir) + evaluator_arguments(
+        engine_file,
+        state,
+        attempt_id,
+        games,
+        workers,
+        stockfish_path=stockfish_path,
+        opponent_engine_file=opponent_engine_file,
+    )
+
+
+def evaluator_arguments(
+    engine_file: Path,
+    state: dict[str, Any],
+    attempt_id: str,
+    games: int,
+    workers: int,
+    *,
+    stockfish_path: Path | None = None,
+    opponent_engine_file: Path | None = None,
+) -> list[str]:
+    # Plays against Stockfish, or against another engine file via evaluate-match when
+    # opponent_engine_file is given. Either way the canonical CSV lands in autoresearch/logs.
+    evaluator = state["evaluator"]
+    command: list[str] = []
+    if opponent_engine_file is None:
+        command += [
+            "evaluate-stock",
+            "--engine-file",
+            str(engine_file.relative_to(REPO_ROOT)),
+            "--stockfish-path",
+            str(stockfish_path),
+            "--stockfish-elo",
+            str(evaluator["stockfish_elo"]),
+        ]
+    else:
+        command += [
+            "evaluate-match",
+            "--engine-a-file",
+            str(engine_file.relative_to(REPO_ROOT)),
+            "--engine-b-file",
+            str(opponent_engine_file.relative_to(REPO_ROOT)),
+        ]
+    command += [
         "--games",
         str(games),
         "--time-limit-ms",
@@ -1223,53 +2388,77 @@ def run_evaluator(
         "--short-sha",
         attempt_id,
     ]
-    result = run(command, cwd=REPO_ROOT, check=False)
-    return result.returncode == 0
+    if fixed_nodes_enabled(state):
+        # Node budgets end every search, so the time limit above is only a runaway guard and the
+        # workers may outnumber the cores without changing any result; pinning would only get in the way.
+        fixed_nodes = evaluator["fixed_nodes"]
+        command += [
+            "--nodes",
+            str(fixed_nodes["engine_nodes"]),
+            "--seed",
+            str(fixed_nodes.get("seed", DEFAULT_FIXED_NODES_SEED)),
+        ]
+        if opponent_engine_file is None:
+            command += ["--stockfish-nodes", str(fixed_nodes["stockfish_nodes"])]
+        return command
+    cpu_sets = evaluator_cpu_sets(state, workers)
+    if cpu_sets:
+        command.extend(["--cpu-sets", cpu_sets])
+    return command
+
+
+def evaluator_cpu_sets(state: dict[str, Any], workers: int) -> str | None:
+    affinity = state["evaluator"].get("affinity", {})
+    if not affinity.get("enabled", False):
+        return None
+    topology = read_cpu_topology()
+    if topology is None:
+        log_phase("CPU affinity requested but this platform exposes no CPU topology; running unpinned.")
+        return None
+    cpus_per_worker = int(affinity.get("cpus_per_worker", DEFAULT_AFFINITY_CPUS_PER_WORKER))
+    plan = plan_worker_cpu_sets(topology, workers, cpus_per_worker)
+    log_phase(
+        f"CPU affinity: {workers} workers x {cpus_per_worker} CPUs on {len(topology.cores)} cores / "
+        f"{topology.logical_cpus} logical CPUs -> {plan.mode} (up to {plan.max_dedicated_workers} workers fit "
+        f"on dedicated cores, {plan.max_shared_core_workers} with SMT siblings)."
+    )
+    return format_cpu_sets(plan.cpu_sets) if plan.cpu_sets else None
+
+
+def contention_samples_path(attempt_id: str) -> Path:
+    return REPO_ROOT / "autoresearch" / "logs" / f"{attempt_id}-contention.jsonl"
 
 
 def parse_evaluation_csv(path: Path, state: dict[str, Any]) -> EvaluationMetrics:
-    rows: list[dict[str, str]]
-    with path.open(newline="", encoding="utf-8") as handle:
-        rows = list(csv.DictReader(handle))
-    if not rows:
+    columns = read_evaluation_columns(path)
+    games = len(columns.engine_a_score)
+    if games == 0:
         raise SystemExit(f"Evaluation CSV is empty: {path}")
 
-    games = len(rows)
-    wins = sum(1 for row in rows if float(row["engine_a_score"]) == 1.0)
-    draws = sum(1 for row in rows if float(row["engine_a_score"]) == 0.5)
-    losses = sum(1 for row in rows if float(row["engine_a_score"]) == 0.0)
-    score = sum(float(row["engine_a_score"]) for row in rows)
-    plies = sum(int(row["plies"]) for row in rows)
-    max_plies_count = sum(1 for row in rows if row["termination_reason"] == "max_plies")
+    scores = columns.engine_a_score
+    wins = int(np.count_nonzero(scores == 1.0))
+    draws = int(np.count_nonzero(scores == 0.5))
+    losses = int(np.count_nonzero(scores == 0.0))
+    score = float(scores.sum())
+    max_plies_count = int(np.count_nonzero(columns.termination == TERMINATION_CODES.index("max_plies")))
 
-    engine_move_ms = []
-    engine_positions = []
     failure_counts = {"crash": 0, "illegal_move": 0, "timeout": 0, "harness": 0, "max_plies": max_plies_count}
-    pair_scores: dict[int, float] = {}
-    for row in rows:
-        engine_a_was_white = row["engine_a_was_white"].strip().lower() == "true"
-        engine_move_ms.append(float(row["white_average_move_ms" if engine_a_was_white else "black_average_move_ms"]))
-        engine_positions.append(float(row["white_average_positions" if engine_a_was_white else "black_average_positions"]))
-        pair = int(row["pair_number"])
-        pair_scores[pair] = pair_scores.get(pair, 0.0) + float(row["engine_a_score"]) / 2.0
-        failure_engine = row.get("failure_engine", "").strip()
-        if failure_engine:
-            reason = row["termination_reason"]
-            if reason == "illegal_move":
-                failure_counts["illegal_move"] += 1
-            elif reason == "timeout":
-                failure_counts["timeout"] += 1
-            elif reason == "engine_exception":
-                failure_counts["crash"] += 1
-            else:
-                failure_counts["harness"] += 1
+    failed_terminations = columns.termination[columns.failed]
+    failure_counts["illegal_move"] = int(np.count_nonzero(failed_terminations == TERMINATION_CODES.index("illegal_move")))
+    failure_counts["timeout"] = int(np.count_nonzero(failed_terminations == TERMINATION_CODES.index("timeout")))
+    failure_counts["crash"] = int(np.count_nonzero(failed_terminations == TERMINATION_CODES.index("engine_exception")))
+    failure_counts["harness"] = len(failed_terminations) - (
+        failure_counts["illegal_move"] + failure_counts["timeout"] + failure_counts["crash"]
+    )
 
-    pair_values = list(pair_scores.values())
-    pair_mean = sum(pair_values) / len(pair_values)
-    pair_sd = sample_sd(pair_values, pair_mean)
-    df = len(pair_values) - 1
-    t_critical = state["evaluator"]["approval"]["t_critical_one_sided_95_by_df"].get(str(df), 1.650996)
-    lcb95 = pair_mean - t_critical * pair_sd / math.sqrt(len(pair_values))
+    _, pair_index = np.unique(columns.pair_number, return_inverse=True)
+    pair_values = np.bincount(pair_index, weights=scores / 2.0)
+    pair_count = len(pair_values)
+    pair_mean = float(pair_values.mean())
+    pair_sd = float(pair_values.std(ddof=1)) if pair_count > 1 else 0.0
+    df = pair_count - 1
+    t_critical = state["evaluator"]["approval"]["t_critical_one_sided_95_by_df"].get(str(df), DEFAULT_T_CRITICAL_ONE_SIDED_95)
+    lcb95 = pair_mean - t_critical * pair_sd / math.sqrt(pair_count)
 
     return EvaluationMetrics(
         wins=wins,
@@ -1277,9 +2466,9 @@ def parse_evaluation_csv(path: Path, state: dict[str, Any]) -> EvaluationMetrics
         losses=losses,
         score=score,
         score_rate=score / games,
-        average_plies=plies / games,
-        average_processing_time_ms=sum(engine_move_ms) / len(engine_move_ms),
-        average_positions_or_nodes=sum(engine_positions) / len(engine_positions),
+        average_plies=float(columns.plies.mean()),
+        average_processing_time_ms=float(columns.engine_move_ms.mean()),
+        average_positions_or_nodes=float(columns.engine_positions.mean()),
         max_plies_count=max_plies_count,
         max_plies_rate=max_plies_count / games,
         failure_counts=failure_counts,
@@ -1287,18 +2476,374 @@ def parse_evaluation_csv(path: Path, state: dict[str, Any]) -> EvaluationMetrics
         pair_sd=pair_sd,
         lcb95=lcb95,
         games=games,
+        bootstrap_lcb95=bootstrap_lcb95(pair_values, state),
     )
 
 
-def sample_sd(values: list[float], mean: float) -> float:
-    if len(values) <= 1:
-        return 0.0
-    return math.sqrt(sum((value - mean) ** 2 for value in values) / (len(values) - 1))
+def read_evaluation_columns(path: Path) -> EvaluationColumns:
+    # Columns come straight from the fixed-width records (the .evb companion when it is current), so
+    # even a 100k-game log is a handful of vectorised selects rather than a per-row parse.
+    try:
+        records = load_evaluation_records(path)
+    except ValueError as exc:
+        raise SystemExit(f"Unreadable evaluation CSV {path}: {exc}") from exc
+    data = records.records
+    engine_a_was_white = data["engine_a_was_white"] != 0
+
+    def engine_side(white: str, black: str) -> np.ndarray:
+        return np.where(engine_a_was_white, data[white], data[black]).astype(np.float64)
+
+    termination_lookup = {reason: code for code, reason in enumerate(TERMINATION_CODES)}
+    failed = (
+        records.lookup("failure_engine", {text: 1 for text in records.strings if text.strip()}, 0).astype(bool)
+        if "failure_engine" in records
+        else np.zeros(len(records), dtype=bool)
+    )
+    has_window = "game_started_unix_ms" in records and "game_finished_unix_ms" in records
+    return EvaluationColumns(
+        engine_a_score=data["engine_a_score"].astype(np.float64),
+        plies=data["plies"].astype(np.intc),
+        pair_number=data["pair_number"].astype(np.intc),
+        engine_move_ms=engine_side("white_average_move_ms", "black_average_move_ms"),
+        engine_positions=engine_side("white_average_positions", "black_average_positions"),
+        termination=records.lookup("termination_reason", termination_lookup, TERMINATION_OTHER).astype(np.int8),
+        failed=failed,
+        engine_move_ms_percentiles={
+            name: engine_side(f"white_move_ms_{name}", f"black_move_ms_{name}")
+            for name in MOVE_TIME_PERCENTILE_COLUMNS
+            if f"white_move_ms_{name}" in records and f"black_move_ms_{name}" in records
+        },
+        game_started_unix_ms=data["game_started_unix_ms"].astype(np.int64) if has_window else None,
+        game_finished_unix_ms=data["game_finished_unix_ms"].astype(np.int64) if has_window else None,
+    )
 
 
-def decide_candidate(metrics: EvaluationMetrics, state: dict[str, Any]) -> tuple[str, str]:
-    approved_score = state["latest_approved"]["approved_reference_score_rate_vs_stockfish_1350"]
+def bootstrap_lcb95(pair_values: np.ndarray, state: dict[str, Any]) -> float:
+    # Paired scores only take a handful of distinct values (0, 0.25, ..., 1), so resampling n pairs with
+    # replacement is exactly a multinomial draw over those levels. That keeps each resample O(levels)
+    # instead of O(n) and makes 10k resamples of a 50k-game run effectively free.
     approval = state["evaluator"]["approval"]
+    resamples = int(approval.get("bootstrap_resamples", DEFAULT_BOOTSTRAP_RESAMPLES))
+    seed = int(approval.get("bootstrap_seed", DEFAULT_BOOTSTRAP_SEED))
+    pair_count = len(pair_values)
+    if pair_count <= 1 or resamples <= 0:
+        return float(pair_values.mean()) if pair_count else 0.0
+
+    levels, counts = np.unique(pair_values, return_counts=True)
+    rng = np.random.default_rng(seed)
+    draws = rng.multinomial(pair_count, counts / pair_count, size=resamples)
+    means = draws @ levels / pair_count
+    return float(np.quantile(means, 0.05))
+
+
+def t_critical_one_sided_95(df: int) -> float:
+    # Cornish-Fisher expansion of the Student-t quantile around the normal quantile; within 1e-3 of the
+    # exact value from df=3 upward, which is plenty for flagging decisions.
+    if df <= 0:
+        return math.inf
+    z = 1.6448536269514722
+    return (
+        z
+        + (z**3 + z) / (4 * df)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+    )
+
+
+def analyze_move_time_risk(log_path: Path, state: dict[str, Any], workers: int) -> MoveTimeRisk:
+    evaluator = state["evaluator"]
+    time_limit_ms = float(evaluator["time_limit_ms"])
+    settings = evaluator.get("move_time_risk", {})
+    overshoot_margin = float(settings.get("overshoot_margin", DEFAULT_MOVE_TIME_OVERSHOOT_MARGIN))
+    unseeded_margin = float(settings.get("unseeded_overshoot_margin", DEFAULT_MOVE_TIME_UNSEEDED_OVERSHOOT_MARGIN))
+    seed_growth_ratio = float(settings.get("seed_growth_ratio", DEFAULT_MOVE_TIME_SEED_GROWTH_RATIO))
+    cpu_count = os.cpu_count() or 1
+
+    columns = read_evaluation_columns(log_path)
+    per_game = columns.engine_move_ms_percentiles
+    typical = {name: float(np.median(values)) for name, values in per_game.items()}
+    worst_game_p99_ms = float(per_game["p99"].max()) if "p99" in per_game else None
+    max_move_ms = float(per_game["max"].max()) if "max" in per_game else None
+    game_average_p99_ms = float(np.percentile(columns.engine_move_ms, 99))
+
+    seed = state["latest_approved"]
+    seed_game_average_p99_ms: float | None = None
+    seed_worst_game_p99_ms: float | None = None
+    seed_max_move_ms: float | None = None
+    seed_source = REPO_ROOT / str(seed.get("approved_reference_score_source", ""))
+    if seed_source.is_file() and seed_source.suffix == ".csv":
+        seed_columns = read_evaluation_columns(seed_source)
+        if len(seed_columns.engine_move_ms):
+            seed_game_average_p99_ms = float(np.percentile(seed_columns.engine_move_ms, 99))
+        if "p99" in seed_columns.engine_move_ms_percentiles:
+            seed_worst_game_p99_ms = float(seed_columns.engine_move_ms_percentiles["p99"].max())
+        if "max" in seed_columns.engine_move_ms_percentiles:
+            seed_max_move_ms = float(seed_columns.engine_move_ms_percentiles["max"].max())
+
+    def overshoot_limit_ms(seed_value: float | None) -> float:
+        # Engines spend nearly their whole budget and routinely finish a few ms late, so the allowed
+        # overshoot starts from how far the seed itself went past the limit.
+        if seed_value is None:
+            return time_limit_ms * (1.0 + unseeded_margin)
+        return time_limit_ms * (1.0 + max(0.0, seed_value / time_limit_ms - 1.0) + overshoot_margin)
+
+    # Per-game p99 when the log has it, otherwise the p99 over per-game averages, which every log has.
+    checks = (
+        [("worst per-game p99", worst_game_p99_ms, seed_worst_game_p99_ms)]
+        if worst_game_p99_ms is not None
+        else [("game-average p99", game_average_p99_ms, seed_game_average_p99_ms)]
+    )
+    if max_move_ms is not None:
+        checks.append(("slowest move", max_move_ms, seed_max_move_ms))
+    reasons: list[str] = []
+    for label, value, seed_value in checks:
+        limit_ms = overshoot_limit_ms(seed_value)
+        if value > limit_ms:
+            reasons.append(f"{label} {value:.1f}ms overshot the {time_limit_ms:.0f}ms limit beyond {limit_ms:.1f}ms")
+        if seed_value is not None and value > seed_value * seed_growth_ratio:
+            reasons.append(f"{label} grew from seed {seed_value:.1f}ms to {value:.1f}ms")
+    # Context only: on a small host every candidate oversubscribes the cores, so it cannot flag one.
+    context: list[str] = []
+    busy_threads = workers * 2
+    if busy_threads > cpu_count:
+        context.append(
+            f"{workers} workers keep ~{busy_threads} engine/Stockfish threads busy on {cpu_count} cores, "
+            "so move times include CPU contention"
+        )
+    # Node budgets, not the clock, end fixed-node searches, so slow moves cost wall time but not strength.
+    informational = fixed_nodes_enabled(state)
+
+    return MoveTimeRisk(
+        time_limit_ms=time_limit_ms,
+        workers=workers,
+        cpu_count=cpu_count,
+        typical_p50_ms=typical.get("p50"),
+        typical_p95_ms=typical.get("p95"),
+        typical_p99_ms=typical.get("p99"),
+        worst_game_p99_ms=worst_game_p99_ms,
+        max_move_ms=max_move_ms,
+        game_average_p99_ms=game_average_p99_ms,
+        seed_version=str(seed["version"]),
+        seed_game_average_p99_ms=seed_game_average_p99_ms,
+        seed_worst_game_p99_ms=seed_worst_game_p99_ms,
+        seed_max_move_ms=seed_max_move_ms,
+        flagged=bool(reasons) and not informational,
+        detail="; ".join([*(reasons or ["move times stay within the seed's overshoot of the limit"]), *context])
+        + (" (fixed-node search, so move times are informational)" if informational else ""),
+    )
+
+
+def format_move_time_risk(risk: MoveTimeRisk) -> str:
+    def ms(value: float | None) -> str:
+        return "n/a" if value is None else f"{value:.1f}ms"
+
+    return (
+        f"Move-time risk ({'FLAGGED' if risk.flagged else 'ok'}): limit={risk.time_limit_ms:.0f}ms, "
+        f"workers={risk.workers}/{risk.cpu_count} cores, typical p50/p95/p99={ms(risk.typical_p50_ms)}/"
+        f"{ms(risk.typical_p95_ms)}/{ms(risk.typical_p99_ms)}, worst game p99={ms(risk.worst_game_p99_ms)}, "
+        f"max={ms(risk.max_move_ms)}, game-average p99={ms(risk.game_average_p99_ms)} "
+        f"(seed {risk.seed_version}: {ms(risk.seed_game_average_p99_ms)}, worst game p99 "
+        f"{ms(risk.seed_worst_game_p99_ms)}, max {ms(risk.seed_max_move_ms)}). {risk.detail}."
+    )
+
+
+def game_contention_scores(columns: EvaluationColumns, samples: list[ContentionSample]) -> np.ndarray:
+    # Each sample covers (unix_ms - interval, unix_ms]. A game's score is the mean over the samples
+    # that overlap its window; games shorter than one interval take the sample that contains them.
+    sample_end = np.array([sample.unix_ms for sample in samples], dtype=np.int64)
+    sample_start = sample_end - np.array([sample.interval_seconds * 1000.0 for sample in samples]).astype(np.int64)
+    sample_score = np.array([sample.score for sample in samples], dtype=np.float64)
+    scores = np.zeros(len(columns.engine_a_score), dtype=np.float64)
+    for game, (started, finished) in enumerate(zip(columns.game_started_unix_ms, columns.game_finished_unix_ms)):
+        overlapping = (sample_end > started) & (sample_start < finished)
+        if overlapping.any():
+            scores[game] = float(sample_score[overlapping].mean())
+        else:
+            scores[game] = float(sample_score[min(int(np.searchsorted(sample_end, finished)), len(samples) - 1)])
+    return scores
+
+
+def analyze_contention(
+    log_path: Path,
+    samples: list[ContentionSample],
+    state: dict[str, Any],
+    *,
+    requeued_pairs: int = 0,
+) -> ContentionReport:
+    settings = state["evaluator"].get("contention", {})
+    heavy_score = float(settings.get("heavy_score", DEFAULT_CONTENTION_HEAVY_SCORE))
+    max_fraction = float(settings.get("max_heavy_pair_fraction", DEFAULT_CONTENTION_MAX_HEAVY_PAIR_FRACTION))
+    columns = read_evaluation_columns(log_path)
+    pair_numbers, pair_index = np.unique(columns.pair_number, return_inverse=True)
+
+    if not samples or columns.game_started_unix_ms is None:
+        return ContentionReport(
+            sample_count=len(samples),
+            mean_score=0.0,
+            peak_score=0.0,
+            peak_load_1m=0.0,
+            heavy_score=heavy_score,
+            pair_count=len(pair_numbers),
+            heavy_pairs=(),
+            requeued_pairs=requeued_pairs,
+            flagged=False,
+            detail="no CPU samples or game timestamps were recorded, so contention was not measured",
+        )
+
+    game_scores = game_contention_scores(columns, samples)
+    # A pair is only as clean as its more contended game.
+    pair_scores = np.zeros(len(pair_numbers), dtype=np.float64)
+    np.maximum.at(pair_scores, pair_index, game_scores)
+    heavy_pairs = tuple(int(pair) for pair in pair_numbers[pair_scores >= heavy_score])
+    heavy_fraction = len(heavy_pairs) / max(len(pair_numbers), 1)
+    flagged = heavy_fraction > max_fraction
+    detail = (
+        f"{len(heavy_pairs)}/{len(pair_numbers)} pairs ({heavy_fraction:.1%}) played at contention >= {heavy_score:.2f}"
+        + (f" after {requeued_pairs} pairs were replayed" if requeued_pairs else "")
+        + (
+            f", above the {max_fraction:.1%} limit, so move times and results may reflect a busy host"
+            if flagged
+            else ""
+        )
+    )
+    return ContentionReport(
+        sample_count=len(samples),
+        mean_score=float(np.mean([sample.score for sample in samples])),
+        peak_score=float(max(sample.score for sample in samples)),
+        peak_load_1m=float(max(sample.load_1m for sample in samples)),
+        heavy_score=heavy_score,
+        pair_count=len(pair_numbers),
+        heavy_pairs=heavy_pairs,
+        requeued_pairs=requeued_pairs,
+        flagged=flagged,
+        detail=detail,
+    )
+
+
+@traced_phase("evaluator_requeue")
+def requeue_contended_pairs(
+    candidate: Candidate,
+    state: dict[str, Any],
+    attempt_id: str,
+    log_path: Path,
+    *,
+    build_dir: Path | None = None,
+    soc_cc_enabled: bool,
+) -> ContentionReport:
+    # Every pair starts from the same position, so pairs are exchangeable: replaying a contended
+    # pair as a fresh pair and swapping it in does not bias the score, because the choice of which
+    # pairs to replay depends only on host load, never on their results.
+    samples_path = contention_samples_path(attempt_id)
+    rounds = int(state["evaluator"].get("contention", {}).get("requeue_rounds", DEFAULT_CONTENTION_REQUEUE_ROUNDS))
+    requeued = 0
+    report = analyze_contention(log_path, read_samples(samples_path), state)
+    if fixed_nodes_enabled(state):
+        # A contended fixed-node game replays move for move, so replaying it would change nothing.
+        return report
+    for round_number in range(1, rounds + 1):
+        if not report.heavy_pairs:
+            break
+        requeue_id = f"{attempt_id}-requeue{round_number}"
+        log_phase(
+            f"Replaying {len(report.heavy_pairs)} pairs played under CPU contention "
+            f"(round {round_number}/{rounds}, attempt {requeue_id})."
+        )
+        requeue_log = REPO_ROOT / "autoresearch" / "logs" / f"{requeue_id}-result.csv"
+        requeue_samples = contention_samples_path(requeue_id)
+        ok = run_evaluator(
+            candidate,
+            state,
+            requeue_id,
+            2 * len(report.heavy_pairs),
+            build_dir=build_dir,
+            soc_cc_enabled=soc_cc_enabled,
+        )
+        if ok and requeue_log.exists():
+            requeued += replace_evaluation_pairs(log_path, requeue_log, report.heavy_pairs, attempt_id)
+            with samples_path.open("a", encoding="utf-8") as handle:
+                handle.write(requeue_samples.read_text(encoding="utf-8") if requeue_samples.exists() else "")
+        else:
+            log_phase("Contention replay failed; keeping the original pairs.")
+        requeue_log.unlink(missing_ok=True)
+        companion_path(requeue_log).unlink(missing_ok=True)
+        requeue_samples.unlink(missing_ok=True)
+        if not ok:
+            break
+        report = analyze_contention(log_path, read_samples(samples_path), state, requeued_pairs=requeued)
+    return report
+
+
+def replace_evaluation_pairs(log_path: Path, replay_path: Path, pairs: tuple[int, ...], attempt_id: str) -> int:
+    with log_path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    with replay_path.open(newline="", encoding="utf-8") as handle:
+        replay_rows = list(csv.reader(handle))
+    header = rows[0]
+    sha_at = header.index("commit_short_sha")
+    game_at = header.index("game_number")
+    pair_at = header.index("pair_number")
+
+    replay_by_pair: dict[int, list[list[str]]] = {}
+    for row in replay_rows[1:]:
+        if row:
+            replay_by_pair.setdefault(int(row[pair_at]), []).append(row)
+    complete = [sorted(games, key=lambda row: int(row[game_at])) for _, games in sorted(replay_by_pair.items())]
+    complete = [games for games in complete if len(games) == 2]
+    targets = dict(zip(pairs, complete))
+
+    kept = [row for row in rows[1:] if row and int(row[pair_at]) not in targets]
+    original_games = {
+        pair: sorted(int(row[game_at]) for row in rows[1:] if row and int(row[pair_at]) == pair) for pair in targets
+    }
+    for pair, games in targets.items():
+        # Reuse the replaced pair's numbers so colour assignment and ordering stay as LocalTesting wrote them.
+        for row, game_number in zip(games, original_games[pair]):
+            row[sha_at] = attempt_id
+            row[game_at] = str(game_number)
+            row[pair_at] = str(pair)
+            kept.append(row)
+    kept.sort(key=lambda row: int(row[game_at]))
+
+    with log_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(kept)
+    if companion_path(log_path).exists():
+        write_companion(log_path)
+    return len(targets)
+
+
+def format_contention(report: ContentionReport) -> str:
+    return (
+        f"CPU contention ({'FLAGGED' if report.flagged else 'ok'}): {report.sample_count} samples, "
+        f"mean score {report.mean_score:.2f}, peak {report.peak_score:.2f}, peak load {report.peak_load_1m:.2f}. "
+        f"{report.detail}."
+    )
+
+
+def decide_candidate(
+    metrics: EvaluationMetrics,
+    state: dict[str, Any],
+    *,
+    workers: int | None = None,
+) -> tuple[str, str]:
+    status, reason = apply_approval_rules(metrics, state)
+    model = load_noise_model(state, int(state["evaluator"]["workers"]) if workers is None else workers)
+    if model is not None and approved_reference_score_rate(state) is not None:
+        # Advisory only: the rules above stay the approval contract.
+        reason = f"{reason} {format_noise_model(model, noise_rule_pass_rates(model, state, metrics.games), metrics)}"
+    return status, reason
+
+
+def apply_approval_rules(metrics: EvaluationMetrics, state: dict[str, Any]) -> tuple[str, str]:
+    approved_score = approved_reference_score_rate(state)
+    approval = state["evaluator"]["approval"]
+    if approved_score is None:
+        mode = "fixed-node" if fixed_nodes_enabled(state) else "time-control"
+        return "rejected", (
+            f"Rejected because seed {state['latest_approved']['version']} has no {mode} reference score_rate "
+            "for these evaluator settings, so the candidate cannot be compared with it."
+        )
     failures = sum(metrics.failure_counts[key] for key in ("crash", "illegal_move", "timeout", "harness"))
     if failures > 0:
         return "rejected", "Rejected because evaluator failures were recorded."
@@ -1314,11 +2859,331 @@ def decide_candidate(metrics: EvaluationMetrics, state: dict[str, Any]) -> tuple
     )
 
 
+def noise_model_config(state: dict[str, Any], workers: int) -> dict[str, Any]:
+    evaluator = state["evaluator"]
+    return {
+        "host": socket.gethostname(),
+        "cpu_count": os.cpu_count() or 1,
+        "seed_version": str(state["latest_approved"]["version"]),
+        "opponent": evaluator["opponent"],
+        "stockfish_elo": evaluator["stockfish_elo"],
+        "time_limit_ms": evaluator["time_limit_ms"],
+        "max_plies": evaluator["max_plies"],
+        "workers": workers,
+        "affinity": bool(evaluator.get("affinity", {}).get("enabled", False)),
+    } | (
+        {"fixed_nodes": f"{evaluator['fixed_nodes'].get('engine_nodes')}/{evaluator['fixed_nodes'].get('stockfish_nodes')}"}
+        if fixed_nodes_enabled(state)
+        else {}
+    )
+
+
+def noise_model_key(config: dict[str, Any]) -> str:
+    return "|".join(f"{name}={config[name]}" for name in sorted(config))
+
+
+def load_noise_models() -> dict[str, Any]:
+    if not NOISE_MODELS_PATH.exists():
+        return {}
+    return json.loads(NOISE_MODELS_PATH.read_text(encoding="utf-8"))
+
+
+def load_noise_model(state: dict[str, Any], workers: int) -> dict[str, Any] | None:
+    return load_noise_models().get(noise_model_key(noise_model_config(state, workers)))
+
+
+def noise_rule_pass_rates(model: dict[str, Any], state: dict[str, Any], games: int) -> dict[str, float]:
+    # Simulates approval runs of an engine identical to the seed: each run draws a run-level offset
+    # (machine and scheduling drift between runs), then the pair-sampling error of `games` games.
+    # The pass rate of each rule is its false-approval rate for a candidate with no real change.
+    approval = state["evaluator"]["approval"]
+    pairs = max(games // 2, 1)
+    t_critical = approval["t_critical_one_sided_95_by_df"].get(str(pairs - 1), DEFAULT_T_CRITICAL_ONE_SIDED_95)
+    pair_sd = float(model["pair_sd"])
+    rng = np.random.default_rng(int(approval.get("bootstrap_seed", DEFAULT_BOOTSTRAP_SEED)))
+    run_mean = float(model["score_rate_mean"]) + rng.normal(0.0, float(model["between_run_sd"]), NOISE_MODEL_DRAWS)
+    score_rate = rng.normal(run_mean, pair_sd / math.sqrt(pairs))
+    lcb95 = score_rate - t_critical * pair_sd / math.sqrt(pairs)
+    max_plies_rate = rng.binomial(games, float(model["max_plies_rate_mean"]), NOISE_MODEL_DRAWS) / games
+    # Without a reference for the current mode the score_rate rule cannot pass.
+    reference = approved_reference_score_rate(state)
+    reference = math.inf if reference is None else reference
+    passes = {
+        "score_rate": score_rate > reference,
+        "lcb95": lcb95 > float(approval["lcb95_min_exclusive"]),
+        "max_plies_rate": max_plies_rate < float(approval["max_plies_rate_max_exclusive"]),
+    }
+    passes["all"] = passes["score_rate"] & passes["lcb95"] & passes["max_plies_rate"]
+    return {rule: float(passed.mean()) for rule, passed in passes.items()}
+
+
+def noise_run_sd(model: dict[str, Any], games: int) -> float:
+    return math.sqrt(float(model["pair_sd"]) ** 2 / max(games // 2, 1) + float(model["between_run_sd"]) ** 2)
+
+
+def format_noise_model(model: dict[str, Any], rates: dict[str, float], metrics: EvaluationMetrics) -> str:
+    run_sd = noise_run_sd(model, metrics.games)
+    margin = (metrics.score_rate - float(model["score_rate_mean"])) / run_sd if run_sd > 0 else 0.0
+    return (
+        f"Noise model ({model['runs']} seed runs, calibrated {model['calibrated_at']}): an unchanged "
+        f"{model['config']['seed_version']} scores {float(model['score_rate_mean']):.4f} +/- {run_sd:.4f} over "
+        f"{metrics.games} games here and would pass score_rate {rates['score_rate']:.1%}, lcb95 {rates['lcb95']:.1%}, "
+        f"max_plies_rate {rates['max_plies_rate']:.1%}, all rules {rates['all']:.1%} of the time; "
+        f"this candidate is {margin:+.2f} sd from it."
+    )
+
+
+def read_game_cells(path: Path) -> list[list[Any]]:
+    records = load_evaluation_records(path)
+    outcome = records.lookup("result", {"1-0": 0, "1/2-1/2": 1, "0-1": 2}, -1)
+    played = outcome >= 0
+    keys = np.stack(
+        [records.records["white_engine"][played].astype(np.int64), records.records["black_engine"][played], outcome[played]]
+    )
+    cells, totals = np.unique(keys, axis=1, return_counts=True)
+    counts: dict[tuple[str, str], list[int]] = {}
+    for (white, black, column), total in zip(cells.T.tolist(), totals.tolist()):
+        counts.setdefault((records.strings[white], records.strings[black]), [0, 0, 0])[column] += total
+    return [[white, black, *outcome] for (white, black), outcome in sorted(counts.items())]
+
+
+def refresh_elo_ledger() -> dict[str, Any]:
+    # Sources are keyed by content hash, so a log that moves from logs/ to approved_logs/ (and is
+    # renamed with its commit) stays one source, and rejected logs that are later deleted from the
+    # scratch directory keep contributing their games.
+    ledger = json.loads(ELO_LEDGER_PATH.read_text(encoding="utf-8")) if ELO_LEDGER_PATH.exists() else {}
+    sources = ledger.setdefault("sources", {})
+    for directory, approved in ((APPROVED_LOG_DIR, True), (EVALUATION_LOG_DIR, False)):
+        for path in list_logs(directory, "*-result.csv"):
+            digest = log_digest(path)
+            entry = sources.get(digest)
+            if entry is None:
+                entry = sources[digest] = {"cells": read_game_cells(path), "approved": False}
+            entry["path"] = str(path.relative_to(REPO_ROOT))
+            entry["approved"] = bool(entry["approved"] or approved)
+            if not approved:
+                entry.setdefault("attempt", path.name.removesuffix("-result.csv"))
+    return ledger
+
+
+def elo_player(stem: str, source: dict[str, Any]) -> str:
+    # Approved logs rate the version itself; attempt logs rate that one attempt, because a later
+    # retry of the same version may be a different engine.
+    if not ENGINE_STEM_RE.match(stem) or source["approved"] or "attempt" not in source:
+        return stem
+    return f"{stem}@{source['attempt']}"
+
+
+def fit_elo_history(state: dict[str, Any], ledger: dict[str, Any]) -> EloHistory:
+    settings = state["evaluator"].get("elo", {})
+    step_sd = float(settings.get("version_step_sd", DEFAULT_ELO_VERSION_STEP_SD))
+    initial_sd = float(settings.get("initial_sd", DEFAULT_ELO_INITIAL_SD))
+    anchor_elo = float(state["evaluator"]["stockfish_elo"])
+    anchors = {f"stockfish-{state['evaluator']['stockfish_elo']}": anchor_elo}
+
+    totals: dict[tuple[str, str], list[int]] = {}
+    for source in ledger["sources"].values():
+        for white, black, white_wins, draws, black_wins in source["cells"]:
+            cell = totals.setdefault((elo_player(white, source), elo_player(black, source)), [0, 0, 0])
+            cell[0] += white_wins
+            cell[1] += draws
+            cell[2] += black_wins
+    cells = [GameCell(white, black, *outcome) for (white, black), outcome in sorted(totals.items())]
+
+    players = {cell.white for cell in cells} | {cell.black for cell in cells}
+    player_versions: dict[str, tuple[int, int]] = {}
+    for player in players:
+        match = ENGINE_STEM_RE.match(player.split("@", 1)[0])
+        if match:
+            player_versions[player] = (int(match.group("major")), int(match.group("minor")))
+
+    # Approved versions form a random walk: each is expected near the previous approved version.
+    # An attempt is expected near the newest approved version before it, i.e. its likely seed.
+    approved = sorted((version, player) for player, version in player_versions.items() if "@" not in player)
+    priors: list[RatingPrior] = []
+    for position, (_, player) in enumerate(approved):
+        if position == 0:
+            priors.append(RatingPrior(player, anchor_elo, initial_sd))
+        else:
+            priors.append(RatingPrior(player, 0.0, step_sd, parent=approved[position - 1][1]))
+    for player, version in player_versions.items():
+        if "@" not in player:
+            continue
+        parents = [name for approved_version, name in approved if approved_version < version]
+        priors.append(
+            RatingPrior(player, 0.0, step_sd, parent=parents[-1])
+            if parents
+            else RatingPrior(player, anchor_elo, initial_sd)
+        )
+    for player in players - set(player_versions) - set(anchors):
+        nominal = re.search(r"(\d+)$", player)
+        priors.append(RatingPrior(player, float(nominal.group(1)) if nominal else anchor_elo, step_sd if nominal else initial_sd))
+
+    previous = ledger.get("fit", {})
+    initial = {player: item["rating"] for player, item in previous.get("ratings", {}).items()}
+    if "draw_elo" in previous:
+        initial["__draw_elo__"] = previous["draw_elo"]
+        initial["__white_advantage__"] = previous["white_advantage"]
+    fit = fit_ratings(cells, priors, anchors, initial=initial)
+    ledger["fit"] = {
+        "fitted_at": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "anchors": anchors,
+        "version_step_sd": step_sd,
+        "draw_elo": round(fit.draw_elo, 2),
+        "white_advantage": round(fit.white_advantage, 2),
+        "games": sum(cell.white_wins + cell.draws + cell.black_wins for cell in cells),
+        "ratings": {
+            player: {"rating": round(fit.ratings[player], 1), "sd": round(fit.sd(player), 1), "games": fit.games[player]}
+            for player in fit.players
+        },
+    }
+    return EloHistory(fit=fit, player_versions=player_versions, anchors=anchors, sources=len(ledger["sources"]))
+
+
+@traced_phase("elo_fit")
+def update_elo_history(state: dict[str, Any]) -> EloHistory:
+    ledger = refresh_elo_ledger()
+    history = fit_elo_history(state, ledger)
+    ELO_LEDGER_PATH.write_text(json.dumps(ledger, indent=2) + "\n", encoding="utf-8")
+    return history
+
+
+def format_elo_posterior(history: EloHistory, candidate: Candidate, attempt_id: str, state: dict[str, Any]) -> str:
+    fit = history.fit
+    player = f"{candidate.stem}@{attempt_id}"
+    seed = Path(state["latest_approved"]["engine_file"]).stem
+    total_games = sum(fit.games[name] for name in history.player_versions)
+    text = f"Bayesian Elo ({total_games} engine games from {history.sources} logs, anchor "
+    text += ", ".join(f"{name}={rating:.0f}" for name, rating in history.anchors.items()) + "): "
+    if player not in fit.ratings:
+        return text + "the candidate log was not found."
+    text += f"candidate {fit.ratings[player]:.0f} +/- {fit.sd(player):.0f} ({fit.games[player]} games)"
+    if seed in fit.ratings:
+        text += (
+            f", seed {state['latest_approved']['version']} {fit.ratings[seed]:.0f} +/- {fit.sd(seed):.0f}, "
+            f"P(candidate > seed) = {fit.probability_better(player, seed):.3f}"
+        )
+    return text + "."
+
+
+def record_elo_in_changelog(history: EloHistory) -> int:
+    changelog = load_changelog()
+    fit = history.fit
+    updated = 0
+    for entry in changelog.get("versions", []):
+        try:
+            version = parse_version(str(entry.get("version", "")))
+        except SystemExit:
+            continue
+        players = sorted(player for player, player_version in history.player_versions.items() if player_version == version)
+        if not players:
+            continue
+        # Prefer the approved rating; otherwise the most recent attempt of that version.
+        player = next((name for name in players if "@" not in name), players[-1])
+        entry["elo"] = {
+            "rating": round(fit.ratings[player], 1),
+            "sd": round(fit.sd(player), 1),
+            "games": fit.games[player],
+            "player": player,
+        }
+        updated += 1
+    changelog["elo_model"] = {
+        "method": "BayesElo-style MAP with Laplace posterior over every approved and attempt log",
+        "anchors": history.anchors,
+        "draw_elo": round(fit.draw_elo, 2),
+        "white_advantage": round(fit.white_advantage, 2),
+        "sources": history.sources,
+    }
+    write_changelog(changelog)
+    return updated
+
+
+def run_engine_profile(engine_file: Path, state: dict[str, Any], build_dir: Path | None = None) -> dict[str, Any] | None:
+    profile = state["evaluator"].get("profile", {})
+    with tempfile.TemporaryDirectory(prefix="engine-profile-") as tmp:
+        output_path = Path(tmp) / "profile.json"
+        result = run_local_testing(
+            [
+                "profile",
+                "--engine-file",
+                str(engine_file.relative_to(REPO_ROOT)),
+                "--time-limit-ms",
+                str(profile.get("time_limit_ms", DEFAULT_PROFILE_TIME_LIMIT_MS)),
+                "--repeats",
+                str(profile.get("repeats", DEFAULT_PROFILE_REPEATS)),
+                "--output",
+                str(output_path),
+            ],
+            build_dir,
+        )
+        if result.returncode != 0 or not output_path.exists():
+            return None
+        return json.loads(output_path.read_text(encoding="utf-8"))
+
+
+@traced_phase("profile", lambda profile: succeeded(profile is not None))
+def profile_candidate_and_seed(
+    candidate: Candidate,
+    state: dict[str, Any],
+    build_dir: Path | None = None,
+) -> HotMethodProfile | None:
+    # Profiling only informs Codex, so a failed profile is logged and never changes the verdict.
+    seed = state["latest_approved"]
+    log_phase(f"Profiling {candidate.version} and seed {seed['version']} with EventPipe sampling.")
+    candidate_file = candidate.engine_file if build_dir is None else candidate.sandbox_engine_file
+    candidate_report = run_engine_profile(candidate_file, state, build_dir)
+    seed_report = run_engine_profile(REPO_ROOT / seed["engine_file"], state, build_dir)
+    if candidate_report is None or seed_report is None:
+        log_phase("Profiling failed; continuing without a hot-method summary.")
+        return None
+    return HotMethodProfile(candidate=candidate_report, seed=seed_report)
+
+
+def format_hot_methods(profile: HotMethodProfile, state: dict[str, Any]) -> str:
+    top = int(state["evaluator"].get("profile", {}).get("top_methods", DEFAULT_PROFILE_TOP_METHODS))
+    candidate, seed = profile.candidate, profile.seed
+
+    def method_key(method: dict[str, Any]) -> tuple[str, str]:
+        # Engine types carry the version (V4_0Engine), so strip it to line the two engines up.
+        return method["module"], re.sub(r"V\d+_\d+", "V*", method["method"])
+
+    def cell(item: dict[str, Any] | None) -> str:
+        if item is None:
+            return f"{'-':>15}"
+        return f"{item['exclusive_percent']:5.1f}% /{item['inclusive_percent']:5.1f}%"
+
+    candidate_methods = {method_key(item): item for item in candidate["methods"]}
+    seed_methods = {method_key(item): item for item in seed["methods"]}
+    hottest = [method_key(item) for item in candidate["methods"][:top]]
+    hottest += [key for key in (method_key(item) for item in seed["methods"][:top]) if key not in hottest]
+    seed_categories = {item["category"]: item for item in seed["categories"]}
+    labels = {key: (candidate_methods.get(key) or seed_methods[key])["method"] for key in hottest}
+    width = max([len("move_generation"), *(len(label) for label in labels.values())])
+
+    lines = [
+        f"Top hot methods, candidate {candidate['engine_stem']} vs seed {seed['engine_stem']} "
+        f"(EventPipe samples, exclusive / inclusive share; {candidate['searches']} searches at "
+        f"{candidate['time_limit_ms']:.0f}ms, {candidate['samples']} vs {seed['samples']} engine samples):",
+        f"{'area':<{width}}  {'candidate':>15}  {'seed':>15}",
+    ]
+    lines.extend(
+        f"{item['category']:<{width}}  {cell(item)}  {cell(seed_categories.get(item['category']))}"
+        for item in candidate["categories"]
+    )
+    lines.append(f"{'method':<{width}}  {'candidate':>15}  {'seed':>15}")
+    lines.extend(
+        f"{labels[key]:<{width}}  {cell(candidate_methods.get(key))}  {cell(seed_methods.get(key))}" for key in hottest
+    )
+    return "\n".join(lines)
+
+
 def move_approved_log(candidate: Candidate, log_path: Path, attempt_id: str) -> Path:
     approved_dir = REPO_ROOT / "autoresearch" / "approved_logs"
     approved_dir.mkdir(parents=True, exist_ok=True)
     target = approved_dir / f"{candidate.stem}-{attempt_id}-result.csv"
     shutil.move(str(log_path), target)
+    # Approved logs are tracked as CSV only; the companion would describe a log that is gone.
+    companion_path(log_path).unlink(missing_ok=True)
     return target
 
 
@@ -1357,14 +3222,18 @@ def build_evaluation_summary(
     verdict_reason: str,
     metrics: EvaluationMetrics | None,
     state: dict[str, Any],
+    move_time_risk: MoveTimeRisk | None = None,
+    contention: ContentionReport | None = None,
+    elo_posterior: str | None = None,
+    hot_methods: str | None = None,
 ) -> str:
-    approved_score = state["latest_approved"]["approved_reference_score_rate_vs_stockfish_1350"]
+    approved_score = format_float(approved_reference_score_rate(state))
     if metrics is None:
         return textwrap.dedent(
             f"""\
             Candidate version: {candidate.version}
             Approval status: {status}
-            Previously approved score_rate: {approved_score:.4f}
+            Previously approved score_rate: {approved_score}
             Candidate score_rate: n/a
             Verdict: {verdict_reason}
             """
@@ -1374,9 +3243,10 @@ def build_evaluation_summary(
         f"""\
         Candidate version: {candidate.version}
         Approval status: {status}
-        Previously approved score_rate: {approved_score:.4f}
+        Previously approved score_rate: {approved_score}
         Candidate score_rate: {metrics.score_rate:.4f}
         Candidate lcb95: {metrics.lcb95:.4f}
+        Candidate bootstrap lcb95 (distribution-free second opinion): {metrics.bootstrap_lcb95:.4f}
         Candidate max_plies_rate: {metrics.max_plies_rate:.4f}
         Wins/draws/losses: {metrics.wins}/{metrics.draws}/{metrics.losses}
         Average plies: {metrics.average_plies:.2f}
@@ -1385,9 +3255,14 @@ def build_evaluation_summary(
         Failure counts: {metrics.failure_counts}
         Verdict: {verdict_reason}
         """
+    ) + (f"{format_move_time_risk(move_time_risk)}\n" if move_time_risk is not None else "") + (
+        f"{format_contention(contention)}\n" if contention is not None else ""
+    ) + (f"{elo_posterior}\n" if elo_posterior is not None else "") + (
+        f"{hot_methods}\n" if hot_methods is not None else ""
     )
 
 
+@traced_phase("record")
 def update_state_and_attempts(
     state: dict[str, Any],
     candidate: Candidate,
@@ -1398,24 +3273,23 @@ def update_state_and_attempts(
     metrics: EvaluationMetrics | None,
     log_path: Path,
     approved_log_path: Path | None,
+    hot_methods: str | None = None,
+    seed: dict[str, Any] | None = None,
+    direction: str | None = None,
+    fan_out: str | None = None,
 ) -> None:
-    now = dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-    seed = state["latest_approved"]
-    attempt = {
-        "timestamp": now,
-        "commit": "<pending>",
-        "status": status,
-        "evaluator_baseline": state["evaluator"]["opponent"],
-        "seed_version": seed["version"],
-        "seed_file": seed["engine_file"],
-        "candidate_version": candidate.version,
-        "version_bump": candidate.version_bump,
-        "hypotheses": attempt_note["hypotheses"],
-        "implementation_summary": attempt_note["implementation_summary"],
-        "evaluation_log_path": "<pending>" if status == "approved" else "<n/a>",
-        "inferred_conclusion": attempt_note["inferred_conclusion"],
-        "metrics": metrics_to_dict(metrics),
-    }
+    attempt = attempt_entry(
+        state,
+        candidate,
+        status,
+        attempt_note,
+        metrics,
+        hot_methods=hot_methods,
+        seed=seed,
+        direction=direction,
+        fan_out=fan_out,
+    )
+    now = attempt["timestamp"]
     upsert_changelog_version(
         candidate,
         status,
@@ -1430,15 +3304,94 @@ def update_state_and_attempts(
             "engine_file": str(candidate.engine_file.relative_to(REPO_ROOT)),
             "commit": attempt_id,
             "approved_recorded_at": now[:10],
-            "approved_reference_score_rate_vs_stockfish_1350": round(metrics.score_rate, 4),
+            # A fixed-node score is not a time-control reference; that mode re-baselines the seed when next used.
+            "approved_reference_score_rate_vs_stockfish_1350": (
+                None if fixed_nodes_enabled(state) else round(metrics.score_rate, 4)
+            ),
             "approved_reference_score_source": "<pending>",
             "notes": attempt_note["implementation_summary"],
         }
+        if fixed_nodes_enabled(state):
+            state["latest_approved"]["fixed_node_references"] = {
+                approved_reference_key(state): {
+                    "score_rate": round(metrics.score_rate, 4),
+                    "attempt_id": attempt_id,
+                    "recorded_at": now[:10],
+                }
+            }
         update_latest_approved_markdown(state["latest_approved"])
     state["next_candidate_version"] = bump_minor(candidate.version)
     append_attempt_markdown(attempt)
 
 
+def attempt_entry(
+    state: dict[str, Any],
+    candidate: Candidate,
+    status: str,
+    attempt_note: dict[str, Any],
+    metrics: EvaluationMetrics | None,
+    *,
+    hot_methods: str | None = None,
+    seed: dict[str, Any] | None = None,
+    direction: str | None = None,
+    fan_out: str | None = None,
+) -> dict[str, Any]:
+    # seed overrides latest_approved for results evaluated elsewhere against an older seed.
+    seed = seed or state["latest_approved"]
+    return {
+        "timestamp": dt.datetime.now(dt.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "commit": "<pending>",
+        "status": status,
+        "evaluator_baseline": state["evaluator"]["opponent"],
+        "seed_version": seed["version"],
+        "seed_file": seed["engine_file"],
+        "candidate_version": candidate.version,
+        "version_bump": candidate.version_bump,
+        "direction": direction,
+        "fan_out": fan_out,
+        "hypotheses": attempt_note["hypotheses"],
+        "implementation_summary": attempt_note["implementation_summary"],
+        "evaluation_log_path": "<pending>" if status == "approved" else "<n/a>",
+        "inferred_conclusion": attempt_note["inferred_conclusion"],
+        "metrics": metrics_to_dict(metrics),
+        "hot_methods": hot_methods,
+    }
+
+
+def write_attempt_result(
+    path: Path,
+    state: dict[str, Any],
+    candidate: Candidate,
+    attempt_id: str,
+    status: str,
+    verdict_reason: str,
+    attempt_note: dict[str, Any],
+    csv_path: Path | None,
+    hot_methods: str | None,
+    direction: str | None,
+    fan_out: FanOutResult | None = None,
+) -> None:
+    payload = {
+        "version": candidate.version,
+        "version_bump": candidate.version_bump,
+        "seed": state["latest_approved"],
+        "attempt_id": attempt_id,
+        "status": status,
+        "verdict_reason": verdict_reason,
+        "attempt_note": attempt_note,
+        "hot_methods": hot_methods,
+        "direction": direction,
+        "fan_out": fan_out.note if fan_out is not None else None,
+        "sub_attempts": fan_out.eliminated if fan_out is not None else [],
+        "engine_source": candidate.sandbox_engine_file.read_text(encoding="utf-8")
+        if candidate.sandbox_engine_file.exists()
+        else None,
+        "csv": csv_path.read_text(encoding="utf-8") if csv_path is not None else None,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
 def metrics_to_dict(metrics: EvaluationMetrics | None) -> dict[str, Any]:
     if metrics is None:
         return {}
@@ -1455,6 +3408,7 @@ def metrics_to_dict(metrics: EvaluationMetrics | None) -> dict[str, Any]:
         "pair_mean": metrics.pair_mean,
         "pair_sd": metrics.pair_sd,
         "lcb95": metrics.lcb95,
+        "bootstrap_lcb95": metrics.bootstrap_lcb95,
         "games": metrics.games,
     }
 
@@ -1473,8 +3427,12 @@ def append_attempt_markdown(attempt: dict[str, Any]) -> None:
         f"- seed_file: `{attempt['seed_file']}`",
         f"- candidate_version: `{attempt['candidate_version']}`",
         f"- version_bump: `{attempt['version_bump']}`",
-        "- hypotheses:",
     ]
+    if attempt.get("direction"):
+        lines.append(f"- direction: `{attempt['direction']}`")
+    if attempt.get("fan_out"):
+        lines.append(f"- fan_out: `{attempt['fan_out']}`")
+    lines.append("- hypotheses:")
     lines.extend(f"  - `{item}`" for item in attempt["hypotheses"])
     lines.extend(
         [
@@ -1489,6 +3447,10 @@ def append_attempt_markdown(attempt: dict[str, Any]) -> None:
             f"- inferred_conclusion: `{attempt['inferred_conclusion']}`",
         ]
     )
+    if attempt.get("hot_methods"):
+        lines.extend(["- hot_methods:", "", "  ```text"])
+        lines.extend(f"  {line}" for line in attempt["hot_methods"].splitlines())
+        lines.append("  ```")
     text = "\n".join(lines)
     with ATTEMPTS_PATH.open("a", encoding="utf-8") as handle:
         handle.write(text)
@@ -1512,7 +3474,7 @@ def update_latest_approved_markdown(latest: dict[str, Any]) -> None:
         - approved_file: `{latest['engine_file']}`
         - approved_commit: `{latest['commit']}`
         - approved_recorded_at: `{latest['approved_recorded_at']}`
-        - approved_reference_score_rate_vs_stockfish_1350: `{latest['approved_reference_score_rate_vs_stockfish_1350']:.4f}`
+        - approved_reference_score_rate_vs_stockfish_1350: `{format_float(latest.get('approved_reference_score_rate_vs_stockfish_1350'))}`
         - approved_reference_score_source: `{latest['approved_reference_score_source']}`
         - notes: `{latest['notes']}`
         """
@@ -1580,6 +3542,10 @@ def upsert_changelog_version(
         existing = versions[existing_index]
         if isinstance(existing, dict) and "served" in existing:
             version_entry["served"] = bool(existing["served"])
+        if isinstance(existing, dict) and "serving_benchmark" in existing:
+            version_entry["serving_benchmark"] = existing["serving_benchmark"]
+        if isinstance(existing, dict) and "elo" in existing:
+            version_entry["elo"] = existing["elo"]
         versions[existing_index] = version_entry
 
     versions.sort(key=lambda item: parse_version(str(item["version"])))
@@ -1639,6 +3605,7 @@ def current_branch() -> str:
     return result.stdout.strip()
 
 
+@traced_phase("git_push")
 def push_current_branch() -> None:
     branch = current_branch()
     if not branch:
@@ -1670,8 +3637,11 @@ def cleanup_rejected_candidate(candidate: Candidate, status: str) -> None:
         candidate.engine_file.unlink()
 
 
+@traced_phase("git_commit")
 def commit_attempt(candidate: Candidate, status: str) -> str | None:
     run(["git", "add", "autoresearch/state.json", "autoresearch/ATTEMPTS.md", "CHANGELOG.json"], check=True)
+    if ELO_LEDGER_PATH.exists():
+        run(["git", "add", str(ELO_LEDGER_PATH.relative_to(REPO_ROOT))], check=True)
     if status == "approved":
         run(["git", "add", str(candidate.engine_file.relative_to(REPO_ROOT)), "autoresearch/approved_logs"], check=True)
     run(["git", "add", "-u", "engine_csharp/src/Engine.Core"], check=True)
@@ -1688,6 +3658,7 @@ def commit_attempt(candidate: Candidate, status: str) -> str | None:
     return sha.stdout.strip()
 
 
+@traced_phase("git_finalize")
 def finalize_attempt_commit(
     candidate: Candidate,
     status: str,
@@ -1755,10 +3726,21 @@ def replace_latest_changelog_placeholders(commit_sha: str, approved_reference_so
     write_changelog(changelog)
 
 
-def prompt_continue(status: str, candidate: Candidate, verdict: str, *, soc_cc_enabled: bool) -> str:
+@traced_phase("continue_prompt", str)
+def prompt_continue(
+    status: str,
+    candidate: Candidate,
+    verdict: str,
+    *,
+    soc_cc_enabled: bool,
+    headless: bool = False,
+) -> str:
     if soc_cc_enabled:
         log_phase(f"SOC CC mode auto-continues after {candidate.version} {status}.")
         return "continue"
+    if headless:
+        log_phase(f"Headless mode auto-continues after {candidate.version} {status}.")
+        return "continue"
     message = f"{candidate.version} {status}: {verdict}"
     while True:
         choice = run_kdialog(message)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The autoresearch scripts import each other as top-level modules, the way they run from that directory.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import copy
+import csv
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from run_autoresearch import REPO_ROOT, analyze_move_time_risk, load_state
+
+
+@pytest.fixture
+def state() -> dict[str, Any]:
+    state = copy.deepcopy(load_state())
+    # Fixed-node runs never flag, which would make every assertion below pass trivially.
+    state["evaluator"].setdefault("fixed_nodes", {})["enabled"] = False
+    return state
+
+
+def seed_log(state: dict[str, Any]) -> Path:
+    path = REPO_ROOT / state["latest_approved"]["approved_reference_score_source"]
+    if not path.is_file():
+        pytest.skip(f"approved seed log {path} is not present")
+    return path
+
+
+def test_seed_log_is_not_flagged(state: dict[str, Any]) -> None:
+    risk = analyze_move_time_risk(seed_log(state), state, workers=1)
+
+    assert not risk.flagged, risk.detail
+
+
+def test_candidate_overshooting_the_seed_is_flagged(state: dict[str, Any], tmp_path: Path) -> None:
+    slower = tmp_path / "slower-result.csv"
+    with seed_log(state).open(newline="", encoding="utf-8") as source:
+        rows = list(csv.DictReader(source))
+    for row in rows:
+        for column in ("white_average_move_ms", "black_average_move_ms"):
+            row[column] = str(float(row[column]) * 1.3)
+    with slower.open("w", newline="", encoding="utf-8") as target:
+        writer = csv.DictWriter(target, fieldnames=list(rows[0]), lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    risk = analyze_move_time_risk(slower, state, workers=1)
+
+    assert risk.flagged, risk.detail
@@ -5,9 +5,22 @@ namespace Engine.Core;
 public static class OpeningBook
 {
     private const string LookupFileName = "Openings.lookup.tsv";
+    private const string BinaryLookupFileName = "Openings.lookup.bin";
     private const int StartingPieceCount = 32;
     private static readonly Lazy<string> LookupPath = new(FindLookupPath);
     private static readonly Lazy<Dictionary<string, string[]>> Lookup = new(LoadLookup);
+    private static readonly Lazy<(OpeningBookIndex? Index, string? SkippedReason)> BinaryLookup = new(OpenBinaryLookup);
+
+    // Set per game by seeded evaluations so both engines' book choices replay identically.
+    [ThreadStatic]
+    private static Random? _seededRandom;
+
+    public static IDisposable UseSeed(int seed)
+    {
+        var previous = _seededRandom;
+        _seededRandom = new Random(seed);
+        return new SeedScope(previous);
+    }
 
     public static bool TryGetMove(BoardState board, out SearchResult result)
     {
@@ -22,17 +35,24 @@ public static class OpeningBook
         result = null!;
         var pieceCount = CountPieces(board);
         var key = NormalizeFenKey(board.Fen);
-        var lookup = Lookup.Value;
+        // The memory-mapped binary book is preferred; the TSV is only parsed when it is missing or stale.
+        var (index, binarySkippedReason) = BinaryLookup.Value;
         var diagnostics = new Dictionary<string, object?>
         {
             ["enabled"] = true,
-            ["lookup_file"] = LookupPath.Value,
-            ["lookup_position_count"] = lookup.Count,
+            ["lookup_file"] = index?.Path ?? LookupPath.Value,
+            ["lookup_format"] = index is null ? "tsv" : "binary",
+            ["lookup_position_count"] = index?.PositionCount ?? Lookup.Value.Count,
             ["fen_key"] = key,
             ["position_piece_count"] = pieceCount,
             ["requires_full_starting_piece_count"] = StartingPieceCount,
         };
 
+        if (binarySkippedReason is not null)
+        {
+            diagnostics["binary_lookup_skipped_reason"] = binarySkippedReason;
+        }
+
         if (pieceCount != StartingPieceCount)
         {
             diagnostics["matched_position"] = false;
@@ -43,7 +63,11 @@ public static class OpeningBook
             return false;
         }
 
-        if (!lookup.TryGetValue(key, out var candidateMoves) || candidateMoves.Length == 0)
+        string[]? candidateMoves;
+        var found = index is not null
+            ? index.TryGetMoves(board.TranspositionKey, out candidateMoves)
+            : Lookup.Value.TryGetValue(key, out candidateMoves);
+        if (!found || candidateMoves is null || candidateMoves.Length == 0)
         {
             diagnostics["matched_position"] = false;
             diagnostics["candidate_move_count"] = 0;
@@ -69,7 +93,7 @@ public static class OpeningBook
             return false;
         }
 
-        var selectedUci = legalCandidates[Random.Shared.Next(legalCandidates.Length)];
+        var selectedUci = legalCandidates[(_seededRandom ?? Random.Shared).Next(legalCandidates.Length)];
         var selectedMove = legalByUci[selectedUci];
         diagnostics["selected_move_uci"] = selectedUci;
         result = new SearchResult(
@@ -96,9 +120,8 @@ public static class OpeningBook
         return string.Join(" ", parts.Take(4));
     }
 
-    private static Dictionary<string, string[]> LoadLookup()
+    public static Dictionary<string, string[]> ReadLookupTsv(string path)
     {
-        var path = LookupPath.Value;
         if (!File.Exists(path))
         {
             return new Dictionary<string, string[]>(StringComparer.Ordinal);
@@ -132,6 +155,29 @@ public static class OpeningBook
         return lookup;
     }
 
+    private static Dictionary<string, string[]> LoadLookup()
+    {
+        return ReadLookupTsv(LookupPath.Value);
+    }
+
+    private static (OpeningBookIndex? Index, string? SkippedReason) OpenBinaryLookup()
+    {
+        var tsvPath = LookupPath.Value;
+        var binaryPath = Path.Combine(Path.GetDirectoryName(tsvPath) ?? Directory.GetCurrentDirectory(), BinaryLookupFileName);
+        var index = OpeningBookIndex.TryOpen(binaryPath, out var skippedReason);
+        // The TSV is hashed once per process (about 1.5 MB); a same-length regeneration still counts as stale.
+        if (index is not null
+            && File.Exists(tsvPath)
+            && (new FileInfo(tsvPath).Length != index.SourceLength || OpeningBookIndex.HashSource(tsvPath) != index.SourceHash))
+        {
+            // Openings.lookup.tsv was regenerated without re-running autoresearch/build_opening_book.py.
+            index.Dispose();
+            return (null, "binary_book_stale");
+        }
+
+        return (index, skippedReason);
+    }
+
     private static bool HasAllStartingPieces(BoardState board)
     {
         return CountPieces(board) == StartingPieceCount;
@@ -176,4 +222,12 @@ public static class OpeningBook
 
         return Path.Combine(Directory.GetCurrentDirectory(), LookupFileName);
     }
+
+    private sealed class SeedScope(Random? previous) : IDisposable
+    {
+        public void Dispose()
+        {
+            _seededRandom = previous;
+        }
+    }
 }
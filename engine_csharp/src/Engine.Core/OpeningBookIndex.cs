@@ -0,0 +1,163 @@
+using System.IO.MemoryMappedFiles;
+
+namespace Engine.Core;
+
+// Read-only view over Openings.lookup.bin, written by autoresearch/build_opening_book.py.
+// The file is memory-mapped and binary-searched in place: opening it parses nothing and
+// allocates no per-position objects, so every serving instance and evaluator worker shares
+// the same page-cache copy. See build_opening_book.py for the byte layout.
+public sealed class OpeningBookIndex : IDisposable
+{
+    private const uint Magic = 0x314B424F; // "OBK1" little-endian
+    private const uint FormatVersion = 1;
+    private const int HeaderSize = 32;
+    private const int EntrySize = 16;
+    private static readonly string[] PromotionSuffixes = [string.Empty, "n", "b", "r", "q"];
+
+    private readonly MemoryMappedFile _file;
+    private readonly MemoryMappedViewAccessor _view;
+    private readonly long _movesOffset;
+
+    private OpeningBookIndex(
+        string path,
+        MemoryMappedFile file,
+        MemoryMappedViewAccessor view,
+        int positionCount,
+        long sourceLength,
+        ulong sourceHash)
+    {
+        Path = path;
+        _file = file;
+        _view = view;
+        PositionCount = positionCount;
+        SourceLength = sourceLength;
+        SourceHash = sourceHash;
+        _movesOffset = HeaderSize + (long)positionCount * EntrySize;
+    }
+
+    public string Path { get; }
+
+    public int PositionCount { get; }
+
+    public long SourceLength { get; }
+
+    // FNV-1a over the bytes of the Openings.lookup.tsv the book was built from.
+    public ulong SourceHash { get; }
+
+    public static OpeningBookIndex? TryOpen(string path, out string? skippedReason)
+    {
+        skippedReason = null;
+        if (!File.Exists(path))
+        {
+            skippedReason = "binary_book_missing";
+            return null;
+        }
+
+        var length = new FileInfo(path).Length;
+        if (length < HeaderSize)
+        {
+            skippedReason = "binary_book_truncated";
+            return null;
+        }
+
+        var file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+        var view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+        var positionCount = view.ReadInt32(8);
+        var moveCount = view.ReadInt32(12);
+        if (view.ReadUInt32(0) != Magic
+            || view.ReadUInt32(4) != FormatVersion
+            || positionCount < 0
+            || moveCount < 0
+            || length < HeaderSize + (long)positionCount * EntrySize + (long)moveCount * sizeof(ushort))
+        {
+            view.Dispose();
+            file.Dispose();
+            skippedReason = "binary_book_invalid_header";
+            return null;
+        }
+
+        return new OpeningBookIndex(path, file, view, positionCount, view.ReadInt64(16), view.ReadUInt64(24));
+    }
+
+    // Same FNV-1a as build_opening_book.py writes into the header, streamed over the file's bytes.
+    public static ulong HashSource(string path)
+    {
+        const ulong offsetBasis = 14695981039346656037UL;
+        const ulong prime = 1099511628211UL;
+
+        ulong hash = offsetBasis;
+        var buffer = new byte[1 << 16];
+        using var stream = File.OpenRead(path);
+        int read;
+        while ((read = stream.Read(buffer, 0, buffer.Length)) > 0)
+        {
+            for (var index = 0; index < read; index++)
+            {
+                hash ^= buffer[index];
+                hash *= prime;
+            }
+        }
+
+        return hash;
+    }
+
+    public bool TryGetMoves(ulong positionKey, out string[] uciMoves)
+    {
+        var low = 0;
+        var high = PositionCount - 1;
+        while (low <= high)
+        {
+            var middle = low + ((high - low) >> 1);
+            var entryOffset = HeaderSize + (long)middle * EntrySize;
+            var key = _view.ReadUInt64(entryOffset);
+            if (key < positionKey)
+            {
+                low = middle + 1;
+            }
+            else if (key > positionKey)
+            {
+                high = middle - 1;
+            }
+            else
+            {
+                var firstMove = _view.ReadUInt32(entryOffset + 8);
+                var moveCount = _view.ReadUInt16(entryOffset + 12);
+                uciMoves = new string[moveCount];
+                for (var index = 0; index < moveCount; index++)
+                {
+                    uciMoves[index] = UnpackMove(_view.ReadUInt16(_movesOffset + (firstMove + index) * (long)sizeof(ushort)));
+                }
+
+                return true;
+            }
+        }
+
+        uciMoves = [];
+        return false;
+    }
+
+    public bool TryGetMoves(string normalizedFenKey, out string[] uciMoves)
+    {
+        return TryGetMoves(ZobristHash.Compute(normalizedFenKey), out uciMoves);
+    }
+
+    public void Dispose()
+    {
+        _view.Dispose();
+        _file.Dispose();
+    }
+
+    private static string UnpackMove(ushort packed)
+    {
+        var promotion = (packed >> 12) & 0x7;
+        return string.Concat(
+            SquareName(packed & 0x3F),
+            SquareName((packed >> 6) & 0x3F),
+            promotion < PromotionSuffixes.Length ? PromotionSuffixes[promotion] : string.Empty);
+    }
+
+    private static string SquareName(int square)
+    {
+        return string.Concat((char)('a' + (square & 7)), (char)('1' + (square >> 3)));
+    }
+}
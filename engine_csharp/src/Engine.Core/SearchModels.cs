@@ -22,12 +22,17 @@ public sealed record SearchResult(
 
 public static class EngineVersions
 {
+    // Fixed-node searches still pass a time limit; this cap only stops a runaway search and is never
+    // reached by a sane node budget, so fixed-node results do not depend on machine speed.
+    private const double NodeLimitTimeCapSeconds = 60.0;
+
     public sealed record ResolvedEngineFile(
         string SourcePath,
         string EngineStem,
         string SearchMethodName,
         Func<BoardState, double, SearchResult> SearchMove,
-        Action? ResetState = null);
+        Action? ResetState = null,
+        Func<BoardState, long, SearchResult>? SearchNodes = null);
 
     public static SearchResult SearchMoveForVersion(
         string version,
@@ -109,6 +114,12 @@ public static class EngineVersions
             return (SearchResult)method.Invoke(null, arguments)!;
         }
 
+        SearchResult SearchNodes(BoardState board, long nodeLimit)
+        {
+            var arguments = BuildInvocationArguments(method, board, NodeLimitTimeCapSeconds, searchContext, nodeLimit);
+            return (SearchResult)method.Invoke(null, arguments)!;
+        }
+
         void ResetState()
         {
             searchContext = CreateSearchContext(contextFactory);
@@ -119,7 +130,14 @@ public static class EngineVersions
             engineStem,
             searchMethodName,
             Search,
-            contextFactory is null ? null : ResetState);
+            contextFactory is null ? null : ResetState,
+            method.GetParameters().Any(IsNodeLimitParameter) ? SearchNodes : null);
+    }
+
+    private static bool IsNodeLimitParameter(ParameterInfo parameter)
+    {
+        return parameter.Name == "nodeLimit"
+            && (parameter.ParameterType == typeof(long) || parameter.ParameterType == typeof(long?));
     }
 
     private static bool CanUseAsTimeLimitedSearchMethod(MethodInfo? method)
@@ -173,7 +191,8 @@ public static class EngineVersions
         MethodInfo method,
         BoardState board,
         double timeLimitSeconds,
-        object? searchContext)
+        object? searchContext,
+        long? nodeLimit = null)
     {
         var parameters = method.GetParameters();
         var arguments = new object?[parameters.Length];
@@ -190,6 +209,12 @@ public static class EngineVersions
                 continue;
             }
 
+            if (nodeLimit is not null && IsNodeLimitParameter(parameter))
+            {
+                arguments[index] = nodeLimit.Value;
+                continue;
+            }
+
             if (searchContext is not null && CanAssignSearchContext(parameter, searchContext))
             {
                 arguments[index] = searchContext;
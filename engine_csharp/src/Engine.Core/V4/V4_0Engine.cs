@@ -54,20 +54,26 @@ public static class V4_0Engine
         BoardState board,
         double timeLimitSeconds = 1.0,
         int? maxDepth = null,
-        V4_0SearchContext? searchContext = null)
+        V4_0SearchContext? searchContext = null,
+        long? nodeLimit = null)
     {
         if (timeLimitSeconds <= 0)
         {
             throw new ArgumentOutOfRangeException(nameof(timeLimitSeconds), "timeLimitSeconds must be greater than 0");
         }
 
+        if (nodeLimit <= 0)
+        {
+            throw new ArgumentOutOfRangeException(nameof(nodeLimit), "nodeLimit must be greater than 0");
+        }
+
         if (OpeningBook.TryGetMove(board, out var openingMove, out var openingBookDebug))
         {
             return openingMove with { OpeningBookDebug = openingBookDebug };
         }
 
         var native = NativeBoard.FromFen(board.Fen);
-        var search = new NativeSearch(native, timeLimitSeconds, maxDepth, searchContext);
+        var search = new NativeSearch(native, timeLimitSeconds, maxDepth, searchContext, nodeLimit);
         var result = search.Run();
         var uci = native.MoveToUci(result.BestMove);
         var legalMoves = board.LegalMoves();
@@ -116,6 +122,7 @@ public static class V4_0Engine
     {
         private readonly NativeBoard _board;
         private readonly long _deadlineTimestamp;
+        private readonly long _nodeLimit;
         private readonly int? _maxDepth;
         private readonly TtEntry[] _transpositionTable;
         private readonly ushort[] _primaryKillerMoves;
@@ -129,10 +136,16 @@ public static class V4_0Engine
         private int _ttHits;
         private int _ttCutoffs;
 
-        public NativeSearch(NativeBoard board, double timeLimitSeconds, int? maxDepth, V4_0SearchContext? searchContext)
+        public NativeSearch(
+            NativeBoard board,
+            double timeLimitSeconds,
+            int? maxDepth,
+            V4_0SearchContext? searchContext,
+            long? nodeLimit)
         {
             _board = board;
             _deadlineTimestamp = Stopwatch.GetTimestamp() + (long)(timeLimitSeconds * Stopwatch.Frequency);
+            _nodeLimit = nodeLimit ?? long.MaxValue;
             _maxDepth = maxDepth;
             _transpositionTable = searchContext?.TranspositionTable ?? new TtEntry[TtSize];
             _primaryKillerMoves = searchContext?.PrimaryKillerMoves ?? new ushort[MaxSearchPly];
@@ -656,6 +669,12 @@ public static class V4_0Engine
         private void VisitNode()
         {
             _nodesSearched++;
+            // A node budget ends the search at the same node on every machine, unlike the deadline.
+            if (_nodesSearched >= _nodeLimit)
+            {
+                throw new SearchTimeoutException();
+            }
+
             if ((_nodesSearched & (TimeCheckInterval - 1)) == 0)
             {
                 CheckTime();
@@ -12,6 +12,8 @@ public sealed class ChessMoveHandler
 {
     private const double DefaultTimeLimitSeconds = 1.0;
     private const string ChangelogFileName = "CHANGELOG.json";
+    private const int MaxBatchItems = 64;
+    private const double MinBatchItemTimeLimitSeconds = 0.05;
     private static readonly TimeSpan ContextTtl = TimeSpan.FromMinutes(30);
 
     private static readonly object ContextLock = new();
@@ -33,14 +35,103 @@ public sealed class ChessMoveHandler
             ErrorBody("Invalid JSON body", 400, normalizedVersion, ("exception", exception)));
     }
 
+    public static Dictionary<string, object?> Metrics()
+    {
+        return new Dictionary<string, object?>
+        {
+            ["response_cache"] = ResponseCache.Shared.Snapshot(),
+        };
+    }
+
     public ChessResponse Generate(string version, ChessRequest payload)
     {
+        return GenerateTimed(NormalizeVersion(version), payload, TimeLimitSeconds());
+    }
+
+    public ChessResponse GenerateBatch(string version, ChessBatchRequest payload)
+    {
+        // Batch contract:
+        // - Items are searched in parallel across cores. Items that share a context key run
+        //   sequentially in request order, because a search context is not thread-safe.
+        // - The whole batch shares one server-controlled budget (ENGINE_BATCH_TIME_LIMIT_SECONDS,
+        //   defaulting to the single-move budget). Each item gets budget / waves, where waves is
+        //   the number of rounds the scheduler needs, with a small floor per item.
         var start = Stopwatch.GetTimestamp();
         var normalizedVersion = NormalizeVersion(version);
+        var items = payload.Items ?? [];
+        if (items.Length == 0)
+        {
+            return new ChessResponse(
+                StatusCodes.Status400BadRequest,
+                ErrorBody("At least one batch item is required", 400, normalizedVersion, ("item_count", 0)));
+        }
+
+        if (items.Length > MaxBatchItems)
+        {
+            return new ChessResponse(
+                StatusCodes.Status400BadRequest,
+                ErrorBody(
+                    $"A batch may contain at most {MaxBatchItems} items",
+                    400,
+                    normalizedVersion,
+                    ("item_count", items.Length),
+                    ("max_batch_items", MaxBatchItems)));
+        }
+
+        var groups = items
+            .Select((item, index) => (Item: item ?? new ChessRequest(), Index: index))
+            .GroupBy(entry => entry.Item.ContextId ?? entry.Item.GameId ?? $"#item-{entry.Index}", StringComparer.Ordinal)
+            .Select(group => group.ToArray())
+            .ToArray();
+        var parallelism = Math.Max(1, Math.Min(Environment.ProcessorCount, groups.Length));
+        var waves = Math.Max((items.Length + parallelism - 1) / parallelism, groups.Max(group => group.Length));
+        var budgetSeconds = BatchTimeLimitSeconds();
+        var itemTimeLimitSeconds = Math.Max(MinBatchItemTimeLimitSeconds, budgetSeconds / waves);
+
+        var results = new Dictionary<string, object?>[items.Length];
+        Parallel.ForEach(
+            groups,
+            new ParallelOptions { MaxDegreeOfParallelism = parallelism },
+            group =>
+            {
+                foreach (var (item, index) in group)
+                {
+                    var response = GenerateTimed(normalizedVersion, item, itemTimeLimitSeconds);
+                    response.Body["index"] = index;
+                    response.Body["status"] = response.StatusCode;
+                    results[index] = response.Body;
+                }
+            });
+
+        var processingTime = Stopwatch.GetElapsedTime(start).TotalSeconds;
+        return new ChessResponse(
+            StatusCodes.Status200OK,
+            new Dictionary<string, object?>
+            {
+                ["results"] = results,
+                ["processing_time"] = processingTime,
+                ["debug"] = new Dictionary<string, object?>
+                {
+                    ["version"] = normalizedVersion,
+                    ["item_count"] = items.Length,
+                    ["context_group_count"] = groups.Length,
+                    ["parallelism"] = parallelism,
+                    ["waves"] = waves,
+                    ["time_budget_seconds"] = budgetSeconds,
+                    ["item_time_limit_seconds"] = itemTimeLimitSeconds,
+                    ["error_count"] = results.Count(result => result.ContainsKey("error")),
+                    ["processing_time"] = processingTime,
+                },
+            });
+    }
+
+    private ChessResponse GenerateTimed(string normalizedVersion, ChessRequest payload, double timeLimitSeconds)
+    {
+        var start = Stopwatch.GetTimestamp();
 
         try
         {
-            var body = GenerateEngineResponse(normalizedVersion, payload);
+            var body = GenerateEngineResponse(normalizedVersion, payload, timeLimitSeconds);
             var processingTime = Stopwatch.GetElapsedTime(start).TotalSeconds;
             body["processing_time"] = processingTime;
 
@@ -66,7 +157,10 @@ public sealed class ChessMoveHandler
         }
     }
 
-    private static Dictionary<string, object?> GenerateEngineResponse(string version, ChessRequest payload)
+    private static Dictionary<string, object?> GenerateEngineResponse(
+        string version,
+        ChessRequest payload,
+        double timeLimitSeconds)
     {
         if (string.IsNullOrWhiteSpace(payload.Fen))
         {
@@ -101,14 +195,14 @@ public sealed class ChessMoveHandler
 
         var searchOutcome = version == "v0"
             ? new ServedSearchOutcome(ChooseRandomMove(board, legalMoves), null)
-            : SearchServedEngine(version, board, payload);
+            : SearchServedEngine(version, board, payload, timeLimitSeconds);
 
         if (searchOutcome is null)
         {
             return ErrorBody($"Unsupported version '{version}'", 400, version);
         }
 
-        return SuccessBody(version, searchOutcome.Result, searchOutcome.TtContextDebug);
+        return SuccessBody(version, searchOutcome.Result, searchOutcome.TtContextDebug, searchOutcome.ResponseCacheDebug);
     }
 
     private static SearchResult ChooseRandomMove(BoardState board, IReadOnlyList<Move> legalMoves)
@@ -117,18 +211,44 @@ public sealed class ChessMoveHandler
         return new SearchResult(move, board.GetSan(move), 0, legalMoves.Count);
     }
 
-    private static ServedSearchOutcome? SearchServedEngine(string version, BoardState board, ChessRequest payload)
+    private static ServedSearchOutcome? SearchServedEngine(
+        string version,
+        BoardState board,
+        ChessRequest payload,
+        double timeLimitSeconds)
     {
         if (!ServedEngines.Value.TryGetValue(version, out var engine))
         {
             return null;
         }
 
+        // A reset request must reach its context, so it always searches.
+        if (!ResponseCache.Shared.Enabled || payload.ResetContext)
+        {
+            return SearchWithContext(version, engine, board, payload, timeLimitSeconds);
+        }
+
+        ServedSearchOutcome? searched = null;
+        var (result, cacheStatus) = ResponseCache.Shared.GetOrSearch(
+            ResponseCache.Key(version, timeLimitSeconds, payload.Fen!),
+            () => (searched = SearchWithContext(version, engine, board, payload, timeLimitSeconds)).Result);
+        var cacheDebug = ResponseCache.Shared.Snapshot();
+        cacheDebug["status"] = cacheStatus;
+        return new ServedSearchOutcome(result, searched?.TtContextDebug, cacheDebug);
+    }
+
+    private static ServedSearchOutcome SearchWithContext(
+        string version,
+        ResolvedServedEngine engine,
+        BoardState board,
+        ChessRequest payload,
+        double timeLimitSeconds)
+    {
         var contextResolution = ContextFor(version, payload, engine.ContextFactory);
         var arguments = BuildSearchArguments(
             engine.SearchMethod,
             board,
-            TimeLimitSeconds(),
+            timeLimitSeconds,
             contextResolution.Context);
 
         var result = (SearchResult)engine.SearchMethod.Invoke(null, arguments)!;
@@ -145,7 +265,8 @@ public sealed class ChessMoveHandler
     private static Dictionary<string, object?> SuccessBody(
         string version,
         SearchResult result,
-        Dictionary<string, object?>? ttContextDebug)
+        Dictionary<string, object?>? ttContextDebug,
+        Dictionary<string, object?>? responseCacheDebug)
     {
         var selectedMoveUci = MoveToUci(result.Move);
         var debug = new Dictionary<string, object?>
@@ -166,6 +287,7 @@ public sealed class ChessMoveHandler
         AddIfPresent(debug, "nodes_searched", result.NodesSearched);
         AddIfPresent(debug, "opening_book", result.OpeningBookDebug);
         AddIfPresent(debug, "tt_context", ttContextDebug);
+        AddIfPresent(debug, "response_cache", responseCacheDebug);
 
         return new Dictionary<string, object?>
         {
@@ -236,6 +358,12 @@ public sealed class ChessMoveHandler
         return double.TryParse(raw, out var value) && value > 0 ? value : DefaultTimeLimitSeconds;
     }
 
+    private static double BatchTimeLimitSeconds()
+    {
+        var raw = Environment.GetEnvironmentVariable("ENGINE_BATCH_TIME_LIMIT_SECONDS");
+        return double.TryParse(raw, out var value) && value > 0 ? value : TimeLimitSeconds();
+    }
+
     private static string NormalizeVersion(string version)
     {
         var normalized = version.Trim().ToLowerInvariant().Replace('_', '.');
@@ -507,6 +635,14 @@ public sealed class ChessMoveHandler
 
     private static string FindChangelogPath()
     {
+        // Lets autoresearch/promote_engine.py serve a candidate from a temporary copy
+        // without editing the tracked CHANGELOG.json.
+        var overridePath = Environment.GetEnvironmentVariable("ENGINE_CHANGELOG_PATH");
+        if (!string.IsNullOrWhiteSpace(overridePath))
+        {
+            return overridePath;
+        }
+
         var outputPath = Path.Combine(AppContext.BaseDirectory, ChangelogFileName);
         if (File.Exists(outputPath))
         {
@@ -542,7 +678,8 @@ public sealed class ChessMoveHandler
 
     private sealed record ServedSearchOutcome(
         SearchResult Result,
-        Dictionary<string, object?>? TtContextDebug);
+        Dictionary<string, object?>? TtContextDebug,
+        Dictionary<string, object?>? ResponseCacheDebug = null);
 
     private sealed record Changelog(
         [property: JsonPropertyName("versions")] ChangelogVersion[]? Versions);
@@ -562,3 +699,8 @@ public sealed class ChessRequest
     public string? ContextId { get; init; }
     public bool ResetContext { get; init; }
 }
+
+public sealed class ChessBatchRequest
+{
+    public ChessRequest?[]? Items { get; init; }
+}
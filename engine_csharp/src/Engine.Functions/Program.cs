@@ -40,9 +40,11 @@ app.MapGet("/api/chess/metadata", async () =>
     return Results.Text(json, "application/json");
 });
 
+app.MapGet("/api/chess/metrics", () => Results.Json(ChessMoveHandler.Metrics()));
+
 app.MapPost("/api/chess/{version}", async (string version, HttpContext context, ChessMoveHandler handler) =>
 {
-    var request = await ReadRequest(context);
+    var request = await ReadRequest<ChessRequest>(context);
     if (request.Error is not null)
     {
         return Results.Json(request.Error.Body, statusCode: request.Error.StatusCode);
@@ -52,7 +54,20 @@ app.MapPost("/api/chess/{version}", async (string version, HttpContext context,
     return Results.Json(response.Body, statusCode: response.StatusCode);
 });
 
+app.MapPost("/api/chess/{version}/batch", async (string version, HttpContext context, ChessMoveHandler handler) =>
+{
+    var request = await ReadRequest<ChessBatchRequest>(context);
+    if (request.Error is not null)
+    {
+        return Results.Json(request.Error.Body, statusCode: request.Error.StatusCode);
+    }
+
+    var response = handler.GenerateBatch(version, request.Payload);
+    return Results.Json(response.Body, statusCode: response.StatusCode);
+});
+
 app.MapMethods("/api/chess/{version}", ["OPTIONS"], () => Results.NoContent());
+app.MapMethods("/api/chess/{version}/batch", ["OPTIONS"], () => Results.NoContent());
 
 app.Run();
 
@@ -70,6 +85,12 @@ static string ListenUrl()
 static string FindChangelogPath()
 {
     const string fileName = "CHANGELOG.json";
+    var overridePath = Environment.GetEnvironmentVariable("ENGINE_CHANGELOG_PATH");
+    if (!string.IsNullOrWhiteSpace(overridePath))
+    {
+        return overridePath;
+    }
+
     var outputPath = Path.Combine(AppContext.BaseDirectory, fileName);
     if (File.Exists(outputPath))
     {
@@ -94,33 +115,34 @@ static string FindChangelogPath()
     return Path.Combine(Directory.GetCurrentDirectory(), fileName);
 }
 
-static async Task<ParsedChessRequest> ReadRequest(HttpContext context)
+static async Task<ParsedChessRequest<T>> ReadRequest<T>(HttpContext context)
+    where T : new()
 {
     using var reader = new StreamReader(context.Request.Body);
     var body = await reader.ReadToEndAsync();
     if (string.IsNullOrWhiteSpace(body))
     {
-        return new ParsedChessRequest(new ChessRequest());
+        return new ParsedChessRequest<T>(new T());
     }
 
     try
     {
-        var payload = JsonSerializer.Deserialize<ChessRequest>(
+        var payload = JsonSerializer.Deserialize<T>(
             body,
             new JsonSerializerOptions
             {
                 PropertyNameCaseInsensitive = true,
                 PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
             });
-        return new ParsedChessRequest(payload ?? new ChessRequest());
+        return new ParsedChessRequest<T>(payload ?? new T());
     }
     catch (JsonException exc)
     {
         var version = context.Request.RouteValues["version"]?.ToString() ?? string.Empty;
-        return new ParsedChessRequest(
-            new ChessRequest(),
+        return new ParsedChessRequest<T>(
+            new T(),
             ChessMoveHandler.InvalidJsonResponse(version, exc.Message));
     }
 }
 
-internal sealed record ParsedChessRequest(ChessRequest Payload, ChessResponse? Error = null);
+internal sealed record ParsedChessRequest<T>(T Payload, ChessResponse? Error = null);
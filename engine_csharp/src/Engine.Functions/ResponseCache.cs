@@ -0,0 +1,157 @@
+using Engine.Core;
+
+namespace Engine.Functions;
+
+public sealed class ResponseCache
+{
+    private const double DefaultTtlSeconds = 300.0;
+
+    private readonly object _lock = new();
+    private readonly Dictionary<string, LinkedListNode<CacheEntry>> _entries = new(StringComparer.Ordinal);
+    private readonly LinkedList<CacheEntry> _recency = new();
+    private readonly Dictionary<string, TaskCompletionSource<SearchResult>> _inFlight = new(StringComparer.Ordinal);
+    private long _hits;
+    private long _misses;
+    private long _coalesced;
+    private long _evictions;
+    private long _expirations;
+
+    public ResponseCache(int capacity, TimeSpan ttl)
+    {
+        Capacity = capacity;
+        Ttl = ttl;
+    }
+
+    // Opt-in: ENGINE_RESPONSE_CACHE_ENTRIES > 0 enables the cache with that many entries.
+    public static ResponseCache Shared { get; } = FromEnvironment();
+
+    public int Capacity { get; }
+
+    public TimeSpan Ttl { get; }
+
+    public bool Enabled => Capacity > 0;
+
+    public static string Key(string version, double timeLimitSeconds, string fen)
+    {
+        // The halfmove clock decides 50-move-rule draws, so it stays in the key; only the fullmove number is dropped.
+        var parts = fen.Split(' ', StringSplitOptions.RemoveEmptyEntries);
+        var halfMove = parts.Length > 4 ? parts[4] : "0";
+        return $"{version}|{timeLimitSeconds:R}|{OpeningBook.NormalizeFenKey(fen)}|{halfMove}";
+    }
+
+    public (SearchResult Result, string Status) GetOrSearch(string key, Func<SearchResult> search)
+    {
+        TaskCompletionSource<SearchResult>? leader = null;
+        Task<SearchResult> pending;
+        var now = DateTimeOffset.UtcNow;
+        lock (_lock)
+        {
+            if (_entries.TryGetValue(key, out var node))
+            {
+                if (now - node.Value.StoredAt <= Ttl)
+                {
+                    _recency.Remove(node);
+                    _recency.AddFirst(node);
+                    _hits += 1;
+                    return (node.Value.Result, "hit");
+                }
+
+                _recency.Remove(node);
+                _entries.Remove(key);
+                _expirations += 1;
+            }
+
+            if (_inFlight.TryGetValue(key, out var existing))
+            {
+                _coalesced += 1;
+                pending = existing.Task;
+            }
+            else
+            {
+                leader = new TaskCompletionSource<SearchResult>(TaskCreationOptions.RunContinuationsAsynchronously);
+                _inFlight[key] = leader;
+                _misses += 1;
+                pending = leader.Task;
+            }
+        }
+
+        if (leader is null)
+        {
+            // Identical request already searching: wait for its result instead of searching again.
+            return (pending.GetAwaiter().GetResult(), "coalesced");
+        }
+
+        try
+        {
+            var result = search();
+            lock (_lock)
+            {
+                _inFlight.Remove(key);
+                Store(key, result, DateTimeOffset.UtcNow);
+            }
+
+            leader.SetResult(result);
+            return (result, "miss");
+        }
+        catch (Exception exc)
+        {
+            lock (_lock)
+            {
+                _inFlight.Remove(key);
+            }
+
+            leader.SetException(exc);
+            throw;
+        }
+    }
+
+    public Dictionary<string, object?> Snapshot()
+    {
+        lock (_lock)
+        {
+            return new Dictionary<string, object?>
+            {
+                ["enabled"] = Enabled,
+                ["capacity"] = Capacity,
+                ["ttl_seconds"] = Ttl.TotalSeconds,
+                ["entries"] = _entries.Count,
+                ["in_flight"] = _inFlight.Count,
+                ["hits"] = _hits,
+                ["misses"] = _misses,
+                ["coalesced"] = _coalesced,
+                ["evictions"] = _evictions,
+                ["expirations"] = _expirations,
+            };
+        }
+    }
+
+    private void Store(string key, SearchResult result, DateTimeOffset now)
+    {
+        if (_entries.TryGetValue(key, out var existing))
+        {
+            _recency.Remove(existing);
+            _entries.Remove(key);
+        }
+
+        _entries[key] = _recency.AddFirst(new CacheEntry(key, result, now));
+        while (_entries.Count > Capacity && _recency.Last is { } oldest)
+        {
+            _recency.RemoveLast();
+            _entries.Remove(oldest.Value.Key);
+            _evictions += 1;
+        }
+    }
+
+    private static ResponseCache FromEnvironment()
+    {
+        var capacity = int.TryParse(Environment.GetEnvironmentVariable("ENGINE_RESPONSE_CACHE_ENTRIES"), out var entries) && entries > 0
+            ? entries
+            : 0;
+        var ttlSeconds = double.TryParse(Environment.GetEnvironmentVariable("ENGINE_RESPONSE_CACHE_TTL_SECONDS"), out var seconds) && seconds > 0
+            ? seconds
+            : DefaultTtlSeconds;
+        return new ResponseCache(capacity, TimeSpan.FromSeconds(ttlSeconds));
+    }
+
+    private sealed record CacheEntry(string Key, SearchResult Result, DateTimeOffset StoredAt);
+}
@@ -0,0 +1,121 @@
+using System.Collections.Concurrent;
+using System.Globalization;
+using System.Runtime.InteropServices;
+
+// Pins evaluation worker slots to dedicated CPU sets (Linux only). The orchestrator computes the
+// sets from the machine topology and passes them as --cpu-sets "0,1;2,3;...", one set per worker.
+// A worker pins its own thread before it creates the pair's engines, so a Stockfish child started
+// from that thread inherits the same mask and both sides of a game share only their own cores.
+internal static class CpuAffinity
+{
+    private const int MaskWords = 16; // 1024 CPUs, the glibc cpu_set_t size.
+
+    [ThreadStatic]
+    private static int[]? _pinnedCpus;
+
+    public static bool IsSupported => OperatingSystem.IsLinux();
+
+    // True while the calling thread holds a slot; engines it starts inherit that slot's CPUs.
+    public static bool IsCurrentThreadPinned => _pinnedCpus is not null;
+
+    public static int[][] ParseCpuSets(string value)
+    {
+        var sets = value
+            .Split(';', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+            .Select(set => set
+                .Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries)
+                .Select(cpu => int.Parse(cpu, NumberStyles.Integer, CultureInfo.InvariantCulture))
+                .ToArray())
+            .ToArray();
+        if (sets.Length == 0 || sets.Any(set => set.Length == 0 || set.Any(cpu => cpu < 0 || cpu >= MaskWords * 64)))
+        {
+            throw new ArgumentException($"--cpu-sets must look like \"0,1;2,3\"; received '{value}'.");
+        }
+
+        return sets;
+    }
+
+    public static string Format(int[] cpus)
+    {
+        return string.Join(',', cpus);
+    }
+
+    public sealed class SlotPool
+    {
+        private readonly BlockingCollection<int[]> _free = new(new ConcurrentQueue<int[]>());
+
+        public SlotPool(IEnumerable<int[]> cpuSets)
+        {
+            foreach (var set in cpuSets)
+            {
+                _free.Add(set);
+            }
+        }
+
+        // Takes a free CPU set, pins the calling thread to it and restores the previous mask on
+        // dispose, so thread-pool threads do not stay pinned after the pair finishes.
+        public IDisposable Pin()
+        {
+            var cpus = _free.Take();
+            var previous = GetCurrentThreadMask();
+            SetCurrentThreadMask(ToMask(cpus));
+            _pinnedCpus = cpus;
+            return new Lease(this, cpus, previous);
+        }
+
+        private sealed class Lease(SlotPool pool, int[] cpus, ulong[] previous) : IDisposable
+        {
+            private bool _disposed;
+
+            public void Dispose()
+            {
+                if (_disposed)
+                {
+                    return;
+                }
+
+                _disposed = true;
+                _pinnedCpus = null;
+                SetCurrentThreadMask(previous);
+                pool._free.Add(cpus);
+            }
+        }
+    }
+
+    private static ulong[] ToMask(int[] cpus)
+    {
+        var mask = new ulong[MaskWords];
+        foreach (var cpu in cpus)
+        {
+            mask[cpu / 64] |= 1UL << (cpu % 64);
+        }
+
+        return mask;
+    }
+
+    private static ulong[] GetCurrentThreadMask()
+    {
+        var mask = new ulong[MaskWords];
+        if (sched_getaffinity(0, (nuint)(MaskWords * sizeof(ulong)), mask) != 0)
+        {
+            throw new InvalidOperationException($"sched_getaffinity failed with errno {Marshal.GetLastPInvokeError()}.");
+        }
+
+        return mask;
+    }
+
+    private static void SetCurrentThreadMask(ulong[] mask)
+    {
+        // pid 0 means the calling thread.
+        if (sched_setaffinity(0, (nuint)(MaskWords * sizeof(ulong)), mask) != 0)
+        {
+            throw new InvalidOperationException($"sched_setaffinity failed with errno {Marshal.GetLastPInvokeError()}.");
+        }
+    }
+
+    [DllImport("libc", SetLastError = true)]
+    private static extern int sched_setaffinity(int pid, nuint cpusetsize, ulong[] mask);
+
+    [DllImport("libc", SetLastError = true)]
+    private static extern int sched_getaffinity(int pid, nuint cpusetsize, ulong[] mask);
+}
@@ -0,0 +1,310 @@
+/*
+Purpose:
+This LocalTesting helper measures raw search speed for one compiled engine file so
+that every V*_* engine can be compared on the same footing.
+
+It searches a fixed set of non-book positions twice per repeat:
+1. Fixed depth, with a generous time cap, so node counts are comparable.
+2. Fixed time, so NPS and completed depth reflect the time-limited contract.
+
+Every search starts from a fresh search context (cold transposition table) so repeats
+are independent samples. The per-search records are printed and, with --output,
+written as JSON for `autoresearch/benchmark_engines.py` to store and compare.
+
+Depth-only V1 engines (SearchMoveV1_0 .. SearchMoveV1_4) have no time-limit parameter,
+so only their fixed-depth mode is measured.
+*/
+
+using System.Diagnostics;
+using System.Reflection;
+using System.Text.Json;
+using Chess;
+using Engine.Core;
+
+internal static class EngineBenchmark
+{
+    private const int DefaultDepth = 4;
+    private const double DefaultTimeLimitSeconds = 0.200;
+    private const double FixedDepthTimeCapSeconds = 60.0;
+    private const int DefaultRepeats = 3;
+
+    // Perft-suite and endgame positions with fewer than 32 pieces or outside the opening
+    // lookup, so no engine can short-circuit them through the opening book.
+    internal static readonly string[] BenchmarkFens =
+    [
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        "8/8/4k3/8/2p5/8/B2P2K1/8 w - - 0 1",
+        "6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1",
+    ];
+
+    public static int Run(string[] args)
+    {
+        var options = ParseOptions(args);
+        var engine = ResolveBenchmarkEngine(options.EngineFilePath);
+
+        Console.WriteLine("=== ENGINE BENCHMARK ===");
+        Console.WriteLine($"Engine source: {options.EngineFilePath}");
+        Console.WriteLine($"Engine name: {engine.EngineStem}");
+        Console.WriteLine($"Search method: {engine.SearchMethod.Name}");
+        Console.WriteLine($"Positions: {BenchmarkFens.Length}");
+        Console.WriteLine($"Fixed depth: {options.Depth}");
+        Console.WriteLine($"Fixed time: {options.TimeLimitSeconds * 1000.0:F1}ms{(engine.SupportsTimeLimit ? string.Empty : " (unsupported by this engine)")}");
+        Console.WriteLine($"Repeats: {options.Repeats}");
+
+        var records = new List<BenchmarkRecord>();
+        for (var repeat = 1; repeat <= options.Repeats; repeat++)
+        {
+            for (var positionIndex = 0; positionIndex < BenchmarkFens.Length; positionIndex++)
+            {
+                records.Add(Measure(engine, "depth", positionIndex, repeat, FixedDepthTimeCapSeconds, options.Depth));
+                if (engine.SupportsTimeLimit)
+                {
+                    records.Add(Measure(engine, "time", positionIndex, repeat, options.TimeLimitSeconds, null));
+                }
+            }
+        }
+
+        foreach (var record in records)
+        {
+            Console.WriteLine(
+                $"mode={record.Mode} | position={record.PositionIndex} | repeat={record.Repeat} | nodes={record.Nodes} | nps={record.Nps:F0} | completed_depth={record.CompletedDepth?.ToString() ?? "n/a"} | tt_hit_rate={record.TtHitRate?.ToString("F3") ?? "n/a"} | wall_ms={record.WallMilliseconds:F3}");
+        }
+
+        if (options.OutputPath is not null)
+        {
+            Directory.CreateDirectory(Path.GetDirectoryName(options.OutputPath) ?? Directory.GetCurrentDirectory());
+            var report = new BenchmarkReport(
+                engine.EngineStem,
+                options.Depth,
+                options.TimeLimitSeconds * 1000.0,
+                options.Repeats,
+                engine.SupportsTimeLimit,
+                BenchmarkFens,
+                records);
+            File.WriteAllText(
+                options.OutputPath,
+                JsonSerializer.Serialize(report, new JsonSerializerOptions
+                {
+                    PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+                    WriteIndented = true,
+                }));
+            Console.WriteLine($"Benchmark JSON: {options.OutputPath}");
+        }
+
+        Console.WriteLine("=== ENGINE BENCHMARK DONE ===");
+        return 0;
+    }
+
+    private static BenchmarkRecord Measure(
+        BenchmarkEngine engine,
+        string mode,
+        int positionIndex,
+        int repeat,
+        double timeLimitSeconds,
+        int? maxDepth)
+    {
+        var board = new BoardState(BenchmarkFens[positionIndex]);
+        var arguments = BuildArguments(engine, board, timeLimitSeconds, maxDepth);
+        var stopwatch = Stopwatch.StartNew();
+        var result = (SearchResult)engine.SearchMethod.Invoke(null, arguments)!;
+        stopwatch.Stop();
+
+        var nodes = result.NodesSearched ?? result.MovesEvaluated;
+        var seconds = stopwatch.Elapsed.TotalSeconds;
+        double? ttHitRate = result.TtProbes is > 0 && result.TtHits is not null
+            ? result.TtHits.Value / (double)result.TtProbes.Value
+            : null;
+
+        return new BenchmarkRecord(
+            mode,
+            positionIndex,
+            repeat,
+            nodes,
+            seconds > 0 ? nodes / seconds : 0.0,
+            result.CompletedDepth ?? (mode == "depth" ? maxDepth : null),
+            result.TtProbes,
+            result.TtHits,
+            ttHitRate,
+            stopwatch.Elapsed.TotalMilliseconds);
+    }
+
+    internal static object?[] BuildArguments(BenchmarkEngine engine, BoardState board, double timeLimitSeconds, int? maxDepth)
+    {
+        var parameters = engine.SearchMethod.GetParameters();
+        var arguments = new object?[parameters.Length];
+        arguments[0] = board;
+        var contextAssigned = false;
+        var context = engine.ContextFactory?.Invoke(null, null);
+
+        for (var index = 1; index < parameters.Length; index++)
+        {
+            var parameter = parameters[index];
+            var type = Nullable.GetUnderlyingType(parameter.ParameterType) ?? parameter.ParameterType;
+            if (type == typeof(double))
+            {
+                arguments[index] = timeLimitSeconds;
+            }
+            else if (type == typeof(int) && parameter.Name?.Contains("depth", StringComparison.OrdinalIgnoreCase) == true)
+            {
+                arguments[index] = maxDepth ?? parameter.DefaultValue;
+            }
+            else if (!contextAssigned && context is not null && parameter.ParameterType.IsInstanceOfType(context))
+            {
+                arguments[index] = context;
+                contextAssigned = true;
+            }
+            else
+            {
+                arguments[index] = parameter.DefaultValue;
+            }
+        }
+
+        return arguments;
+    }
+
+    internal static BenchmarkEngine ResolveBenchmarkEngine(string engineFilePath)
+    {
+        if (!File.Exists(engineFilePath))
+        {
+            throw new FileNotFoundException($"Engine file not found: {engineFilePath}", engineFilePath);
+        }
+
+        var engineStem = Path.GetFileNameWithoutExtension(engineFilePath);
+        if (!engineStem.EndsWith("Engine", StringComparison.Ordinal))
+        {
+            throw new ArgumentException($"Engine file name must end with 'Engine.cs': {engineFilePath}");
+        }
+
+        var versionStem = engineStem[..^"Engine".Length];
+        var searchMethodName = $"SearchMove{versionStem}";
+        var searchMethod = typeof(EngineVersions).Assembly
+            .GetTypes()
+            .Select(type => type.GetMethod(searchMethodName, BindingFlags.Public | BindingFlags.Static))
+            .FirstOrDefault(method => method is not null
+                && method.ReturnType == typeof(SearchResult)
+                && method.GetParameters().Length > 0
+                && method.GetParameters()[0].ParameterType == typeof(BoardState))
+            ?? throw new ArgumentException(
+                $"No compiled search method named '{searchMethodName}' was found for engine file '{engineFilePath}'.");
+
+        var supportsTimeLimit = searchMethod.GetParameters()
+            .Skip(1)
+            .Any(parameter => (Nullable.GetUnderlyingType(parameter.ParameterType) ?? parameter.ParameterType) == typeof(double));
+        var contextFactory = searchMethod.DeclaringType?.GetMethod(
+            $"CreateSearchContext{versionStem}",
+            BindingFlags.Public | BindingFlags.Static);
+        if (contextFactory is not null && contextFactory.GetParameters().Length != 0)
+        {
+            contextFactory = null;
+        }
+
+        return new BenchmarkEngine(engineStem, searchMethod, contextFactory, supportsTimeLimit);
+    }
+
+    private static EngineBenchmarkOptions ParseOptions(string[] args)
+    {
+        string? engineFilePath = null;
+        string? outputPath = null;
+        var depth = DefaultDepth;
+        var timeLimitSeconds = DefaultTimeLimitSeconds;
+        var repeats = DefaultRepeats;
+
+        for (var index = 0; index < args.Length; index++)
+        {
+            switch (args[index])
+            {
+                case "--engine-file":
+                    engineFilePath = args[++index];
+                    break;
+                case "--depth":
+                    depth = int.Parse(args[++index]);
+                    break;
+                case "--time-limit-ms":
+                    timeLimitSeconds = double.Parse(args[++index]) / 1000.0;
+                    break;
+                case "--repeats":
+                    repeats = int.Parse(args[++index]);
+                    break;
+                case "--output":
+                    outputPath = args[++index];
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown argument '{args[index]}'");
+            }
+        }
+
+        if (string.IsNullOrWhiteSpace(engineFilePath))
+        {
+            throw new ArgumentException("--engine-file is required.");
+        }
+
+        if (depth < 1)
+        {
+            throw new ArgumentException("--depth must be at least 1.");
+        }
+
+        if (timeLimitSeconds <= 0)
+        {
+            throw new ArgumentException("--time-limit-ms must be greater than 0.");
+        }
+
+        if (repeats < 1)
+        {
+            throw new ArgumentException("--repeats must be at least 1.");
+        }
+
+        return new EngineBenchmarkOptions(
+            ResolveCliPath(engineFilePath),
+            depth,
+            timeLimitSeconds,
+            repeats,
+            outputPath is null ? null : ResolveCliPath(outputPath));
+    }
+
+    private static string ResolveCliPath(string path)
+    {
+        return Path.IsPathRooted(path)
+            ? Path.GetFullPath(path)
+            : Path.GetFullPath(Path.Combine(Directory.GetCurrentDirectory(), path));
+    }
+
+    private sealed record EngineBenchmarkOptions(
+        string EngineFilePath,
+        int Depth,
+        double TimeLimitSeconds,
+        int Repeats,
+        string? OutputPath);
+
+    internal sealed record BenchmarkEngine(
+        string EngineStem,
+        MethodInfo SearchMethod,
+        MethodInfo? ContextFactory,
+        bool SupportsTimeLimit);
+
+    private sealed record BenchmarkRecord(
+        string Mode,
+        int PositionIndex,
+        int Repeat,
+        int Nodes,
+        double Nps,
+        int? CompletedDepth,
+        int? TtProbes,
+        int? TtHits,
+        double? TtHitRate,
+        double WallMilliseconds);
+
+    private sealed record BenchmarkReport(
+        string EngineStem,
+        int Depth,
+        double TimeLimitMs,
+        int Repeats,
+        bool SupportsTimeLimit,
+        IReadOnlyList<string> Positions,
+        IReadOnlyList<BenchmarkRecord> Records);
+}
+
+// dotnet run --project engine_csharp/src/LocalTesting -- benchmark --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --depth 4 --time-limit-ms 200 --repeats 3 --output autoresearch/benchmarks/tmp.json
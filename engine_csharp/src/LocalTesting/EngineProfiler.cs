@@ -0,0 +1,383 @@
+/*
+Purpose:
+This LocalTesting helper profiles one compiled engine file with in-process EventPipe CPU sampling,
+so the autoresearch loop can tell Codex where search time actually goes instead of only how fast
+the engine is overall. No external profiler or service is needed.
+
+It warms the engine up on the EngineBenchmark position set, then searches the same positions at a
+fixed time limit while a Microsoft-DotNETCore-SampleProfiler session records every managed thread's
+stack about once per millisecond. The trace is resolved with TraceEvent and aggregated by method:
+- exclusive samples: the method was the innermost frame;
+- inclusive samples: the method appeared anywhere on the stack (counted once per sample).
+
+Only samples with an Engine.Core frame on the stack count, which drops idle, runtime and tracing
+threads. Engine methods are also rolled up by name into tt_probe, ordering, evaluation,
+move_generation and search (everything else in the engine). A sample whose innermost frame is
+outside the engine (List<T>.Add, for example) is charged exclusively to the category of the
+innermost engine frame that called it.
+
+With --output the report is written as JSON for `autoresearch/run_autoresearch.py --profile`.
+*/
+
+using System.Diagnostics.Tracing;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+using Chess;
+using Engine.Core;
+using Microsoft.Diagnostics.NETCore.Client;
+using Microsoft.Diagnostics.Tracing.Etlx;
+using Microsoft.Diagnostics.Tracing.Parsers;
+
+internal static class EngineProfiler
+{
+    private const double DefaultTimeLimitSeconds = 0.200;
+    private const int DefaultRepeats = 2;
+    private const int DefaultTopMethods = 25;
+    private const string SampleProfilerProvider = "Microsoft-DotNETCore-SampleProfiler";
+    private const string RuntimeProvider = "Microsoft-Windows-DotNETRuntime";
+    private const string EngineModule = "Engine.Core";
+    private const string SearchCategory = "search";
+    private const string RuntimeCategory = "runtime";
+
+    // Checked in order and the first match wins, so ScoreToTt counts as TT work, not ordering.
+    private static readonly (string Category, Regex Pattern)[] Categories =
+    [
+        ("tt_probe", new Regex("Probe|Store|Tt|Transposition", RegexOptions.Compiled)),
+        ("ordering", new Regex("Order|ScoreMove|History|Killer|RewardQuiet", RegexOptions.Compiled)),
+        ("evaluation", new Regex("Eval|Mobility|Passed|Positional|Outpost|Endgame|MopUp|KingSafety", RegexOptions.Compiled)),
+        ("move_generation", new Regex("Generate|MakeMove|UnmakeMove|Attack|InCheck|LegalMove|Push|Pop|Castl", RegexOptions.Compiled)),
+    ];
+
+    public static int Run(string[] args)
+    {
+        var options = ParseOptions(args);
+        var engine = EngineBenchmark.ResolveBenchmarkEngine(options.EngineFilePath);
+        var positions = EngineBenchmark.BenchmarkFens;
+
+        Console.WriteLine("=== ENGINE PROFILE ===");
+        Console.WriteLine($"Engine source: {options.EngineFilePath}");
+        Console.WriteLine($"Engine name: {engine.EngineStem}");
+        Console.WriteLine($"Search method: {engine.SearchMethod.Name}");
+        Console.WriteLine($"Positions: {positions.Length}");
+        Console.WriteLine($"Time limit: {options.TimeLimitSeconds * 1000.0:F1}ms{(engine.SupportsTimeLimit ? string.Empty : " (unsupported by this engine; default depth)")}");
+        Console.WriteLine($"Repeats: {options.Repeats}");
+
+        // Warm-up pass so tier-0 JIT code and one-time initialisation do not dominate the samples.
+        SearchAll(engine, positions, options.TimeLimitSeconds);
+
+        var tracePath = Path.Combine(Path.GetTempPath(), $"engine-profile-{Environment.ProcessId}.nettrace");
+        string? etlxPath = null;
+        try
+        {
+            long nodes = 0;
+            var providers = new[]
+            {
+                new EventPipeProvider(SampleProfilerProvider, EventLevel.Informational),
+                // JIT and loader events, plus the rundown at stop, let TraceEvent name sampled methods.
+                new EventPipeProvider(RuntimeProvider, EventLevel.Informational, (long)ClrTraceEventParser.Keywords.Default),
+            };
+            var client = new DiagnosticsClient(Environment.ProcessId);
+            using (var session = client.StartEventPipeSession(providers, requestRundown: true))
+            {
+                var copy = Task.Run(() =>
+                {
+                    using var file = File.Create(tracePath);
+                    session.EventStream.CopyTo(file);
+                });
+                for (var repeat = 1; repeat <= options.Repeats; repeat++)
+                {
+                    nodes += SearchAll(engine, positions, options.TimeLimitSeconds);
+                }
+
+                session.Stop();
+                copy.Wait();
+            }
+
+            etlxPath = TraceLog.CreateFromEventPipeDataFile(tracePath);
+            var report = Aggregate(engine, options, positions, nodes, etlxPath);
+
+            Console.WriteLine($"Engine samples: {report.Samples}");
+            foreach (var category in report.Categories)
+            {
+                Console.WriteLine(
+                    $"category={category.Category} | exclusive={category.ExclusivePercent:F1}% | inclusive={category.InclusivePercent:F1}%");
+            }
+
+            foreach (var method in report.Methods)
+            {
+                Console.WriteLine(
+                    $"method={method.Method} | category={method.Category} | exclusive={method.ExclusivePercent:F1}% | inclusive={method.InclusivePercent:F1}%");
+            }
+
+            if (options.OutputPath is not null)
+            {
+                Directory.CreateDirectory(Path.GetDirectoryName(options.OutputPath) ?? Directory.GetCurrentDirectory());
+                File.WriteAllText(
+                    options.OutputPath,
+                    JsonSerializer.Serialize(report, new JsonSerializerOptions
+                    {
+                        PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+                        WriteIndented = true,
+                    }));
+                Console.WriteLine($"Profile JSON: {options.OutputPath}");
+            }
+        }
+        finally
+        {
+            File.Delete(tracePath);
+            if (etlxPath is not null)
+            {
+                File.Delete(etlxPath);
+            }
+        }
+
+        Console.WriteLine("=== ENGINE PROFILE DONE ===");
+        return 0;
+    }
+
+    private static long SearchAll(EngineBenchmark.BenchmarkEngine engine, string[] positions, double timeLimitSeconds)
+    {
+        long nodes = 0;
+        foreach (var fen in positions)
+        {
+            var arguments = EngineBenchmark.BuildArguments(engine, new BoardState(fen), timeLimitSeconds, null);
+            var result = (SearchResult)engine.SearchMethod.Invoke(null, arguments)!;
+            nodes += result.NodesSearched ?? result.MovesEvaluated;
+        }
+
+        return nodes;
+    }
+
+    private static ProfileReport Aggregate(
+        EngineBenchmark.BenchmarkEngine engine,
+        EngineProfileOptions options,
+        string[] positions,
+        long nodes,
+        string etlxPath)
+    {
+        var exclusive = new Dictionary<(string Module, string Method), int>();
+        var inclusive = new Dictionary<(string Module, string Method), int>();
+        var categoryExclusive = new Dictionary<string, int>();
+        var categoryInclusive = new Dictionary<string, int>();
+        var samples = 0;
+
+        using var traceLog = new TraceLog(etlxPath);
+        foreach (var traceEvent in traceLog.Events)
+        {
+            if (traceEvent.ProviderName != SampleProfilerProvider)
+            {
+                continue;
+            }
+
+            // Frames from the innermost outwards.
+            var frames = new List<(string Module, string Method)>();
+            for (var stack = traceEvent.CallStack(); stack is not null; stack = stack.Caller)
+            {
+                frames.Add((stack.CodeAddress.ModuleName, ShortMethodName(stack.CodeAddress.FullMethodName)));
+            }
+
+            var innermostEngineFrame = frames.FindIndex(frame => frame.Module == EngineModule);
+            if (innermostEngineFrame < 0)
+            {
+                continue;
+            }
+
+            samples++;
+            Increment(exclusive, frames[0]);
+            Increment(categoryExclusive, Classify(frames[innermostEngineFrame]));
+            foreach (var frame in frames.Distinct())
+            {
+                Increment(inclusive, frame);
+            }
+
+            foreach (var category in frames.Where(frame => frame.Module == EngineModule).Select(Classify).Distinct())
+            {
+                Increment(categoryInclusive, category);
+            }
+        }
+
+        double Percent(int count) => samples > 0 ? 100.0 * count / samples : 0.0;
+
+        var categories = Categories.Select(item => item.Category)
+            .Append(SearchCategory)
+            .Select(category => new CategoryProfile(
+                category,
+                categoryExclusive.GetValueOrDefault(category),
+                categoryInclusive.GetValueOrDefault(category),
+                Percent(categoryExclusive.GetValueOrDefault(category)),
+                Percent(categoryInclusive.GetValueOrDefault(category))))
+            .ToList();
+
+        // The union of the top methods by exclusive and by inclusive time, so both the leaves that
+        // burn cycles and the callers that own them are reported.
+        var topExclusive = exclusive.OrderByDescending(item => item.Value).Take(options.TopMethods).Select(item => item.Key);
+        var topInclusive = inclusive.OrderByDescending(item => item.Value).Take(options.TopMethods).Select(item => item.Key);
+        var methods = topExclusive.Union(topInclusive)
+            .Select(key => new MethodProfile(
+                key.Method,
+                key.Module,
+                key.Module == EngineModule ? Classify(key) : RuntimeCategory,
+                exclusive.GetValueOrDefault(key),
+                inclusive.GetValueOrDefault(key),
+                Percent(exclusive.GetValueOrDefault(key)),
+                Percent(inclusive.GetValueOrDefault(key))))
+            .OrderByDescending(method => method.ExclusiveSamples)
+            .ThenByDescending(method => method.InclusiveSamples)
+            .ToList();
+
+        return new ProfileReport(
+            engine.EngineStem,
+            options.TimeLimitSeconds * 1000.0,
+            options.Repeats,
+            positions.Length * options.Repeats,
+            samples,
+            nodes,
+            positions,
+            categories,
+            methods);
+    }
+
+    private static void Increment<TKey>(Dictionary<TKey, int> counts, TKey key)
+        where TKey : notnull
+    {
+        counts[key] = counts.GetValueOrDefault(key) + 1;
+    }
+
+    private static string Classify((string Module, string Method) frame)
+    {
+        var methodName = frame.Method[(frame.Method.LastIndexOf('.') + 1)..];
+        foreach (var (category, pattern) in Categories)
+        {
+            if (pattern.IsMatch(methodName))
+            {
+                return category;
+            }
+        }
+
+        return SearchCategory;
+    }
+
+    // "Engine.Core.V4_0Engine+NativeBoard.Evaluate(...)" -> "NativeBoard.Evaluate".
+    private static string ShortMethodName(string fullMethodName)
+    {
+        if (string.IsNullOrEmpty(fullMethodName))
+        {
+            return "?";
+        }
+
+        var parenthesis = fullMethodName.IndexOf('(');
+        var name = parenthesis >= 0 ? fullMethodName[..parenthesis] : fullMethodName;
+        var methodStart = name.LastIndexOf('.');
+        if (methodStart <= 0)
+        {
+            return name;
+        }
+
+        var type = name[..methodStart];
+        type = type[(Math.Max(type.LastIndexOf('.'), type.LastIndexOf('+')) + 1)..];
+        return $"{type}.{name[(methodStart + 1)..]}";
+    }
+
+    private static EngineProfileOptions ParseOptions(string[] args)
+    {
+        string? engineFilePath = null;
+        string? outputPath = null;
+        var timeLimitSeconds = DefaultTimeLimitSeconds;
+        var repeats = DefaultRepeats;
+        var topMethods = DefaultTopMethods;
+
+        for (var index = 0; index < args.Length; index++)
+        {
+            switch (args[index])
+            {
+                case "--engine-file":
+                    engineFilePath = args[++index];
+                    break;
+                case "--time-limit-ms":
+                    timeLimitSeconds = double.Parse(args[++index]) / 1000.0;
+                    break;
+                case "--repeats":
+                    repeats = int.Parse(args[++index]);
+                    break;
+                case "--top":
+                    topMethods = int.Parse(args[++index]);
+                    break;
+                case "--output":
+                    outputPath = args[++index];
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown argument '{args[index]}'");
+            }
+        }
+
+        if (string.IsNullOrWhiteSpace(engineFilePath))
+        {
+            throw new ArgumentException("--engine-file is required.");
+        }
+
+        if (timeLimitSeconds <= 0)
+        {
+            throw new ArgumentException("--time-limit-ms must be greater than 0.");
+        }
+
+        if (repeats < 1)
+        {
+            throw new ArgumentException("--repeats must be at least 1.");
+        }
+
+        if (topMethods < 1)
+        {
+            throw new ArgumentException("--top must be at least 1.");
+        }
+
+        return new EngineProfileOptions(
+            ResolveCliPath(engineFilePath),
+            timeLimitSeconds,
+            repeats,
+            topMethods,
+            outputPath is null ? null : ResolveCliPath(outputPath));
+    }
+
+    private static string ResolveCliPath(string path)
+    {
+        return Path.IsPathRooted(path)
+            ? Path.GetFullPath(path)
+            : Path.GetFullPath(Path.Combine(Directory.GetCurrentDirectory(), path));
+    }
+
+    private sealed record EngineProfileOptions(
+        string EngineFilePath,
+        double TimeLimitSeconds,
+        int Repeats,
+        int TopMethods,
+        string? OutputPath);
+
+    private sealed record CategoryProfile(
+        string Category,
+        int ExclusiveSamples,
+        int InclusiveSamples,
+        double ExclusivePercent,
+        double InclusivePercent);
+
+    private sealed record MethodProfile(
+        string Method,
+        string Module,
+        string Category,
+        int ExclusiveSamples,
+        int InclusiveSamples,
+        double ExclusivePercent,
+        double InclusivePercent);
+
+    private sealed record ProfileReport(
+        string EngineStem,
+        double TimeLimitMs,
+        int Repeats,
+        int Searches,
+        int Samples,
+        long Nodes,
+        IReadOnlyList<string> Positions,
+        IReadOnlyList<CategoryProfile> Categories,
+        IReadOnlyList<MethodProfile> Methods);
+}
+
+// dotnet run --project engine_csharp/src/LocalTesting -- profile --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --time-limit-ms 200 --repeats 2 --output autoresearch/logs/tmp-profile.json
@@ -0,0 +1,128 @@
+using System.Globalization;
+using System.Text;
+using System.Text.Json;
+
+// Writes the compact ".evb" companion of an evaluation CSV (autoresearch/evaluation_records.py reads
+// it): MAGIC, a u32 header length, a UTF-8 JSON header padded with spaces to 8 bytes, then one
+// fixed-width little-endian record per row in CSV column order. Text columns are indices into the
+// header's interned string table. Field types must match CSV_COLUMN_TYPES on the Python side.
+internal static class EvaluationRecordFile
+{
+    private static readonly byte[] Magic = "EVALREC1"u8.ToArray();
+    private const int RecordAlignment = 8;
+
+    private static readonly Dictionary<string, string> ColumnTypes = new(StringComparer.Ordinal)
+    {
+        ["game_number"] = "i4",
+        ["pair_number"] = "i4",
+        ["opening_index"] = "i4",
+        ["engine_a_was_white"] = "bool",
+        ["plies"] = "i4",
+        ["engine_a_score"] = "f8",
+        ["white_moves"] = "i4",
+        ["black_moves"] = "i4",
+        ["white_total_positions"] = "i4",
+        ["black_total_positions"] = "i4",
+        ["white_average_positions"] = "f8",
+        ["black_average_positions"] = "f8",
+        ["white_average_move_ms"] = "f8",
+        ["black_average_move_ms"] = "f8",
+        ["game_elapsed_ms"] = "f8",
+        ["white_move_ms_p50"] = "f8",
+        ["white_move_ms_p95"] = "f8",
+        ["white_move_ms_p99"] = "f8",
+        ["white_move_ms_max"] = "f8",
+        ["black_move_ms_p50"] = "f8",
+        ["black_move_ms_p95"] = "f8",
+        ["black_move_ms_p99"] = "f8",
+        ["black_move_ms_max"] = "f8",
+        ["game_started_unix_ms"] = "i8",
+        ["game_finished_unix_ms"] = "i8",
+    };
+
+    public static string CompanionPath(string csvPath)
+    {
+        return Path.ChangeExtension(csvPath, ".evb");
+    }
+
+    // Rows are the CSV fields exactly as written, so numbers parse back to the values that produced them.
+    public static void Write(string path, IReadOnlyList<string> columns, IEnumerable<IReadOnlyList<string>> rows)
+    {
+        var types = columns.Select(column => ColumnTypes.GetValueOrDefault(column, "str")).ToArray();
+        var strings = new Dictionary<string, int>(StringComparer.Ordinal);
+        using var records = new MemoryStream();
+        using (var writer = new BinaryWriter(records, Encoding.UTF8, leaveOpen: true))
+        {
+            foreach (var row in rows)
+            {
+                for (var index = 0; index < types.Length; index++)
+                {
+                    WriteField(writer, types[index], index < row.Count ? row[index] : string.Empty, strings);
+                }
+            }
+        }
+
+        var recordSize = types.Sum(FieldSize);
+        var header = JsonSerializer.SerializeToUtf8Bytes(new
+        {
+            fields = columns.Zip(types, (column, type) => new[] { column, type }),
+            record_size = recordSize,
+            count = recordSize == 0 ? 0 : records.Length / recordSize,
+            strings = strings.OrderBy(entry => entry.Value).Select(entry => entry.Key),
+        });
+        var headerEnd = Magic.Length + sizeof(uint) + header.Length;
+        var padding = (RecordAlignment - headerEnd % RecordAlignment) % RecordAlignment;
+
+        var temporaryPath = path + ".tmp";
+        using (var stream = new FileStream(temporaryPath, FileMode.Create, FileAccess.Write))
+        using (var writer = new BinaryWriter(stream))
+        {
+            writer.Write(Magic);
+            writer.Write((uint)(header.Length + padding));
+            writer.Write(header);
+            writer.Write(Enumerable.Repeat((byte)' ', padding).ToArray());
+            records.Position = 0;
+            records.CopyTo(stream);
+        }
+
+        File.Move(temporaryPath, path, overwrite: true);
+    }
+
+    private static void WriteField(BinaryWriter writer, string type, string text, Dictionary<string, int> strings)
+    {
+        switch (type)
+        {
+            case "i4":
+                writer.Write(int.Parse(text, NumberStyles.Integer, CultureInfo.InvariantCulture));
+                break;
+            case "i8":
+                writer.Write(long.Parse(text, NumberStyles.Integer, CultureInfo.InvariantCulture));
+                break;
+            case "f8":
+                writer.Write(double.Parse(text, NumberStyles.Float, CultureInfo.InvariantCulture));
+                break;
+            case "bool":
+                writer.Write((byte)(text == "true" ? 1 : 0));
+                break;
+            default:
+                if (!strings.TryGetValue(text, out var stringIndex))
+                {
+                    stringIndex = strings.Count;
+                    strings.Add(text, stringIndex);
+                }
+
+                writer.Write((uint)stringIndex);
+                break;
+        }
+    }
+
+    private static int FieldSize(string type)
+    {
+        return type switch
+        {
+            "i8" or "f8" => 8,
+            "bool" => 1,
+            _ => 4,
+        };
+    }
+}
@@ -0,0 +1,543 @@
+/*
+Purpose:
+This LocalTesting mode keeps one process alive for the whole autoresearch loop, so short evaluations
+stop paying .NET startup, JIT and Stockfish spawns on every call. `autoresearch/evaluator_host.py`
+starts `LocalTesting host` and speaks line-delimited JSON-RPC 2.0 over stdin/stdout, one request at
+a time:
+
+- run {"build_dir", "args"}: runs a LocalTesting command (the same args as the CLI, for example
+  ["evaluate-stock", "--engine-file", ...]) from the LocalTesting.dll under build_dir. Console output
+  comes back as "output" notifications and every finished evaluation game as a "game" notification
+  carrying its CSV fields, then the response gives the exit code.
+- unload {"build_dir"}: drops that build's load context.
+- status: lists the loaded contexts.
+- shutdown: unloads everything and exits.
+
+Each build is loaded into its own collectible AssemblyLoadContext, with LocalTesting, Engine.Core
+(which contains the candidate) and their packages resolved from the build's deps.json and only the
+framework shared with the host. Nothing but strings and delegates crosses the context boundary, so
+a candidate compiled from another tree works as long as it has EvaluatorHostEntryPoint. Contexts are
+reused until their assemblies change on disk, and the least recently used one is unloaded once more
+than --max-contexts are loaded. Stockfish processes live as long as their context.
+*/
+
+using System.Diagnostics;
+using System.Reflection;
+using System.Runtime.CompilerServices;
+using System.Runtime.Loader;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Nodes;
+
+internal static class EvaluatorHost
+{
+    private const int DefaultMaxContexts = 4;
+    private const int ParseError = -32700;
+    private const int MethodNotFound = -32601;
+    private const int InvalidParams = -32602;
+    private const int LoadFailed = -32000;
+
+    public static int Run(string[] args)
+    {
+        var maxContexts = DefaultMaxContexts;
+        for (var index = 0; index < args.Length; index++)
+        {
+            switch (args[index])
+            {
+                case "--max-contexts":
+                    maxContexts = int.Parse(args[++index]);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown argument '{args[index]}'");
+            }
+        }
+
+        if (maxContexts < 1)
+        {
+            throw new ArgumentException("--max-contexts must be at least 1.");
+        }
+
+        // Commands write to Console; only protocol messages may reach the real stdout.
+        var channel = new HostChannel(new StreamWriter(Console.OpenStandardOutput(), new UTF8Encoding(false)));
+        var contexts = new List<HostedBuild>();
+        var originalOut = Console.Out;
+        var originalError = Console.Error;
+        using var input = new StreamReader(Console.OpenStandardInput(), Encoding.UTF8);
+        channel.Notify("ready", new JsonObject { ["pid"] = Environment.ProcessId });
+
+        try
+        {
+            string? line;
+            while ((line = input.ReadLine()) is not null)
+            {
+                if (string.IsNullOrWhiteSpace(line))
+                {
+                    continue;
+                }
+
+                JsonNode? id = null;
+                try
+                {
+                    var request = JsonNode.Parse(line)?.AsObject()
+                        ?? throw new HostRequestException(ParseError, "Request must be a JSON object.");
+                    id = request["id"]?.DeepClone();
+                    var method = request["method"]?.GetValue<string>()
+                        ?? throw new HostRequestException(InvalidParams, "Request has no method.");
+                    var parameters = request["params"] as JsonObject ?? new JsonObject();
+                    switch (method)
+                    {
+                        case "run":
+                            Console.SetOut(new HostOutputWriter(channel, id, "stdout"));
+                            Console.SetError(new HostOutputWriter(channel, id, "stderr"));
+                            try
+                            {
+                                channel.Respond(id, RunCommand(contexts, maxContexts, parameters, channel, id));
+                            }
+                            finally
+                            {
+                                Console.Out.Flush();
+                                Console.Error.Flush();
+                                Console.SetOut(originalOut);
+                                Console.SetError(originalError);
+                            }
+
+                            break;
+                        case "unload":
+                            var buildDir = RequiredString(parameters, "build_dir");
+                            var hosted = contexts.FirstOrDefault(item => item.Matches(buildDir));
+                            if (hosted is not null)
+                            {
+                                contexts.Remove(hosted);
+                            }
+
+                            channel.Respond(id, new JsonObject { ["unloaded"] = hosted is not null && Unload(hosted) });
+                            break;
+                        case "status":
+                            var loaded = new JsonArray();
+                            foreach (var item in contexts)
+                            {
+                                loaded.Add(item.BuildDir);
+                            }
+
+                            channel.Respond(id, new JsonObject
+                            {
+                                ["pid"] = Environment.ProcessId,
+                                ["contexts"] = loaded,
+                                ["managed_bytes"] = GC.GetTotalMemory(forceFullCollection: false),
+                            });
+                            break;
+                        case "shutdown":
+                            channel.Respond(id, new JsonObject { ["unloaded"] = contexts.Count });
+                            return 0;
+                        default:
+                            throw new HostRequestException(MethodNotFound, $"Unknown method '{method}'.");
+                    }
+                }
+                catch (HostRequestException exception)
+                {
+                    channel.Fail(id, exception.Code, exception.Message);
+                }
+                catch (JsonException exception)
+                {
+                    channel.Fail(id, ParseError, exception.Message);
+                }
+                catch (Exception exception) when (exception is InvalidOperationException or FormatException)
+                {
+                    // A field of the wrong JSON type.
+                    channel.Fail(id, InvalidParams, exception.Message);
+                }
+            }
+
+            return 0;
+        }
+        finally
+        {
+            foreach (var hosted in contexts)
+            {
+                Unload(hosted);
+            }
+        }
+    }
+
+    private static JsonObject RunCommand(
+        List<HostedBuild> contexts,
+        int maxContexts,
+        JsonObject parameters,
+        HostChannel channel,
+        JsonNode? id)
+    {
+        var buildDir = RequiredString(parameters, "build_dir");
+        var args = (parameters["args"] as JsonArray)?.Select(item => item?.GetValue<string>() ?? string.Empty).ToArray()
+            ?? throw new HostRequestException(InvalidParams, "run needs an args array.");
+
+        var hosted = contexts.FirstOrDefault(item => item.Matches(buildDir));
+        var reused = hosted is not null && hosted.IsCurrent();
+        if (hosted is not null && !reused)
+        {
+            // Rebuilt since it was loaded (the shared tree after an approval, for example).
+            contexts.Remove(hosted);
+            Unload(hosted);
+        }
+
+        if (!reused)
+        {
+            hosted = Load(buildDir);
+            while (contexts.Count >= maxContexts)
+            {
+                Unload(contexts[0]);
+                contexts.RemoveAt(0);
+            }
+        }
+        else
+        {
+            contexts.Remove(hosted!);
+        }
+
+        contexts.Add(hosted!);
+        var stopwatch = Stopwatch.StartNew();
+        Action<string> gameSink = row => channel.Notify("game", new JsonObject
+        {
+            ["id"] = id?.DeepClone(),
+            ["row"] = JsonNode.Parse(row),
+        });
+        int exitCode;
+        try
+        {
+            exitCode = hosted!.Execute(args, gameSink);
+        }
+        catch (Exception exception)
+        {
+            // A crash inside the command is reported like a crashed CLI run; the host itself keeps going.
+            Console.Error.WriteLine(Unwrap(exception).ToString());
+            exitCode = 1;
+        }
+
+        return new JsonObject
+        {
+            ["exit_code"] = exitCode,
+            ["elapsed_ms"] = stopwatch.Elapsed.TotalMilliseconds,
+            ["context"] = reused ? "reused" : "loaded",
+        };
+    }
+
+    private static HostedBuild Load(string buildDir)
+    {
+        var assemblyPath = Path.Combine(Path.GetFullPath(buildDir), "bin", "LocalTesting", "debug", "LocalTesting.dll");
+        if (!File.Exists(assemblyPath))
+        {
+            throw new HostRequestException(LoadFailed, $"No LocalTesting build at {assemblyPath}.");
+        }
+
+        var context = new CandidateLoadContext(assemblyPath);
+        try
+        {
+            var assembly = context.LoadFromAssemblyPath(assemblyPath);
+            var entryPoint = assembly.GetType(nameof(EvaluatorHostEntryPoint))
+                ?? throw new HostRequestException(LoadFailed, $"{assemblyPath} predates host mode; rebuild it.");
+            var execute = entryPoint.GetMethod(nameof(EvaluatorHostEntryPoint.Execute), BindingFlags.Public | BindingFlags.Static)!;
+            var release = entryPoint.GetMethod(nameof(EvaluatorHostEntryPoint.Release), BindingFlags.Public | BindingFlags.Static)!;
+            return new HostedBuild(
+                Path.GetFullPath(buildDir),
+                context,
+                execute.CreateDelegate<Func<string[], Action<string>, int>>(),
+                release.CreateDelegate<Action>(),
+                HostedBuild.Stamp(assemblyPath));
+        }
+        catch (HostRequestException)
+        {
+            context.Unload();
+            throw;
+        }
+        catch (Exception exception) when (exception is IOException or BadImageFormatException or MissingMethodException or ArgumentException)
+        {
+            context.Unload();
+            throw new HostRequestException(LoadFailed, $"Unable to load {assemblyPath}: {exception.Message}");
+        }
+    }
+
+    [MethodImpl(MethodImplOptions.NoInlining)]
+    private static bool Unload(HostedBuild hosted)
+    {
+        var reference = hosted.Release();
+        // Unloading finishes once nothing references the context's types; give finalizers a few rounds.
+        for (var attempt = 0; attempt < 10 && reference.IsAlive; attempt++)
+        {
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+        }
+
+        return !reference.IsAlive;
+    }
+
+    private static string RequiredString(JsonObject parameters, string name)
+    {
+        return parameters[name]?.GetValue<string>()
+            ?? throw new HostRequestException(InvalidParams, $"Missing string parameter '{name}'.");
+    }
+
+    private static Exception Unwrap(Exception exception)
+    {
+        return exception is TargetInvocationException { InnerException: not null } invocation
+            ? invocation.InnerException
+            : exception;
+    }
+
+    private sealed class HostedBuild
+    {
+        private CandidateLoadContext? _context;
+        private Func<string[], Action<string>, int>? _execute;
+        private Action? _release;
+
+        public HostedBuild(
+            string buildDir,
+            CandidateLoadContext context,
+            Func<string[], Action<string>, int> execute,
+            Action release,
+            DateTime stamp)
+        {
+            BuildDir = buildDir;
+            _context = context;
+            _execute = execute;
+            _release = release;
+            LoadedStamp = stamp;
+        }
+
+        public string BuildDir { get; }
+
+        public DateTime LoadedStamp { get; }
+
+        public static DateTime Stamp(string assemblyPath)
+        {
+            var directory = Path.GetDirectoryName(assemblyPath)!;
+            var engineCore = Path.Combine(directory, "Engine.Core.dll");
+            var localTesting = File.GetLastWriteTimeUtc(assemblyPath);
+            return File.Exists(engineCore) && File.GetLastWriteTimeUtc(engineCore) > localTesting
+                ? File.GetLastWriteTimeUtc(engineCore)
+                : localTesting;
+        }
+
+        public bool Matches(string buildDir)
+        {
+            return string.Equals(BuildDir, Path.GetFullPath(buildDir), StringComparison.Ordinal);
+        }
+
+        public bool IsCurrent()
+        {
+            var assemblyPath = Path.Combine(BuildDir, "bin", "LocalTesting", "debug", "LocalTesting.dll");
+            return File.Exists(assemblyPath) && Stamp(assemblyPath) == LoadedStamp;
+        }
+
+        public int Execute(string[] args, Action<string> gameSink)
+        {
+            return _execute!(args, gameSink);
+        }
+
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        public WeakReference Release()
+        {
+            try
+            {
+                _release?.Invoke();
+            }
+            catch (Exception exception)
+            {
+                Console.Error.WriteLine($"Releasing {BuildDir} failed: {exception.Message}");
+            }
+
+            var reference = new WeakReference(_context);
+            _context?.Unload();
+            _context = null;
+            _execute = null;
+            _release = null;
+            return reference;
+        }
+    }
+
+    private sealed class CandidateLoadContext : AssemblyLoadContext
+    {
+        private readonly AssemblyDependencyResolver _resolver;
+
+        public CandidateLoadContext(string mainAssemblyPath)
+            : base($"LocalTesting {mainAssemblyPath}", isCollectible: true)
+        {
+            _resolver = new AssemblyDependencyResolver(mainAssemblyPath);
+        }
+
+        // Framework assemblies resolve to null here and come from the default context, so BCL types
+        // such as string and Action are shared with the host.
+        protected override Assembly? Load(AssemblyName assemblyName)
+        {
+            var path = _resolver.ResolveAssemblyToPath(assemblyName);
+            return path is null ? null : LoadFromAssemblyPath(path);
+        }
+
+        protected override IntPtr LoadUnmanagedDll(string unmanagedDllName)
+        {
+            var path = _resolver.ResolveUnmanagedDllToPath(unmanagedDllName);
+            return path is null ? IntPtr.Zero : LoadUnmanagedDllFromPath(path);
+        }
+    }
+
+    private sealed class HostChannel
+    {
+        private readonly object _lock = new();
+        private readonly StreamWriter _writer;
+
+        public HostChannel(StreamWriter writer)
+        {
+            _writer = writer;
+        }
+
+        public void Notify(string method, JsonObject parameters)
+        {
+            Write(new JsonObject { ["jsonrpc"] = "2.0", ["method"] = method, ["params"] = parameters });
+        }
+
+        public void Respond(JsonNode? id, JsonObject result)
+        {
+            Write(new JsonObject { ["jsonrpc"] = "2.0", ["id"] = id?.DeepClone(), ["result"] = result });
+        }
+
+        public void Fail(JsonNode? id, int code, string message)
+        {
+            Write(new JsonObject
+            {
+                ["jsonrpc"] = "2.0",
+                ["id"] = id?.DeepClone(),
+                ["error"] = new JsonObject { ["code"] = code, ["message"] = message },
+            });
+        }
+
+        private void Write(JsonObject message)
+        {
+            var text = message.ToJsonString();
+            lock (_lock)
+            {
+                _writer.Write(text);
+                _writer.Write('\n');
+                _writer.Flush();
+            }
+        }
+    }
+
+    // Turns a command's Console output into one "output" notification per line.
+    private sealed class HostOutputWriter : TextWriter
+    {
+        private readonly HostChannel _channel;
+        private readonly JsonNode? _id;
+        private readonly string _stream;
+        private readonly StringBuilder _line = new();
+
+        public HostOutputWriter(HostChannel channel, JsonNode? id, string stream)
+        {
+            _channel = channel;
+            _id = id;
+            _stream = stream;
+        }
+
+        public override Encoding Encoding => Encoding.UTF8;
+
+        public override void Write(char value)
+        {
+            lock (_line)
+            {
+                if (value == '\n')
+                {
+                    EmitLine();
+                }
+                else if (value != '\r')
+                {
+                    _line.Append(value);
+                }
+            }
+        }
+
+        public override void Write(string? value)
+        {
+            if (value is null)
+            {
+                return;
+            }
+
+            lock (_line)
+            {
+                foreach (var character in value)
+                {
+                    Write(character);
+                }
+            }
+        }
+
+        public override void WriteLine(string? value)
+        {
+            lock (_line)
+            {
+                _line.Append(value);
+                EmitLine();
+            }
+        }
+
+        public override void Flush()
+        {
+            // Partial lines wait for their newline so every notification carries whole lines.
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+            lock (_line)
+            {
+                if (_line.Length > 0)
+                {
+                    EmitLine();
+                }
+            }
+
+            base.Dispose(disposing);
+        }
+
+        private void EmitLine()
+        {
+            _channel.Notify("output", new JsonObject
+            {
+                ["id"] = _id?.DeepClone(),
+                ["stream"] = _stream,
+                ["line"] = _line.ToString(),
+            });
+            _line.Clear();
+        }
+    }
+
+    private sealed class HostRequestException : Exception
+    {
+        public HostRequestException(int code, string message)
+            : base(message)
+        {
+            Code = code;
+        }
+
+        public int Code { get; }
+    }
+}
+
+// Called by EvaluatorHost, by reflection, inside the load context of the build it belongs to.
+internal static class EvaluatorHostEntryPoint
+{
+    public static int Execute(string[] args, Action<string> gameSink)
+    {
+        LocalTestingProgram.KeepStockfishProcesses();
+        LocalTestingProgram.GameSink = gameSink;
+        try
+        {
+            return LocalTestingProgram.Run(args);
+        }
+        finally
+        {
+            LocalTestingProgram.GameSink = null;
+        }
+    }
+
+    public static void Release()
+    {
+        LocalTestingProgram.ReleaseStockfishProcesses();
+    }
+}
@@ -0,0 +1,133 @@
+/*
+Purpose:
+This LocalTesting helper compares the two opening book formats:
+1. Openings.lookup.tsv parsed into a Dictionary<string, string[]> (the original path).
+2. Openings.lookup.bin memory-mapped through OpeningBookIndex.
+
+It reports load time, managed heap retained and bytes allocated while loading, and
+average lookup latency for book hits and misses. It also checks that every TSV
+position resolves to the same moves in the binary book.
+*/
+
+using System.Diagnostics;
+using Engine.Core;
+
+internal static class OpeningBookBenchmark
+{
+    private const int DefaultLookups = 200_000;
+
+    public static int Run(string[] args)
+    {
+        var tsvPath = Path.GetFullPath("Openings.lookup.tsv");
+        var binPath = Path.GetFullPath("Openings.lookup.bin");
+        var lookups = DefaultLookups;
+
+        for (var index = 0; index < args.Length; index++)
+        {
+            switch (args[index])
+            {
+                case "--tsv":
+                    tsvPath = Path.GetFullPath(args[++index]);
+                    break;
+                case "--bin":
+                    binPath = Path.GetFullPath(args[++index]);
+                    break;
+                case "--lookups":
+                    lookups = int.Parse(args[++index]);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown argument '{args[index]}'");
+            }
+        }
+
+        if (!File.Exists(tsvPath))
+        {
+            throw new FileNotFoundException($"Opening lookup not found: {tsvPath}", tsvPath);
+        }
+
+        Console.WriteLine("=== OPENING BOOK BENCHMARK ===");
+        Console.WriteLine($"TSV: {tsvPath} ({new FileInfo(tsvPath).Length} bytes)");
+        Console.WriteLine($"Binary: {binPath} ({(File.Exists(binPath) ? new FileInfo(binPath).Length : 0)} bytes)");
+
+        var (tsvLookup, tsvLoad) = MeasureLoad(() => OpeningBook.ReadLookupTsv(tsvPath));
+        var (bookIndex, binaryLoad) = MeasureLoad(() => OpeningBookIndex.TryOpen(binPath, out _));
+        if (bookIndex is null)
+        {
+            Console.Error.WriteLine("Binary book could not be opened; run autoresearch/build_opening_book.py first.");
+            return 1;
+        }
+
+        using (bookIndex)
+        {
+            var random = new Random(1350);
+            var hitKeys = tsvLookup.Keys.OrderBy(_ => random.Next()).ToArray();
+            var missKeys = hitKeys.Select(key => key.Replace(" w ", " x ").Replace(" b ", " y ")).ToArray();
+
+            var mismatches = hitKeys.Count(key => !bookIndex.TryGetMoves(key, out var moves) || !moves.SequenceEqual(tsvLookup[key]));
+
+            PrintLoad("tsv", tsvLoad, tsvLookup.Count);
+            PrintLoad("binary", binaryLoad, bookIndex.PositionCount);
+            PrintLookup("tsv", "hit", MeasureLookups(hitKeys, lookups, key => tsvLookup.TryGetValue(key, out _)));
+            PrintLookup("binary", "hit", MeasureLookups(hitKeys, lookups, key => bookIndex.TryGetMoves(key, out _)));
+            PrintLookup("tsv", "miss", MeasureLookups(missKeys, lookups, key => tsvLookup.TryGetValue(key, out _)));
+            PrintLookup("binary", "miss", MeasureLookups(missKeys, lookups, key => bookIndex.TryGetMoves(key, out _)));
+            Console.WriteLine($"Positions whose moves differ between formats: {mismatches}");
+            Console.WriteLine("=== OPENING BOOK BENCHMARK DONE ===");
+            return mismatches == 0 ? 0 : 1;
+        }
+    }
+
+    private static (T Value, LoadMeasurement Measurement) MeasureLoad<T>(Func<T> load)
+    {
+        GC.Collect();
+        GC.WaitForPendingFinalizers();
+        GC.Collect();
+        var heapBefore = GC.GetTotalMemory(forceFullCollection: true);
+        var allocatedBefore = GC.GetAllocatedBytesForCurrentThread();
+        var stopwatch = Stopwatch.StartNew();
+        var value = load();
+        stopwatch.Stop();
+        var allocated = GC.GetAllocatedBytesForCurrentThread() - allocatedBefore;
+        var retained = GC.GetTotalMemory(forceFullCollection: true) - heapBefore;
+        GC.KeepAlive(value);
+        return (value, new LoadMeasurement(stopwatch.Elapsed.TotalMilliseconds, retained, allocated));
+    }
+
+    private static double MeasureLookups(string[] keys, int lookups, Func<string, bool> lookup)
+    {
+        // Warm up once so JIT and page faults are not billed to the timed loop.
+        foreach (var key in keys.Take(1024))
+        {
+            lookup(key);
+        }
+
+        var found = 0;
+        var stopwatch = Stopwatch.StartNew();
+        for (var index = 0; index < lookups; index++)
+        {
+            if (lookup(keys[index % keys.Length]))
+            {
+                found += 1;
+            }
+        }
+
+        stopwatch.Stop();
+        GC.KeepAlive(found);
+        return stopwatch.Elapsed.TotalMilliseconds * 1_000_000.0 / lookups;
+    }
+
+    private static void PrintLoad(string format, LoadMeasurement measurement, int positions)
+    {
+        Console.WriteLine(
+            $"load | format={format} | positions={positions} | load_ms={measurement.Milliseconds:F3} | retained_heap_bytes={measurement.RetainedBytes} | allocated_bytes={measurement.AllocatedBytes}");
+    }
+
+    private static void PrintLookup(string format, string kind, double nanoseconds)
+    {
+        Console.WriteLine($"lookup | format={format} | kind={kind} | ns_per_lookup={nanoseconds:F1}");
+    }
+
+    private sealed record LoadMeasurement(double Milliseconds, long RetainedBytes, long AllocatedBytes);
+}
+
+// dotnet run -c Release --project engine_csharp/src/LocalTesting -- benchmark-opening-book --tsv Openings.lookup.tsv --bin Openings.lookup.bin
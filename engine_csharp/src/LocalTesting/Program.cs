@@ -18,6 +18,60 @@ internal static class LocalTestingProgram
     private const string DefaultStockfishBinary = "autoresearch/stockfish/stockfish-ubuntu-x86-64-avx2";
     private const string StartingFen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1";
 
+    private static readonly string[] EvaluationCsvColumns =
+    [
+        "commit_short_sha",
+        "game_number",
+        "pair_number",
+        "opening_index",
+        "engine_a_was_white",
+        "white_engine",
+        "black_engine",
+        "result",
+        "termination_reason",
+        "plies",
+        "engine_a_score",
+        "white_moves",
+        "black_moves",
+        "white_total_positions",
+        "black_total_positions",
+        "white_average_positions",
+        "black_average_positions",
+        "white_average_move_ms",
+        "black_average_move_ms",
+        "game_elapsed_ms",
+        "failure_engine",
+        "failure_message",
+        "opening_fen",
+        "white_move_ms_p50",
+        "white_move_ms_p95",
+        "white_move_ms_p99",
+        "white_move_ms_max",
+        "black_move_ms_p50",
+        "black_move_ms_p95",
+        "black_move_ms_p99",
+        "black_move_ms_max",
+        "game_started_unix_ms",
+        "game_finished_unix_ms",
+    ];
+
+    // Set by EvaluatorHostEntryPoint while a host request runs: each finished game is streamed back as
+    // a JSON object of its CSV fields.
+    internal static Action<string>? GameSink { get; set; }
+
+    // Kept for the lifetime of a host load context, so Stockfish processes outlive pairs and requests.
+    private static StockfishPool? _stockfishPool;
+
+    internal static void KeepStockfishProcesses()
+    {
+        Interlocked.CompareExchange(ref _stockfishPool, new StockfishPool(), null);
+    }
+
+    internal static void ReleaseStockfishProcesses()
+    {
+        Interlocked.Exchange(ref _stockfishPool, null)?.Dispose();
+    }
+
     public static int Run(string[] args)
     {
         if (args.Length == 0)
@@ -36,8 +90,13 @@ internal static class LocalTestingProgram
                 "endgame-2" => RunEndgame("endgame_2", args[1..]),
                 "evaluate-match" => RunEvaluateMatch(args[1..]),
                 "evaluate-stock" or "--evaluate-stock" => RunEvaluateStock(args[1..]),
+                "calibrate-nodes" => RunCalibrateNodes(args[1..]),
                 "build-openings-lookup" => RunBuildOpeningsLookup(args[1..]),
                 "backend-worker-experiment" => BackendWorkerExperiment.Run(args[1..]),
+                "benchmark" => EngineBenchmark.Run(args[1..]),
+                "profile" => EngineProfiler.Run(args[1..]),
+                "benchmark-opening-book" => OpeningBookBenchmark.Run(args[1..]),
+                "host" => EvaluatorHost.Run(args[1..]),
                 _ => Fail($"Unknown command '{args[0]}'"),
             };
         }
@@ -327,14 +386,16 @@ internal static class LocalTestingProgram
         }
 
         return RunEvaluationSeries(
-            CreateEngineFileParticipantFactory(options.EngineAFilePath),
-            CreateEngineFileParticipantFactory(options.EngineBFilePath),
+            CreateEngineFileParticipantFactory(options.EngineAFilePath, options.NodeLimit),
+            CreateEngineFileParticipantFactory(options.EngineBFilePath, options.NodeLimit),
             options.Games,
             options.MaxPlies,
             options.TimeLimitSeconds,
             options.Workers,
             options.Log,
-            options.ShortSha);
+            options.ShortSha,
+            options.CpuSets,
+            options.Seed);
     }
 
     private static int RunEvaluateStock(string[] args)
@@ -356,14 +417,131 @@ internal static class LocalTestingProgram
         }
 
         return RunEvaluationSeries(
-            CreateEngineFileParticipantFactory(options.EngineFilePath),
-            CreateStockfishParticipantFactory(options.StockfishPath, options.StockfishElo),
+            CreateEngineFileParticipantFactory(options.EngineFilePath, options.NodeLimit),
+            CreateStockfishParticipantFactory(options.StockfishPath, options.StockfishElo, options.StockfishNodes),
             options.Games,
             options.MaxPlies,
             options.TimeLimitSeconds,
             options.Workers,
             options.Log,
-            options.ShortSha);
+            options.ShortSha,
+            options.CpuSets,
+            options.Seed);
+    }
+
+    private static int RunCalibrateNodes(string[] args)
+    {
+        string? engineFilePath = null;
+        var stockfishPath = DefaultStockfishBinary;
+        var stockfishElo = 1320;
+        var timeLimitSeconds = DefaultEvaluationTimeLimitSeconds;
+        var repeats = 3;
+        string? outputPath = null;
+
+        for (var index = 0; index < args.Length; index++)
+        {
+            switch (args[index])
+            {
+                case "--engine-file":
+                    engineFilePath = args[++index];
+                    break;
+                case "--stockfish-path":
+                    stockfishPath = args[++index];
+                    break;
+                case "--stockfish-elo":
+                    stockfishElo = int.Parse(args[++index]);
+                    break;
+                case "--time-limit-ms":
+                    timeLimitSeconds = double.Parse(args[++index]) / 1000.0;
+                    break;
+                case "--repeats":
+                    repeats = int.Parse(args[++index]);
+                    break;
+                case "--output":
+                    outputPath = args[++index];
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown argument '{args[index]}'");
+            }
+        }
+
+        if (string.IsNullOrWhiteSpace(engineFilePath))
+        {
+            throw new ArgumentException("--engine-file is required.");
+        }
+
+        if (timeLimitSeconds <= 0)
+        {
+            throw new ArgumentException("--time-limit-ms must be greater than 0.");
+        }
+
+        if (repeats < 1)
+        {
+            throw new ArgumentException("--repeats must be at least 1.");
+        }
+
+        // Run alone on a quiet machine: the medians become the node budgets that stand in for the
+        // time limit, so they should reflect what each engine reaches uncontended.
+        using var engine = ResolveParticipantFromEngineFile(ResolveCliPath(engineFilePath));
+        using var stockfish = CreateStockfishParticipant(ResolveStockfishPath(stockfishPath), stockfishElo);
+        var engineNodes = new List<long>();
+        var stockfishNodes = new List<long>();
+        for (var repeat = 0; repeat < repeats; repeat++)
+        {
+            foreach (var fen in EngineBenchmark.BenchmarkFens)
+            {
+                engine.ResetForNewGame();
+                var engineResult = engine.SearchMove(new BoardState(fen), timeLimitSeconds);
+                engineNodes.Add(engineResult.NodesSearched ?? engineResult.MovesEvaluated);
+                var stockfishResult = stockfish.SearchMove(new BoardState(fen), timeLimitSeconds);
+                stockfishNodes.Add(stockfishResult.NodesSearched ?? stockfishResult.MovesEvaluated);
+            }
+        }
+
+        var engineMedian = Median(engineNodes);
+        var stockfishMedian = Median(stockfishNodes);
+        Console.WriteLine("=== NODE CALIBRATION ===");
+        Console.WriteLine($"Engine name: {engine.EngineStem}");
+        Console.WriteLine($"Stockfish: {stockfish.Details}");
+        Console.WriteLine($"Time limit per move: {timeLimitSeconds * 1000.0:F1}ms");
+        Console.WriteLine($"Searches per engine: {engineNodes.Count}");
+        Console.WriteLine($"Engine median nodes: {engineMedian}");
+        Console.WriteLine($"Stockfish median nodes: {stockfishMedian}");
+
+        if (outputPath is not null)
+        {
+            var resolvedOutput = ResolveCliPath(outputPath);
+            Directory.CreateDirectory(Path.GetDirectoryName(resolvedOutput) ?? Directory.GetCurrentDirectory());
+            File.WriteAllText(
+                resolvedOutput,
+                JsonSerializer.Serialize(
+                    new NodeCalibrationReport(
+                        engine.EngineStem,
+                        stockfish.EngineStem,
+                        timeLimitSeconds * 1000.0,
+                        repeats,
+                        engineMedian,
+                        stockfishMedian,
+                        engineNodes,
+                        stockfishNodes),
+                    new JsonSerializerOptions
+                    {
+                        PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+                        WriteIndented = true,
+                    }));
+            Console.WriteLine($"Calibration JSON: {resolvedOutput}");
+        }
+
+        Console.WriteLine("=== NODE CALIBRATION DONE ===");
+        return 0;
+    }
+
+    private static long Median(List<long> values)
+    {
+        var sorted = values.Order().ToArray();
+        return sorted.Length % 2 == 1
+            ? sorted[sorted.Length / 2]
+            : (sorted[sorted.Length / 2 - 1] + sorted[sorted.Length / 2]) / 2;
     }
 
     private static int RunBuildOpeningsLookup(string[] args)
@@ -420,6 +598,9 @@ internal static class LocalTestingProgram
         var workers = 1;
         var log = false;
         string? shortSha = null;
+        int[][]? cpuSets = null;
+        long? nodeLimit = null;
+        int? seed = null;
 
         for (var index = 0; index < args.Length; index++)
         {
@@ -449,6 +630,15 @@ internal static class LocalTestingProgram
                 case "--short-sha":
                     shortSha = args[++index];
                     break;
+                case "--cpu-sets":
+                    cpuSets = CpuAffinity.ParseCpuSets(args[++index]);
+                    break;
+                case "--nodes":
+                    nodeLimit = long.Parse(args[++index]);
+                    break;
+                case "--seed":
+                    seed = int.Parse(args[++index]);
+                    break;
                 default:
                     throw new ArgumentException($"Unknown argument '{args[index]}'");
             }
@@ -469,6 +659,16 @@ internal static class LocalTestingProgram
             throw new ArgumentException("--workers must be at least 1.");
         }
 
+        if (cpuSets is not null && cpuSets.Length < workers)
+        {
+            throw new ArgumentException($"--cpu-sets lists {cpuSets.Length} sets but --workers is {workers}.");
+        }
+
+        if (nodeLimit is <= 0)
+        {
+            throw new ArgumentException("--nodes must be greater than 0.");
+        }
+
         return new EvaluateMatchOptions(
             ResolveCliPath(engineAFilePath),
             ResolveCliPath(engineBFilePath),
@@ -477,7 +677,10 @@ internal static class LocalTestingProgram
             timeLimitSeconds,
             workers,
             log,
-            shortSha);
+            shortSha,
+            cpuSets,
+            nodeLimit,
+            seed);
     }
 
     private static EvaluateStockOptions ParseEvaluateStockOptions(string[] args)
@@ -491,6 +694,10 @@ internal static class LocalTestingProgram
         var workers = 1;
         var log = false;
         string? shortSha = null;
+        int[][]? cpuSets = null;
+        long? nodeLimit = null;
+        long? stockfishNodes = null;
+        int? seed = null;
 
         for (var index = 0; index < args.Length; index++)
         {
@@ -499,6 +706,9 @@ internal static class LocalTestingProgram
                 case "--engine-file":
                     engineFilePath = args[++index];
                     break;
+                case "--stockfish-nodes":
+                    stockfishNodes = long.Parse(args[++index]);
+                    break;
                 case "--stockfish-path":
                     stockfishPath = args[++index];
                     break;
@@ -523,6 +733,15 @@ internal static class LocalTestingProgram
                 case "--short-sha":
                     shortSha = args[++index];
                     break;
+                case "--cpu-sets":
+                    cpuSets = CpuAffinity.ParseCpuSets(args[++index]);
+                    break;
+                case "--nodes":
+                    nodeLimit = long.Parse(args[++index]);
+                    break;
+                case "--seed":
+                    seed = int.Parse(args[++index]);
+                    break;
                 default:
                     throw new ArgumentException($"Unknown argument '{args[index]}'");
             }
@@ -543,6 +762,22 @@ internal static class LocalTestingProgram
             throw new ArgumentException("--workers must be at least 1.");
         }
 
+        if (cpuSets is not null && cpuSets.Length < workers)
+        {
+            throw new ArgumentException($"--cpu-sets lists {cpuSets.Length} sets but --workers is {workers}.");
+        }
+
+        // A node budget on one side only would still let oversubscription move the other side's strength.
+        if (nodeLimit.HasValue != stockfishNodes.HasValue)
+        {
+            throw new ArgumentException("--nodes and --stockfish-nodes must be given together.");
+        }
+
+        if (nodeLimit is <= 0 || stockfishNodes is <= 0)
+        {
+            throw new ArgumentException("--nodes and --stockfish-nodes must be greater than 0.");
+        }
+
         return new EvaluateStockOptions(
             ResolveCliPath(engineFilePath),
             ResolveStockfishPath(stockfishPath),
@@ -552,7 +787,11 @@ internal static class LocalTestingProgram
             timeLimitSeconds,
             workers,
             log,
-            shortSha);
+            shortSha,
+            cpuSets,
+            nodeLimit,
+            stockfishNodes,
+            seed);
     }
 
     private static int RunEvaluationSeries(
@@ -563,7 +802,9 @@ internal static class LocalTestingProgram
         double timeLimitSeconds,
         int workers,
         bool log,
-        string? shortSha)
+        string? shortSha,
+        int[][]? cpuSets,
+        int? seed)
     {
         string[] openingFens = [StartingFen];
         var totalPairs = games / 2;
@@ -576,6 +817,9 @@ internal static class LocalTestingProgram
         using var workerLoggers = csvCoordinator is not null
             ? new ThreadLocal<EvaluationCsvLogger?>(() => csvCoordinator.CreateWorkerLogger(), trackAllValues: true)
             : null;
+        var cpuSlots = cpuSets is not null && CpuAffinity.IsSupported
+            ? new CpuAffinity.SlotPool(cpuSets.Take(workers))
+            : null;
 
         try
         {
@@ -591,6 +835,18 @@ internal static class LocalTestingProgram
             Console.WriteLine($"Time limit per move: {timeLimitSeconds * 1000.0:F1}ms");
             Console.WriteLine($"Max plies: {maxPlies}");
             Console.WriteLine($"Workers: {workers}");
+            Console.WriteLine($"Seed: {seed?.ToString(CultureInfo.InvariantCulture) ?? "none"}");
+            if (cpuSets is not null)
+            {
+                Console.WriteLine(cpuSlots is not null
+                    ? $"CPU sets: {string.Join(" | ", cpuSets.Take(workers).Select(CpuAffinity.Format))}"
+                    : "CPU sets: ignored (thread affinity is only supported on Linux)");
+                if (cpuSlots is not null && _stockfishPool is not null)
+                {
+                    Console.WriteLine("Stockfish pool: bypassed (pinned workers start their own Stockfish on their CPU set)");
+                }
+            }
+
             Console.WriteLine("Opening mode: starting_position");
             Console.WriteLine("Opening source file: not used");
             Console.WriteLine($"Unique opening positions loaded: {openingFens.Length}");
@@ -616,10 +872,13 @@ internal static class LocalTestingProgram
                     var openingIndex = pairIndex % openingFens.Length + 1;
                     var workerLogger = workerLoggers?.Value;
 
+                    // Pin before creating the engines so a Stockfish child inherits this slot's CPUs.
+                    using var cpuLease = cpuSlots?.Pin();
                     using var pairEngineA = engineAFactory.Create();
                     using var pairEngineB = engineBFactory.Create();
 
-                    var gameAWhite = PlayEvaluationGame(
+                    var gameAWhite = PlaySeededEvaluationGame(
+                        seed,
                         whiteGameNumber,
                         pairNumber,
                         openingIndex,
@@ -633,7 +892,8 @@ internal static class LocalTestingProgram
                     pairEngineA.ResetForNewGame();
                     pairEngineB.ResetForNewGame();
 
-                    var gameBWhite = PlayEvaluationGame(
+                    var gameBWhite = PlaySeededEvaluationGame(
+                        seed,
                         blackGameNumber,
                         pairNumber,
                         openingIndex,
@@ -659,6 +919,12 @@ internal static class LocalTestingProgram
                         aggregate.Record(pairResult.SecondGame);
                         PrintGameSummary(pairResult.SecondGame);
 
+                        if (GameSink is not null)
+                        {
+                            GameSink(FormatGameJson(shortSha, pairResult.FirstGame));
+                            GameSink(FormatGameJson(shortSha, pairResult.SecondGame));
+                        }
+
                         var completed = ++completedPairs;
                         Console.WriteLine(
                             $"Pair {pairResult.PairNumber}/{totalPairs}: opening_index={pairResult.OpeningIndex} | engine_a_pair_score={pairResult.PairScore:F2} | completed_pairs={completed}/{totalPairs}");
@@ -690,6 +956,35 @@ internal static class LocalTestingProgram
         }
     }
 
+    private static EvaluationGameResult PlaySeededEvaluationGame(
+        int? seed,
+        int gameNumber,
+        int pairNumber,
+        int openingIndex,
+        string openingFen,
+        EvaluationParticipant whiteEngine,
+        EvaluationParticipant blackEngine,
+        double timeLimitSeconds,
+        int maxPlies,
+        bool engineAWasWhite)
+    {
+        // Derive each game's book seed from its number so the same game replays the same opening
+        // regardless of which worker plays it or in what order.
+        using var seedScope = seed is null
+            ? null
+            : OpeningBook.UseSeed(unchecked(seed.Value * 1_000_003 + gameNumber));
+        return PlayEvaluationGame(
+            gameNumber,
+            pairNumber,
+            openingIndex,
+            openingFen,
+            whiteEngine,
+            blackEngine,
+            timeLimitSeconds,
+            maxPlies,
+            engineAWasWhite);
+    }
+
     private static EvaluationGameResult PlayEvaluationGame(
         int gameNumber,
         int pairNumber,
@@ -708,6 +1003,7 @@ internal static class LocalTestingProgram
         string terminationReason;
         string? failureEngineStem = null;
         string? failureMessage = null;
+        var startedAt = DateTimeOffset.UtcNow;
         var gameStopwatch = Stopwatch.StartNew();
         var plies = 0;
 
@@ -746,7 +1042,8 @@ internal static class LocalTestingProgram
                     failureMessage,
                     whiteStats,
                     blackStats,
-                    gameStopwatch.Elapsed);
+                    gameStopwatch.Elapsed,
+                    startedAt);
             }
 
             searchStopwatch.Stop();
@@ -774,7 +1071,8 @@ internal static class LocalTestingProgram
                     failureMessage,
                     whiteStats,
                     blackStats,
-                    gameStopwatch.Elapsed);
+                    gameStopwatch.Elapsed,
+                    startedAt);
             }
 
             board.Push(searchResult.Move);
@@ -824,41 +1122,70 @@ internal static class LocalTestingProgram
             failureMessage,
             whiteStats,
             blackStats,
-            gameStopwatch.Elapsed);
+            gameStopwatch.Elapsed,
+            startedAt);
     }
 
-    private static EvaluationParticipant ResolveParticipantFromEngineFile(string engineFilePath)
+    private static EvaluationParticipant ResolveParticipantFromEngineFile(string engineFilePath, long? nodeLimit = null)
     {
         var engine = EngineFileSupport.ResolveV3PlusEngine(engineFilePath);
+        if (nodeLimit is null)
+        {
+            return new EvaluationParticipant(
+                engine.SourcePath,
+                engine.EngineStem,
+                engine.SearchMethodName,
+                engine.SearchMove,
+                engine.ResetState);
+        }
+
+        if (engine.SearchNodes is null)
+        {
+            throw new ArgumentException(
+                $"{engine.EngineStem} has no nodeLimit parameter on {engine.SearchMethodName}, so it cannot run with --nodes.");
+        }
+
+        var searchNodes = engine.SearchNodes;
+        var nodes = nodeLimit.Value;
+        // The move time argument is ignored: the node budget alone decides when the search stops.
         return new EvaluationParticipant(
             engine.SourcePath,
             engine.EngineStem,
-            engine.SearchMethodName,
-            engine.SearchMove,
+            $"{engine.SearchMethodName} nodes={nodes}",
+            (board, _) => searchNodes(board, nodes),
             engine.ResetState);
     }
 
-    private static EvaluationParticipant CreateStockfishParticipant(string stockfishPath, int stockfishElo)
+    private static EvaluationParticipant CreateStockfishParticipant(string stockfishPath, int stockfishElo, long? nodeLimit = null)
     {
-        var stockfish = new StockfishEngine(stockfishPath, stockfishElo);
+        // A pooled process keeps the affinity of the slot that spawned it, and re-pinning its pid
+        // would only move the main thread, so pinned workers always start their own Stockfish.
+        var pool = CpuAffinity.IsCurrentThreadPinned ? null : _stockfishPool;
+        var lease = pool?.Rent(stockfishPath, stockfishElo, nodeLimit);
+        var stockfish = lease?.Engine ?? new StockfishEngine(stockfishPath, stockfishElo, nodeLimit);
         return new EvaluationParticipant(
             stockfish.BinaryPath,
             $"stockfish-{stockfish.ConfiguredElo}",
-            $"uci elo={stockfish.ConfiguredElo}",
+            nodeLimit is null
+                ? $"uci elo={stockfish.ConfiguredElo}"
+                : $"uci elo={stockfish.ConfiguredElo} nodes={nodeLimit}",
             stockfish.SearchMove,
-            Disposable: stockfish);
+            Disposable: lease is null ? stockfish : lease);
     }
 
-    private static EvaluationParticipantFactory CreateEngineFileParticipantFactory(string engineFilePath)
+    private static EvaluationParticipantFactory CreateEngineFileParticipantFactory(string engineFilePath, long? nodeLimit = null)
     {
         var resolvedPath = ResolveCliPath(engineFilePath);
-        return new EvaluationParticipantFactory(() => ResolveParticipantFromEngineFile(resolvedPath));
+        return new EvaluationParticipantFactory(() => ResolveParticipantFromEngineFile(resolvedPath, nodeLimit));
     }
 
-    private static EvaluationParticipantFactory CreateStockfishParticipantFactory(string stockfishPath, int stockfishElo)
+    private static EvaluationParticipantFactory CreateStockfishParticipantFactory(
+        string stockfishPath,
+        int stockfishElo,
+        long? nodeLimit = null)
     {
         var resolvedPath = ResolveStockfishPath(stockfishPath);
-        return new EvaluationParticipantFactory(() => CreateStockfishParticipant(resolvedPath, stockfishElo));
+        return new EvaluationParticipantFactory(() => CreateStockfishParticipant(resolvedPath, stockfishElo, nodeLimit));
     }
 
     private static void PrintGameSummary(EvaluationGameResult result)
@@ -1319,8 +1646,15 @@ internal static class LocalTestingProgram
         Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- endgame-2 --engine-file engine_csharp/src/Engine.Core/V3/V3_4Engine.cs --time-limit-seconds 1.0");
         Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- evaluate-match --engine-a-file engine_csharp/src/Engine.Core/V3/V3_4Engine.cs --engine-b-file engine_csharp/src/Engine.Core/V3/V3_0Engine.cs --workers 6 --log --short-sha 1a2b3c4");
         Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- evaluate-stock --engine-file engine_csharp/src/Engine.Core/V3/V3_4Engine.cs --stockfish-path autoresearch/stockfish/stockfish-ubuntu-x86-64-avx2 --stockfish-elo 1350 --games 20 --time-limit-ms 100 --workers 6 --log --short-sha 1a2b3c4");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- evaluate-stock --engine-file engine_csharp/src/Engine.Core/V3/V3_4Engine.cs --games 20 --workers 2 --cpu-sets \"0,1;2,3\" --log --short-sha 1a2b3c4");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- evaluate-stock --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --games 20 --nodes 40000 --stockfish-nodes 60000 --seed 1350 --workers 12 --log --short-sha 1a2b3c4");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- calibrate-nodes --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --stockfish-elo 1350 --time-limit-ms 100 --repeats 3 --output autoresearch/benchmarks/node-calibration.json");
         Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- build-openings-lookup");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- benchmark-opening-book --tsv Openings.lookup.tsv --bin Openings.lookup.bin --lookups 200000");
         Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- backend-worker-experiment --engine-file engine_csharp/src/Engine.Core/V3/V3_4Engine.cs --games 20 --time-limit-ms 100 --workers 6 --skip-1-worker");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- benchmark --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --depth 4 --time-limit-ms 200 --repeats 3 --output autoresearch/benchmarks/V4_0Engine.json");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- profile --engine-file engine_csharp/src/Engine.Core/V4/V4_0Engine.cs --time-limit-ms 200 --repeats 2 --top 25 --output autoresearch/logs/V4_0Engine-profile.json");
+        Console.Error.WriteLine("  dotnet run --project engine_csharp/src/LocalTesting -- host --max-contexts 4");
     }
 
     private sealed record Puzzle1Scenario(
@@ -1348,7 +1682,10 @@ internal static class LocalTestingProgram
         double TimeLimitSeconds,
         int Workers,
         bool Log,
-        string? ShortSha);
+        string? ShortSha,
+        int[][]? CpuSets,
+        long? NodeLimit,
+        int? Seed);
 
     private sealed record EvaluateStockOptions(
         string EngineFilePath,
@@ -1359,7 +1696,21 @@ internal static class LocalTestingProgram
         double TimeLimitSeconds,
         int Workers,
         bool Log,
-        string? ShortSha);
+        string? ShortSha,
+        int[][]? CpuSets,
+        long? NodeLimit,
+        long? StockfishNodes,
+        int? Seed);
+
+    private sealed record NodeCalibrationReport(
+        string EngineStem,
+        string StockfishStem,
+        double TimeLimitMs,
+        int Repeats,
+        long EngineNodes,
+        long StockfishNodes,
+        IReadOnlyList<long> EngineSamples,
+        IReadOnlyList<long> StockfishSamples);
 
     private sealed record EvaluationParticipant(
         string SourcePath,
@@ -1401,6 +1752,8 @@ internal static class LocalTestingProgram
 
     private sealed class EngineGameStats
     {
+        private readonly List<double> _moveSeconds = [];
+
         public int Moves { get; private set; }
 
         public double TotalMoveSeconds { get; private set; }
@@ -1412,6 +1765,22 @@ internal static class LocalTestingProgram
             Moves++;
             TotalMoveSeconds += elapsedSeconds;
             TotalPositions += PositionCount(result);
+            _moveSeconds.Add(elapsedSeconds);
+        }
+
+        public double MoveMillisecondsPercentile(double percentile)
+        {
+            if (_moveSeconds.Count == 0)
+            {
+                return 0.0;
+            }
+
+            var sorted = _moveSeconds.Order().ToArray();
+            var rank = percentile / 100.0 * (sorted.Length - 1);
+            var lower = (int)Math.Floor(rank);
+            var upper = (int)Math.Ceiling(rank);
+            var interpolated = sorted[lower] + (sorted[upper] - sorted[lower]) * (rank - lower);
+            return interpolated * 1000.0;
         }
     }
 
@@ -1430,7 +1799,8 @@ internal static class LocalTestingProgram
         string? FailureMessage,
         EngineGameStats WhiteStats,
         EngineGameStats BlackStats,
-        TimeSpan Elapsed);
+        TimeSpan Elapsed,
+        DateTimeOffset StartedAt);
 
     private sealed class EvaluationCsvLogCoordinator
     {
@@ -1461,6 +1831,8 @@ internal static class LocalTestingProgram
                 File.Delete(stalePath);
             }
 
+            File.Delete(EvaluationRecordFile.CompanionPath(Path.Combine(logsDirectory, $"{commitShortSha}-result.csv")));
+
             return new EvaluationCsvLogCoordinator(logsDirectory, commitShortSha);
         }
 
@@ -1517,7 +1889,7 @@ internal static class LocalTestingProgram
                         throw new InvalidOperationException($"Unable to parse evaluation CSV row from {workerFilePath}: {line}");
                     }
 
-                    mergedRows.Add(new MergedCsvRow(gameNumber, line));
+                    mergedRows.Add(new MergedCsvRow(gameNumber, line, fields));
                 }
             }
 
@@ -1526,13 +1898,22 @@ internal static class LocalTestingProgram
                 return;
             }
 
-            using var writer = new StreamWriter(FinalFilePath, append: false);
-            writer.WriteLine(header);
-            foreach (var row in mergedRows.OrderBy(row => row.GameNumber))
+            var orderedRows = mergedRows.OrderBy(row => row.GameNumber).ToList();
+            using (var writer = new StreamWriter(FinalFilePath, append: false))
             {
-                writer.WriteLine(row.Line);
+                writer.WriteLine(header);
+                foreach (var row in orderedRows)
+                {
+                    writer.WriteLine(row.Line);
+                }
             }
 
+            // Written after the CSV so the orchestrator sees a companion at least as new as its source.
+            EvaluationRecordFile.Write(
+                EvaluationRecordFile.CompanionPath(FinalFilePath),
+                ParseCsvLine(header),
+                orderedRows.Select(row => row.Fields));
+
             foreach (var workerFilePath in _workerFilePaths)
             {
                 if (File.Exists(workerFilePath))
@@ -1570,37 +1951,7 @@ internal static class LocalTestingProgram
         public void WriteGame(EvaluationGameResult result)
         {
             ThrowIfDisposed();
-
-            var engineAScore = ScoreForEngine(result);
-            var whiteAverageMoveMs = AverageOrZero(result.WhiteStats.TotalMoveSeconds, result.WhiteStats.Moves) * 1000.0;
-            var blackAverageMoveMs = AverageOrZero(result.BlackStats.TotalMoveSeconds, result.BlackStats.Moves) * 1000.0;
-            var whiteAveragePositions = AverageOrZero(result.WhiteStats.TotalPositions, result.WhiteStats.Moves);
-            var blackAveragePositions = AverageOrZero(result.BlackStats.TotalPositions, result.BlackStats.Moves);
-
-            WriteFields(
-                CommitShortSha,
-                result.GameNumber,
-                result.PairNumber,
-                result.OpeningIndex,
-                result.EngineAWasWhite,
-                result.WhiteEngineStem,
-                result.BlackEngineStem,
-                result.Result,
-                result.TerminationReason,
-                result.Plies,
-                engineAScore,
-                result.WhiteStats.Moves,
-                result.BlackStats.Moves,
-                result.WhiteStats.TotalPositions,
-                result.BlackStats.TotalPositions,
-                whiteAveragePositions,
-                blackAveragePositions,
-                whiteAverageMoveMs,
-                blackAverageMoveMs,
-                result.Elapsed.TotalMilliseconds,
-                result.FailureEngineStem ?? string.Empty,
-                result.FailureMessage ?? string.Empty,
-                result.OpeningFen);
+            WriteFields(EvaluationCsvValues(CommitShortSha, result));
         }
 
         public void Flush()
@@ -1622,30 +1973,7 @@ internal static class LocalTestingProgram
 
         private void WriteHeader()
         {
-            WriteFields(
-                "commit_short_sha",
-                "game_number",
-                "pair_number",
-                "opening_index",
-                "engine_a_was_white",
-                "white_engine",
-                "black_engine",
-                "result",
-                "termination_reason",
-                "plies",
-                "engine_a_score",
-                "white_moves",
-                "black_moves",
-                "white_total_positions",
-                "black_total_positions",
-                "white_average_positions",
-                "black_average_positions",
-                "white_average_move_ms",
-                "black_average_move_ms",
-                "game_elapsed_ms",
-                "failure_engine",
-                "failure_message",
-                "opening_fen");
+            WriteFields(EvaluationCsvColumns);
         }
 
         private void WriteFields(params object[] values)
@@ -1656,13 +1984,7 @@ internal static class LocalTestingProgram
 
         private static string FormatCsvField(object value)
         {
-            var text = value switch
-            {
-                bool boolValue => boolValue ? "true" : "false",
-                IFormattable formattable => formattable.ToString(null, CultureInfo.InvariantCulture),
-                _ => value.ToString() ?? string.Empty,
-            };
-
+            var text = FormatCsvText(value);
             if (text.Contains('"') || text.Contains(',') || text.Contains('\n') || text.Contains('\r'))
             {
                 return $"\"{text.Replace("\"", "\"\"", StringComparison.Ordinal)}\"";
@@ -1680,7 +2002,76 @@ internal static class LocalTestingProgram
         }
     }
 
-    private sealed record MergedCsvRow(int GameNumber, string Line);
+    private static object[] EvaluationCsvValues(string commitShortSha, EvaluationGameResult result)
+    {
+        var engineAScore = ScoreForEngine(result);
+        var whiteAverageMoveMs = AverageOrZero(result.WhiteStats.TotalMoveSeconds, result.WhiteStats.Moves) * 1000.0;
+        var blackAverageMoveMs = AverageOrZero(result.BlackStats.TotalMoveSeconds, result.BlackStats.Moves) * 1000.0;
+        var whiteAveragePositions = AverageOrZero(result.WhiteStats.TotalPositions, result.WhiteStats.Moves);
+        var blackAveragePositions = AverageOrZero(result.BlackStats.TotalPositions, result.BlackStats.Moves);
+
+        return
+        [
+            commitShortSha,
+            result.GameNumber,
+            result.PairNumber,
+            result.OpeningIndex,
+            result.EngineAWasWhite,
+            result.WhiteEngineStem,
+            result.BlackEngineStem,
+            result.Result,
+            result.TerminationReason,
+            result.Plies,
+            engineAScore,
+            result.WhiteStats.Moves,
+            result.BlackStats.Moves,
+            result.WhiteStats.TotalPositions,
+            result.BlackStats.TotalPositions,
+            whiteAveragePositions,
+            blackAveragePositions,
+            whiteAverageMoveMs,
+            blackAverageMoveMs,
+            result.Elapsed.TotalMilliseconds,
+            result.FailureEngineStem ?? string.Empty,
+            result.FailureMessage ?? string.Empty,
+            result.OpeningFen,
+            result.WhiteStats.MoveMillisecondsPercentile(50),
+            result.WhiteStats.MoveMillisecondsPercentile(95),
+            result.WhiteStats.MoveMillisecondsPercentile(99),
+            result.WhiteStats.MoveMillisecondsPercentile(100),
+            result.BlackStats.MoveMillisecondsPercentile(50),
+            result.BlackStats.MoveMillisecondsPercentile(95),
+            result.BlackStats.MoveMillisecondsPercentile(99),
+            result.BlackStats.MoveMillisecondsPercentile(100),
+            result.StartedAt.ToUnixTimeMilliseconds(),
+            (result.StartedAt + result.Elapsed).ToUnixTimeMilliseconds(),
+        ];
+    }
+
+    private static string FormatCsvText(object value)
+    {
+        return value switch
+        {
+            bool boolValue => boolValue ? "true" : "false",
+            IFormattable formattable => formattable.ToString(null, CultureInfo.InvariantCulture),
+            _ => value.ToString() ?? string.Empty,
+        };
+    }
+
+    private static string FormatGameJson(string? commitShortSha, EvaluationGameResult result)
+    {
+        // Field texts match the CSV row exactly, so the orchestrator parses either the same way.
+        var values = EvaluationCsvValues(commitShortSha ?? string.Empty, result);
+        var row = new Dictionary<string, string>(EvaluationCsvColumns.Length, StringComparer.Ordinal);
+        for (var index = 0; index < EvaluationCsvColumns.Length; index++)
+        {
+            row[EvaluationCsvColumns[index]] = FormatCsvText(values[index]);
+        }
+
+        return JsonSerializer.Serialize(row);
+    }
+
+    private sealed record MergedCsvRow(int GameNumber, string Line, List<string> Fields);
 
     private static List<string> ParseCsvLine(string line)
     {
@@ -1837,11 +2228,13 @@ internal static class LocalTestingProgram
         private readonly Process _process;
         private readonly StreamWriter _input;
         private readonly StreamReader _output;
+        private readonly long? _nodeLimit;
         private bool _disposed;
 
-        public StockfishEngine(string binaryPath, int requestedElo)
+        public StockfishEngine(string binaryPath, int requestedElo, long? nodeLimit = null)
         {
             BinaryPath = binaryPath;
+            _nodeLimit = nodeLimit;
 
             try
             {
@@ -1895,13 +2288,27 @@ internal static class LocalTestingProgram
 
         public int ConfiguredElo { get; }
 
+        public bool IsAlive => !_disposed && !_process.HasExited;
+
+        // Clears a reused process for its next game; readyok also drains a search left unread by a failed game.
+        public void NewGame()
+        {
+            ThrowIfDisposed();
+            SendCommand("stop");
+            SendCommand("ucinewgame");
+            SendCommand("isready");
+            _ = ReadUntil(line => line == "readyok");
+        }
+
         public SearchResult SearchMove(BoardState board, double timeLimitSeconds)
         {
             ThrowIfDisposed();
 
             var moveTimeMs = Math.Max(1, (int)Math.Round(timeLimitSeconds * 1000.0, MidpointRounding.AwayFromZero));
             SendCommand($"position fen {board.Fen}");
-            SendCommand($"go movetime {moveTimeMs}");
+            // UCI_LimitStrength still picks among its candidate moves with a time-seeded PRNG, so a node
+            // budget fixes Stockfish's search effort but not every move it plays.
+            SendCommand(_nodeLimit is null ? $"go movetime {moveTimeMs}" : $"go nodes {_nodeLimit}");
 
             var searchLines = ReadUntil(line => line.StartsWith("bestmove ", StringComparison.Ordinal));
             var bestMoveLine = searchLines[^1];
@@ -2074,4 +2481,101 @@ internal static class LocalTestingProgram
     }
 
     private sealed record ParsedStockfishInfo(long Nodes, int ScoreCp, int? Depth);
+
+    private sealed class StockfishPool : IDisposable
+    {
+        private readonly Dictionary<(string Path, int Elo, long? Nodes), Stack<StockfishEngine>> _idle = new();
+
+        public StockfishLease Rent(string binaryPath, int requestedElo, long? nodeLimit)
+        {
+            var key = (binaryPath, requestedElo, nodeLimit);
+            while (true)
+            {
+                StockfishEngine? engine = null;
+                lock (_idle)
+                {
+                    if (_idle.TryGetValue(key, out var stack) && stack.Count > 0)
+                    {
+                        engine = stack.Pop();
+                    }
+                }
+
+                if (engine is null)
+                {
+                    return new StockfishLease(this, key, new StockfishEngine(binaryPath, requestedElo, nodeLimit));
+                }
+
+                try
+                {
+                    engine.NewGame();
+                    return new StockfishLease(this, key, engine);
+                }
+                catch (Exception exception) when (exception is InvalidOperationException or IOException)
+                {
+                    // The process died while idle; start a fresh one instead.
+                    engine.Dispose();
+                }
+            }
+        }
+
+        public void Return((string Path, int Elo, long? Nodes) key, StockfishEngine engine)
+        {
+            if (!engine.IsAlive)
+            {
+                engine.Dispose();
+                return;
+            }
+
+            lock (_idle)
+            {
+                if (!_idle.TryGetValue(key, out var stack))
+                {
+                    stack = new Stack<StockfishEngine>();
+                    _idle[key] = stack;
+                }
+
+                stack.Push(engine);
+            }
+        }
+
+        public void Dispose()
+        {
+            lock (_idle)
+            {
+                foreach (var engine in _idle.Values.SelectMany(stack => stack))
+                {
+                    engine.Dispose();
+                }
+
+                _idle.Clear();
+            }
+        }
+    }
+
+    private sealed class StockfishLease : IDisposable
+    {
+        private readonly StockfishPool _pool;
+        private readonly (string Path, int Elo, long? Nodes) _key;
+        private bool _returned;
+
+        public StockfishLease(StockfishPool pool, (string Path, int Elo, long? Nodes) key, StockfishEngine engine)
+        {
+            _pool = pool;
+            _key = key;
+            Engine = engine;
+        }
+
+        public StockfishEngine Engine { get; }
+
+        public void Dispose()
+        {
+            if (_returned)
+            {
+                return;
+            }
+
+            _pool.Return(_key, Engine);
+            _returned = true;
+        }
+    }
 }